@@ -0,0 +1,175 @@
+"""
+Concurrent access to the GitHub API for independent lookups.
+
+GitHubClient is synchronous and most of the release automation depends
+on the order of its calls. Some lookups are independent, though (the
+Commonalities and ICM VERSION.yaml reads, one label check per required
+label, deleting and renaming branches after publication), and waiting
+for each before sending the next only adds round trips.
+
+- AsyncGitHubClient exposes the GitHubClient methods as coroutines,
+  running each call in a worker thread under a shared concurrency bound.
+- gather_bounded() awaits a set of zero-argument calls with bounded
+  concurrency; run_parallel() is its synchronous facade for the
+  existing (synchronous) callers.
+
+The HTTP transport keeps one keep-alive connection per worker thread
+and its RateLimiter is shared, so concurrent calls still respect the
+API rate limits.
+"""
+
+import asyncio
+import functools
+from typing import Any, Awaitable, Callable, Iterable, List, Optional, TypeVar
+
+from .github_client import GitHubClient
+
+
+T = TypeVar("T")
+
+# Enough to overlap round trips without provoking secondary rate limits
+DEFAULT_CONCURRENCY = 4
+
+
+async def gather_bounded(
+    calls: Iterable[Callable[[], T]],
+    limit: int = DEFAULT_CONCURRENCY,
+    return_exceptions: bool = False,
+) -> List[Any]:
+    """
+    Run blocking calls in worker threads, at most `limit` at a time.
+
+    Args:
+        calls: Zero-argument callables (e.g., functools.partial objects)
+        limit: Maximum number of calls in flight
+        return_exceptions: Return exceptions in the result list instead
+            of raising the first one
+
+    Returns:
+        Results in the order of `calls`
+    """
+    semaphore = asyncio.Semaphore(max(1, limit))
+
+    async def run(call: Callable[[], T]) -> T:
+        async with semaphore:
+            return await asyncio.to_thread(call)
+
+    return await asyncio.gather(
+        *(run(call) for call in calls),
+        return_exceptions=return_exceptions,
+    )
+
+
+def run_parallel(
+    calls: Iterable[Callable[[], T]],
+    limit: int = DEFAULT_CONCURRENCY,
+    return_exceptions: bool = False,
+) -> List[Any]:
+    """
+    Synchronous facade for gather_bounded().
+
+    Runs the calls concurrently and blocks until all have finished. With
+    a single call (or limit=1) the calls are made in order on the
+    current thread, which keeps simple cases free of thread overhead.
+
+    Args:
+        calls: Zero-argument callables
+        limit: Maximum number of calls in flight
+        return_exceptions: Return exceptions in the result list instead
+            of raising the first one
+
+    Returns:
+        Results in the order of `calls`
+
+    Raises:
+        RuntimeError: If called from a running event loop (await
+            gather_bounded() there instead)
+    """
+    calls = list(calls)
+    if len(calls) <= 1 or limit <= 1:
+        results = []
+        for call in calls:
+            try:
+                results.append(call())
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                results.append(e)
+        return results
+    return asyncio.run(gather_bounded(calls, limit, return_exceptions))
+
+
+class AsyncGitHubClient:
+    """
+    Coroutine interface to a GitHubClient.
+
+    Every public GitHubClient method is available under the same name and
+    signature as a coroutine, e.g. `await client.get_label("release-issue")`.
+    Attributes that are not methods (repo, token) are passed through.
+    All calls share one concurrency bound.
+    """
+
+    def __init__(
+        self,
+        client: Optional[GitHubClient] = None,
+        repo: Optional[str] = None,
+        token: Optional[str] = None,
+        max_concurrency: int = DEFAULT_CONCURRENCY,
+    ):
+        """
+        Initialize the async client.
+
+        Args:
+            client: GitHubClient to wrap (created from repo/token if not given)
+            repo: Repository in format "owner/name" (if client is not given)
+            token: Optional GitHub token (if client is not given)
+            max_concurrency: Maximum number of calls in flight
+        """
+        if client is None:
+            if repo is None:
+                raise ValueError("AsyncGitHubClient needs a client or a repo")
+            client = GitHubClient(repo=repo, token=token)
+        self.client = client
+        self.max_concurrency = max(1, max_concurrency)
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self.client, name)
+        if name.startswith("_") or not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        async def call(*args, **kwargs):
+            async with self._bound():
+                return await asyncio.to_thread(attr, *args, **kwargs)
+
+        return call
+
+    def _bound(self) -> asyncio.Semaphore:
+        # Created lazily so it binds to the loop the client is used from
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def gather(
+        self,
+        *calls: Awaitable[Any],
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """
+        Await several client calls concurrently.
+
+        Example:
+            labels = await client.gather(
+                client.get_label("release-issue"),
+                client.get_label("release-state: planned"),
+            )
+
+        Args:
+            calls: Coroutines returned by this client's methods
+            return_exceptions: Return exceptions instead of raising
+
+        Returns:
+            Results in the order of `calls`
+        """
+        return await asyncio.gather(*calls, return_exceptions=return_exceptions)
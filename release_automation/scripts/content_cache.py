@@ -0,0 +1,187 @@
+"""
+Cache for file contents at immutable refs.
+
+Files read at a commit SHA or at a published release tag never change,
+yet release automation reads the same ones on every run (e.g.
+release-metadata.yaml from every historical tag when calculating
+version extensions). ContentCache stores such reads keyed by
+(repo, sha, path) so they are fetched once:
+
+- file contents are kept on disk when a directory is given, so later
+  runs can reuse them (e.g. restored with actions/cache);
+- ref resolutions (release tag -> object SHA) are kept in memory only:
+  a tag can be deleted and re-created (e.g. after a discarded release),
+  so each run resolves the tags again and a re-created tag simply maps
+  to a new SHA;
+- parsed YAML is memoized in memory and handed out as deep copies, so
+  callers may modify the result freely.
+
+Only refs that cannot move are cached: full commit SHAs and release
+tags (rX.Y). Branch reads always go to the API.
+"""
+
+import copy
+import hashlib
+import json
+import os
+import re
+import tempfile
+from typing import Any, Dict, Optional, Tuple
+
+
+# Full 40-character commit SHA
+SHA_PATTERN = re.compile(r"^[0-9a-f]{40}$")
+
+# Release tags (r3.2, r4.1, ...) are never moved once published
+RELEASE_TAG_PATTERN = re.compile(r"^r\d+\.\d+$")
+
+
+def is_commit_sha(ref: str) -> bool:
+    """Return True if ref is a full commit SHA."""
+    return bool(SHA_PATTERN.match(ref))
+
+
+def is_release_tag(ref: str) -> bool:
+    """Return True if ref is a release tag name (e.g., "r4.1")."""
+    return bool(RELEASE_TAG_PATTERN.match(ref))
+
+
+class ContentCache:
+    """
+    Store of file contents at immutable refs, keyed by (repo, sha, path).
+
+    A file that does not exist at a SHA is cached as None, so repeated
+    lookups for missing files (e.g. legacy releases without a committed
+    release-metadata.yaml) are answered locally as well.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            directory: Optional directory for persistent storage
+                (memory only if not given)
+        """
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        self._refs: Dict[Tuple[str, str], str] = {}
+        self._contents: Dict[Tuple[str, str, str], Optional[str]] = {}
+        self._parsed: Dict[Tuple[str, str, str], Any] = {}
+
+    # -------------------------------------------------------------------------
+    # Ref resolution
+    # -------------------------------------------------------------------------
+
+    def get_sha(self, repo: str, ref: str) -> Optional[str]:
+        """
+        Look up the SHA a release tag resolved to in this run.
+
+        Args:
+            repo: Repository in format "owner/name"
+            ref: Release tag name
+
+        Returns:
+            Object SHA, or None if the tag has not been resolved yet
+        """
+        return self._refs.get((repo, ref))
+
+    def put_shas(self, repo: str, shas: Dict[str, str]) -> None:
+        """
+        Record release tag resolutions (in memory, never persisted).
+
+        Args:
+            repo: Repository in format "owner/name"
+            shas: Mapping of release tag name to object SHA
+        """
+        for ref, sha in shas.items():
+            self._refs[(repo, ref)] = sha
+
+    # -------------------------------------------------------------------------
+    # File contents
+    # -------------------------------------------------------------------------
+
+    def get(self, repo: str, sha: str, path: str) -> Tuple[bool, Optional[str]]:
+        """
+        Look up a file at a SHA.
+
+        Args:
+            repo: Repository in format "owner/name"
+            sha: Object SHA the ref resolved to
+            path: File path relative to repository root
+
+        Returns:
+            Tuple of (found, content); content is None for a file known
+            not to exist at that SHA
+        """
+        key = (repo, sha, path)
+        if key not in self._contents:
+            entry = self._read(self._object_name(key))
+            if not isinstance(entry, dict) or entry.get("key") != list(key):
+                self.misses += 1
+                return False, None
+            self._contents[key] = entry.get("content")
+        self.hits += 1
+        return True, self._contents[key]
+
+    def put(self, repo: str, sha: str, path: str, content: Optional[str]) -> None:
+        """
+        Store a file at a SHA (None records that it does not exist).
+
+        Args:
+            repo: Repository in format "owner/name"
+            sha: Object SHA the ref resolved to
+            path: File path relative to repository root
+            content: File content, or None if the file does not exist
+        """
+        key = (repo, sha, path)
+        self._contents[key] = content
+        if self.directory:
+            self._write(self._object_name(key), {"key": list(key), "content": content})
+
+    def get_parsed(self, repo: str, sha: str, path: str) -> Tuple[bool, Any]:
+        """
+        Look up a memoized parse result.
+
+        Returns:
+            Tuple of (found, deep copy of the parsed value)
+        """
+        key = (repo, sha, path)
+        if key not in self._parsed:
+            return False, None
+        return True, copy.deepcopy(self._parsed[key])
+
+    def put_parsed(self, repo: str, sha: str, path: str, value: Any) -> None:
+        """Memoize a parse result (kept in memory only)."""
+        self._parsed[(repo, sha, path)] = copy.deepcopy(value)
+
+    # -------------------------------------------------------------------------
+    # Storage
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _object_name(key: Tuple[str, str, str]) -> str:
+        digest = hashlib.sha256("\0".join(key).encode()).hexdigest()
+        return os.path.join("objects", f"{digest}.json")
+
+    def _read(self, name: str) -> Any:
+        if not self.directory:
+            return None
+        try:
+            with open(os.path.join(self.directory, name), encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, name: str, data: Any) -> None:
+        # Write failures are ignored; the cache is an optimization only
+        path = os.path.join(self.directory, name)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
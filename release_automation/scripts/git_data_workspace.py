@@ -0,0 +1,257 @@
+"""
+Clone-free snapshot workspace for CAMARA release automation.
+
+GitDataWorkspace offers the GitOperations methods SnapshotCreator uses
+(clone, create_branch, commit_all, push, create_pr), backed by the GitHub
+Git Data API instead of a local repository:
+
+- "clone" lists the branch tree in one request and downloads only the
+  blobs matching the given patterns (the files the transformations, the
+  WIP check, README and CHANGELOG steps read) into work_dir;
+- "commit_all" compares work_dir with the downloaded files and creates
+  blobs for the changed files, one tree on top of the previous tree
+  (base_tree) and one commit;
+- "push" creates the branch ref at the last commit.
+
+All other files stay untouched in the tree, so they are never downloaded.
+"""
+
+import os
+import re
+import time
+from functools import partial
+from typing import Dict, Optional, Sequence
+
+from .async_github_client import run_parallel
+from .git_operations import (
+    BranchError,
+    CloneError,
+    CloneStats,
+    CommitError,
+    GitOperations,
+    PushError,
+)
+from .github_client import GitHubClient, GitHubClientError
+
+
+# Reported as the clone strategy of this workspace
+CLONE_GIT_DATA = "git-data"
+
+# Only regular files are downloaded (no symlinks, submodules)
+BLOB_MODES = ("100644", "100755")
+
+
+def pattern_regex(pattern: str) -> "re.Pattern":
+    """
+    Compile a glob pattern (as used by glob.glob with recursive=True) for
+    repository-relative paths: "*" and "?" do not cross "/", "**/" matches
+    any number of directories.
+    """
+    regex = ""
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            regex += "(?:[^/]+/)*"
+            i += 3
+        elif pattern.startswith("**", i):
+            regex += ".*"
+            i += 2
+        elif pattern[i] == "*":
+            regex += "[^/]*"
+            i += 1
+        elif pattern[i] == "?":
+            regex += "[^/]"
+            i += 1
+        else:
+            regex += re.escape(pattern[i])
+            i += 1
+    return re.compile(regex + r"\Z")
+
+
+class GitDataWorkspace(GitOperations):
+    """
+    Snapshot workspace on the Git Data API, without a local clone.
+
+    Branches exist only as names until pushed: create_branch() starts the
+    next commits from the current one, as "git checkout -b" does.
+    """
+
+    def __init__(
+        self,
+        github_client: GitHubClient,
+        work_dir: str,
+        patterns: Sequence[str],
+    ):
+        """
+        Initialize the workspace.
+
+        Args:
+            github_client: GitHubClient of the repository
+            work_dir: Directory receiving the downloaded files
+            patterns: Glob patterns (repository-relative) of the files to
+                download
+        """
+        super().__init__(repo=github_client.repo, work_dir=work_dir, token=github_client.token)
+        self.gh = github_client
+        self.patterns = [pattern_regex(p) for p in patterns if p]
+        self.head: Optional[str] = None
+        self.tree: Optional[str] = None
+        self.branch: Optional[str] = None
+        self.author: Optional[Dict[str, str]] = None
+        # Downloaded (or last committed) content and mode per path
+        self._files: Dict[str, bytes] = {}
+        self._modes: Dict[str, str] = {}
+
+    def clone(
+        self,
+        branch: str = "main",
+        strategy: Optional[str] = None,
+        sparse_paths: Optional[Sequence[str]] = None,
+    ) -> CloneStats:
+        """
+        Download the files matching the patterns at the head of a branch.
+
+        Args:
+            branch: Branch to start from
+            strategy: Ignored (kept for GitOperations compatibility)
+            sparse_paths: Ignored (the patterns select the files)
+
+        Returns:
+            CloneStats with strategy "git-data"
+
+        Raises:
+            CloneError: If the branch or its tree cannot be read (e.g. a
+                tree too large to list in one response)
+        """
+        start = time.monotonic()
+        head = self.gh.get_branch_sha(branch)
+        if not head:
+            raise CloneError(f"Branch '{branch}' not found in {self.repo}")
+        try:
+            tree, entries = self.gh.get_tree(head)
+            selected = [
+                entry for entry in entries
+                if entry.get("type") == "blob"
+                and entry.get("mode") in BLOB_MODES
+                and self._selected(entry["path"])
+            ]
+            contents = run_parallel([partial(self.gh.get_blob, e["sha"]) for e in selected])
+        except GitHubClientError as e:
+            raise CloneError(f"Failed to read {self.repo}@{branch}: {e}")
+
+        for entry, content in zip(selected, contents):
+            path = os.path.join(self.work_dir, entry["path"])
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as f:
+                f.write(content)
+            self._files[entry["path"]] = content
+            self._modes[entry["path"]] = entry["mode"]
+
+        self.head, self.tree, self.branch = head, tree, branch
+        stats = CloneStats(
+            requested=CLONE_GIT_DATA,
+            strategy=CLONE_GIT_DATA,
+            duration=time.monotonic() - start,
+            disk_bytes=sum(len(c) for c in contents),
+        )
+        print(
+            f"Read {len(selected)} of {len(entries)} files of {self.repo}@{branch} "
+            f"via the Git Data API in {stats.duration:.1f}s"
+        )
+        return stats
+
+    def _selected(self, path: str) -> bool:
+        return any(regex.match(path) for regex in self.patterns)
+
+    def configure_user(self, name: str, email: str) -> None:
+        """Set the author and committer of the commits created."""
+        self.author = {"name": name, "email": email}
+
+    def get_commit_sha(self, ref: str = "HEAD") -> str:
+        """Return the current commit (only "HEAD" is known locally)."""
+        if ref != "HEAD":
+            raise BranchError(f"Unknown ref in Git Data workspace: {ref}")
+        return self.head
+
+    def create_branch(self, name: str, from_ref: str = "HEAD") -> None:
+        """Continue on a new branch from the current commit."""
+        if from_ref != "HEAD":
+            raise BranchError(f"Git Data workspace can only branch from HEAD, not {from_ref}")
+        self.branch = name
+
+    def checkout(self, ref: str) -> None:
+        """Not supported: the workspace only moves forward."""
+        raise BranchError("checkout is not supported by the Git Data workspace")
+
+    def commit_all(self, message: str, author: Optional[str] = None) -> str:
+        """
+        Commit the changes made in work_dir to the downloaded files.
+
+        Args:
+            message: Commit message
+            author: Ignored (use configure_user)
+
+        Returns:
+            Commit SHA of the new commit
+
+        Raises:
+            CommitError: If there are no changes or an API call fails
+        """
+        current = self._read_work_dir()
+        changed = [
+            path for path, content in current.items()
+            if self._files.get(path) != content
+        ]
+        deleted = [path for path in self._files if path not in current]
+        if not changed and not deleted:
+            raise CommitError("No changes to commit")
+
+        try:
+            blob_shas = run_parallel([partial(self.gh.create_blob, current[p]) for p in changed])
+            entries = [
+                {"path": path, "mode": self._modes.get(path, "100644"), "sha": sha}
+                for path, sha in zip(changed, blob_shas)
+            ] + [{"path": path, "sha": None} for path in deleted]
+            tree = self.gh.create_tree(self.tree, entries)
+            head = self.gh.create_commit(message, tree, [self.head], author=self.author)
+        except GitHubClientError as e:
+            raise CommitError(f"Failed to commit via Git Data API: {e}")
+
+        for path in deleted:
+            self._modes.pop(path, None)
+        for path in changed:
+            self._modes.setdefault(path, "100644")
+        self._files = current
+        self.head, self.tree = head, tree
+        return head
+
+    def _read_work_dir(self) -> Dict[str, bytes]:
+        files = {}
+        for root, _, names in os.walk(self.work_dir):
+            for name in names:
+                path = os.path.join(root, name)
+                relative = os.path.relpath(path, self.work_dir).replace(os.sep, "/")
+                with open(path, "rb") as f:
+                    files[relative] = f.read()
+        return files
+
+    def push(self, branch: str, set_upstream: bool = True) -> None:
+        """
+        Create the branch on GitHub at the current commit.
+
+        Raises:
+            PushError: If the branch already exists or creation fails
+        """
+        try:
+            created = self.gh.create_branch_at_sha(branch, self.head)
+        except GitHubClientError as e:
+            raise PushError(str(e))
+        if not created:
+            raise PushError(f"Branch '{branch}' already exists in {self.repo}")
+
+    def delete_remote_branch(self, branch: str) -> bool:
+        """Delete a branch on GitHub (see GitOperations.delete_remote_branch)."""
+        try:
+            return self.gh.delete_branch(branch)
+        except GitHubClientError as e:
+            raise BranchError(str(e))
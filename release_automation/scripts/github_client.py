@@ -2,19 +2,36 @@
 GitHub API client wrapper for release automation.
 
 This module provides a thin wrapper around GitHub API operations
-needed by the release automation workflow. It uses the `gh` CLI
-for authentication and API access.
+needed by the release automation workflow. Requests are expressed as
+`gh` CLI commands and executed by a pluggable transport (see
+github_transport.py): in-process over a keep-alive HTTP connection when
+a token is available, or through the `gh` CLI.
 """
 
+from contextlib import contextmanager
 from fnmatch import fnmatch
+import base64
+import contextvars
 import json
-import subprocess
-import time
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+import os
+import threading
+import urllib.parse
+import warnings
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import yaml
 
+from .content_cache import ContentCache, is_commit_sha, is_release_tag
+from .github_transport import (
+    CACHE_DIR_ENV,
+    GitHubTransport,
+    TransportError,
+    create_transport,
+)
+from .rate_limiter import RateLimitBudget
+from .waiter import Waiter
+
 
 @dataclass
 class Branch:
@@ -33,37 +50,425 @@ class Release:
     html_url: str
 
 
+@dataclass(frozen=True)
+class ReleaseRecord:
+    """Compact release entry (see GitHubClient.iter_releases)."""
+    id: Optional[int]
+    tag_name: str
+    draft: bool
+    prerelease: bool
+    created_at: str
+    name: str = ""
+    html_url: str = ""
+
+
+def _literal_prefix(pattern: str) -> str:
+    """Return the part of a glob pattern before its first wildcard."""
+    for i, char in enumerate(pattern):
+        if char in "*?[":
+            return pattern[:i]
+    return pattern
+
+
+# `gh api` options that take a value (used to find the endpoint argument)
+_API_VALUE_OPTIONS = {
+    "-X", "--method", "-f", "--raw-field", "-F", "--field",
+    "-H", "--header", "-q", "--jq", "-t", "--template", "--input",
+}
+
+# `gh` subcommands that only read
+_CLI_READ_COMMANDS = {"list", "view", "download", "status"}
+
+# Resource touched by `gh <command>` subcommands
+_CLI_RESOURCES = {
+    "release": "releases",
+    "issue": "issues",
+    "pr": "pulls",
+    "label": "labels",
+}
+
+# Resource name for the first path segment after repos/{owner}/{repo}/
+_API_RESOURCES = {
+    "git": "refs",
+    "branches": "refs",
+    "tags": "refs",
+    "releases": "releases",
+    "issues": "issues",
+    "labels": "labels",
+    "pulls": "pulls",
+    "contents": "contents",
+    "commits": "commits",
+    "compare": "commits",
+}
+
+# Memoized resources a write to a resource can change. GraphQL reads span
+# several resources and are dropped on every write.
+_INVALIDATES = {
+    "refs": {"refs", "contents", "commits"},
+    "releases": {"releases", "refs"},
+    "issues": {"issues", "labels"},
+    "labels": {"labels", "issues"},
+    "pulls": {"pulls", "issues", "refs"},
+    "contents": {"contents", "refs", "commits"},
+}
+
+# POST endpoints that do not change anything (new git objects are not
+# visible until a ref points at them)
+_NON_MUTATING_POSTS = (
+    "/releases/generate-notes", "/markdown",
+    "/git/blobs", "/git/trees", "/git/commits",
+)
+
+
+def _classify_command(args: List[str]) -> Tuple[str, Optional[str]]:
+    """
+    Classify a gh command for request memoization.
+
+    Returns:
+        Tuple of (kind, resource): kind is "read", "write" or "other"
+        (neither memoized nor invalidating); resource is None when the
+        affected resource is unknown
+    """
+    if not args:
+        return "write", None
+
+    if args[0] != "api":
+        resource = _CLI_RESOURCES.get(args[0])
+        if len(args) > 1 and args[1] in _CLI_READ_COMMANDS:
+            return "read", resource
+        return "write", resource
+
+    method = None
+    endpoint = None
+    query = None
+    has_fields = False
+    i = 1
+    while i < len(args):
+        arg = args[i]
+        if arg in _API_VALUE_OPTIONS and i + 1 < len(args):
+            value = args[i + 1]
+            if arg in ("-X", "--method"):
+                method = value.upper()
+            elif arg in ("-f", "--raw-field", "-F", "--field"):
+                has_fields = True
+                if value.startswith("query="):
+                    query = value[len("query="):]
+            i += 2
+            continue
+        if not arg.startswith("-") and endpoint is None:
+            endpoint = arg
+        i += 1
+
+    endpoint = (endpoint or "").lstrip("/")
+    if endpoint == "graphql":
+        if (query or "").lstrip().startswith("mutation"):
+            return "write", None
+        return "read", "graphql"
+
+    path = endpoint.split("?", 1)[0]
+    if path.endswith(_NON_MUTATING_POSTS):
+        return "other", None
+
+    parts = path.split("/")
+    if parts[0] == "repos" and len(parts) > 3:
+        resource = _API_RESOURCES.get(parts[3], parts[3])
+    else:
+        resource = parts[0] or None
+
+    method = method or ("POST" if has_fields else "GET")
+    if method in ("GET", "HEAD"):
+        return "read", resource
+    return "write", resource
+
+
 class GitHubClientError(Exception):
     """Base exception for GitHub client errors."""
     pass
 
 
+# Page size for the connections fetched by RELEASE_VIEW_QUERY
+RELEASE_VIEW_PAGE_SIZE = 100
+
+RELEASE_VIEW_QUERY = """
+query($owner: String!, $name: String!, $tagQuery: String!, $branchPrefix: String!,
+      $planExpression: String!, $metadataPath: String!, $first: Int!) {
+  repository(owner: $owner, name: $name) {
+    tags: refs(refPrefix: "refs/tags/", query: $tagQuery, first: $first) {
+      pageInfo { hasNextPage }
+      nodes { name target { oid } }
+    }
+    branches: refs(refPrefix: $branchPrefix, first: $first) {
+      pageInfo { hasNextPage }
+      nodes {
+        name
+        target {
+          oid
+          ... on Commit {
+            committedDate
+            file(path: $metadataPath) { object { ... on Blob { text } } }
+          }
+        }
+      }
+    }
+    releases(first: $first, orderBy: {field: CREATED_AT, direction: DESC}) {
+      pageInfo { hasNextPage }
+      nodes { tagName isDraft }
+    }
+    pullRequests(states: OPEN, first: $first) {
+      pageInfo { hasNextPage }
+      nodes { number headRefName }
+    }
+    plan: object(expression: $planExpression) { ... on Blob { text } }
+  }
+}
+"""
+
+# Set inside GitHubClient.fresh_reads(): reads bypass the request memo
+_FRESH_READS: contextvars.ContextVar[bool] = contextvars.ContextVar("fresh_reads", default=False)
+
+# First page of GitHubClient.iter_releases; callers looking for the latest
+# release of some kind usually stop within it
+RELEASES_PAGE_SIZE = 30
+
+RELEASES_PAGE_QUERY = """
+query($owner: String!, $name: String!, $first: Int!, $after: String) {
+  repository(owner: $owner, name: $name) {
+    releases(first: $first, after: $after, orderBy: {field: CREATED_AT, direction: DESC}) {
+      pageInfo { hasNextPage endCursor }
+      nodes { databaseId tagName name url isDraft isPrerelease createdAt }
+    }
+  }
+}
+"""
+
+# Open/closed issues listed by GitHubClient.list_issue_titles: number and
+# title only, so lookups by title marker do not download issue bodies
+ISSUE_TITLES_QUERY = """
+query($owner: String!, $name: String!, $labels: [String!], $states: [IssueState!], $first: Int!, $after: String) {
+  repository(owner: $owner, name: $name) {
+    issues(labels: $labels, states: $states, first: $first, after: $after, orderBy: {field: CREATED_AT, direction: DESC}) {
+      pageInfo { hasNextPage endCursor }
+      nodes { number title }
+    }
+  }
+}
+"""
+
+ISSUE_STATES = {"open": ["OPEN"], "closed": ["CLOSED"], "all": ["OPEN", "CLOSED"]}
+
+# `gh issue list` returns 30 issues unless told otherwise
+ISSUE_LIST_LIMIT = 1000
+
+
+@dataclass
+class ReleaseView:
+    """
+    Release-relevant repository artifacts fetched in one GraphQL request.
+
+    Exposes the same read methods as GitHubClient (tag_exists,
+    list_branches, draft_release_exists, get_file_content, ...) so state
+    derivation can run against either. Lookups the single query could not
+    answer exhaustively (a connection had more pages) fall back to the
+    client's REST calls, so answers are always exact.
+
+    Attributes:
+        tags: Tag name → commit SHA for the fetched tags
+        branches: Branches under branch_prefix
+        branch_dates: Branch name → HEAD committer date
+        branch_files: (branch, path) → content of prefetched files
+        draft_tags: Tags that have a draft release
+        open_prs: Head branch name → open PR number
+        plan_ref: Ref the plan was read from
+        plan_path: Path of the plan file
+        plan_content: Plan file content, or None if missing
+    """
+    tags: Dict[str, str]
+    branches: List[Branch]
+    branch_dates: Dict[str, str]
+    branch_files: Dict[tuple, str]
+    draft_tags: List[str]
+    open_prs: Dict[str, int]
+    plan_ref: str
+    plan_path: str
+    plan_content: Optional[str]
+    tags_complete: bool = True
+    branches_complete: bool = True
+    releases_complete: bool = True
+    prs_complete: bool = True
+    client: Optional["GitHubClient"] = field(default=None, repr=False, compare=False)
+
+    def tag_exists(self, tag: str) -> bool:
+        """Check if a tag exists (see GitHubClient.tag_exists)."""
+        if tag in self.tags:
+            return True
+        if self.tags_complete:
+            return False
+        return self.client.tag_exists(tag)
+
+    def list_branches(self, pattern: Optional[str] = None) -> List[Branch]:
+        """List prefetched branches matching pattern (see GitHubClient.list_branches)."""
+        if not self.branches_complete:
+            return self.client.list_branches(pattern)
+        return [b for b in self.branches if not pattern or fnmatch(b.name, pattern)]
+
+    def draft_release_exists(self, tag: str) -> bool:
+        """Check for a draft release (see GitHubClient.draft_release_exists)."""
+        if tag in self.draft_tags:
+            return True
+        if self.releases_complete:
+            return False
+        return self.client.draft_release_exists(tag)
+
+    def find_pr_for_branch(self, head_branch: str) -> Optional[int]:
+        """Find an open PR by head branch (see GitHubClient.find_pr_for_branch)."""
+        if head_branch in self.open_prs:
+            return self.open_prs[head_branch]
+        if self.prs_complete:
+            return None
+        return self.client.find_pr_for_branch(head_branch)
+
+    def get_branch_creation_time(self, branch: str) -> Optional[str]:
+        """Get a branch HEAD date (see GitHubClient.get_branch_creation_time)."""
+        if branch in self.branch_dates:
+            return self.branch_dates[branch]
+        return self.client.get_branch_creation_time(branch)
+
+    def get_file_content(self, path: str, ref: str = "main") -> Optional[str]:
+        """Read a file, answering prefetched files without a request."""
+        if path == self.plan_path and ref == self.plan_ref:
+            return self.plan_content
+        if (ref, path) in self.branch_files:
+            return self.branch_files[(ref, path)]
+        return self.client.get_file_content(path, ref=ref)
+
+
 class GitHubClient:
     """
     GitHub API client for release automation operations.
 
-    Uses the `gh` CLI for authentication and API access.
+    Requests are built as `gh` CLI commands and executed by a transport.
     All methods are repository-scoped.
     """
 
-    def __init__(self, repo: str, token: Optional[str] = None):
+    # Content cache key for release metadata (committed file or legacy asset)
+    RELEASE_METADATA_KEY = "release:release-metadata.yaml"
+
+    def __init__(
+        self,
+        repo: str,
+        token: Optional[str] = None,
+        transport: Optional[GitHubTransport] = None,
+        cache_dir: Optional[str] = None,
+        content_cache: Optional[ContentCache] = None,
+    ):
         """
         Initialize the GitHub client.
 
         Args:
             repo: Repository in format "owner/name"
             token: Optional GitHub token (uses gh CLI auth if not provided)
+            transport: Optional transport (defaults to create_transport(token))
+            cache_dir: Optional directory for the conditional-request
+                response cache and the immutable content cache
+                (defaults to GITHUB_CLIENT_CACHE_DIR)
+            content_cache: Optional cache for file reads at commit SHAs
+                and release tags (defaults to one under cache_dir)
         """
         self.repo = repo
         self.token = token
+        if transport is None:
+            transport = create_transport(token, cache_dir=cache_dir)
+        self.transport = transport
+
+        cache_dir = cache_dir or os.environ.get(CACHE_DIR_ENV)
+        if content_cache is None and cache_dir:
+            content_cache = ContentCache(os.path.join(cache_dir, "content"))
+        self.content_cache = content_cache
+        self._release_tags_resolved = False
+        self._memo: Optional[Dict[Tuple[Tuple[str, ...], bool], Tuple[Optional[str], Any]]] = None
+        self._release_index: Optional[Dict[str, List[ReleaseRecord]]] = None
+        # Guards _memo and _release_index, which concurrent stages share;
+        # _memo_generation counts invalidations, so a read that overlapped
+        # a write is not stored
+        self._lock = threading.Lock()
+        self._memo_generation = 0
+
+    @contextmanager
+    def memoized(self) -> Iterator["GitHubClient"]:
+        """
+        Deduplicate identical read requests for the duration of a block.
+
+        Within the block every distinct read (GET / `gh ... list|view`,
+        GraphQL queries) is sent once and its successful result is
+        replayed for repeated calls; failed reads are not stored, so a
+        retry sends the request again. Reads inside fresh_reads() always
+        go to GitHub. Writes made through this client drop the memoized
+        reads of the resources they affect, e.g. creating a ref drops
+        branch, tag and content reads. Changes made outside the client
+        (git push) are not seen, so keep the block to read-only work.
+        Nested blocks share the outer scope. The memo may be used from
+        several threads.
+
+        Yields:
+            This client
+        """
+        if self._memo is not None:
+            yield self
+            return
+        self._memo = {}
+        try:
+            yield self
+        finally:
+            self._memo = None
+
+    def invalidate(self, resource: Optional[str] = None) -> None:
+        """
+        Drop memoized reads (see memoized()).
 
-    def _run_gh(self, args: List[str], check: bool = True) -> str:
+        Args:
+            resource: Resource name (e.g., "releases", "refs"), or None
+                to drop every memoized read
+        """
+        with self._lock:
+            self._memo_generation += 1
+            if not self._memo:
+                return
+            if resource is None:
+                self._memo.clear()
+                return
+            affected = _INVALIDATES.get(resource, {resource}) | {"graphql"}
+            for key in [k for k, (r, _) in self._memo.items() if r is None or r in affected]:
+                del self._memo[key]
+
+    @contextmanager
+    def fresh_reads(self) -> Iterator[None]:
+        """
+        Send every read of the block to GitHub, bypassing the memo.
+
+        For polls waiting on eventual consistency, which must see each
+        new answer. Applies to the calling context only (and to worker
+        threads started from it).
+        """
+        token = _FRESH_READS.set(True)
+        try:
+            yield
+        finally:
+            _FRESH_READS.reset(token)
+
+    def _run_gh(self, args: List[str], check: bool = True, input: Optional[str] = None) -> str:
         """
-        Run a gh CLI command and return output.
+        Run a gh CLI command through the transport and return output.
+
+        Inside a memoized() block, repeated reads are answered from the
+        memo (unless inside fresh_reads()) and writes invalidate the
+        reads they affect. Release and
+        ref writes also drop the release index.
 
         Args:
             args: Command arguments (without 'gh')
             check: Whether to raise on non-zero exit code
+            input: Request body for `--input -` (kept out of the argument
+                list, which the OS limits in size)
 
         Returns:
             Command output as string
@@ -71,26 +476,48 @@ class GitHubClient:
         Raises:
             GitHubClientError: If command fails and check=True
         """
-        import os as _os
+        if self._memo is None and self._release_index is None:
+            return self._send(args, check, input)
+
+        kind, resource = _classify_command(args)
+        if kind == "write":
+            self.invalidate(resource)
+            if resource in ("releases", "refs", None):
+                self.invalidate_release_index()
+        if kind != "read" or self._memo is None or _FRESH_READS.get() or input is not None:
+            return self._send(args, check, input)
+
+        key = (tuple(args), check)
+        with self._lock:
+            memo, generation = self._memo, self._memo_generation
+            if memo is not None and key in memo:
+                return memo[key][1]
+        output = self._send(args, check)
+        with self._lock:
+            # Not stored if the block ended or a write happened meanwhile
+            if memo is self._memo and generation == self._memo_generation:
+                memo[key] = (resource, output)
+        return output
+
+    def rate_limit_budget(self, resource: str = "core") -> Optional[RateLimitBudget]:
+        """
+        Return the remaining API budget for this client's token.
 
-        cmd = ["gh"] + args
-        if self.token:
-            # Extend environment with GH_TOKEN, don't replace it
-            env = {**_os.environ, "GH_TOKEN": self.token}
-        else:
-            env = None
+        Args:
+            resource: Rate limit resource (e.g., "core", "graphql")
 
+        Returns:
+            RateLimitBudget as last reported by GitHub, or None if the
+            transport does not track it (gh CLI) or no request was made yet
+        """
+        limiter = getattr(self.transport, "rate_limiter", None)
+        return limiter.budget(resource) if limiter is not None else None
+
+    def _send(self, args: List[str], check: bool, input: Optional[str] = None) -> str:
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=check,
-                env=env
-            )
-            return result.stdout
-        except subprocess.CalledProcessError as e:
-            raise GitHubClientError(f"gh command failed: {e.stderr}")
+            return self.transport.run(args, check=check, input=input)
+        except TransportError as e:
+            raise GitHubClientError(str(e))
 
     def get_user(self, login: str) -> Dict[str, Any]:
         """
@@ -151,60 +578,203 @@ class GitHubClient:
         """
         List branches in the repository, optionally filtered by pattern.
 
+        Names and SHAs come from one paginated listing. When the pattern
+        starts with a literal prefix (e.g., "release-snapshot/r4.1-*"), the
+        listing is narrowed server-side via git/matching-refs.
+
         Args:
             pattern: Optional glob pattern to filter branches (e.g., "release-snapshot/r4.1-*")
 
         Returns:
             List of Branch objects matching the pattern
         """
-        output = self._run_gh([
-            "api",
-            f"repos/{self.repo}/branches",
-            "--paginate",
-            "--jq", ".[].name"
-        ])
+        prefix = _literal_prefix(pattern) if pattern else ""
 
-        branch_names = [name.strip() for name in output.strip().split('\n') if name.strip()]
+        if prefix:
+            endpoint = f"repos/{self.repo}/git/matching-refs/heads/{urllib.parse.quote(prefix)}"
+            jq_filter = ".[] | {name: .ref, sha: .object.sha}"
+        else:
+            endpoint = f"repos/{self.repo}/branches?per_page=100"
+            jq_filter = ".[] | {name: .name, sha: .commit.sha}"
 
-        if pattern:
-            branch_names = [name for name in branch_names if fnmatch(name, pattern)]
+        output = self._run_gh(["api", endpoint, "--paginate", "--jq", jq_filter])
 
-        # Get SHA for each branch
         branches = []
-        for name in branch_names:
+        for line in output.splitlines():
+            if not line.strip():
+                continue
             try:
-                sha_output = self._run_gh([
-                    "api",
-                    f"repos/{self.repo}/branches/{name}",
-                    "--jq", ".commit.sha"
-                ])
-                branches.append(Branch(name=name, sha=sha_output.strip()))
-            except GitHubClientError:
-                # Branch may have been deleted between listing and fetching
+                item = json.loads(line)
+            except json.JSONDecodeError:
                 continue
+            name = item.get("name") or ""
+            if name.startswith("refs/heads/"):
+                name = name[len("refs/heads/"):]
+            if pattern and not fnmatch(name, pattern):
+                continue
+            branches.append(Branch(name=name, sha=item.get("sha") or ""))
 
         return branches
 
-    def draft_release_exists(self, tag: str) -> bool:
+    def get_release_view(
+        self,
+        release_tag: Optional[str],
+        branch_prefix: str,
+        plan_path: str,
+        metadata_path: str,
+        ref: str = "main",
+    ) -> ReleaseView:
+        """
+        Fetch release-relevant artifacts in a single GraphQL request.
+
+        Collects matching tags, branches under branch_prefix (with SHA, HEAD
+        date and metadata_path content), draft releases, open PRs by head
+        branch and the plan file on ref.
+
+        Args:
+            release_tag: Tag to look up, or None to fetch tags without a filter
+            branch_prefix: Branch name prefix (e.g., "release-snapshot/")
+            plan_path: Plan file path (e.g., "release-plan.yaml")
+            metadata_path: File to read from each matching branch
+            ref: Ref to read the plan file from
+
+        Returns:
+            ReleaseView answering state-derivation lookups
+
+        Raises:
+            GitHubClientError: If the query fails
+        """
+        owner, name = self.repo.split("/", 1)
+        output = self._run_gh([
+            "api", "graphql",
+            "-f", f"query={RELEASE_VIEW_QUERY}",
+            "-f", f"owner={owner}",
+            "-f", f"name={name}",
+            "-f", f"tagQuery={release_tag or ''}",
+            "-f", f"branchPrefix=refs/heads/{branch_prefix}",
+            "-f", f"planExpression={ref}:{plan_path}",
+            "-f", f"metadataPath={metadata_path}",
+            "-F", f"first={RELEASE_VIEW_PAGE_SIZE}",
+        ])
+        try:
+            repository = json.loads(output)["data"]["repository"]
+        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            raise GitHubClientError(f"Failed to parse release view response: {e}")
+        if repository is None:
+            raise GitHubClientError(f"Repository {self.repo} not found")
+
+        def has_more(connection: dict) -> bool:
+            return bool(connection["pageInfo"]["hasNextPage"])
+
+        branches = []
+        branch_dates = {}
+        branch_files = {}
+        for node in repository["branches"]["nodes"]:
+            branch_name = f"{branch_prefix}{node['name']}"
+            target = node.get("target") or {}
+            branches.append(Branch(name=branch_name, sha=target.get("oid", "")))
+            if target.get("committedDate"):
+                branch_dates[branch_name] = target["committedDate"]
+            blob = (target.get("file") or {}).get("object") or {}
+            if "text" in blob:
+                branch_files[(branch_name, metadata_path)] = blob["text"]
+
+        plan = repository.get("plan") or {}
+        return ReleaseView(
+            tags={
+                node["name"]: (node.get("target") or {}).get("oid", "")
+                for node in repository["tags"]["nodes"]
+            },
+            branches=branches,
+            branch_dates=branch_dates,
+            branch_files=branch_files,
+            draft_tags=[
+                node["tagName"] for node in repository["releases"]["nodes"]
+                if node.get("isDraft")
+            ],
+            open_prs={
+                node["headRefName"]: node["number"]
+                for node in repository["pullRequests"]["nodes"]
+            },
+            plan_ref=ref,
+            plan_path=plan_path,
+            plan_content=plan.get("text"),
+            tags_complete=not has_more(repository["tags"]),
+            branches_complete=not has_more(repository["branches"]),
+            releases_complete=not has_more(repository["releases"]),
+            prs_complete=not has_more(repository["pullRequests"]),
+            client=self,
+        )
+
+    def draft_release_exists(self, tag: str, fresh: bool = False) -> bool:
         """
         Check if a draft release exists for the given tag.
 
+        Answered from the release index (see release_index()), unless
+        fresh is set: then the index is rebuilt from the full release
+        list, bypassing the request memo, so a poll sees drafts created
+        since the index was built wherever they are in the list.
+
         Args:
             tag: Tag name to check (e.g., "r4.1")
+            fresh: Rebuild the release index first (for polling)
 
         Returns:
             True if a draft release exists with this tag, False otherwise
+
+        Raises:
+            GitHubClientError: In fresh mode, if the releases cannot be
+                listed for another reason than 404 (so a poll fails
+                instead of reporting "no draft")
         """
+        if fresh:
+            try:
+                with self.fresh_reads():
+                    index = self.release_index(refresh=True)
+            except GitHubClientError as e:
+                error_msg = str(e).lower()
+                if "404" in error_msg or "not found" in error_msg:
+                    return False
+                raise
+            return any(r.draft for r in index.get(tag, []))
         try:
-            output = self._run_gh([
-                "api",
-                f"repos/{self.repo}/releases",
-                "--jq", f'[.[] | select(.tag_name == "{tag}" and .draft == true)] | length'
-            ])
-            return int(output.strip()) > 0
-        except (GitHubClientError, ValueError):
+            return any(r.draft for r in self.release_index().get(tag, []))
+        except GitHubClientError:
             return False
 
+    def release_index(self, refresh: bool = False) -> Dict[str, List[ReleaseRecord]]:
+        """
+        Map each tag to its releases (newest first), including drafts.
+
+        Built with one paginated iter_releases() pass the first time a
+        tag-based release lookup is made, then reused, so every further
+        lookup is a dictionary hit. Release changes made through this
+        client drop the index; call with refresh=True (or
+        invalidate_release_index()) to pick up changes made elsewhere.
+
+        Args:
+            refresh: Rebuild the index even if one exists
+
+        Returns:
+            Dict of tag name to list of ReleaseRecord
+
+        Raises:
+            GitHubClientError: If the releases cannot be listed
+        """
+        index = self._release_index
+        if index is None or refresh:
+            index = {}
+            for record in self.iter_releases(include_drafts=True, page_size=100):
+                index.setdefault(record.tag_name, []).append(record)
+            with self._lock:
+                self._release_index = index
+        return index
+
+    def invalidate_release_index(self) -> None:
+        """Drop the release index so the next lookup rebuilds it."""
+        with self._lock:
+            self._release_index = None
+
     def get_file_content(self, path: str, ref: str = "main") -> Optional[str]:
         """
         Get the content of a file from the repository.
@@ -221,6 +791,12 @@ class GitHubClient:
             Logs warnings for other errors (auth, server, etc.) but still returns None
             to maintain backward compatibility.
         """
+        sha = self._immutable_sha(ref)
+        if sha is not None:
+            found, content = self.content_cache.get(self.repo, sha, path)
+            if found:
+                return content
+
         api_path = f"repos/{self.repo}/contents/{path}?ref={ref}"
         try:
             # Use gh api to get file content
@@ -230,16 +806,71 @@ class GitHubClient:
                 api_path,
                 "-H", "Accept: application/vnd.github.raw"
             ])
-            return output
         except GitHubClientError as e:
             error_msg = str(e).lower()
             # 404 is expected when file doesn't exist - return None silently
             if "404" in error_msg or "not found" in error_msg:
+                if sha is not None:
+                    self.content_cache.put(self.repo, sha, path, None)
                 return None
             # Other errors (auth, server, rate limit) should be surfaced
             print(f"Warning: Failed to read {path} from {ref}: {e}")
             return None
 
+        if sha is not None:
+            self.content_cache.put(self.repo, sha, path, output)
+        return output
+
+    def _immutable_sha(self, ref: str) -> Optional[str]:
+        """
+        Resolve a ref to the SHA its content cache entries are keyed by.
+
+        Only refs that cannot move are resolved: full commit SHAs map to
+        themselves, release tags (rX.Y) to their tag object SHA. All
+        release tags are resolved with one listing the first time one is
+        needed in this run; the resolution is kept in memory only, so a
+        re-created tag is never served the contents of its old SHA.
+
+        Args:
+            ref: Branch, tag, or commit SHA
+
+        Returns:
+            SHA to key cached contents by, or None if the ref is mutable,
+            unknown, or no content cache is configured
+        """
+        if self.content_cache is None:
+            return None
+        if is_commit_sha(ref):
+            return ref
+        if not is_release_tag(ref):
+            return None
+
+        sha = self.content_cache.get_sha(self.repo, ref)
+        if sha is None and not self._release_tags_resolved:
+            self._release_tags_resolved = True
+            try:
+                output = self._run_gh([
+                    "api", f"repos/{self.repo}/git/matching-refs/tags/r",
+                    "--paginate",
+                    "--jq", ".[] | {name: .ref, sha: .object.sha}",
+                ])
+            except GitHubClientError:
+                return None
+            shas = {}
+            for line in output.strip().split("\n"):
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                name = entry["name"].replace("refs/tags/", "", 1)
+                if is_release_tag(name):
+                    shas[name] = entry["sha"]
+            self.content_cache.put_shas(self.repo, shas)
+            sha = shas.get(ref)
+        return sha
+
     def get_yaml_file(self, path: str, ref: str = "main") -> Optional[dict]:
         """
         Read and parse a YAML file from the repository.
@@ -251,6 +882,12 @@ class GitHubClient:
         Returns:
             Parsed YAML dict, or None if the file cannot be read or parsed
         """
+        sha = self._immutable_sha(ref)
+        if sha is not None:
+            found, parsed = self.content_cache.get_parsed(self.repo, sha, path)
+            if found:
+                return parsed
+
         content = self.get_file_content(path, ref=ref)
         if not content:
             return None
@@ -260,7 +897,10 @@ class GitHubClient:
         except yaml.YAMLError:
             return None
 
-        return parsed if isinstance(parsed, dict) else None
+        result = parsed if isinstance(parsed, dict) else None
+        if sha is not None:
+            self.content_cache.put_parsed(self.repo, sha, path, result)
+        return result
 
     def get_repository_yaml_file(
         self, repo: str, path: str, ref: str = "main"
@@ -276,28 +916,67 @@ class GitHubClient:
         Returns:
             Parsed YAML dict, or None if the file cannot be read or parsed
         """
-        client = GitHubClient(repo=repo, token=self.token)
+        client = GitHubClient(
+            repo=repo,
+            token=self.token,
+            transport=self.transport,
+            content_cache=self.content_cache,
+        )
+        # Requests go through this client, so they share its memo, lock
+        # and invalidation count (the paths name the other repository)
+        client._run_gh = self._run_gh
         return client.get_yaml_file(path, ref=ref)
 
     def get_release_metadata(self, tag: str) -> Optional[dict]:
         """Read release-metadata.yaml from a release tag or legacy asset."""
+        sha = self._immutable_sha(tag)
+        if sha is not None:
+            found, metadata = self.content_cache.get_parsed(
+                self.repo, sha, self.RELEASE_METADATA_KEY
+            )
+            if found:
+                return metadata
+
+        metadata, final = self._read_release_metadata(tag, sha)
+        # A None caused by a failed read is not cached, so it is retried
+        if sha is not None and final:
+            self.content_cache.put_parsed(self.repo, sha, self.RELEASE_METADATA_KEY, metadata)
+        return metadata
+
+    def _read_release_metadata(self, tag: str, sha: Optional[str]) -> Tuple[Optional[dict], bool]:
+        """Return (metadata, final); final is False if a read failed."""
         content = self.get_file_content("release-metadata.yaml", ref=tag)
         if content is not None:
+            return self._parse_release_metadata(content), True
+        if sha is not None and not self.content_cache.get(self.repo, sha, "release-metadata.yaml")[0]:
+            # get_file_content caches a 404 at the tag SHA, anything else failed
+            return None, False
+
+        asset_key = f"{self.RELEASE_METADATA_KEY}:asset"
+        found, content = (False, None)
+        if sha is not None:
+            found, content = self.content_cache.get(self.repo, sha, asset_key)
+        if not found:
             try:
-                metadata = yaml.safe_load(content)
-            except yaml.YAMLError:
-                return None
-            return metadata if isinstance(metadata, dict) else None
-
-        content = self.download_release_asset(tag, "release-metadata.yaml")
+                content = self._fetch_release_asset(tag, "release-metadata.yaml")
+            except GitHubClientError as e:
+                error_msg = str(e).lower()
+                if not ("no assets match" in error_msg or "not found" in error_msg or "404" in error_msg):
+                    return None, False
+                content = None
+            if content and sha is not None:
+                self.content_cache.put(self.repo, sha, asset_key, content)
         if not content:
-            return None
+            return None, True
+
+        return self._parse_release_metadata(content), True
 
+    @staticmethod
+    def _parse_release_metadata(content: str) -> Optional[dict]:
         try:
             metadata = yaml.safe_load(content)
         except yaml.YAMLError:
             return None
-
         return metadata if isinstance(metadata, dict) else None
 
     def get_releases(self, include_drafts: bool = False) -> List[Release]:
@@ -336,6 +1015,66 @@ class GitHubClient:
 
         return releases
 
+    def iter_releases(
+        self,
+        include_drafts: bool = False,
+        page_size: int = RELEASES_PAGE_SIZE,
+    ) -> Iterator[ReleaseRecord]:
+        """
+        Iterate over releases, newest first, one page at a time.
+
+        Only the fields of ReleaseRecord are requested (no bodies or
+        assets), and the next page is fetched only when the consumer
+        reaches the end of the current one, so callers that stop at the
+        first matching release usually cost a single small request.
+
+        Args:
+            include_drafts: Whether to yield draft releases
+            page_size: Releases per request (max 100)
+
+        Yields:
+            ReleaseRecord for each release
+
+        Raises:
+            GitHubClientError: If a page cannot be fetched or parsed
+        """
+        owner, name = self.repo.split("/", 1)
+        cursor = None
+        while True:
+            args = [
+                "api", "graphql",
+                "-f", f"query={RELEASES_PAGE_QUERY}",
+                "-f", f"owner={owner}",
+                "-f", f"name={name}",
+                "-F", f"first={min(page_size, 100)}",
+            ]
+            if cursor:
+                args.extend(["-f", f"after={cursor}"])
+            output = self._run_gh(args + ["--jq", ".data.repository.releases"])
+            try:
+                page = json.loads(output)
+                nodes = page["nodes"]
+                page_info = page["pageInfo"]
+            except (json.JSONDecodeError, KeyError, TypeError) as e:
+                raise GitHubClientError(f"Failed to parse releases page: {e}")
+
+            for node in nodes:
+                if node.get("isDraft") and not include_drafts:
+                    continue
+                yield ReleaseRecord(
+                    id=node.get("databaseId"),
+                    tag_name=node["tagName"],
+                    draft=bool(node.get("isDraft")),
+                    prerelease=bool(node.get("isPrerelease")),
+                    created_at=node.get("createdAt") or "",
+                    name=node.get("name") or "",
+                    html_url=node.get("url") or "",
+                )
+
+            if not page_info.get("hasNextPage") or not page_info.get("endCursor"):
+                return
+            cursor = page_info["endCursor"]
+
     def get_draft_release(self, tag: str) -> Optional[Release]:
         """Get draft release by tag name.
 
@@ -346,13 +1085,19 @@ class GitHubClient:
             Release object if found, None otherwise
         """
         try:
-            releases = self.get_releases(include_drafts=True)
-            for release in releases:
-                if release.draft and release.tag_name == tag:
-                    return release
-            return None
+            records = self.release_index().get(tag, [])
         except GitHubClientError:
             return None
+        for record in records:
+            if record.draft:
+                return Release(
+                    tag_name=record.tag_name,
+                    name=record.name,
+                    draft=record.draft,
+                    prerelease=record.prerelease,
+                    html_url=record.html_url,
+                )
+        return None
 
     def get_release_id(self, tag: str, draft_only: bool = False) -> Optional[int]:
         """Get release ID by tag name.
@@ -365,20 +1110,12 @@ class GitHubClient:
             Release ID if found, None otherwise
         """
         try:
-            jq_filter = f'.[] | select(.tag_name == "{tag}"'
-            if draft_only:
-                jq_filter += ' and .draft == true'
-            jq_filter += ') | .id'
-
-            output = self._run_gh([
-                "api",
-                f"repos/{self.repo}/releases",
-                "--jq", jq_filter
-            ])
-            if output.strip():
-                return int(output.strip())
-        except (GitHubClientError, ValueError):
-            pass
+            records = self.release_index().get(tag, [])
+        except GitHubClientError:
+            return None
+        for record in records:
+            if record.draft or not draft_only:
+                return record.id
         return None
 
     def update_release(
@@ -458,8 +1195,6 @@ class GitHubClient:
         Raises:
             GitHubClientError: If update fails
         """
-        import base64
-
         # Get current file SHA (required for update)
         try:
             file_info = self._run_gh([
@@ -471,21 +1206,21 @@ class GitHubClient:
         except GitHubClientError:
             sha = None  # File doesn't exist, will create
 
-        # Encode content as base64
-        encoded_content = base64.b64encode(content.encode()).decode()
+        # Content goes in a JSON body on stdin: as a -f field it would
+        # exceed the argument size limit for large files
+        body = {
+            "message": message,
+            "content": base64.b64encode(content.encode()).decode(),
+            "branch": branch,
+        }
+        if sha:
+            body["sha"] = sha
 
-        # Build API call
-        args = [
+        output = self._run_gh([
             "api", "-X", "PUT",
             f"repos/{self.repo}/contents/{path}",
-            "-f", f"message={message}",
-            "-f", f"content={encoded_content}",
-            "-f", f"branch={branch}"
-        ]
-        if sha:
-            args.extend(["-f", f"sha={sha}"])
-
-        output = self._run_gh(args)
+            "--input", "-"
+        ], input=json.dumps(body))
         return json.loads(output)
 
     def get_branch_creation_time(self, branch: str) -> Optional[str]:
@@ -521,13 +1256,12 @@ class GitHubClient:
         Returns:
             PR number or None if no matching PR found
         """
+        owner = self.repo.split("/")[0]
+        head = urllib.parse.quote(f"{owner}:{head_branch}", safe=":/")
         try:
             output = self._run_gh([
-                "pr", "list",
-                "--repo", self.repo,
-                "--head", head_branch,
-                "--state", "open",
-                "--json", "number",
+                "api",
+                f"repos/{self.repo}/pulls?head={head}&state=open",
                 "--jq", ".[0].number"
             ])
             return int(output.strip()) if output.strip() else None
@@ -538,32 +1272,63 @@ class GitHubClient:
     # Retry helper for eventual consistency
     # -------------------------------------------------------------------------
 
-    def retry_on_not_found(self, fn, max_retries: int = 3, delay: float = 1.0):
+    def retry_on_not_found(
+        self,
+        fn,
+        max_retries: Optional[int] = None,
+        delay: Optional[float] = None,
+        *,
+        waiter: Optional[Waiter] = None,
+    ):
         """
         Retry a callable that may fail with HTTP 404 due to GitHub API
         eventual consistency (e.g., operations on a freshly created issue).
 
         Args:
             fn: Zero-argument callable to execute
-            max_retries: Maximum number of attempts (default 3)
-            delay: Base delay in seconds between retries (multiplied by attempt number)
+            max_retries: Deprecated, pass a waiter. Attempts before giving
+                up (default 3); with delay, sets the waiter's deadline to
+                the total wait of the former linear schedule
+            delay: Deprecated, pass a waiter. First wait in seconds
+                (default 1.0)
+            waiter: Backoff and deadline for the retries (defaults to Waiter())
 
         Returns:
             The return value of fn()
 
         Raises:
-            GitHubClientError: If all retries fail or error is not a 404
+            GitHubClientError: If the error is not a 404, or the deadline
+                passes while the 404 persists
+            ValueError: If both waiter and max_retries/delay are given
         """
-        for attempt in range(max_retries):
-            try:
-                return fn()
-            except GitHubClientError as e:
-                error_msg = str(e).lower()
-                is_not_found = "404" in error_msg or "not found" in error_msg
-                if is_not_found and attempt < max_retries - 1:
-                    time.sleep(delay * (attempt + 1))
-                    continue
-                raise
+        if max_retries is not None or delay is not None:
+            if waiter is not None:
+                raise ValueError("pass either waiter or max_retries/delay, not both")
+            warnings.warn(
+                "retry_on_not_found(max_retries=, delay=) is deprecated; pass waiter=Waiter(...)",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+            max_retries = 3 if max_retries is None else max_retries
+            delay = 1.0 if delay is None else delay
+            # The former schedule waited delay, 2*delay, ... between attempts
+            waiter = Waiter(
+                initial_delay=delay,
+                deadline=delay * max_retries * (max_retries - 1) / 2,
+                jitter=0.0,
+            )
+
+        def is_not_found(error: Exception) -> bool:
+            if not isinstance(error, GitHubClientError):
+                return False
+            error_msg = str(error).lower()
+            return "404" in error_msg or "not found" in error_msg
+
+        with self.fresh_reads():
+            result = (waiter or Waiter()).until(
+                fn, done=lambda _: True, retry_on=is_not_found, description="Not found (404)"
+            )
+        return result.value
 
     # -------------------------------------------------------------------------
     # Issue Operations (added for issue_sync.py)
@@ -601,6 +1366,103 @@ class GitHubClient:
         except json.JSONDecodeError as e:
             raise GitHubClientError(f"Failed to parse issue response: {e}")
 
+    def list_issue_titles(
+        self,
+        labels: Optional[List[str]] = None,
+        state: str = "open",
+        page_size: int = 100,
+    ) -> List[dict]:
+        """
+        List issues by labels and state, with number and title only.
+
+        Pages through all matching issues (newest first). Use get_issue()
+        to read the body of the ones whose title is of interest.
+
+        Args:
+            labels: Label names the issues must all carry
+            state: Issue state ('open', 'closed', 'all')
+            page_size: Issues per request (max 100)
+
+        Returns:
+            List of {"number", "title"} dicts
+
+        Raises:
+            GitHubClientError: If a page cannot be fetched or parsed
+        """
+        owner, name = self.repo.split("/", 1)
+        base_args = [
+            "api", "graphql",
+            "-f", f"query={ISSUE_TITLES_QUERY}",
+            "-f", f"owner={owner}",
+            "-f", f"name={name}",
+            "-F", f"first={min(page_size, 100)}",
+        ]
+        for label in labels or []:
+            base_args.extend(["-f", f"labels[]={label}"])
+        for issue_state in ISSUE_STATES.get(state, ISSUE_STATES["open"]):
+            base_args.extend(["-f", f"states[]={issue_state}"])
+
+        issues = []
+        cursor = None
+        while True:
+            args = list(base_args)
+            if cursor:
+                args.extend(["-f", f"after={cursor}"])
+            output = self._run_gh(args + ["--jq", ".data.repository.issues"])
+            try:
+                page = json.loads(output)
+                nodes = page["nodes"]
+                page_info = page["pageInfo"]
+            except (json.JSONDecodeError, KeyError, TypeError) as e:
+                raise GitHubClientError(f"Failed to parse issues page: {e}")
+
+            issues.extend(
+                {"number": node["number"], "title": node.get("title") or ""}
+                for node in nodes
+            )
+            if not page_info.get("hasNextPage") or not page_info.get("endCursor"):
+                return issues
+            cursor = page_info["endCursor"]
+
+    def search_issue_numbers(
+        self,
+        text: str,
+        labels: Optional[List[str]] = None,
+        state: str = "open",
+    ) -> List[int]:
+        """
+        Find issues whose body contains a phrase (GitHub issue search).
+
+        One request, answered from the search index, which may lag
+        behind recent edits: read the hits with get_issue() before
+        relying on their body.
+
+        Args:
+            text: Phrase to search for in issue bodies
+            labels: Label names the issues must all carry
+            state: Issue state ('open', 'closed', 'all')
+
+        Returns:
+            Issue numbers of the first 100 hits
+
+        Raises:
+            GitHubClientError: If the search fails or cannot be parsed
+        """
+        terms = [f"repo:{self.repo}", "is:issue", f'"{text}"', "in:body"]
+        terms.extend(f'label:"{label}"' for label in labels or [])
+        if state in ("open", "closed"):
+            terms.append(f"state:{state}")
+        output = self._run_gh([
+            "api", "-X", "GET", "search/issues",
+            "-f", f"q={' '.join(terms)}",
+            "-F", "per_page=100",
+            "--jq", "[.items[].number]",
+        ])
+        try:
+            return [int(number) for number in json.loads(output)]
+        except (json.JSONDecodeError, TypeError, ValueError) as e:
+            raise GitHubClientError(f"Failed to parse issue search: {e}")
+
     def search_issues(
         self,
         labels: Optional[List[str]] = None,
@@ -621,7 +1483,8 @@ class GitHubClient:
             "issue", "list",
             "--repo", self.repo,
             "--state", state,
-            "--json", "number,title,body,labels,url"
+            "--json", "number,title,body,labels,url",
+            "--limit", str(ISSUE_LIST_LIMIT),
         ]
 
         if labels:
@@ -827,7 +1690,6 @@ class GitHubClient:
         Returns:
             Label dict with 'name', 'color', 'description' if found, None otherwise
         """
-        import urllib.parse
         encoded_name = urllib.parse.quote(label_name, safe='')
 
         try:
@@ -924,16 +1786,20 @@ class GitHubClient:
             Asset content as string, or None if not found/error.
         """
         try:
-            output = self._run_gh([
-                "release", "download", tag,
-                "--repo", self.repo,
-                "-p", filename,
-                "-O", "-"
-            ])
-            return output if output.strip() else None
+            return self._fetch_release_asset(tag, filename)
         except GitHubClientError:
             return None
 
+    def _fetch_release_asset(self, tag: str, filename: str) -> Optional[str]:
+        """Like download_release_asset(), but raises GitHubClientError."""
+        output = self._run_gh([
+            "release", "download", tag,
+            "--repo", self.repo,
+            "-p", filename,
+            "-O", "-"
+        ])
+        return output if output.strip() else None
+
     def generate_release_notes(
         self, tag_name: str, previous_tag_name: Optional[str] = None
     ) -> Optional[str]:
@@ -1084,6 +1950,162 @@ class GitHubClient:
                 return False
             raise
 
+    def get_branch_sha(self, branch: str) -> Optional[str]:
+        """Get the commit SHA at the head of a branch.
+
+        Args:
+            branch: Branch name (without refs/heads/)
+
+        Returns:
+            Commit SHA or None if the branch doesn't exist
+        """
+        try:
+            output = self._run_gh([
+                "api",
+                f"repos/{self.repo}/git/ref/heads/{branch}",
+                "--jq", ".object.sha"
+            ])
+            return output.strip() if output.strip() else None
+        except GitHubClientError:
+            return None
+
+    def get_tree(self, sha: str) -> Tuple[str, List[Dict[str, Any]]]:
+        """Read a tree recursively (Git Data API).
+
+        Args:
+            sha: Tree or commit SHA
+
+        Returns:
+            Tuple of (tree SHA, entries with path, mode, type, sha and size)
+
+        Raises:
+            GitHubClientError: If the tree cannot be read or is too large to
+                be listed in one response
+        """
+        output = self._run_gh([
+            "api",
+            f"repos/{self.repo}/git/trees/{sha}?recursive=1",
+        ])
+        try:
+            data = json.loads(output)
+        except json.JSONDecodeError as e:
+            raise GitHubClientError(f"Failed to parse tree {sha}: {e}")
+        if data.get("truncated"):
+            raise GitHubClientError(f"Tree {sha} of {self.repo} is too large to list")
+        return data["sha"], data.get("tree", [])
+
+    def get_blob(self, sha: str) -> bytes:
+        """Read a blob (Git Data API).
+
+        Args:
+            sha: Blob SHA
+
+        Returns:
+            Blob content
+
+        Raises:
+            GitHubClientError: If the blob cannot be read
+        """
+        output = self._run_gh([
+            "api",
+            f"repos/{self.repo}/git/blobs/{sha}",
+            "--jq", ".content"
+        ])
+        return base64.b64decode(output)
+
+    def create_blob(self, content: bytes) -> str:
+        """Create a blob (Git Data API).
+
+        Args:
+            content: Blob content
+
+        Returns:
+            SHA of the new blob
+
+        Raises:
+            GitHubClientError: If creation fails
+        """
+        body = {"content": base64.b64encode(content).decode("ascii"), "encoding": "base64"}
+        output = self._run_gh([
+            "api",
+            f"repos/{self.repo}/git/blobs",
+            "-X", "POST",
+            "--input", "-",
+            "--jq", ".sha"
+        ], input=json.dumps(body))
+        return output.strip()
+
+    def create_tree(self, base_tree: str, entries: List[Dict[str, Any]]) -> str:
+        """Create a tree on top of a base tree (Git Data API).
+
+        Args:
+            base_tree: SHA of the tree the entries are applied to
+            entries: Dicts with path, mode and sha; sha None deletes the path
+
+        Returns:
+            SHA of the new tree
+
+        Raises:
+            GitHubClientError: If creation fails
+        """
+        args = [
+            "api",
+            f"repos/{self.repo}/git/trees",
+            "-X", "POST",
+            "-f", f"base_tree={base_tree}",
+        ]
+        for entry in entries:
+            args.extend([
+                "-f", f"tree[][path]={entry['path']}",
+                "-f", f"tree[][mode]={entry.get('mode', '100644')}",
+                "-f", "tree[][type]=blob",
+            ])
+            if entry.get("sha"):
+                args.extend(["-f", f"tree[][sha]={entry['sha']}"])
+            else:
+                args.extend(["-F", "tree[][sha]=null"])
+        args.extend(["--jq", ".sha"])
+        return self._run_gh(args).strip()
+
+    def create_commit(
+        self,
+        message: str,
+        tree: str,
+        parents: List[str],
+        author: Optional[Dict[str, str]] = None,
+    ) -> str:
+        """Create a commit (Git Data API).
+
+        Args:
+            message: Commit message
+            tree: SHA of the commit's tree
+            parents: Parent commit SHAs
+            author: Optional {"name", "email"}, used as author and committer
+
+        Returns:
+            SHA of the new commit
+
+        Raises:
+            GitHubClientError: If creation fails
+        """
+        args = [
+            "api",
+            f"repos/{self.repo}/git/commits",
+            "-X", "POST",
+            "-f", f"message={message}",
+            "-f", f"tree={tree}",
+        ]
+        for parent in parents:
+            args.extend(["-f", f"parents[]={parent}"])
+        if author:
+            for role in ("author", "committer"):
+                args.extend([
+                    "-f", f"{role}[name]={author['name']}",
+                    "-f", f"{role}[email]={author['email']}",
+                ])
+        args.extend(["--jq", ".sha"])
+        return self._run_gh(args).strip()
+
     def close_issue(
         self,
         issue_number: int,
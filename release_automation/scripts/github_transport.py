@@ -0,0 +1,971 @@
+"""
+Transports for the GitHub API client.
+
+GitHubClient builds every request as a `gh` command line (e.g.
+["api", "repos/o/r/git/refs/tags/r4.1", "--jq", ".ref"]). A transport
+executes such a command and returns what `gh` would have printed:
+
+- GhCliTransport forks the `gh` CLI for every call (original behavior).
+- HttpTransport answers `gh api` commands in-process over a persistent
+  keep-alive HTTPS connection using the same token, and hands every
+  other command (`gh pr`, `gh issue`, `gh release`, ...) to the CLI.
+  With a ResponseCache it revalidates GET responses with conditional
+  requests (ETag / Last-Modified) instead of downloading them again;
+  with a RateLimiter it paces requests and retries rate-limited ones.
+
+Keeping the command-line contract means callers and tests that work
+with `GitHubClient._run_gh` are unaffected by the choice of transport.
+"""
+
+import hashlib
+import http.client
+import json
+import os
+import re
+import subprocess
+import tempfile
+import threading
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlencode, urlsplit
+
+from .profiling import record_api_call
+from .rate_limiter import RateLimiter
+
+
+DEFAULT_API_URL = "https://api.github.com"
+DEFAULT_ACCEPT = "application/vnd.github+json"
+API_VERSION = "2022-11-28"
+USER_AGENT = "camara-release-automation"
+
+# Environment variable selecting the transport ("http" or "gh")
+TRANSPORT_ENV = "GITHUB_CLIENT_TRANSPORT"
+
+# Environment variable enabling the on-disk response cache (directory path)
+CACHE_DIR_ENV = "GITHUB_CLIENT_CACHE_DIR"
+
+
+class TransportError(Exception):
+    """Raised when a transport fails to execute a command."""
+    pass
+
+
+class UnsupportedCommandError(TransportError):
+    """Raised when a transport cannot execute a command in-process."""
+    pass
+
+
+class GitHubTransport:
+    """Interface for executing `gh`-style commands."""
+
+    def run(self, args: List[str], check: bool = True, input: Optional[str] = None) -> str:
+        """
+        Execute a command and return its output.
+
+        Args:
+            args: Command arguments (without 'gh')
+            check: Whether to raise on failure
+            input: Standard input (the request body for `--input -`)
+
+        Returns:
+            Output as `gh` would print it
+
+        Raises:
+            TransportError: If the command fails and check=True
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release any held resources."""
+        pass
+
+
+class GhCliTransport(GitHubTransport):
+    """Runs every command through a `gh` CLI subprocess."""
+
+    def __init__(self, token: Optional[str] = None):
+        """
+        Initialize the CLI transport.
+
+        Args:
+            token: Optional GitHub token (uses gh CLI auth if not provided)
+        """
+        self.token = token
+
+    def run(self, args: List[str], check: bool = True, input: Optional[str] = None) -> str:
+        cmd = ["gh"] + args
+        if self.token:
+            # Extend environment with GH_TOKEN, don't replace it
+            env = {**os.environ, "GH_TOKEN": self.token}
+        else:
+            env = None
+
+        sent = sum(len(a) for a in args) + len(input or "")
+        try:
+            result = subprocess.run(
+                cmd,
+                input=input,
+                capture_output=True,
+                text=True,
+                check=check,
+                env=env
+            )
+            record_api_call(sent, len(result.stdout))
+            return result.stdout
+        except subprocess.CalledProcessError as e:
+            record_api_call(sent, len(e.stderr or ""))
+            raise TransportError(f"gh command failed: {e.stderr}")
+        except OSError as e:
+            # gh missing, or the arguments exceed the OS limit (E2BIG)
+            raise TransportError(f"gh command could not be run: {e}")
+
+
+class HttpResponse:
+    """Status, headers and decoded body of an HTTP response."""
+
+    def __init__(self, status: int, headers: Dict[str, str], body: str):
+        self.status = status
+        # Header names are case-insensitive; normalize to lower case
+        self.headers = {k.lower(): v for k, v in headers.items()}
+        self.body = body
+
+    def json(self) -> Any:
+        return json.loads(self.body) if self.body.strip() else None
+
+
+class ResponseCache:
+    """
+    On-disk store of GET responses for conditional requests.
+
+    Each entry keeps the validators (ETag, Last-Modified) together with
+    the response, one JSON file per URL and Accept header. HttpTransport
+    replays the validators as If-None-Match / If-Modified-Since and
+    serves the stored response on 304 Not Modified, which GitHub does
+    not count against the rate limit.
+
+    Entries are only ever served after GitHub answered 304 for the
+    current token, so a cache restored from an earlier run (e.g. via
+    actions/cache) never exposes data the token could not read itself.
+    """
+
+    def __init__(self, directory: str):
+        """
+        Initialize the cache.
+
+        Args:
+            directory: Directory holding the entries (created on demand)
+        """
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(url: str, accept: str) -> str:
+        return hashlib.sha256(f"{accept} {url}".encode()).hexdigest()
+
+    def _path(self, url: str, accept: str) -> str:
+        return os.path.join(self.directory, f"{self._key(url, accept)}.json")
+
+    def get(self, url: str, accept: str) -> Optional[Dict[str, Any]]:
+        """
+        Load the entry for a URL, or None if there is no usable entry.
+
+        Args:
+            url: Absolute request URL
+            accept: Accept header of the request
+
+        Returns:
+            Dict with etag, last_modified, status, headers and body
+        """
+        try:
+            with open(self._path(url, accept), encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or entry.get("url") != url:
+            return None
+        return entry
+
+    def put(self, url: str, accept: str, response: HttpResponse) -> None:
+        """
+        Store a response if it carries a validator.
+
+        Write failures are ignored; the cache is an optimization only.
+
+        Args:
+            url: Absolute request URL
+            accept: Accept header of the request
+            response: Successful response to store
+        """
+        etag = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+        if not etag and not last_modified:
+            return
+        entry = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "status": response.status,
+            "headers": response.headers,
+            "body": response.body,
+        }
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, self._path(url, accept))
+        except OSError:
+            pass
+
+
+class HttpTransport(GitHubTransport):
+    """
+    Executes `gh api` commands over a persistent HTTP connection.
+
+    The connection is opened lazily (one per thread) and reused for all
+    requests (HTTP/1.1 keep-alive), so a run pays one TLS handshake
+    instead of one process spawn and handshake per call. Commands other than
+    `gh api` are delegated to the fallback transport.
+
+    With a ResponseCache, GET requests are sent as conditional requests
+    and a 304 Not Modified is answered from the cache. With a
+    RateLimiter, every request waits for its turn and rate-limited
+    responses (403/429 with Retry-After, an exhausted budget or the
+    secondary rate limit message) are retried.
+    """
+
+    MAX_REDIRECTS = 3
+
+    def __init__(
+        self,
+        token: Optional[str],
+        api_url: str = DEFAULT_API_URL,
+        fallback: Optional[GitHubTransport] = None,
+        timeout: float = 30.0,
+        cache: Optional[ResponseCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        """
+        Initialize the HTTP transport.
+
+        Args:
+            token: GitHub token sent as bearer authorization
+            api_url: Base URL of the REST API (GITHUB_API_URL on Actions)
+            fallback: Transport for commands not handled in-process
+                (defaults to GhCliTransport with the same token)
+            timeout: Socket timeout in seconds
+            cache: Optional response cache for conditional GET requests
+            rate_limiter: Optional scheduler for rate-limit-aware pacing
+        """
+        self.token = token
+        self.api_url = api_url.rstrip("/")
+        self.fallback = fallback if fallback is not None else GhCliTransport(token)
+        self.timeout = timeout
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+
+        parts = urlsplit(self.api_url)
+        self._scheme = parts.scheme or "https"
+        self._netloc = parts.netloc
+        self._base_path = parts.path.rstrip("/")
+        # One keep-alive connection per thread, so clients can be used
+        # from worker threads (see async_github_client)
+        self._local = threading.local()
+        self._open_connections: List[http.client.HTTPConnection] = []
+        self._connections_lock = threading.Lock()
+
+    # -------------------------------------------------------------------------
+    # Command execution
+    # -------------------------------------------------------------------------
+
+    def run(self, args: List[str], check: bool = True, input: Optional[str] = None) -> str:
+        if not args or args[0] != "api":
+            return self.fallback.run(args, check=check, input=input)
+
+        try:
+            request = _parse_api_args(args[1:])
+            jq_filter = _compile_jq(request["jq"]) if request["jq"] else None
+        except UnsupportedCommandError:
+            return self.fallback.run(args, check=check, input=input)
+        if request["input"]:
+            request["body"] = input or ""
+
+        try:
+            return self._execute(request, jq_filter)
+        except TransportError:
+            if check:
+                raise
+            return ""
+
+    def _execute(self, request: Dict[str, Any], jq_filter) -> str:
+        method = request["method"]
+        headers = request["headers"]
+        fields = request["fields"]
+        endpoint = request["endpoint"]
+
+        if "body" in request:
+            # --input: the body is sent as given, fields go to the query
+            path = _api_path(endpoint)
+            if fields:
+                separator = "&" if "?" in path else "?"
+                path = f"{path}{separator}{urlencode(fields, doseq=True)}"
+            body = request["body"]
+        elif endpoint == "graphql":
+            path = "/graphql"
+            query = fields.pop("query", "")
+            body = json.dumps({"query": query, "variables": fields})
+            method = "POST"
+        elif method in ("GET", "HEAD"):
+            path = _api_path(endpoint)
+            if fields:
+                separator = "&" if "?" in path else "?"
+                path = f"{path}{separator}{urlencode(fields, doseq=True)}"
+            body = None
+        else:
+            path = _api_path(endpoint)
+            body = json.dumps(fields) if fields else None
+
+        outputs = []
+        while path:
+            response = self.request(method, path, body=body, headers=headers)
+            self._raise_for_status(response, graphql=endpoint == "graphql")
+
+            if jq_filter is not None:
+                outputs.append(_format_jq_output(jq_filter(response.json())))
+            else:
+                outputs.append(response.body)
+
+            path = _next_link(response.headers.get("link", "")) if request["paginate"] else None
+
+        return "".join(outputs)
+
+    @staticmethod
+    def _raise_for_status(response: HttpResponse, graphql: bool = False) -> None:
+        if response.status >= 400:
+            raise TransportError(
+                f"GitHub API request failed: {_error_message(response)} "
+                f"(HTTP {response.status})"
+            )
+        if graphql:
+            data = response.json() or {}
+            errors = data.get("errors") if isinstance(data, dict) else None
+            if errors:
+                messages = "; ".join(e.get("message", "") for e in errors)
+                raise TransportError(f"GitHub GraphQL request failed: {messages}")
+
+    # -------------------------------------------------------------------------
+    # HTTP
+    # -------------------------------------------------------------------------
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        body: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> HttpResponse:
+        """
+        Send one request on the pooled connection, following redirects.
+
+        Args:
+            method: HTTP method
+            path: Path relative to the API base URL, or an absolute URL
+            body: Optional request body (JSON string)
+            headers: Extra request headers
+
+        Returns:
+            HttpResponse with status, headers and body
+
+        Raises:
+            TransportError: On connection failures
+        """
+        request_headers = {
+            "Accept": DEFAULT_ACCEPT,
+            "User-Agent": USER_AGENT,
+            "X-GitHub-Api-Version": API_VERSION,
+        }
+        if self.token:
+            request_headers["Authorization"] = f"Bearer {self.token}"
+        if body is not None:
+            request_headers["Content-Type"] = "application/json"
+        request_headers.update(headers or {})
+
+        if method == "GET" and self.cache is not None:
+            return self._conditional_get(path, request_headers)
+        return self._limited(method, path, body, request_headers)
+
+    def _conditional_get(self, path: str, headers: Dict[str, str]) -> HttpResponse:
+        url = path if urlsplit(path).netloc else f"{self.api_url}{path}"
+        accept = headers.get("Accept", DEFAULT_ACCEPT)
+        entry = self.cache.get(url, accept)
+        if entry:
+            if entry.get("etag"):
+                headers = {**headers, "If-None-Match": entry["etag"]}
+            if entry.get("last_modified"):
+                headers = {**headers, "If-Modified-Since": entry["last_modified"]}
+
+        response = self._limited("GET", path, None, headers)
+        if response.status == 304 and entry:
+            self.cache.hits += 1
+            return HttpResponse(entry["status"], entry["headers"], entry["body"])
+
+        self.cache.misses += 1
+        if response.status == 200:
+            self.cache.put(url, accept, response)
+        return response
+
+    def _limited(
+        self,
+        method: str,
+        path: str,
+        body: Optional[str],
+        headers: Dict[str, str],
+    ) -> HttpResponse:
+        if self.rate_limiter is None:
+            return self._follow(method, path, body, dict(headers))
+
+        resource = "graphql" if urlsplit(path).path.endswith("/graphql") else "core"
+        attempt = 0
+        while True:
+            self.rate_limiter.acquire(method, resource)
+            response = self._follow(method, path, body, dict(headers))
+            self.rate_limiter.update(response.headers)
+            delay = self.rate_limiter.retry_delay(
+                response.status, response.headers, response.body, attempt
+            )
+            if delay is None:
+                return response
+            print(f"GitHub API rate limit hit; retrying in {delay:.0f}s")
+            self.rate_limiter.sleep(delay)
+            attempt += 1
+
+    def _follow(
+        self,
+        method: str,
+        path: str,
+        body: Optional[str],
+        request_headers: Dict[str, str],
+    ) -> HttpResponse:
+        url = path
+        for _ in range(self.MAX_REDIRECTS + 1):
+            response = self._send(method, url, body, request_headers)
+            record_api_call(len(body or ""), len(response.body or ""))
+            if response.status not in (301, 302, 307, 308) or "location" not in response.headers:
+                return response
+            url = response.headers["location"]
+            if urlsplit(url).netloc not in ("", self._netloc):
+                # Never forward credentials to another host (e.g. asset storage)
+                request_headers.pop("Authorization", None)
+        return response
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        body: Optional[str],
+        headers: Dict[str, str],
+    ) -> HttpResponse:
+        parts = urlsplit(url)
+        if parts.netloc and parts.netloc != self._netloc:
+            conn = self._new_connection(parts.scheme, parts.netloc)
+            target = parts.path + (f"?{parts.query}" if parts.query else "")
+            try:
+                return self._roundtrip(conn, method, target, body, headers)
+            finally:
+                conn.close()
+
+        if parts.netloc:
+            target = parts.path + (f"?{parts.query}" if parts.query else "")
+        else:
+            target = f"{self._base_path}{url}"
+
+        # A pooled connection may have been closed by the server while idle;
+        # retry once on a fresh connection before giving up.
+        for attempt in range(2):
+            conn = self._connection()
+            try:
+                return self._roundtrip(conn, method, target, body, headers)
+            except (http.client.HTTPException, ConnectionError, OSError) as e:
+                self._reset_connection()
+                if attempt == 1:
+                    raise TransportError(f"GitHub API request failed: {e}")
+
+    @staticmethod
+    def _roundtrip(conn, method, target, body, headers) -> HttpResponse:
+        conn.request(method, target, body=body.encode() if body is not None else None, headers=headers)
+        raw = conn.getresponse()
+        data = raw.read()
+        return HttpResponse(
+            raw.status,
+            dict(raw.getheaders()),
+            data.decode("utf-8", errors="replace"),
+        )
+
+    def _connection(self) -> http.client.HTTPConnection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._new_connection(self._scheme, self._netloc)
+            self._local.conn = conn
+            with self._connections_lock:
+                self._open_connections.append(conn)
+        return conn
+
+    def _new_connection(self, scheme: str, netloc: str) -> http.client.HTTPConnection:
+        if scheme == "http":
+            return http.client.HTTPConnection(netloc, timeout=self.timeout)
+        return http.client.HTTPSConnection(netloc, timeout=self.timeout)
+
+    def _reset_connection(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+            with self._connections_lock:
+                self._open_connections.remove(conn)
+
+    def close(self) -> None:
+        with self._connections_lock:
+            connections, self._open_connections = self._open_connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
+        self.fallback.close()
+
+
+def create_transport(
+    token: Optional[str],
+    kind: Optional[str] = None,
+    cache_dir: Optional[str] = None,
+) -> GitHubTransport:
+    """
+    Create the transport for a GitHubClient.
+
+    The in-process HTTP transport is used when a token is available,
+    because it cannot use the gh CLI's stored credentials. Set
+    GITHUB_CLIENT_TRANSPORT=gh to force the CLI for every call.
+
+    The response cache is opt-in: pass cache_dir or set
+    GITHUB_CLIENT_CACHE_DIR to enable conditional GET requests. Requests
+    are paced by the RateLimiter shared by all clients using the token.
+
+    Args:
+        token: Optional GitHub token
+        kind: "http" or "gh" (defaults to GITHUB_CLIENT_TRANSPORT)
+        cache_dir: Optional response cache directory
+            (defaults to GITHUB_CLIENT_CACHE_DIR)
+
+    Returns:
+        GitHubTransport instance
+    """
+    kind = (kind or os.environ.get(TRANSPORT_ENV, "")).strip().lower()
+    if kind == "gh" or not token:
+        return GhCliTransport(token)
+    api_url = os.environ.get("GITHUB_API_URL") or DEFAULT_API_URL
+    cache_dir = cache_dir or os.environ.get(CACHE_DIR_ENV)
+    cache = ResponseCache(cache_dir) if cache_dir else None
+    return HttpTransport(
+        token,
+        api_url=api_url,
+        cache=cache,
+        rate_limiter=RateLimiter.for_token(token),
+    )
+
+
+# -----------------------------------------------------------------------------
+# `gh api` argument handling
+# -----------------------------------------------------------------------------
+
+def _parse_api_args(args: List[str]) -> Dict[str, Any]:
+    """Parse `gh api` arguments into a request description."""
+    request: Dict[str, Any] = {
+        "endpoint": None,
+        "method": None,
+        "fields": {},
+        "headers": {},
+        "paginate": False,
+        "jq": None,
+        "input": False,
+    }
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg in ("-X", "--method"):
+            request["method"] = args[i + 1].upper()
+            i += 2
+        elif arg in ("-f", "--raw-field", "-F", "--field"):
+            key, _, value = args[i + 1].partition("=")
+            typed = arg in ("-F", "--field")
+            if typed and value.startswith("@"):
+                raise UnsupportedCommandError("file fields are not supported")
+            _add_field(request["fields"], key, _typed_value(value) if typed else value)
+            i += 2
+        elif arg in ("-H", "--header"):
+            name, _, value = args[i + 1].partition(":")
+            request["headers"][name.strip()] = value.strip()
+            i += 2
+        elif arg in ("-q", "--jq"):
+            request["jq"] = args[i + 1]
+            i += 2
+        elif arg == "--paginate":
+            request["paginate"] = True
+            i += 1
+        elif arg == "--input":
+            if args[i + 1] != "-":
+                raise UnsupportedCommandError("file input is not supported")
+            request["input"] = True
+            i += 2
+        elif arg.startswith("-"):
+            raise UnsupportedCommandError(f"unsupported gh api flag: {arg}")
+        elif request["endpoint"] is None:
+            request["endpoint"] = arg
+            i += 1
+        else:
+            raise UnsupportedCommandError(f"unexpected argument: {arg}")
+
+    if request["endpoint"] is None:
+        raise UnsupportedCommandError("missing endpoint")
+    if request["method"] is None:
+        # gh defaults to POST when fields or a body are given
+        request["method"] = "POST" if request["fields"] or request["input"] else "GET"
+    return request
+
+
+def _add_field(fields: Dict[str, Any], key: str, value: Any) -> None:
+    """Add a field the way gh nests them: a[]=, a[b]=, a[][b]=."""
+    match = re.fullmatch(r"([^\[\]]+)((?:\[[^\[\]]*\])+)", key)
+    if not match:
+        fields[key] = value
+        return
+    _set_nested(fields, [match.group(1)] + re.findall(r"\[([^\[\]]*)\]", match.group(2)), value)
+
+
+def _set_nested(container: Dict[str, Any], keys: List[str], value: Any) -> None:
+    key, rest = keys[0], keys[1:]
+    if not rest:
+        container[key] = value
+    elif rest[0]:
+        _set_nested(container.setdefault(key, {}), rest, value)
+    elif len(rest) == 1:
+        container.setdefault(key, []).append(value)
+    else:
+        # Array of objects: a repeated key starts the next object
+        items = container.setdefault(key, [])
+        if not items or not isinstance(items[-1], dict) or rest[1] in items[-1]:
+            items.append({})
+        _set_nested(items[-1], rest[1:], value)
+
+
+def _typed_value(value: str) -> Any:
+    """Convert a -F value the way gh does (booleans, null, integers)."""
+    if value in ("true", "false"):
+        return value == "true"
+    if value == "null":
+        return None
+    if re.fullmatch(r"-?\d+", value):
+        return int(value)
+    return value
+
+
+def _api_path(endpoint: str) -> str:
+    if endpoint.startswith(("http://", "https://")):
+        return endpoint
+    return "/" + endpoint.lstrip("/")
+
+
+def _next_link(link_header: str) -> Optional[str]:
+    for part in link_header.split(","):
+        match = re.match(r'\s*<([^>]+)>\s*;\s*rel="next"', part)
+        if match:
+            return match.group(1)
+    return None
+
+
+def _error_message(response: HttpResponse) -> str:
+    try:
+        data = response.json()
+    except ValueError:
+        return response.body.strip() or "request failed"
+    if not isinstance(data, dict):
+        return "request failed"
+    message = data.get("message", "request failed")
+    details = [
+        e.get("message") or e.get("code", "")
+        for e in data.get("errors", []) or []
+        if isinstance(e, dict)
+    ]
+    if details:
+        message = f"{message}: {', '.join(d for d in details if d)}"
+    return message
+
+
+# -----------------------------------------------------------------------------
+# Minimal jq evaluator
+#
+# Supports the filter subset used by GitHubClient: paths (.a.b, .[], .[0]),
+# pipes, array/object construction, select(), length, `and`/`or`, == and !=.
+# Anything else raises UnsupportedCommandError so the command falls back to
+# the gh CLI.
+# -----------------------------------------------------------------------------
+
+JqFilter = Callable[[Any], Iterator[Any]]
+
+_JQ_TOKEN = re.compile(
+    r'\s*(?:(?P<string>"(?:[^"\\]|\\.)*")|(?P<number>-?\d+)'
+    r'|(?P<ident>[A-Za-z_][A-Za-z0-9_]*)|(?P<op>==|!=|[.|,:\[\]{}()]))'
+)
+
+
+def _tokenize(source: str) -> List[Tuple[str, Any]]:
+    tokens = []
+    pos = 0
+    source = source.strip()
+    while pos < len(source):
+        match = _JQ_TOKEN.match(source, pos)
+        if not match:
+            raise UnsupportedCommandError(f"unsupported jq filter: {source}")
+        kind = match.lastgroup
+        text = match.group(kind)
+        if kind == "string":
+            if "\\(" in text:
+                raise UnsupportedCommandError("jq string interpolation is not supported")
+            tokens.append(("value", json.loads(text)))
+        elif kind == "number":
+            tokens.append(("value", int(text)))
+        else:
+            tokens.append((kind, text))
+        pos = match.end()
+    return tokens
+
+
+class _JqParser:
+    """Recursive-descent parser turning a jq filter into a generator function."""
+
+    def __init__(self, source: str):
+        self.tokens = _tokenize(source)
+        self.pos = 0
+
+    def parse(self) -> JqFilter:
+        node = self._pipe()
+        if self.pos != len(self.tokens):
+            raise UnsupportedCommandError("unsupported jq filter")
+        return node
+
+    def _peek(self, offset: int = 0) -> Tuple[Optional[str], Any]:
+        index = self.pos + offset
+        return self.tokens[index] if index < len(self.tokens) else (None, None)
+
+    def _accept(self, text: str) -> bool:
+        kind, value = self._peek()
+        if kind in ("op", "ident") and value == text:
+            self.pos += 1
+            return True
+        return False
+
+    def _expect(self, text: str) -> None:
+        if not self._accept(text):
+            raise UnsupportedCommandError(f"expected '{text}' in jq filter")
+
+    def _pipe(self) -> JqFilter:
+        left = self._comma()
+        while self._accept("|"):
+            right = self._comma()
+            left = _jq_pipe(left, right)
+        return left
+
+    def _comma(self) -> JqFilter:
+        parts = [self._or()]
+        while self._accept(","):
+            parts.append(self._or())
+        if len(parts) == 1:
+            return parts[0]
+        return lambda v: (out for part in parts for out in part(v))
+
+    def _or(self) -> JqFilter:
+        left = self._and()
+        while self._accept("or"):
+            left = _jq_binary(left, self._and(), lambda a, b: _truthy(a) or _truthy(b))
+        return left
+
+    def _and(self) -> JqFilter:
+        left = self._compare()
+        while self._accept("and"):
+            left = _jq_binary(left, self._compare(), lambda a, b: _truthy(a) and _truthy(b))
+        return left
+
+    def _compare(self) -> JqFilter:
+        left = self._postfix()
+        if self._accept("=="):
+            return _jq_binary(left, self._postfix(), lambda a, b: a == b)
+        if self._accept("!="):
+            return _jq_binary(left, self._postfix(), lambda a, b: a != b)
+        return left
+
+    def _postfix(self) -> JqFilter:
+        node = self._primary()
+        while True:
+            kind, value = self._peek()
+            next_kind, _ = self._peek(1)
+            if kind == "op" and value == "." and next_kind == "ident":
+                self.pos += 1
+                node = _jq_pipe(node, _jq_field(self.tokens[self.pos][1]))
+                self.pos += 1
+            elif kind == "op" and value == "." and self._peek(1) == ("op", "["):
+                self.pos += 1
+            elif kind == "op" and value == "[":
+                node = _jq_pipe(node, self._brackets())
+            else:
+                return node
+
+    def _brackets(self) -> JqFilter:
+        self._expect("[")
+        if self._accept("]"):
+            return _jq_iterate
+        kind, value = self._peek()
+        if kind != "value" or not isinstance(value, int):
+            raise UnsupportedCommandError("unsupported jq index")
+        self.pos += 1
+        self._expect("]")
+        return _jq_index(value)
+
+    def _primary(self) -> JqFilter:
+        kind, value = self._peek()
+        if kind == "op" and value == ".":
+            self.pos += 1
+            next_kind, next_value = self._peek()
+            if next_kind == "ident":
+                self.pos += 1
+                return _jq_field(next_value)
+            if next_kind == "op" and next_value == "[":
+                return self._brackets()
+            return lambda v: iter([v])
+        if kind == "value":
+            self.pos += 1
+            return lambda v, c=value: iter([c])
+        if kind == "op" and value == "(":
+            self.pos += 1
+            node = self._pipe()
+            self._expect(")")
+            return node
+        if kind == "op" and value == "[":
+            self.pos += 1
+            if self._accept("]"):
+                return lambda v: iter([[]])
+            inner = self._pipe()
+            self._expect("]")
+            return lambda v: iter([list(inner(v))])
+        if kind == "op" and value == "{":
+            self.pos += 1
+            return self._object()
+        if kind == "ident":
+            self.pos += 1
+            if value in ("true", "false", "null"):
+                constant = {"true": True, "false": False, "null": None}[value]
+                return lambda v: iter([constant])
+            if value == "length":
+                return lambda v: iter([_jq_length(v)])
+            if value == "not":
+                return lambda v: iter([not _truthy(v)])
+            if value == "select":
+                self._expect("(")
+                condition = self._pipe()
+                self._expect(")")
+                return lambda v: (v for c in condition(v) if _truthy(c))
+        raise UnsupportedCommandError("unsupported jq filter")
+
+    def _object(self) -> JqFilter:
+        entries: List[Tuple[str, JqFilter]] = []
+        while not self._accept("}"):
+            kind, key = self._peek()
+            if kind not in ("ident", "value") or not isinstance(key, str):
+                raise UnsupportedCommandError("unsupported jq object key")
+            self.pos += 1
+            if self._accept(":"):
+                entries.append((key, self._or()))
+            else:
+                entries.append((key, _jq_field(key)))
+            if not self._accept(","):
+                self._expect("}")
+                break
+
+        def build(v):
+            results = [{}]
+            for key, value_filter in entries:
+                results = [
+                    {**partial, key: out}
+                    for partial in results
+                    for out in value_filter(v)
+                ]
+            return iter(results)
+        return build
+
+
+def _truthy(value: Any) -> bool:
+    return value is not None and value is not False
+
+
+def _jq_pipe(left: JqFilter, right: JqFilter) -> JqFilter:
+    return lambda v: (out for mid in left(v) for out in right(mid))
+
+
+def _jq_binary(left: JqFilter, right: JqFilter, op) -> JqFilter:
+    return lambda v: (op(a, b) for b in right(v) for a in left(v))
+
+
+def _jq_field(name: str) -> JqFilter:
+    def field(v):
+        if v is None:
+            return iter([None])
+        if not isinstance(v, dict):
+            raise TransportError(f"jq: cannot index {type(v).__name__} with \"{name}\"")
+        return iter([v.get(name)])
+    return field
+
+
+def _jq_index(index: int) -> JqFilter:
+    def item(v):
+        if v is None:
+            return iter([None])
+        if not isinstance(v, list):
+            raise TransportError(f"jq: cannot index {type(v).__name__} with number")
+        try:
+            return iter([v[index]])
+        except IndexError:
+            return iter([None])
+    return item
+
+
+def _jq_iterate(v: Any) -> Iterator[Any]:
+    if isinstance(v, list):
+        return iter(v)
+    if isinstance(v, dict):
+        return iter(v.values())
+    raise TransportError(f"jq: cannot iterate over {type(v).__name__ if v is not None else 'null'}")
+
+
+def _jq_length(v: Any) -> int:
+    if v is None:
+        return 0
+    if isinstance(v, (list, dict, str)):
+        return len(v)
+    if isinstance(v, (int, float)) and not isinstance(v, bool):
+        return abs(v)
+    raise TransportError("jq: value has no length")
+
+
+def _compile_jq(source: str) -> JqFilter:
+    return _JqParser(source).parse()
+
+
+def _format_jq_output(values: Iterator[Any]) -> str:
+    """Print jq results the way gh does: raw strings, compact JSON otherwise."""
+    lines = []
+    for value in values:
+        if value is None:
+            lines.append("")
+        elif isinstance(value, bool):
+            lines.append("true" if value else "false")
+        elif isinstance(value, (str, int, float)):
+            lines.append(str(value))
+        else:
+            lines.append(json.dumps(value, separators=(",", ":"), ensure_ascii=False))
+    return "".join(f"{line}\n" for line in lines)
@@ -7,8 +7,10 @@ artifacts.
 """
 
 from dataclasses import dataclass
+from functools import partial
 from typing import Any, Dict, List, Optional
 
+from .async_github_client import run_parallel
 from .github_client import GitHubClient
 from .state_manager import ReleaseState, ReleaseStateManager
 from .issue_manager import IssueManager
@@ -98,12 +100,18 @@ class IssueSyncManager:
         if self._labels_ensured:
             return []
 
-        created = []
-        for name, color, description in REQUIRED_LABELS:
-            existing = self.gh.get_label(name)
-            if existing is None:
-                self.gh.create_label(name, color, description)
-                created.append(name)
+        # Label lookups (and creations) are independent: run them concurrently
+        existing = run_parallel(
+            partial(self.gh.get_label, name) for name, _, _ in REQUIRED_LABELS
+        )
+        missing = [
+            label for label, found in zip(REQUIRED_LABELS, existing) if found is None
+        ]
+        run_parallel(
+            partial(self.gh.create_label, name, color, description)
+            for name, color, description in missing
+        )
+        created = [name for name, _, _ in missing]
 
         self._labels_ensured = True
         return created
@@ -207,23 +215,48 @@ class IssueSyncManager:
         """
         Find an existing workflow-owned issue for the given release.
 
-        Searches for open issues with the 'release-issue' label, then
-        filters to find one that:
-        1. Contains the WORKFLOW_MARKER in its body
-        2. Contains the release-tag marker in its body
+        Lists the open issues with the 'release-issue' label (number and
+        title only) and reads the body of those whose title contains the
+        release tag. Only if none of them is the one (e.g., the title was
+        edited) are the other issues searched for the tag in their body.
+        An issue matches if its body contains:
+        1. The WORKFLOW_MARKER
+        2. The release-tag marker
 
         Args:
             release_tag: Release tag to search for (e.g., "r4.1")
 
         Returns:
             Issue dict if found, None otherwise
+
+        Raises:
+            GitHubClientError: If the issues cannot be listed or searched
+                (an empty answer would lead to a duplicate Release Issue)
         """
-        issues = self.gh.search_issues(
+        issues = self.gh.list_issue_titles(
             labels=[self.RELEASE_ISSUE_LABEL],
             state="open"
         )
+        titled = [issue["number"] for issue in issues if release_tag in (issue.get("title") or "")]
+        issue = self._first_owned_issue(titled, release_tag)
+        if issue is not None or len(titled) == len(issues):
+            return issue
+
+        # The title normally carries the tag, but the body marker decides
+        found = self.gh.search_issue_numbers(
+            release_tag, labels=[self.RELEASE_ISSUE_LABEL], state="open"
+        )
+        open_numbers = {issue["number"] for issue in issues}
+        return self._first_owned_issue(
+            [number for number in found if number in open_numbers and number not in titled],
+            release_tag,
+        )
 
-        for issue in issues:
+    def _first_owned_issue(self, numbers: List[int], release_tag: str) -> Optional[Dict[str, Any]]:
+        """Read the given issues and return the first workflow-owned one for the tag."""
+        release_tag_marker = f"<!-- release-automation:release-tag:{release_tag} -->"
+        for number in numbers:
+            issue = self.gh.get_issue(number)
             body = issue.get("body", "") or ""
 
             # Check for workflow marker
@@ -231,7 +264,6 @@ class IssueSyncManager:
                 continue
 
             # Check for release tag marker in body (hidden HTML comment)
-            release_tag_marker = f"<!-- release-automation:release-tag:{release_tag} -->"
             if release_tag_marker in body:
                 return issue
 
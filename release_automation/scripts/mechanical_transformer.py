@@ -154,6 +154,38 @@ class MechanicalTransformer:
             except (KeyError, ValueError) as e:
                 print(f"Warning: Skipping invalid rule: {e}")
 
+    def file_patterns(self) -> List[str]:
+        """File patterns of the enabled rules (relative to the repository root)."""
+        return [rule.file_pattern for rule in self.rules if rule.enabled and rule.file_pattern]
+
+    def sparse_directories(self) -> Optional[List[str]]:
+        """
+        Directories the enabled rules can touch, for a sparse checkout.
+
+        Each file pattern contributes its leading directories up to the
+        first wildcard; patterns for files at the repository root
+        contribute nothing.
+
+        Returns:
+            Sorted directory list, or None if a rule may match anywhere in
+            the tree (a wildcard in its first directory)
+        """
+        directories = set()
+        for rule in self.rules:
+            if not rule.enabled or not rule.file_pattern:
+                continue
+            parts = rule.file_pattern.split("/")[:-1]
+            literal = []
+            for part in parts:
+                if glob.has_magic(part):
+                    break
+                literal.append(part)
+            if parts and not literal:
+                return None
+            if literal:
+                directories.add("/".join(literal))
+        return sorted(directories)
+
     def apply_all(
         self,
         repo_path: str,
@@ -0,0 +1,160 @@
+"""
+Per-stage profiling for CAMARA release automation.
+
+A Profile records, for each named stage of a run, the wall time, the
+number of GitHub API requests and the bytes sent and received. Stages are
+entered with `with profile.stage("clone"):`; the transports report every
+request with record_api_call(), which is attributed to the innermost
+stage active in the calling context.
+
+The current stage is kept in a context variable, so calls made from worker
+threads started by async_github_client.run_parallel() (which copies the
+context) count towards the stage that started them, and concurrent stages
+do not mix their counts.
+"""
+
+import contextvars
+import json
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional
+
+
+@dataclass
+class StageProfile:
+    """
+    Measurements of one stage.
+
+    Attributes:
+        name: Stage name
+        wall_time: Seconds spent in the stage (summed over repeated entries)
+        api_calls: GitHub API requests (HTTP requests or gh invocations)
+        bytes_sent: Request bytes (bodies and arguments)
+        bytes_received: Response bytes
+    """
+    name: str
+    wall_time: float = 0.0
+    api_calls: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "wall_time": round(self.wall_time, 3),
+            "api_calls": self.api_calls,
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+        }
+
+
+_current: contextvars.ContextVar[Optional["_ActiveStage"]] = contextvars.ContextVar(
+    "profiling_stage", default=None
+)
+
+
+@dataclass
+class _ActiveStage:
+    profile: "Profile"
+    stage: StageProfile
+
+
+class Profile:
+    """Stage measurements of one run, in the order stages were first entered."""
+
+    def __init__(self, clock=time.monotonic):
+        """
+        Initialize an empty profile.
+
+        Args:
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.clock = clock
+        self.stages: Dict[str, StageProfile] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[StageProfile]:
+        """
+        Measure a stage; nested stages count only towards the innermost.
+
+        Args:
+            name: Stage name (re-entering a name accumulates)
+
+        Yields:
+            The StageProfile being recorded
+        """
+        with self._lock:
+            stage = self.stages.setdefault(name, StageProfile(name))
+        token = _current.set(_ActiveStage(self, stage))
+        start = self.clock()
+        try:
+            yield stage
+        finally:
+            elapsed = self.clock() - start
+            _current.reset(token)
+            with self._lock:
+                stage.wall_time += elapsed
+
+    def record(self, stage: StageProfile, sent: int, received: int) -> None:
+        with self._lock:
+            stage.api_calls += 1
+            stage.bytes_sent += sent
+            stage.bytes_received += received
+
+    def totals(self) -> StageProfile:
+        """Sum of the API counts over all stages (wall time not summed:
+        stages may overlap)."""
+        total = StageProfile("total")
+        for stage in self.stages.values():
+            total.api_calls += stage.api_calls
+            total.bytes_sent += stage.bytes_sent
+            total.bytes_received += stage.bytes_received
+        return total
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Machine-readable profile: {"stages": [...], "totals": {...}}."""
+        totals = self.totals().to_dict()
+        del totals["wall_time"]
+        del totals["name"]
+        return {
+            "stages": [stage.to_dict() for stage in self.stages.values()],
+            "totals": totals,
+        }
+
+    def to_markdown(self, title: str = "Profile") -> str:
+        """Stage table plus the JSON profile, for a job summary."""
+        lines: List[str] = [
+            f"### {title}",
+            "",
+            "| Stage | Wall time (s) | API calls | Sent (bytes) | Received (bytes) |",
+            "|-------|--------------:|----------:|-------------:|-----------------:|",
+        ]
+        for stage in self.stages.values():
+            lines.append(
+                f"| {stage.name} | {stage.wall_time:.2f} | {stage.api_calls} "
+                f"| {stage.bytes_sent} | {stage.bytes_received} |"
+            )
+        lines += [
+            "",
+            "```json",
+            json.dumps(self.to_dict(), indent=2),
+            "```",
+            "",
+        ]
+        return "\n".join(lines)
+
+
+def record_api_call(sent: int = 0, received: int = 0) -> None:
+    """
+    Count one API request towards the active stage, if any.
+
+    Args:
+        sent: Request bytes
+        received: Response bytes
+    """
+    active = _current.get()
+    if active is not None:
+        active.profile.record(active.stage, sent, received)
@@ -0,0 +1,239 @@
+"""
+Rate-limit-aware request scheduling for the GitHub API.
+
+GitHub enforces a primary rate limit (requests per hour, reported in the
+X-RateLimit-* response headers) and secondary limits on bursts, which
+answer 403/429 with Retry-After or a "secondary rate limit" message.
+RateLimiter keeps requests inside both:
+
+- a token bucket spaces requests, with writes costing more points than
+  reads (as GitHub counts them for the secondary limit);
+- the remaining primary budget is tracked from the response headers;
+  when it runs low, requests are spread evenly until the reset time;
+- rate-limited responses are retried after Retry-After, the reset time,
+  or an exponential backoff with jitter.
+
+One limiter is shared by all transports using the same token
+(RateLimiter.for_token), because GitHub counts the budget per token.
+"""
+
+import hashlib
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Mapping, Optional
+
+
+# Points per request for the secondary rate limit (GitHub: 1 for reads,
+# 5 for requests that create or change content)
+READ_COST = 1
+WRITE_COST = 5
+
+# Secondary limit: 900 points per minute for REST requests
+DEFAULT_POINTS_PER_SECOND = 15.0
+DEFAULT_BURST = 60.0
+
+# Start spreading requests when fewer than this many remain in the window
+DEFAULT_RESERVE = 100
+
+
+@dataclass
+class RateLimitBudget:
+    """Primary rate limit state as last reported by GitHub."""
+    limit: Optional[int]
+    remaining: Optional[int]
+    reset: Optional[float]  # Epoch seconds when the window resets
+    used: Optional[int] = None
+    resource: str = "core"
+
+
+class RateLimiter:
+    """
+    Token bucket plus primary-budget tracking for one GitHub token.
+
+    acquire() is called before each request and update() after it;
+    retry_delay() tells the caller whether and how long to wait before
+    retrying a rate-limited response.
+    """
+
+    MAX_RETRIES = 3
+    BACKOFF_BASE = 60.0  # GitHub: wait at least a minute without Retry-After
+    MAX_WAIT = 900.0
+
+    _registry: Dict[str, "RateLimiter"] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(
+        self,
+        points_per_second: float = DEFAULT_POINTS_PER_SECOND,
+        burst: float = DEFAULT_BURST,
+        reserve: int = DEFAULT_RESERVE,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+        jitter: Callable[[], float] = random.random,
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            points_per_second: Token bucket refill rate
+            burst: Token bucket capacity
+            reserve: Remaining primary budget below which requests are
+                spread until the window resets
+            clock: Time source in epoch seconds (injectable for tests)
+            sleep: Sleep function (injectable for tests)
+            jitter: Random source in [0, 1) for backoff jitter
+        """
+        self.points_per_second = points_per_second
+        self.burst = burst
+        self.reserve = reserve
+        self.clock = clock
+        self.sleep = sleep
+        self.jitter = jitter
+
+        self._tokens = burst
+        self._last_refill = clock()
+        self._budgets: Dict[str, RateLimitBudget] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_token(cls, token: Optional[str]) -> "RateLimiter":
+        """Return the limiter shared by all transports using a token."""
+        key = hashlib.sha256((token or "").encode()).hexdigest()
+        with cls._registry_lock:
+            if key not in cls._registry:
+                cls._registry[key] = cls()
+            return cls._registry[key]
+
+    # -------------------------------------------------------------------------
+    # Scheduling
+    # -------------------------------------------------------------------------
+
+    def acquire(self, method: str = "GET", resource: str = "core") -> float:
+        """
+        Wait until a request may be sent.
+
+        Args:
+            method: HTTP method (writes cost more points)
+            resource: Rate limit resource the request counts against
+
+        Returns:
+            Seconds waited
+        """
+        cost = READ_COST if method in ("GET", "HEAD") else WRITE_COST
+        with self._lock:
+            wait = max(self._bucket_wait(cost), self._budget_wait(resource))
+        if wait > 0:
+            self.sleep(wait)
+        return wait
+
+    def _bucket_wait(self, cost: float) -> float:
+        now = self.clock()
+        elapsed = max(0.0, now - self._last_refill)
+        self._tokens = min(self.burst, self._tokens + elapsed * self.points_per_second)
+        self._last_refill = now
+        self._tokens -= cost
+        if self._tokens >= 0:
+            return 0.0
+        return -self._tokens / self.points_per_second
+
+    def _budget_wait(self, resource: str) -> float:
+        budget = self._budgets.get(resource)
+        if budget is None or budget.remaining is None or budget.reset is None:
+            return 0.0
+        until_reset = budget.reset - self.clock()
+        if until_reset <= 0:
+            return 0.0
+        if budget.remaining <= 0:
+            return min(until_reset, self.MAX_WAIT)
+        if budget.remaining < self.reserve:
+            # Spread what is left evenly over the rest of the window
+            budget.remaining -= 1
+            return until_reset / (budget.remaining + 1)
+        return 0.0
+
+    # -------------------------------------------------------------------------
+    # Response handling
+    # -------------------------------------------------------------------------
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        """
+        Record the primary budget from response headers.
+
+        Args:
+            headers: Response headers with lower-case names
+        """
+        remaining = _int(headers.get("x-ratelimit-remaining"))
+        if remaining is None:
+            return
+        resource = headers.get("x-ratelimit-resource") or "core"
+        budget = RateLimitBudget(
+            limit=_int(headers.get("x-ratelimit-limit")),
+            remaining=remaining,
+            reset=_int(headers.get("x-ratelimit-reset")),
+            used=_int(headers.get("x-ratelimit-used")),
+            resource=resource,
+        )
+        with self._lock:
+            self._budgets[resource] = budget
+
+    def retry_delay(
+        self,
+        status: int,
+        headers: Mapping[str, str],
+        body: str,
+        attempt: int,
+    ) -> Optional[float]:
+        """
+        Decide whether a response was rate-limited and when to retry.
+
+        Args:
+            status: HTTP status code
+            headers: Response headers with lower-case names
+            body: Response body (checked for the secondary limit message)
+            attempt: Number of retries already made
+
+        Returns:
+            Seconds to wait before retrying, or None if the response is
+            not rate-limited or retries are exhausted
+        """
+        if status not in (403, 429) or attempt >= self.MAX_RETRIES:
+            return None
+
+        retry_after = _int(headers.get("retry-after"))
+        if retry_after is not None:
+            return min(float(retry_after), self.MAX_WAIT)
+
+        if headers.get("x-ratelimit-remaining") == "0":
+            reset = _int(headers.get("x-ratelimit-reset"))
+            if reset is not None:
+                return min(max(reset - self.clock(), 0.0) + 1.0, self.MAX_WAIT)
+
+        if status == 429 or "rate limit" in body.lower():
+            backoff = self.BACKOFF_BASE * (2 ** attempt)
+            return min(backoff * (1 + self.jitter()), self.MAX_WAIT)
+
+        # A plain 403 is a permission error, not a rate limit
+        return None
+
+    def budget(self, resource: str = "core") -> Optional[RateLimitBudget]:
+        """
+        Return the last reported budget for a rate limit resource.
+
+        Args:
+            resource: Rate limit resource (e.g., "core", "graphql")
+
+        Returns:
+            RateLimitBudget, or None if no response reported one yet
+        """
+        with self._lock:
+            budget = self._budgets.get(resource)
+            return RateLimitBudget(**vars(budget)) if budget else None
+
+
+def _int(value: Optional[str]) -> Optional[int]:
+    try:
+        return int(value) if value is not None else None
+    except ValueError:
+        return None
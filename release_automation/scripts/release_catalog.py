@@ -0,0 +1,378 @@
+"""
+Organisation-wide catalog of published releases.
+
+Each automation run only knows its own repository, but dependency
+resolution, version numbering and meta-release readiness need to see
+the releases of all API repositories. ReleaseCatalog crawls the
+releases and release-metadata.yaml of every repository listed in
+config/validation-settings.yaml and keeps the result in one JSON file:
+
+- one entry per (repository, tag) with release type, date, API
+  versions and dependency tags (Commonalities, ICM);
+- refresh() crawls the repositories with bounded parallelism and reads
+  release-metadata.yaml only for tags added since the last crawl (and
+  tags recorded without metadata);
+  tags whose release was deleted are dropped;
+- in-memory indexes answer "which releases carry API X" and "which
+  releases depend on Commonalities rX.Y" without scanning.
+
+Usage:
+    python -m release_automation.scripts.release_catalog --path catalog.json
+    python -m release_automation.scripts.release_catalog --path catalog.json --repo QualityOnDemand --full
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+from dataclasses import asdict, dataclass, field
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import yaml
+
+from .async_github_client import DEFAULT_CONCURRENCY, run_parallel
+from .github_client import GitHubClient, GitHubClientError
+
+
+DEFAULT_ORG = "camaraproject"
+
+# Relative to the tooling repository root
+DEFAULT_SETTINGS_PATH = os.path.join("config", "validation-settings.yaml")
+
+
+def load_repositories(settings_path: str = DEFAULT_SETTINGS_PATH) -> List[str]:
+    """
+    Read the API repository names from validation-settings.yaml.
+
+    Args:
+        settings_path: Path to validation-settings.yaml
+
+    Returns:
+        Repository names (without owner), in file order
+    """
+    with open(settings_path, encoding="utf-8") as f:
+        settings = yaml.safe_load(f) or {}
+    repositories = settings.get("repositories") or {}
+    return [str(name) for name in repositories]
+
+
+@dataclass
+class CatalogEntry:
+    """One published release of one repository."""
+    repository: str
+    tag: str
+    prerelease: bool = False
+    release_type: Optional[str] = None
+    release_date: Optional[str] = None
+    apis: Dict[str, str] = field(default_factory=dict)
+    dependencies: Dict[str, str] = field(default_factory=dict)
+    has_metadata: bool = True
+
+    @classmethod
+    def from_metadata(
+        cls,
+        repository: str,
+        tag: str,
+        prerelease: bool,
+        metadata: Optional[dict],
+    ) -> "CatalogEntry":
+        """Build an entry from a parsed release-metadata.yaml (or None)."""
+        if not metadata:
+            return cls(repository, tag, prerelease, has_metadata=False)
+
+        repo_section = metadata.get("repository") or {}
+        apis = {}
+        for api in metadata.get("apis") or []:
+            if api.get("api_name") and api.get("api_version"):
+                apis[api["api_name"]] = str(api["api_version"])
+        dependencies = {
+            str(name): str(tag_name)
+            for name, tag_name in (metadata.get("dependencies") or {}).items()
+            if tag_name
+        }
+        return cls(
+            repository=repository,
+            tag=tag,
+            prerelease=prerelease,
+            release_type=repo_section.get("release_type"),
+            release_date=repo_section.get("release_date"),
+            apis=apis,
+            dependencies=dependencies,
+        )
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CatalogEntry":
+        return cls(
+            repository=data["repository"],
+            tag=data["tag"],
+            prerelease=bool(data.get("prerelease", False)),
+            release_type=data.get("release_type"),
+            release_date=data.get("release_date"),
+            apis=dict(data.get("apis") or {}),
+            dependencies=dict(data.get("dependencies") or {}),
+            has_metadata=bool(data.get("has_metadata", True)),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class CrawlResult:
+    """Outcome of refreshing one repository."""
+    repository: str
+    added: int = 0
+    removed: int = 0
+    error: Optional[str] = None
+
+
+class ReleaseCatalog:
+    """
+    Published releases of all repositories of an organisation.
+
+    Entries are kept per repository in release order (newest first).
+    """
+
+    def __init__(self, org: str = DEFAULT_ORG, path: Optional[str] = None):
+        """
+        Initialize an empty catalog.
+
+        Args:
+            org: GitHub organisation the repositories belong to
+            path: Optional file the catalog is saved to
+        """
+        self.org = org
+        self.path = path
+        self.repositories: Dict[str, Dict[str, CatalogEntry]] = {}
+        self._by_api: Optional[Dict[str, List[CatalogEntry]]] = None
+        self._by_dependency: Optional[Dict[str, List[CatalogEntry]]] = None
+
+    # -------------------------------------------------------------------------
+    # Persistence
+    # -------------------------------------------------------------------------
+
+    @classmethod
+    def load(cls, path: Optional[str], org: str = DEFAULT_ORG) -> "ReleaseCatalog":
+        """
+        Load a catalog file; a missing or unreadable file gives an empty catalog.
+
+        Args:
+            path: Catalog file (None for an in-memory catalog)
+            org: GitHub organisation
+
+        Returns:
+            ReleaseCatalog for the organisation
+        """
+        catalog = cls(org, path)
+        if not path:
+            return catalog
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return catalog
+        if not isinstance(data, dict) or data.get("organization") != org:
+            return catalog
+
+        for repository, tags in (data.get("repositories") or {}).items():
+            if not isinstance(tags, dict):
+                continue
+            try:
+                catalog.repositories[repository] = {
+                    tag: CatalogEntry.from_dict(entry) for tag, entry in tags.items()
+                }
+            except (KeyError, TypeError, AttributeError):
+                continue
+        return catalog
+
+    def save(self) -> None:
+        """Write the catalog to its file (atomically); no-op without a path."""
+        if not self.path:
+            return
+        data = {
+            "organization": self.org,
+            "repositories": {
+                repository: {tag: entry.to_dict() for tag, entry in tags.items()}
+                for repository, tags in self.repositories.items()
+            },
+        }
+        directory = os.path.dirname(self.path) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    # -------------------------------------------------------------------------
+    # Crawling
+    # -------------------------------------------------------------------------
+
+    def refresh(
+        self,
+        repositories: Iterable[str],
+        client_factory: Callable[[str], GitHubClient],
+        max_concurrency: int = DEFAULT_CONCURRENCY,
+        full: bool = False,
+    ) -> List[CrawlResult]:
+        """
+        Bring the catalog up to date for a set of repositories.
+
+        Repositories are crawled concurrently. For each, the release list
+        is fetched and release-metadata.yaml is read only for tags not
+        yet in the catalog or recorded without metadata. A repository that fails keeps its previous
+        entries. Repositories not listed are left untouched.
+
+        Args:
+            repositories: Repository names (without owner)
+            client_factory: Returns a GitHubClient for "owner/name"
+            max_concurrency: Repositories crawled at the same time
+            full: Re-read the metadata of all tags, not only new ones
+
+        Returns:
+            CrawlResult per repository, in the order given
+        """
+        repositories = list(repositories)
+        crawled = run_parallel(
+            [partial(self._crawl, repository, client_factory, full) for repository in repositories],
+            limit=max_concurrency,
+        )
+
+        results = []
+        for repository, (entries, result) in zip(repositories, crawled):
+            if entries is not None:
+                self.repositories[repository] = entries
+            results.append(result)
+
+        self._by_api = None
+        self._by_dependency = None
+        return results
+
+    def _crawl(
+        self,
+        repository: str,
+        client_factory: Callable[[str], GitHubClient],
+        full: bool,
+    ) -> Tuple[Optional[Dict[str, CatalogEntry]], CrawlResult]:
+        known = {} if full else self.repositories.get(repository, {})
+        result = CrawlResult(repository)
+        try:
+            gh = client_factory(f"{self.org}/{repository}")
+            entries: Dict[str, CatalogEntry] = {}
+            for release in gh.iter_releases(page_size=100):
+                entry = known.get(release.tag_name)
+                # Entries without metadata are read again: the read may
+                # have failed transiently
+                if entry is not None and entry.has_metadata:
+                    entries[release.tag_name] = entry
+                    continue
+                metadata = gh.get_release_metadata(release.tag_name)
+                entries[release.tag_name] = CatalogEntry.from_metadata(
+                    repository, release.tag_name, release.prerelease, metadata
+                )
+                if entry is None:
+                    result.added += 1
+        except GitHubClientError as e:
+            result.error = str(e)
+            return None, result
+
+        result.removed = len(set(self.repositories.get(repository, {})) - set(entries))
+        return entries, result
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def entries(self, repository: Optional[str] = None) -> List[CatalogEntry]:
+        """Return all entries, or those of one repository (newest first)."""
+        if repository is not None:
+            return list(self.repositories.get(repository, {}).values())
+        return [entry for tags in self.repositories.values() for entry in tags.values()]
+
+    def get(self, repository: str, tag: str) -> Optional[CatalogEntry]:
+        """Return the entry for a repository's release tag."""
+        return self.repositories.get(repository, {}).get(tag)
+
+    def latest(self, repository: str, include_prereleases: bool = False) -> Optional[CatalogEntry]:
+        """Return the newest release of a repository."""
+        for entry in self.repositories.get(repository, {}).values():
+            if include_prereleases or not entry.prerelease:
+                return entry
+        return None
+
+    def releases_with_api(self, api_name: str) -> List[CatalogEntry]:
+        """Return the releases that carry an API, across repositories."""
+        if self._by_api is None:
+            self._build_indexes()
+        return list(self._by_api.get(api_name, []))
+
+    def releases_depending_on(self, dependency_tag: str) -> List[CatalogEntry]:
+        """Return the releases that declare a dependency tag (e.g., "r3.4")."""
+        if self._by_dependency is None:
+            self._build_indexes()
+        return list(self._by_dependency.get(dependency_tag, []))
+
+    def _build_indexes(self) -> None:
+        by_api: Dict[str, List[CatalogEntry]] = {}
+        by_dependency: Dict[str, List[CatalogEntry]] = {}
+        for entry in self.entries():
+            for api_name in entry.apis:
+                by_api.setdefault(api_name, []).append(entry)
+            for dependency_tag in set(entry.dependencies.values()):
+                by_dependency.setdefault(dependency_tag, []).append(entry)
+        self._by_api = by_api
+        self._by_dependency = by_dependency
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Build the organisation-wide release catalog")
+    parser.add_argument("--path", required=True, help="Catalog file to update")
+    parser.add_argument("--org", default=DEFAULT_ORG, help="GitHub organisation")
+    parser.add_argument(
+        "--settings",
+        default=DEFAULT_SETTINGS_PATH,
+        help="validation-settings.yaml listing the repositories",
+    )
+    parser.add_argument(
+        "--repo",
+        action="append",
+        help="Only crawl these repositories (repeatable)",
+    )
+    parser.add_argument("--full", action="store_true", help="Re-read all tags")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY)
+    args = parser.parse_args(argv)
+
+    repositories = args.repo or load_repositories(args.settings)
+    token = os.environ.get("GITHUB_TOKEN")
+
+    catalog = ReleaseCatalog.load(args.path, args.org)
+    results = catalog.refresh(
+        repositories,
+        lambda repo: GitHubClient(repo, token),
+        max_concurrency=args.concurrency,
+        full=args.full,
+    )
+    catalog.save()
+
+    failed = 0
+    for result in results:
+        if result.error:
+            failed += 1
+            print(f"::warning::{result.repository}: {result.error}", file=sys.stderr)
+        else:
+            print(
+                f"{result.repository}: +{result.added} -{result.removed} "
+                f"({len(catalog.repositories.get(result.repository, {}))} releases)",
+                file=sys.stderr,
+            )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,222 @@
+"""
+Organisation-wide release state dashboard.
+
+Derives the release state of every API repository listed in
+config/validation-settings.yaml in one process, instead of one
+derive-release-state run per repository:
+
+- each repository is derived with ReleaseStateManager in a consistent
+  view (one batched GraphQL request plus the release issue search);
+- repositories are processed concurrently, and all clients share the
+  token's rate limiter and, with --cache-dir, one API response cache;
+- the result is written as JSON and as a Markdown table (also appended
+  to the job summary when run in GitHub Actions).
+
+Usage:
+    python -m release_automation.scripts.release_dashboard --json status.json --markdown status.md
+"""
+
+import argparse
+import json
+import os
+import sys
+from dataclasses import asdict, dataclass
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from .async_github_client import run_parallel
+from .github_client import GitHubClient, GitHubClientError
+from .release_catalog import DEFAULT_ORG, DEFAULT_SETTINGS_PATH, load_repositories
+from .state_manager import ReleaseStateManager
+
+# Repositories derived at the same time (each derivation issues a few
+# concurrent lookups itself)
+DEFAULT_REPO_CONCURRENCY = 8
+
+
+@dataclass
+class RepositoryStatus:
+    """Release state of one repository."""
+    repository: str
+    release_tag: Optional[str] = None
+    state: Optional[str] = None
+    source: Optional[str] = None
+    snapshot_id: Optional[str] = None
+    snapshot_branch: Optional[str] = None
+    release_pr_number: Optional[int] = None
+    release_issue_number: Optional[int] = None
+    release_type: Optional[str] = None
+    config_error: Optional[str] = None
+    config_error_type: Optional[str] = None
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def derive_repository_status(
+    repository: str,
+    gh: GitHubClient,
+    use_release_view: bool = True,
+) -> RepositoryStatus:
+    """
+    Derive the release state of one repository.
+
+    Args:
+        repository: Repository name (without owner)
+        gh: GitHubClient for the repository
+        use_release_view: Fetch the artifacts in one GraphQL request
+
+    Returns:
+        RepositoryStatus (with error set if the derivation failed)
+    """
+    status = RepositoryStatus(repository)
+    manager = ReleaseStateManager(gh, use_release_view=use_release_view)
+    try:
+        with manager.consistent_view():
+            info = manager.get_current_release_info()
+            if not info.success:
+                error = info.config_error
+                status.config_error = error.message if error else "Unknown error"
+                status.config_error_type = error.error_type if error else "unknown"
+                return status
+
+            status.release_tag = info.release_tag
+            status.state = info.state.value if info.state else None
+            status.source = info.source
+            status.release_issue_number = info.release_issue_number
+            status.release_type = info.release_type
+            status.snapshot_branch = info.snapshot_branch
+
+            snapshot = manager.get_current_snapshot(info.release_tag) if info.release_tag else None
+            if snapshot:
+                status.snapshot_id = snapshot.snapshot_id
+                status.snapshot_branch = snapshot.snapshot_branch
+                status.release_pr_number = snapshot.release_pr_number
+                status.release_type = snapshot.release_type or status.release_type
+    except GitHubClientError as e:
+        status.error = str(e)
+    return status
+
+
+def collect_statuses(
+    repositories: Iterable[str],
+    client_factory: Callable[[str], GitHubClient],
+    org: str = DEFAULT_ORG,
+    max_concurrency: int = DEFAULT_REPO_CONCURRENCY,
+    use_release_view: bool = True,
+) -> List[RepositoryStatus]:
+    """
+    Derive the release state of several repositories concurrently.
+
+    Args:
+        repositories: Repository names (without owner)
+        client_factory: Returns a GitHubClient for "owner/name"
+        org: GitHub organisation
+        max_concurrency: Repositories derived at the same time
+        use_release_view: Fetch each repository's artifacts in one GraphQL request
+
+    Returns:
+        RepositoryStatus per repository, in the order given
+    """
+    def derive(repository: str) -> RepositoryStatus:
+        try:
+            gh = client_factory(f"{org}/{repository}")
+        except GitHubClientError as e:
+            return RepositoryStatus(repository, error=str(e))
+        return derive_repository_status(repository, gh, use_release_view)
+
+    return run_parallel(
+        [partial(derive, repository) for repository in repositories],
+        limit=max_concurrency,
+    )
+
+
+def render_json(statuses: List[RepositoryStatus], org: str = DEFAULT_ORG) -> str:
+    """Render the statuses as a JSON report."""
+    return json.dumps(
+        {"organization": org, "repositories": [s.to_dict() for s in statuses]},
+        indent=2,
+    )
+
+
+def render_markdown(statuses: List[RepositoryStatus], org: str = DEFAULT_ORG) -> str:
+    """Render the statuses as a Markdown table."""
+    lines = [
+        "## Release status",
+        "",
+        "| Repository | Release | State | Snapshot | Release PR | Release Issue | Notes |",
+        "|---|---|---|---|---|---|---|",
+    ]
+    for s in statuses:
+        repo_url = f"https://github.com/{org}/{s.repository}"
+        pr = f"[#{s.release_pr_number}]({repo_url}/pull/{s.release_pr_number})" if s.release_pr_number else ""
+        issue = f"[#{s.release_issue_number}]({repo_url}/issues/{s.release_issue_number})" if s.release_issue_number else ""
+        if s.error:
+            notes = f"Error: {s.error}"
+        elif s.config_error:
+            notes = f"Configuration error ({s.config_error_type}): {s.config_error}"
+        else:
+            notes = s.release_type or ""
+        cells = [
+            f"[{s.repository}]({repo_url})",
+            f"`{s.release_tag}`" if s.release_tag else "",
+            s.state or "",
+            s.snapshot_id or "",
+            pr,
+            issue,
+            notes.replace("|", "\\|").replace("\n", " "),
+        ]
+        lines.append("| " + " | ".join(cells) + " |")
+    return "\n".join(lines) + "\n"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Derive the release state of all API repositories")
+    parser.add_argument("--org", default=DEFAULT_ORG, help="GitHub organisation")
+    parser.add_argument(
+        "--settings",
+        default=DEFAULT_SETTINGS_PATH,
+        help="validation-settings.yaml listing the repositories",
+    )
+    parser.add_argument("--repo", action="append", help="Only these repositories (repeatable)")
+    parser.add_argument("--json", dest="json_path", help="Write the JSON report to this file")
+    parser.add_argument("--markdown", dest="markdown_path", help="Write the Markdown report to this file")
+    parser.add_argument("--cache-dir", help="Shared API response cache directory")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_REPO_CONCURRENCY)
+    args = parser.parse_args(argv)
+
+    repositories = args.repo or load_repositories(args.settings)
+    token = os.environ.get("GITHUB_TOKEN")
+
+    statuses = collect_statuses(
+        repositories,
+        lambda repo: GitHubClient(repo, token, cache_dir=args.cache_dir),
+        org=args.org,
+        max_concurrency=args.concurrency,
+    )
+
+    json_report = render_json(statuses, args.org)
+    markdown_report = render_markdown(statuses, args.org)
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            f.write(json_report)
+    else:
+        print(json_report)
+    if args.markdown_path:
+        with open(args.markdown_path, "w", encoding="utf-8") as f:
+            f.write(markdown_report)
+
+    summary = os.environ.get("GITHUB_STEP_SUMMARY")
+    if summary:
+        with open(summary, "a", encoding="utf-8") as f:
+            f.write(markdown_report)
+
+    failed = [s for s in statuses if s.error]
+    for s in failed:
+        print(f"::warning::{s.repository}: {s.error}", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
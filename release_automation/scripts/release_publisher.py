@@ -7,11 +7,14 @@ of the CAMARA release automation workflow.
 import logging
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import partial
 from typing import Any, Dict, Optional
 
 import yaml
 
+from .async_github_client import run_parallel
 from .github_client import GitHubClient, GitHubClientError
+from .version_ledger import VersionLedger
 
 logger = logging.getLogger(__name__)
 
@@ -35,15 +38,18 @@ class ReleasePublisher:
     1. Find and validate the draft release
     2. Finalize release-metadata.yaml with release_date
     3. Publish the draft (set draft=false, which creates the tag)
+    4. Append the published API versions to the version ledger (if any)
     """
 
-    def __init__(self, gh: GitHubClient):
+    def __init__(self, gh: GitHubClient, ledger: Optional[VersionLedger] = None):
         """Initialize with GitHub client.
 
         Args:
             gh: Configured GitHubClient instance
+            ledger: Optional version ledger to record published releases in
         """
         self.gh = gh
+        self.ledger = ledger
 
     def get_draft_release(self, release_tag: str) -> Optional[Dict[str, Any]]:
         """Find draft release by tag name.
@@ -139,6 +145,7 @@ class ReleasePublisher:
         1. Find draft release by tag
         2. Finalize release-metadata.yaml (set release_date)
         3. Update draft to published (creates tag)
+        4. Record the release in the version ledger (if configured)
 
         Args:
             release_tag: Release tag to publish
@@ -193,6 +200,10 @@ class ReleasePublisher:
             except GitHubClientError:
                 logger.warning(f"Failed to mark {release_tag} as Latest release")
 
+        # Step 4: Record the release in the version ledger (non-critical;
+        # a ledger that misses it catches up on its next sync)
+        self.record_in_ledger(release_tag)
+
         return PublishResult(
             success=True,
             release_url=updated.get("html_url"),
@@ -200,6 +211,32 @@ class ReleasePublisher:
             is_prerelease=is_prerelease
         )
 
+    def record_in_ledger(self, release_tag: str) -> bool:
+        """Append a published release's API versions to the version ledger.
+
+        Args:
+            release_tag: Published release tag
+
+        Returns:
+            True if the release was recorded
+        """
+        if self.ledger is None:
+            return False
+
+        metadata = self.gh.get_release_metadata(release_tag)
+        if not metadata:
+            logger.warning(f"Cannot read release-metadata.yaml of {release_tag} for the version ledger")
+            return False
+
+        self.ledger.record(release_tag, metadata)
+        try:
+            self.ledger.save()
+        except OSError as e:
+            logger.warning(f"Failed to save version ledger: {e}")
+            return False
+        logger.info(f"Recorded {release_tag} in the version ledger")
+        return True
+
     def create_reference_tag(
         self,
         release_tag: str,
@@ -302,30 +339,41 @@ class ReleasePublisher:
             - "review_renamed": "renamed", "not_found", or "error"
         """
         result: Dict[str, str] = {}
+        new_review_branch = f"{release_review_branch}-published"
+
+        # The delete and the rename are independent: run them concurrently
+        deleted, renamed = run_parallel(
+            [
+                partial(self.gh.delete_branch, snapshot_branch),
+                partial(self.gh.rename_branch, release_review_branch, new_review_branch),
+            ],
+            return_exceptions=True,
+        )
 
         # Delete snapshot branch
-        try:
-            deleted = self.gh.delete_branch(snapshot_branch)
+        if isinstance(deleted, GitHubClientError):
+            logger.error(f"Failed to delete {snapshot_branch}: {deleted}")
+            result["snapshot_deleted"] = "error"
+        elif isinstance(deleted, Exception):
+            raise deleted
+        else:
             result["snapshot_deleted"] = "deleted" if deleted else "not_found"
             if deleted:
                 logger.info(f"Deleted branch {snapshot_branch}")
             else:
                 logger.warning(f"Branch {snapshot_branch} not found (already deleted)")
-        except GitHubClientError as e:
-            logger.error(f"Failed to delete {snapshot_branch}: {e}")
-            result["snapshot_deleted"] = "error"
 
         # Rename release-review branch to -published
-        new_review_branch = f"{release_review_branch}-published"
-        try:
-            renamed = self.gh.rename_branch(release_review_branch, new_review_branch)
+        if isinstance(renamed, GitHubClientError):
+            logger.error(f"Failed to rename {release_review_branch}: {renamed}")
+            result["review_renamed"] = "error"
+        elif isinstance(renamed, Exception):
+            raise renamed
+        else:
             result["review_renamed"] = "renamed" if renamed else "not_found"
             if renamed:
                 logger.info(f"Renamed {release_review_branch} to {new_review_branch}")
             else:
                 logger.warning(f"Branch {release_review_branch} not found (already renamed)")
-        except GitHubClientError as e:
-            logger.error(f"Failed to rename {release_review_branch}: {e}")
-            result["review_renamed"] = "error"
 
         return result
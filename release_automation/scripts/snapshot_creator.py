@@ -11,16 +11,29 @@ import shutil
 import tempfile
 from copy import deepcopy
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import yaml
 
 from . import config
+from .async_github_client import run_parallel
 from .changelog_generator import ChangelogGenerator
-from .git_operations import GitOperations, GitOperationsError, PullRequestInfo
+from .git_operations import (
+    CLONE_FULL,
+    CLONE_PARTIAL,
+    CLONE_SHALLOW,
+    CLONE_SPARSE,
+    CloneStats,
+    GitOperations,
+    GitOperationsError,
+    PullRequestInfo,
+)
+from .git_data_workspace import GitDataWorkspace
 from .github_client import GitHubClient
 from .mechanical_transformer import MechanicalTransformer, TransformationContext
 from .metadata_generator import MetadataGenerator
+from .profiling import Profile
 from .readme_updater import ReadmeUpdater, ReadmeUpdateError
 from .state_manager import ReleaseState, ReleaseStateManager
 from .template_loader import render_template
@@ -35,6 +48,12 @@ class SnapshotConfig:
     base_branch: str = "main"
     src_commit_sha: Optional[str] = None
     dry_run: bool = False
+    # One of git_operations.CLONE_STRATEGIES; anything but "full" falls
+    # back to a full clone if it fails
+    clone_strategy: str = CLONE_FULL
+    # "clone" (local git) or "git-data" (Git Data API, no clone; falls
+    # back to a clone if the tree cannot be read)
+    backend: str = "clone"
     # Note: commonalities_release and icm_release are derived from
     # release_plan['dependencies'], not passed via config
 
@@ -53,6 +72,9 @@ class SnapshotResult:
     transformation_summary: Dict[str, Any] = field(default_factory=dict)
     errors: List[str] = field(default_factory=list)
     warnings: List[str] = field(default_factory=list)
+    clone_stats: Optional[CloneStats] = None
+    # Wall time, API calls and bytes transferred per step
+    profile: Profile = field(default_factory=Profile)
 
     def to_bot_context(self) -> Dict[str, Any]:
         """
@@ -78,6 +100,7 @@ class SnapshotResult:
             "warnings": self.warnings,
             "has_errors": len(self.errors) > 0,
             "has_warnings": len(self.warnings) > 0,
+            "profile": self.profile.to_dict(),
         }
 
 
@@ -115,6 +138,19 @@ class SnapshotCreator:
     COMMONALITIES_REPO = "camaraproject/Commonalities"
     ICM_REPO = "camaraproject/IdentityAndConsentManagement"
     COMMONALITIES_VERSION_FILE = "VERSION.yaml"
+    # Directories read or written outside the transformation rules (WIP
+    # check, API titles, CHANGELOG); root files are always checked out
+    SPARSE_PATHS = ("code/API_definitions", "code/Test_definitions", "CHANGELOG")
+    # The same files as patterns, for the Git Data backend
+    WORKSPACE_PATTERNS = (
+        "README.md",
+        "release-plan.yaml",
+        "code/API_definitions/*.yaml",
+        "code/Test_definitions/*.feature",
+        "CHANGELOG/*.md",
+    )
+    BACKEND_CLONE = "clone"
+    BACKEND_GIT_DATA = "git-data"
 
     def __init__(
         self,
@@ -162,38 +198,68 @@ class SnapshotCreator:
             SnapshotResult with all details or errors
         """
         result = SnapshotResult(success=False)
+        profile = result.profile
         temp_dir = None
         snapshot_branch = None
         release_review_branch = None
 
         try:
-            # Step 1: Validate preconditions
-            errors = self.validate_preconditions(config.release_tag)
-            if errors:
-                result.errors = errors
-                return result
-
-            # Step 2: Get source commit SHA
-            if config.src_commit_sha:
-                base_sha = config.src_commit_sha
-            else:
-                # Get from main branch via API
-                branches = self.gh.list_branches(config.base_branch)
-                if not branches:
-                    result.errors.append(
-                        f"Base branch '{config.base_branch}' not found"
-                    )
-                    return result
-                base_sha = branches[0].sha
-
-            result.src_commit_sha = base_sha
-
-            # Step 3: Generate snapshot ID
-            snapshot_id = self.generate_snapshot_id(config.release_tag, base_sha)
-            result.snapshot_id = snapshot_id
-
-            # Step 4: Calculate API versions
-            api_versions = self.version_calc.calculate_versions_for_plan(release_plan)
+            # Steps 1-4 only read from GitHub: deduplicate repeated reads
+            # (releases, tags, VERSION.yaml) across them and the stages
+            with self.gh.memoized():
+                # Step 1: Validate preconditions
+                with profile.stage("preconditions"):
+                    errors = self.validate_preconditions(config.release_tag)
+                    if errors:
+                        result.errors = errors
+                        return result
+
+                # Step 2: Get source commit SHA
+                with profile.stage("base_sha"):
+                    if config.src_commit_sha:
+                        base_sha = config.src_commit_sha
+                    else:
+                        # Get from main branch via API
+                        branches = self.gh.list_branches(config.base_branch)
+                        if not branches:
+                            result.errors.append(
+                                f"Base branch '{config.base_branch}' not found"
+                            )
+                            return result
+                        base_sha = branches[0].sha
+
+                result.src_commit_sha = base_sha
+
+                # Step 3: Generate snapshot ID
+                snapshot_id = self.generate_snapshot_id(config.release_tag, base_sha)
+                result.snapshot_id = snapshot_id
+
+                # Step 4: Start the preparation stages concurrently. Version
+                # calculation, the Commonalities/ICM VERSION.yaml reads, the
+                # clone and the CHANGELOG candidate changes only need the plan
+                # and the base branch. Failures are raised after the join, in
+                # step order, so error handling and cleanup are unchanged.
+                dependencies = release_plan.get("dependencies", {})
+                commonalities_release = dependencies.get("commonalities_release", "main")
+                icm_release = dependencies.get("identity_consent_management_release", "main")
+                icm_dependency_configured = "identity_consent_management_release" in dependencies
+                stages = {
+                    "versions": partial(self.version_calc.calculate_versions_for_plan, release_plan),
+                    "commonalities": partial(self._resolve_commonalities_version, commonalities_release),
+                }
+                if icm_dependency_configured:
+                    stages["icm"] = partial(self._resolve_icm_version, icm_release)
+                if not config.dry_run:
+                    temp_dir = tempfile.mkdtemp(prefix="camara-snapshot-")
+                    stages["clone"] = partial(self._open_workspace, config, temp_dir, result)
+                    stages["changes"] = partial(self._prefetch_candidate_changes, release_plan, config.release_tag)
+                outcomes = dict(zip(stages, run_parallel(
+                    [partial(_profiled, profile, name, call) for name, call in stages.items()],
+                    limit=len(stages),
+                    return_exceptions=True,
+                )))
+
+            api_versions = _stage_result(outcomes["versions"])
             result.api_versions = api_versions
 
             # Step 5: Define branch names
@@ -202,84 +268,74 @@ class SnapshotCreator:
             result.snapshot_branch = snapshot_branch
             result.release_review_branch = release_review_branch
 
-            # Step 5b: Resolve Commonalities semantic version from VERSION.yaml
-            dependencies = release_plan.get("dependencies", {})
-            commonalities_release = dependencies.get("commonalities_release", "main")
-            icm_release = dependencies.get("identity_consent_management_release", "main")
-            icm_dependency_configured = "identity_consent_management_release" in dependencies
-            commonalities_version = self._resolve_commonalities_version(
-                commonalities_release
-            )
-            icm_version = self._resolve_icm_version(icm_release) if icm_dependency_configured else ""
+            # Step 5b: Commonalities (and ICM) semantic versions from VERSION.yaml
+            commonalities_version = _stage_result(outcomes["commonalities"])
+            icm_version = _stage_result(outcomes["icm"]) if icm_dependency_configured else ""
 
             if config.dry_run:
                 result.success = True
                 result.warnings.append("Dry run: no branches or PR created")
                 return result
 
-            # Step 6: Clone repository to temp directory
-            temp_dir = tempfile.mkdtemp(prefix="camara-snapshot-")
-            git_ops = GitOperations(
-                repo=self.gh.repo,
-                work_dir=temp_dir,
-                token=self.gh.token,
-            )
-
-            git_ops.clone(branch=config.base_branch)
+            # Step 6: Repository checkout in temp directory
+            git_ops = _stage_result(outcomes["clone"])
             git_ops.configure_user(self.bot_name, self.bot_email)
 
             # Step 7: Create snapshot branch
             git_ops.create_branch(snapshot_branch)
 
             # Step 7b: Validate wip versions before transformation
-            wip_result = check_wip_versions(temp_dir, release_plan)
-            if wip_result.warnings:
-                result.warnings.extend(wip_result.warnings)
-            if not wip_result.compliant:
-                result.errors.append(wip_result.format_error_message())
-                return result
+            with profile.stage("wip_check"):
+                wip_result = check_wip_versions(temp_dir, release_plan)
+                if wip_result.warnings:
+                    result.warnings.extend(wip_result.warnings)
+                if not wip_result.compliant:
+                    result.errors.append(wip_result.format_error_message())
+                    return result
 
             # Step 8: Apply transformations
-            context = TransformationContext(
-                release_tag=config.release_tag,
-                api_versions=api_versions,
-                commonalities_release=commonalities_release,
-                commonalities_version=commonalities_version,
-                icm_release=icm_release,
-                repo_name=self.gh.repo.split("/")[-1],
-                release_plan=release_plan,
-            )
+            with profile.stage("transform"):
+                context = TransformationContext(
+                    release_tag=config.release_tag,
+                    api_versions=api_versions,
+                    commonalities_release=commonalities_release,
+                    commonalities_version=commonalities_version,
+                    icm_release=icm_release,
+                    repo_name=self.gh.repo.split("/")[-1],
+                    release_plan=release_plan,
+                )
 
-            transform_result = self.transformer.apply_all(temp_dir, context)
-            result.transformation_summary = {
-                "files_modified": len(transform_result.files_modified),
-                "changes": len(transform_result.changes),
-            }
-            result.warnings.extend(transform_result.warnings)
+                transform_result = self.transformer.apply_all(temp_dir, context)
+                result.transformation_summary = {
+                    "files_modified": len(transform_result.files_modified),
+                    "changes": len(transform_result.changes),
+                }
+                result.warnings.extend(transform_result.warnings)
 
-            if not transform_result.success:
-                result.errors.extend(transform_result.errors)
-                raise TransformationError("Transformations failed")
+                if not transform_result.success:
+                    result.errors.extend(transform_result.errors)
+                    raise TransformationError("Transformations failed")
 
             # Step 9: Generate and write release-metadata.yaml
-            api_titles = self._extract_api_titles(release_plan, temp_dir)
-            metadata_release_plan = self._build_release_plan_for_metadata(
-                release_plan,
-                commonalities_release,
-                commonalities_version,
-                icm_release if icm_dependency_configured else "",
-                icm_version,
-            )
-            metadata = self.metadata_gen.generate(
-                metadata_release_plan,
-                api_versions,
-                base_sha,
-                api_titles,
-                repo=self.gh.repo,
-            )
-            metadata_path = os.path.join(temp_dir, "release-metadata.yaml")
-            with open(metadata_path, "w") as f:
-                yaml.safe_dump(metadata, f, default_flow_style=False, sort_keys=False)
+            with profile.stage("metadata"):
+                api_titles = self._extract_api_titles(release_plan, temp_dir)
+                metadata_release_plan = self._build_release_plan_for_metadata(
+                    release_plan,
+                    commonalities_release,
+                    commonalities_version,
+                    icm_release if icm_dependency_configured else "",
+                    icm_version,
+                )
+                metadata = self.metadata_gen.generate(
+                    metadata_release_plan,
+                    api_versions,
+                    base_sha,
+                    api_titles,
+                    repo=self.gh.repo,
+                )
+                metadata_path = os.path.join(temp_dir, "release-metadata.yaml")
+                with open(metadata_path, "w") as f:
+                    yaml.safe_dump(metadata, f, default_flow_style=False, sort_keys=False)
 
             # Step 9b: Remove release-plan.yaml from snapshot
             # release-metadata.yaml is the authoritative artifact; the plan is
@@ -289,61 +345,68 @@ class SnapshotCreator:
                 os.remove(plan_path)
 
             # Step 10: Commit changes
-            commit_message = f"Release automation: create snapshot {snapshot_id}"
-            git_ops.commit_all(commit_message)
+            with profile.stage("commit"):
+                commit_message = f"Release automation: create snapshot {snapshot_id}"
+                git_ops.commit_all(commit_message)
 
             # Step 11: Push snapshot branch
-            git_ops.push(snapshot_branch)
+            with profile.stage("push_snapshot"):
+                git_ops.push(snapshot_branch)
 
             # Step 12a: Create release-review branch from snapshot
             git_ops.create_branch(release_review_branch, from_ref="HEAD")
 
             # Step 12b: Update README Release Information
-            try:
-                readme_changed = self._update_readme(
-                    temp_dir, config, release_plan, api_versions, metadata
-                )
-                if readme_changed:
-                    git_ops.commit_all(
-                        f"Update README Release Information for {config.release_tag}"
+            with profile.stage("readme"):
+                try:
+                    readme_changed = self._update_readme(
+                        temp_dir, config, release_plan, api_versions, metadata
                     )
-            except ReadmeUpdateError as e:
-                result.warnings.append(f"README update skipped: {e}")
-            except Exception as e:
-                result.warnings.append(f"README update failed: {e}")
+                    if readme_changed:
+                        git_ops.commit_all(
+                            f"Update README Release Information for {config.release_tag}"
+                        )
+                except ReadmeUpdateError as e:
+                    result.warnings.append(f"README update skipped: {e}")
+                except Exception as e:
+                    result.warnings.append(f"README update failed: {e}")
 
             # Step 12c: Generate CHANGELOG draft
-            try:
-                repo_name = self.gh.repo.split("/")[-1]
-                self._generate_changelog(
-                    temp_dir,
-                    config,
-                    release_plan,
-                    api_versions,
-                    metadata,
-                    repo_name,
-                    commonalities_version=commonalities_version,
-                    icm_version=icm_version,
-                )
-                git_ops.commit_all(
-                    f"Add CHANGELOG draft for {config.release_tag}"
-                )
-            except Exception as e:
-                result.warnings.append(f"CHANGELOG generation failed: {e}")
+            with profile.stage("changelog"):
+                try:
+                    repo_name = self.gh.repo.split("/")[-1]
+                    self._generate_changelog(
+                        temp_dir,
+                        config,
+                        release_plan,
+                        api_versions,
+                        metadata,
+                        repo_name,
+                        commonalities_version=commonalities_version,
+                        icm_version=icm_version,
+                        prefetched_changes=outcomes["changes"],
+                    )
+                    git_ops.commit_all(
+                        f"Add CHANGELOG draft for {config.release_tag}"
+                    )
+                except Exception as e:
+                    result.warnings.append(f"CHANGELOG generation failed: {e}")
 
             # Step 13: Push release-review branch
-            git_ops.push(release_review_branch)
+            with profile.stage("push_review"):
+                git_ops.push(release_review_branch)
 
             # Step 14: Create Release PR
-            pr_info = self._create_release_pr(
-                git_ops,
-                config.release_tag,
-                snapshot_id,
-                api_versions,
-                release_plan,
-            )
-            result.release_pr_number = pr_info.number
-            result.release_pr_url = pr_info.url
+            with profile.stage("release_pr"):
+                pr_info = self._create_release_pr(
+                    git_ops,
+                    config.release_tag,
+                    snapshot_id,
+                    api_versions,
+                    release_plan,
+                )
+                result.release_pr_number = pr_info.number
+                result.release_pr_url = pr_info.url
 
             result.success = True
 
@@ -370,6 +433,80 @@ class SnapshotCreator:
 
         return result
 
+    def _open_workspace(
+        self,
+        config: SnapshotConfig,
+        temp_dir: str,
+        result: SnapshotResult,
+    ) -> GitOperations:
+        """
+        Check out the base branch into temp_dir with the configured backend.
+
+        The Git Data backend downloads only the files matching
+        WORKSPACE_PATTERNS and the transformation rules. If it cannot read
+        the tree (e.g. one too large to list), a clone is used instead.
+
+        Args:
+            config: Snapshot configuration (backend, clone strategy)
+            temp_dir: Empty work directory
+            result: Receives clone_stats and fallback warnings
+
+        Returns:
+            GitOperations (or GitDataWorkspace) ready for commits
+
+        Raises:
+            GitOperationsError: If the clone fails
+        """
+        if config.backend == self.BACKEND_GIT_DATA:
+            patterns = list(self.WORKSPACE_PATTERNS) + self.transformer.file_patterns()
+            workspace = GitDataWorkspace(self.gh, temp_dir, patterns)
+            try:
+                result.clone_stats = workspace.clone(branch=config.base_branch)
+                return workspace
+            except GitOperationsError as e:
+                result.warnings.append(f"Git Data API checkout failed, used a clone: {e}")
+                shutil.rmtree(temp_dir, ignore_errors=True)
+                os.makedirs(temp_dir, exist_ok=True)
+
+        git_ops = GitOperations(
+            repo=self.gh.repo,
+            work_dir=temp_dir,
+            token=self.gh.token,
+        )
+        strategy, sparse_paths = self._clone_plan(config.clone_strategy)
+        result.clone_stats = git_ops.clone(
+            branch=config.base_branch,
+            strategy=strategy,
+            sparse_paths=sparse_paths,
+        )
+        if result.clone_stats.fallback_reason:
+            result.warnings.append(
+                f"{strategy} clone failed, used a full clone: "
+                f"{result.clone_stats.fallback_reason}"
+            )
+        return git_ops
+
+    def _clone_plan(self, strategy: str) -> Tuple[str, Optional[List[str]]]:
+        """
+        Resolve the clone strategy and sparse-checkout directories.
+
+        A sparse checkout covers SPARSE_PATHS and the directories of the
+        transformation rules. If a rule may match anywhere in the tree, a
+        partial clone (all files, blobs of the tip only) is used instead.
+
+        Args:
+            strategy: Requested clone strategy
+
+        Returns:
+            Tuple of (strategy, sparse_paths or None)
+        """
+        if strategy != CLONE_SPARSE:
+            return strategy, None
+        rule_directories = self.transformer.sparse_directories()
+        if rule_directories is None:
+            return CLONE_PARTIAL, None
+        return CLONE_SPARSE, sorted(set(self.SPARSE_PATHS) | set(rule_directories))
+
     def _resolve_commonalities_version(self, release_tag: str) -> str:
         """
         Resolve the Commonalities semantic version from VERSION.yaml.
@@ -662,18 +799,15 @@ class SnapshotCreator:
 
     def _get_latest_public_release(self) -> Optional[str]:
         """Query GitHub releases for the latest non-prerelease, non-draft release tag."""
-        releases = self.gh.get_releases(include_drafts=False)
-        for release in releases:
+        for release in self.gh.iter_releases(include_drafts=False):
             if not release.prerelease:
                 return release.tag_name
         return None
 
     def _get_previous_release(self) -> Optional[str]:
         """Query GitHub releases for the most recent release tag (any type)."""
-        releases = self.gh.get_releases(include_drafts=False)
-        if releases:
-            return releases[0].tag_name
-        return None
+        release = next(self.gh.iter_releases(include_drafts=False), None)
+        return release.tag_name if release else None
 
     def _get_compare_base(
         self, release_type: str, release_tag: str
@@ -719,34 +853,36 @@ class SnapshotCreator:
         Returns:
             Tag name of the compare base, or None if no prior release exists.
         """
-        releases = self.gh.get_releases(include_drafts=False)
-        if not releases:
-            return None
-
         # Extract cycle prefix (e.g., "r4." from "r4.2")
         match = re.match(r"(r\d+\.)", release_tag)
         cycle_prefix = match.group(1) if match else None
-
-        if cycle_prefix:
-            for r in releases:
-                if not r.tag_name.startswith(cycle_prefix):
-                    continue  # Different cycle
+        checking_cycle = cycle_prefix is not None
+
+        # One newest-first pass: same-cycle prereleases are checked for a
+        # previous RC until the cycle's public release (if any) is reached;
+        # the first public release is the fallback base. Stops fetching as
+        # soon as both are settled.
+        latest_public = None
+        for r in self.gh.iter_releases(include_drafts=False):
+            if checking_cycle and r.tag_name.startswith(cycle_prefix):
                 if not r.prerelease:
-                    break  # Public release in same cycle — no prior RC possible
-                # Same-cycle prerelease — check if it's an RC
-                metadata = self.gh.get_release_metadata(r.tag_name)
-                if metadata:
-                    prev_type = metadata.get("repository", {}).get(
-                        "release_type", ""
-                    )
-                    if prev_type == "pre-release-rc":
-                        return r.tag_name  # Subsequent RC
+                    checking_cycle = False  # Public release in same cycle — no prior RC possible
+                else:
+                    # Same-cycle prerelease — check if it's an RC
+                    metadata = self.gh.get_release_metadata(r.tag_name)
+                    if metadata:
+                        prev_type = metadata.get("repository", {}).get(
+                            "release_type", ""
+                        )
+                        if prev_type == "pre-release-rc":
+                            return r.tag_name  # Subsequent RC
+            if latest_public is None and not r.prerelease:
+                latest_public = r.tag_name
+            if latest_public is not None and not checking_cycle:
+                break
 
         # No previous RC in same cycle → first RC → last public (any cycle)
-        for r in releases:
-            if not r.prerelease:
-                return r.tag_name
-        return None
+        return latest_public
 
     def _get_candidate_changes(
         self, release_tag: str, previous_release: Optional[str]
@@ -757,6 +893,21 @@ class SnapshotCreator:
         """
         return self.gh.generate_release_notes(release_tag, previous_release)
 
+    def _prefetch_candidate_changes(
+        self, release_plan: Dict[str, Any], release_tag: str
+    ) -> Tuple[str, Optional[str]]:
+        """Fetch the CHANGELOG candidate changes ahead of the CHANGELOG step.
+
+        Uses the release type of the plan, which release-metadata.yaml
+        carries over.
+
+        Returns:
+            Tuple of (release type used, candidate changes)
+        """
+        release_type = release_plan.get("repository", {}).get("target_release_type", "")
+        compare_base = self._get_compare_base(release_type, release_tag)
+        return release_type, self._get_candidate_changes(release_tag, compare_base)
+
     def _update_readme(
         self,
         temp_dir: str,
@@ -864,6 +1015,7 @@ class SnapshotCreator:
         repo_name: str,
         commonalities_version: str = "",
         icm_version: str = "",
+        prefetched_changes: Any = None,
     ) -> str:
         """Generate CHANGELOG draft on release-review branch.
 
@@ -871,14 +1023,21 @@ class SnapshotCreator:
         changes from GitHub's generate-notes API, generates draft, writes to
         CHANGELOG directory.
 
+        Args:
+            prefetched_changes: Outcome of _prefetch_candidate_changes(), used
+                if it succeeded for the same release type
+
         Returns:
             Relative path to the written CHANGELOG file.
         """
         release_type = metadata.get("repository", {}).get("release_type", "")
-        compare_base = self._get_compare_base(release_type, config.release_tag)
-        candidate_changes = self._get_candidate_changes(
-            config.release_tag, compare_base
-        )
+        if isinstance(prefetched_changes, tuple) and prefetched_changes[0] == release_type:
+            candidate_changes = prefetched_changes[1]
+        else:
+            compare_base = self._get_compare_base(release_type, config.release_tag)
+            candidate_changes = self._get_candidate_changes(
+                config.release_tag, compare_base
+            )
         changelog_metadata = deepcopy(metadata)
         if commonalities_version:
             changelog_metadata.setdefault("dependencies", {})[
@@ -926,7 +1085,7 @@ class SnapshotCreator:
             )
             # Clone minimally just to have access to remote
             try:
-                git_ops.clone()
+                git_ops.clone(strategy=CLONE_SHALLOW)
 
                 if release_review_branch:
                     try:
@@ -951,3 +1110,16 @@ class SnapshotCreator:
             shutil.rmtree(temp_dir, ignore_errors=True)
 
         return cleanup_errors
+
+
+def _stage_result(outcome: Any) -> Any:
+    """Return a preparation stage's result, or raise its exception."""
+    if isinstance(outcome, Exception):
+        raise outcome
+    return outcome
+
+
+def _profiled(profile: Profile, name: str, call: Callable[[], Any]) -> Any:
+    """Run a preparation stage as a profile stage of the same name."""
+    with profile.stage(name):
+        return call()
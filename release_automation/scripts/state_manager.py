@@ -5,15 +5,19 @@ This module provides the core state derivation logic that determines
 the current release state by examining repository artifacts.
 """
 
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-import time
-from typing import Any, Dict, List, Optional
+from functools import partial
+import threading
+from typing import Any, Callable, Dict, Iterator, List, Optional
 
 import yaml
 
-from .github_client import GitHubClient
+from .async_github_client import DEFAULT_CONCURRENCY, run_parallel
+from .github_client import GitHubClient, GitHubClientError
+from .waiter import Waiter
 from . import config
 
 
@@ -142,6 +146,109 @@ class ReleaseInfoResult:
             }
 
 
+class RepositoryStateView:
+    """
+    Release-relevant repository artifacts as seen by one workflow run.
+
+    Wraps an artifact source (a ReleaseView, which fetches tags, snapshot
+    branches, drafts, open PRs and the plan in one GraphQL request, or
+    the GitHubClient itself) and memoizes every lookup, including the
+    release issue search. State derivations that share a view therefore
+    see one consistent picture of the repository, and each artifact is
+    fetched at most once. Any object with the same read methods can be
+    used as the source, e.g. a stub to exercise the state machine offline.
+
+    Attributes:
+        source: Artifact source the lookups are answered from
+        client: Client for lookups the source does not offer (issues)
+        lookups: Number of lookups made through the view
+        fetches: Number of lookups that reached the source
+    """
+
+    def __init__(self, source: Any, client: Optional[GitHubClient] = None):
+        """
+        Initialize the view.
+
+        Args:
+            source: ReleaseView, GitHubClient or compatible object
+            client: Client for issue searches (defaults to source)
+        """
+        self.source = source
+        self.client = client or source
+        self.lookups = 0
+        self.fetches = 0
+        self._memo: Dict[tuple, Any] = {}
+        self._lock = threading.Lock()
+
+    def _lookup(self, key: tuple, fetch: Callable[[], Any]) -> Any:
+        # Safe for concurrent lookups of different keys (see
+        # ReleaseStateManager.get_current_snapshot)
+        with self._lock:
+            self.lookups += 1
+            if key in self._memo:
+                return self._memo[key]
+            self.fetches += 1
+        value = fetch()
+        with self._lock:
+            return self._memo.setdefault(key, value)
+
+    def tag_exists(self, tag: str) -> bool:
+        """Check if a tag exists (see GitHubClient.tag_exists)."""
+        return self._lookup(("tag", tag), lambda: self.source.tag_exists(tag))
+
+    def list_branches(self, pattern: Optional[str] = None) -> List[Any]:
+        """List branches matching pattern (see GitHubClient.list_branches)."""
+        return list(self._lookup(
+            ("branches", pattern), lambda: self.source.list_branches(pattern)
+        ))
+
+    def draft_release_exists(self, tag: str) -> bool:
+        """Check for a draft release (see GitHubClient.draft_release_exists)."""
+        return self._lookup(("draft", tag), lambda: self.source.draft_release_exists(tag))
+
+    def find_pr_for_branch(self, head_branch: str) -> Optional[int]:
+        """Find an open PR by head branch (see GitHubClient.find_pr_for_branch)."""
+        return self._lookup(
+            ("pr", head_branch), lambda: self.source.find_pr_for_branch(head_branch)
+        )
+
+    def get_branch_creation_time(self, branch: str) -> Optional[str]:
+        """Get a branch HEAD date (see GitHubClient.get_branch_creation_time)."""
+        return self._lookup(
+            ("branch_date", branch), lambda: self.source.get_branch_creation_time(branch)
+        )
+
+    def get_file_content(self, path: str, ref: str = "main") -> Optional[str]:
+        """Read a file (see GitHubClient.get_file_content)."""
+        return self._lookup(
+            ("file", path, ref), lambda: self.source.get_file_content(path, ref)
+        )
+
+    def search_issues(
+        self, labels: Optional[List[str]] = None, state: str = "open"
+    ) -> List[dict]:
+        """Search issues (see GitHubClient.search_issues)."""
+        return list(self._lookup(
+            ("issues", tuple(labels or ()), state),
+            lambda: self.client.search_issues(labels=labels, state=state),
+        ))
+
+    def list_issue_titles(
+        self, labels: Optional[List[str]] = None, state: str = "open"
+    ) -> List[dict]:
+        """List issue numbers and titles (see GitHubClient.list_issue_titles)."""
+        return list(self._lookup(
+            ("issue_titles", tuple(labels or ()), state),
+            lambda: self.client.list_issue_titles(labels=labels, state=state),
+        ))
+
+    def get_issue(self, issue_number: int) -> dict:
+        """Read one issue (see GitHubClient.get_issue)."""
+        return self._lookup(
+            ("issue", issue_number), lambda: self.client.get_issue(issue_number)
+        )
+
+
 class ReleaseStateManager:
     """
     Manages release state derivation from repository artifacts.
@@ -149,16 +256,106 @@ class ReleaseStateManager:
     This class examines repository artifacts (tags, branches, releases,
     release-plan.yaml) to determine the current state of a release.
     All operations are read-only.
+
+    Each method reads the artifacts through a RepositoryStateView. Inside
+    `with manager.consistent_view():` all methods share one view, so a
+    run sees the same tags, branches and drafts throughout and fetches
+    each artifact once; outside such a block every call takes a fresh view.
     """
 
-    def __init__(self, github_client: GitHubClient):
+    def __init__(
+        self,
+        github_client: GitHubClient,
+        use_release_view: bool = False,
+        max_concurrency: int = DEFAULT_CONCURRENCY,
+        draft_waiter: Optional[Waiter] = None,
+    ):
         """
         Initialize the state manager.
 
         Args:
             github_client: GitHubClient instance for repository operations
+            use_release_view: Fetch the artifacts for a derivation in one
+                GraphQL request (GitHubClient.get_release_view) instead of
+                one REST call per artifact
+            max_concurrency: Maximum number of independent lookups in
+                flight (1 makes all lookups sequential)
+            draft_waiter: Backoff and deadline for retried draft-release
+                detection (defaults to Waiter())
         """
         self.gh = github_client
+        self.use_release_view = use_release_view
+        self.max_concurrency = max_concurrency
+        self.draft_waiter = draft_waiter or Waiter()
+        self._view: Optional[RepositoryStateView] = None
+
+    @contextmanager
+    def consistent_view(
+        self, release_tag: Optional[str] = None
+    ) -> Iterator[RepositoryStateView]:
+        """
+        Answer all state-manager calls in the block from one view.
+
+        Nested blocks share the outer view. Retries of the draft-release
+        check still query the client, since they wait for changes.
+
+        Args:
+            release_tag: Release tag being derived, if already known
+
+        Yields:
+            The shared RepositoryStateView
+        """
+        if self._view is not None:
+            yield self._view
+            return
+        self._view = self.capture_view(release_tag)
+        try:
+            yield self._view
+        finally:
+            self._view = None
+
+    def capture_view(self, release_tag: Optional[str] = None) -> RepositoryStateView:
+        """
+        Create a RepositoryStateView over the configured artifact source.
+
+        Args:
+            release_tag: Release tag being derived, if already known
+
+        Returns:
+            New RepositoryStateView
+        """
+        return RepositoryStateView(self._source(release_tag), self.gh)
+
+    def _artifacts(self, release_tag: Optional[str] = None) -> RepositoryStateView:
+        """Get the active view, or a fresh one outside consistent_view()."""
+        if self._view is not None:
+            return self._view
+        return self.capture_view(release_tag)
+
+    def _source(self, release_tag: Optional[str] = None):
+        """
+        Get the source of repository artifacts for a view.
+
+        Returns a ReleaseView when use_release_view is enabled, otherwise the
+        GitHubClient itself. Both expose the same read methods. If the batched
+        query fails, falls back to the client.
+
+        Args:
+            release_tag: Release tag being derived, if already known
+        """
+        if not self.use_release_view:
+            return self.gh
+
+        try:
+            return self.gh.get_release_view(
+                release_tag,
+                branch_prefix=config.SNAPSHOT_BRANCH_PREFIX,
+                plan_path=config.RELEASE_PLAN_FILE,
+                metadata_path=config.RELEASE_METADATA_FILE,
+            )
+        except GitHubClientError as e:
+            print(f"Warning: Release view query failed, using REST lookups: {e}")
+            return self.gh
 
     def derive_state(
         self,
@@ -185,21 +382,25 @@ class ReleaseStateManager:
         Returns:
             Current ReleaseState for the given release tag
         """
+        artifacts = self._artifacts(release_tag)
+
         # Step 1: Check if tag exists → PUBLISHED
-        if self.gh.tag_exists(release_tag):
+        if artifacts.tag_exists(release_tag):
             return ReleaseState.PUBLISHED
 
         # Step 2: Check for snapshot branch
-        snapshot_branches = self.gh.list_branches(f"{config.SNAPSHOT_BRANCH_PREFIX}{release_tag}-*")
+        snapshot_branches = artifacts.list_branches(f"{config.SNAPSHOT_BRANCH_PREFIX}{release_tag}-*")
 
         if snapshot_branches:
             # Step 3: Check for draft release
-            if self._draft_release_exists(release_tag, retry=retry_draft_release):
+            if self._draft_release_exists(
+                release_tag, retry=retry_draft_release, artifacts=artifacts
+            ):
                 return ReleaseState.DRAFT_READY
             return ReleaseState.SNAPSHOT_ACTIVE
 
         # Step 4: No snapshot - check release-plan.yaml for PLANNED state
-        plan = self._read_release_plan()
+        plan = self._read_release_plan(artifacts=artifacts)
         if plan:
             target_tag = plan.get("repository", {}).get("target_release_tag")
             release_type = plan.get("repository", {}).get("target_release_type")
@@ -212,27 +413,38 @@ class ReleaseStateManager:
 
         return ReleaseState.NOT_PLANNED
 
-    def _draft_release_exists(self, release_tag: str, retry: bool = False) -> bool:
+    def _draft_release_exists(
+        self, release_tag: str, retry: bool = False, artifacts=None
+    ) -> bool:
         """
-        Check if a draft release exists, optionally retrying for eventual consistency.
+        Check if a draft release exists, optionally polling for eventual consistency.
 
         Args:
             release_tag: Release tag to check (e.g., "r4.1")
-            retry: Whether to retry draft-release detection
+            retry: Poll (with draft_waiter) until the draft is seen or the
+                deadline passes
+            artifacts: Artifact source for the first attempt (polls always
+                query the client, since a ReleaseView is a point-in-time snapshot)
 
         Returns:
             True if a draft release exists, False otherwise
         """
-        attempts = 3 if retry else 1
+        source = artifacts if artifacts is not None else self.gh
+        if not retry:
+            return source.draft_release_exists(release_tag)
 
-        for attempt in range(attempts):
-            if self.gh.draft_release_exists(release_tag):
-                return True
+        # First probe through the view; later ones bypass the client's
+        # release index, which would not see drafts created since it was built
+        probes = iter([partial(source.draft_release_exists, release_tag)])
 
-            if attempt < attempts - 1:
-                time.sleep(5)
+        def probe() -> bool:
+            first = next(probes, None)
+            if first is not None:
+                return first()
+            return self.gh.draft_release_exists(release_tag, fresh=True)
 
-        return False
+        result = self.draft_waiter.until(probe, description=f"Draft release {release_tag}")
+        return result.satisfied
 
     def get_current_snapshot(self, release_tag: str) -> Optional[SnapshotInfo]:
         """
@@ -247,7 +459,8 @@ class ReleaseStateManager:
         Returns:
             SnapshotInfo if a snapshot exists, None otherwise
         """
-        branches = self.gh.list_branches(f"{config.SNAPSHOT_BRANCH_PREFIX}{release_tag}-*")
+        artifacts = self._artifacts(release_tag)
+        branches = artifacts.list_branches(f"{config.SNAPSHOT_BRANCH_PREFIX}{release_tag}-*")
 
         if not branches:
             return None
@@ -261,8 +474,15 @@ class ReleaseStateManager:
         # release-snapshot/r4.1-abc1234 → r4.1-abc1234
         snapshot_id = branch_name.replace(config.SNAPSHOT_BRANCH_PREFIX, "")
 
-        # Read release-metadata.yaml from the snapshot branch
-        metadata = self._read_release_metadata(branch_name)
+        release_review_branch = f"{config.RELEASE_REVIEW_BRANCH_PREFIX}{snapshot_id}"
+
+        # The metadata, HEAD date and Release PR lookups depend only on
+        # the branch name: issue them concurrently
+        metadata, created_at_str, release_pr_number = run_parallel([
+            partial(self._read_release_metadata, branch_name, artifacts=artifacts),
+            partial(artifacts.get_branch_creation_time, branch_name),
+            partial(artifacts.find_pr_for_branch, release_review_branch),
+        ], limit=self.max_concurrency)
 
         # Extract data from metadata (or use defaults)
         if metadata:
@@ -282,8 +502,7 @@ class ReleaseStateManager:
             commonalities_release = ""
             identity_consent_management_release = ""
 
-        # Get branch creation time (approximated)
-        created_at_str = self.gh.get_branch_creation_time(branch_name)
+        # Branch creation time (approximated by the HEAD commit date)
         if created_at_str:
             try:
                 created_at = datetime.fromisoformat(created_at_str.replace("Z", "+00:00"))
@@ -292,10 +511,6 @@ class ReleaseStateManager:
         else:
             created_at = datetime.now()
 
-        # Find the Release PR for this snapshot branch
-        release_review_branch = f"{config.RELEASE_REVIEW_BRANCH_PREFIX}{snapshot_id}"
-        release_pr_number = self.gh.find_pr_for_branch(release_review_branch)
-
         return SnapshotInfo(
             snapshot_id=snapshot_id,
             snapshot_branch=branch_name,
@@ -334,35 +549,45 @@ class ReleaseStateManager:
         """
         Find the Release Issue number for a given release tag.
 
-        Searches for open issues with the 'release-issue' label that:
-        1. Contain the WORKFLOW_MARKER in the body (workflow-owned)
-        2. Have the release_tag in the title
+        Lists the open issues with the 'release-issue' label (number and
+        title only) and reads the body of those whose title contains the
+        release_tag, returning the first one that contains the
+        WORKFLOW_MARKER (workflow-owned).
 
         Args:
             release_tag: Release tag to search for (e.g., "r4.1")
 
         Returns:
             Issue number if found, None otherwise
+
+        Raises:
+            GitHubClientError: If the issues cannot be listed
         """
-        issues = self.gh.search_issues(
-            labels=[RELEASE_ISSUE_LABEL],
-            state="open"
-        )
+        return self._find_release_issue(release_tag, self._artifacts(release_tag))
 
-        for issue in issues:
-            body = issue.get("body", "") or ""
-            title = issue.get("title", "") or ""
+    def _find_release_issue(
+        self, release_tag: str, artifacts: RepositoryStateView
+    ) -> Optional[int]:
+        for issue in self._release_issue_titles(artifacts):
+            # Check for release tag in title
+            if release_tag not in (issue.get("title") or ""):
+                continue
 
             # Check for workflow marker
-            if WORKFLOW_MARKER not in body:
+            try:
+                body = artifacts.get_issue(issue["number"]).get("body") or ""
+            except GitHubClientError:
                 continue
-
-            # Check for release tag in title
-            if release_tag in title:
-                return issue.get("number")
+            if WORKFLOW_MARKER in body:
+                return issue["number"]
 
         return None
 
+    def _release_issue_titles(self, artifacts: RepositoryStateView) -> List[dict]:
+        # Listing errors (auth, rate limit) propagate: they must not be
+        # reported as "no Release Issue"
+        return artifacts.list_issue_titles(labels=[RELEASE_ISSUE_LABEL], state="open")
+
     def get_current_release_info(self) -> ReleaseInfoResult:
         """
         Get the current release tag and state from repository artifacts.
@@ -385,35 +610,49 @@ class ReleaseStateManager:
                 - success=True: release_tag, state, snapshot_branch, source
                 - success=False: config_error with details
         """
+        artifacts = self._artifacts()
+
         # First, try to read release-plan.yaml and handle configuration errors
-        plan, config_error = self._read_release_plan_with_validation()
+        plan, config_error = self._read_release_plan_with_validation(artifacts=artifacts)
 
         if config_error:
             return ReleaseInfoResult(success=False, config_error=config_error)
 
+        # The release issue listing does not depend on the derivation:
+        # prefetch it into the view while the artifacts are checked
+        result, _ = run_parallel([
+            partial(self._release_info_from_plan, plan, artifacts),
+            partial(self._release_issue_titles, artifacts),
+        ], limit=self.max_concurrency)
+        result.release_issue_number = self._find_release_issue(result.release_tag, artifacts)
+        return result
+
+    def _release_info_from_plan(
+        self, plan: dict, artifacts: RepositoryStateView
+    ) -> ReleaseInfoResult:
+        """Derive release tag and state for a validated plan (without issue number)."""
         # At this point, plan is valid with all required fields
         plan_release_tag = plan["repository"]["target_release_tag"]
         plan_release_type = plan["repository"].get("target_release_type")
 
         # Check if the planned release is already published
-        if self.gh.tag_exists(plan_release_tag):
+        if artifacts.tag_exists(plan_release_tag):
             return ReleaseInfoResult(
                 success=True,
                 release_tag=plan_release_tag,
                 state=ReleaseState.PUBLISHED,
                 snapshot_branch=None,
                 source="tag",
-                release_issue_number=self.find_release_issue(plan_release_tag),
                 release_type=plan_release_type
             )
 
         # Check for any snapshot branches for the planned release
-        snapshot_branches = self.gh.list_branches(f"{config.SNAPSHOT_BRANCH_PREFIX}{plan_release_tag}-*")
+        snapshot_branches = artifacts.list_branches(f"{config.SNAPSHOT_BRANCH_PREFIX}{plan_release_tag}-*")
 
         if snapshot_branches:
             # Snapshot exists - read release_tag from release-metadata.yaml
             snapshot_branch = snapshot_branches[0].name
-            metadata = self._read_release_metadata(snapshot_branch)
+            metadata = self._read_release_metadata(snapshot_branch, artifacts=artifacts)
 
             if metadata:
                 metadata_release_tag = metadata.get("repository", {}).get("release_tag")
@@ -424,7 +663,7 @@ class ReleaseStateManager:
                 metadata_release_tag = snapshot_id.split("-")[0] if "-" in snapshot_id else snapshot_id
 
             # Determine if draft ready
-            if self.gh.draft_release_exists(metadata_release_tag or plan_release_tag):
+            if artifacts.draft_release_exists(metadata_release_tag or plan_release_tag):
                 state = ReleaseState.DRAFT_READY
             else:
                 state = ReleaseState.SNAPSHOT_ACTIVE
@@ -436,7 +675,6 @@ class ReleaseStateManager:
                 state=state,
                 snapshot_branch=snapshot_branch,
                 source="release-metadata.yaml",
-                release_issue_number=self.find_release_issue(effective_tag),
                 release_type=snapshot.release_type if 'snapshot' in locals() and snapshot else None
             )
 
@@ -453,12 +691,11 @@ class ReleaseStateManager:
             state=state,
             snapshot_branch=None,
             source="release-plan.yaml",
-            release_issue_number=self.find_release_issue(plan_release_tag),
             release_type=plan_release_type
         )
 
     def _read_release_plan_with_validation(
-        self, ref: str = "main"
+        self, ref: str = "main", artifacts=None
     ) -> tuple[Optional[dict], Optional[ConfigurationError]]:
         """
         Read and validate release-plan.yaml from the repository.
@@ -470,13 +707,15 @@ class ReleaseStateManager:
 
         Args:
             ref: Branch, tag, or commit to read from
+            artifacts: Artifact source (defaults to the active view, or
+                the GitHubClient outside consistent_view())
 
         Returns:
             Tuple of (parsed_content, error):
                 - (dict, None) if successful
                 - (None, ConfigurationError) if error
         """
-        content = self.gh.get_file_content(config.RELEASE_PLAN_FILE, ref)
+        content = (artifacts or self._view or self.gh).get_file_content(config.RELEASE_PLAN_FILE, ref)
 
         if content is None:
             return None, ConfigurationError(
@@ -524,17 +763,19 @@ class ReleaseStateManager:
 
         return plan, None
 
-    def _read_release_plan(self, ref: str = "main") -> Optional[dict]:
+    def _read_release_plan(self, ref: str = "main", artifacts=None) -> Optional[dict]:
         """
         Read and parse release-plan.yaml from the repository.
 
         Args:
             ref: Branch, tag, or commit to read from
+            artifacts: Artifact source (defaults to the active view, or
+                the GitHubClient outside consistent_view())
 
         Returns:
             Parsed YAML content as dict, or None if file doesn't exist or is invalid
         """
-        content = self.gh.get_file_content(config.RELEASE_PLAN_FILE, ref)
+        content = (artifacts or self._view or self.gh).get_file_content(config.RELEASE_PLAN_FILE, ref)
         if not content:
             return None
 
@@ -544,17 +785,19 @@ class ReleaseStateManager:
             print(f"Warning: Failed to parse release-plan.yaml from {ref}: {e}")
             return None
 
-    def _read_release_metadata(self, ref: str) -> Optional[dict]:
+    def _read_release_metadata(self, ref: str, artifacts=None) -> Optional[dict]:
         """
         Read and parse release-metadata.yaml from a branch.
 
         Args:
             ref: Branch, tag, or commit to read from
+            artifacts: Artifact source (defaults to the active view, or
+                the GitHubClient outside consistent_view())
 
         Returns:
             Parsed YAML content as dict, or None if file doesn't exist or is invalid
         """
-        content = self.gh.get_file_content(config.RELEASE_METADATA_FILE, ref)
+        content = (artifacts or self._view or self.gh).get_file_content(config.RELEASE_METADATA_FILE, ref)
         if not content:
             return None
 
@@ -0,0 +1,478 @@
+"""
+Incremental release state updates from GitHub event payloads.
+
+Every workflow run derives the release state from scratch, although the
+triggering event usually says exactly what changed - and for most
+triggers (slash commands, PR updates, comments) the answer is "no
+release artifact changed". The reducer keeps the state derived by the
+previous run in a small JSON file and applies the event payload to it:
+
+    reduce_event(previous, event_name, payload) -> DerivedState | None
+
+- events that cannot change the release artifacts return the previous
+  state unchanged;
+- events whose effect is fully described by the payload (the Release
+  PR opened or closed) are applied to it;
+- anything else (plan changes, snapshot branches, release events,
+  unknown events) returns None and the caller falls back to full
+  derivation.
+
+Draft releases do not trigger workflows, so no event reports a draft
+being created or deleted. resolve_state() therefore checks the draft
+release of an active snapshot on every reduced run (one lookup) instead
+of trusting the stored SNAPSHOT_ACTIVE / DRAFT_READY distinction.
+
+A stored state is only reused if it is recent and "settled": the run
+that wrote it did not go on to change the artifacts itself (e.g.,
+/create-snapshot creates the snapshot after the state was derived).
+Changes made outside the workflow are not seen by the reducer; verify
+mode derives in full as well and reports any difference.
+"""
+
+import json
+import os
+import tempfile
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from .github_transport import CACHE_DIR_ENV
+from .state_manager import (
+    ConfigurationError,
+    ReleaseInfoResult,
+    ReleaseState,
+    ReleaseStateManager,
+    SnapshotInfo,
+)
+from . import config
+
+
+STATE_DIR = "release-state"
+
+# A stored state older than this is re-derived, bounding how long a
+# change made outside the workflow can go unnoticed
+DEFAULT_MAX_AGE = timedelta(hours=24)
+
+# Slash commands whose run changes the release artifacts after the state
+# has been derived
+MUTATING_COMMANDS = {"create-snapshot", "discard-snapshot", "delete-draft", "publish-release"}
+
+# Push payloads list at most 20 commits
+PUSH_COMMIT_LIMIT = 20
+
+
+def default_state_path(repo: str, cache_dir: Optional[str] = None) -> Optional[str]:
+    """
+    Return the stored state file for a repository under the API cache directory.
+
+    Args:
+        repo: Repository in format "owner/name"
+        cache_dir: Cache directory (defaults to GITHUB_CLIENT_CACHE_DIR)
+
+    Returns:
+        Path of the state file, or None if no cache directory is set
+    """
+    cache_dir = cache_dir or os.environ.get(CACHE_DIR_ENV)
+    if not cache_dir:
+        return None
+    return os.path.join(cache_dir, STATE_DIR, repo.replace("/", "__") + ".json")
+
+
+@dataclass
+class DerivedState:
+    """
+    Everything derive-release-state reports for a repository.
+
+    Attributes:
+        release_info: Result of get_current_release_info()
+        snapshot: Current snapshot of the release tag, if any
+        plan: Parsed release-plan.yaml from main, if readable
+        derived_at: When the state was last derived in full (ISO 8601, UTC)
+        settled: False if the run that derived it changes the artifacts
+            afterwards, so the next run must derive in full
+    """
+    release_info: ReleaseInfoResult
+    snapshot: Optional[SnapshotInfo] = None
+    plan: Optional[dict] = None
+    derived_at: str = field(default_factory=lambda: _now().isoformat())
+    settled: bool = True
+
+    @classmethod
+    def derive(cls, manager: ReleaseStateManager) -> "DerivedState":
+        """
+        Derive the state from the repository artifacts.
+
+        Args:
+            manager: ReleaseStateManager for the repository
+
+        Returns:
+            Freshly derived state
+        """
+        with manager.consistent_view():
+            release_info = manager.get_current_release_info()
+            snapshot = None
+            plan = None
+            if release_info.success:
+                if release_info.release_tag:
+                    snapshot = manager.get_current_snapshot(release_info.release_tag)
+                plan = manager._read_release_plan()
+        return cls(release_info, snapshot, plan)
+
+    # -------------------------------------------------------------------------
+    # Persistence
+    # -------------------------------------------------------------------------
+
+    @classmethod
+    def load(cls, path: Optional[str]) -> Optional["DerivedState"]:
+        """
+        Load a stored state; a missing or unreadable file gives None.
+
+        Args:
+            path: State file
+
+        Returns:
+            The stored state, or None
+        """
+        if not path:
+            return None
+        try:
+            with open(path, encoding="utf-8") as f:
+                return cls.from_dict(json.load(f))
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return None
+
+    def save(self, path: Optional[str]) -> None:
+        """Write the state to a file (atomically); no-op without a path."""
+        if not path:
+            return
+        directory = os.path.dirname(path) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self.to_dict(), f, indent=2)
+            os.replace(tmp_path, path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    def to_dict(self) -> Dict[str, Any]:
+        info = self.release_info
+        snapshot = None
+        if self.snapshot:
+            snapshot = dict(vars(self.snapshot))
+            snapshot["created_at"] = self.snapshot.created_at.isoformat()
+        return {
+            "release_info": {
+                "success": info.success,
+                "release_tag": info.release_tag,
+                "state": info.state.value if info.state else None,
+                "snapshot_branch": info.snapshot_branch,
+                "source": info.source,
+                "config_error": dict(vars(info.config_error)) if info.config_error else None,
+                "release_issue_number": info.release_issue_number,
+                "release_type": info.release_type,
+            },
+            "snapshot": snapshot,
+            "plan": self.plan,
+            "derived_at": self.derived_at,
+            "settled": self.settled,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DerivedState":
+        info = dict(data["release_info"])
+        if info.get("state"):
+            info["state"] = ReleaseState(info["state"])
+        if info.get("config_error"):
+            info["config_error"] = ConfigurationError(**info["config_error"])
+        snapshot = data.get("snapshot")
+        if snapshot:
+            snapshot = dict(snapshot)
+            snapshot["created_at"] = datetime.fromisoformat(snapshot["created_at"])
+            snapshot = SnapshotInfo(**snapshot)
+        return cls(
+            release_info=ReleaseInfoResult(**info),
+            snapshot=snapshot,
+            plan=data.get("plan"),
+            derived_at=data["derived_at"],
+            settled=bool(data.get("settled", False)),
+        )
+
+    def copy(self) -> "DerivedState":
+        """
+        Return an independent copy.
+
+        derived_at is kept, so the age of a reduced state is the time
+        since the last full derivation.
+        """
+        return DerivedState.from_dict(self.to_dict())
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _slash_command(event_name: str, payload: Dict[str, Any]) -> Optional[str]:
+    """Return the slash command of an issue comment (e.g., "create-snapshot")."""
+    if event_name != "issue_comment":
+        return None
+    body = ((payload.get("comment") or {}).get("body") or "").strip()
+    if not body.startswith("/"):
+        return None
+    return body[1:].split(None, 1)[0] if len(body) > 1 else None
+
+
+def reduce_event(
+    previous: Optional[DerivedState],
+    event_name: str,
+    payload: Dict[str, Any],
+    max_age: timedelta = DEFAULT_MAX_AGE,
+) -> Optional[DerivedState]:
+    """
+    Apply a GitHub event to the previously derived state.
+
+    Args:
+        previous: State stored by the previous run (None if there is none)
+        event_name: GitHub event name (e.g., "issue_comment")
+        payload: GitHub event payload
+        max_age: Oldest stored state that is reused
+
+    Returns:
+        The new state, or None if the event needs a full derivation
+    """
+    if previous is None or not previous.settled:
+        return None
+    try:
+        derived_at = datetime.fromisoformat(previous.derived_at)
+    except ValueError:
+        return None
+    if derived_at.tzinfo is None or _now() - derived_at > max_age:
+        return None
+
+    action = payload.get("action")
+    info = previous.release_info
+
+    if event_name in ("issue_comment", "pull_request_review", "pull_request_review_comment"):
+        return previous.copy()
+
+    if event_name == "issues":
+        # Closing or reopening may change which issue is the Release Issue
+        if action in ("closed", "reopened", "deleted", "transferred"):
+            return None
+        return previous.copy()
+
+    if event_name == "pull_request":
+        pr = payload.get("pull_request") or {}
+        head = (pr.get("head") or {}).get("ref", "")
+        base = (pr.get("base") or {}).get("ref", "")
+        if base.startswith(config.SNAPSHOT_BRANCH_PREFIX) and pr.get("merged"):
+            return None
+        snapshot = previous.snapshot
+        if not snapshot or head != snapshot.release_review_branch:
+            return previous.copy()
+        state = previous.copy()
+        if action in ("opened", "reopened"):
+            state.snapshot.release_pr_number = pr.get("number")
+        elif action == "closed":
+            state.snapshot.release_pr_number = None
+        return state
+
+    if event_name == "push":
+        ref = payload.get("ref", "")
+        if ref.startswith("refs/tags/"):
+            return None if ref[len("refs/tags/"):] == info.release_tag else previous.copy()
+        branch = ref[len("refs/heads/"):]
+        if branch.startswith(config.SNAPSHOT_BRANCH_PREFIX):
+            return None
+        if branch != "main":
+            return previous.copy()
+        commits = payload.get("commits")
+        if not commits or len(commits) >= PUSH_COMMIT_LIMIT:
+            return None
+        for commit in commits:
+            changed = (
+                (commit.get("added") or [])
+                + (commit.get("modified") or [])
+                + (commit.get("removed") or [])
+            )
+            if config.RELEASE_PLAN_FILE in changed:
+                return None
+        return previous.copy()
+
+    if event_name in ("create", "delete"):
+        ref = payload.get("ref", "")
+        if payload.get("ref_type") == "tag":
+            return None if ref == info.release_tag else previous.copy()
+        if ref.startswith((config.SNAPSHOT_BRANCH_PREFIX, config.RELEASE_REVIEW_BRANCH_PREFIX)):
+            return None
+        return previous.copy()
+
+    if event_name == "release":
+        # Only published releases trigger workflows; one for the release
+        # tag changes the state
+        release = payload.get("release") or {}
+        if release.get("tag_name") != info.release_tag:
+            return previous.copy()
+        return None
+
+    # workflow_dispatch is the documented recovery path after manual
+    # changes; unknown events are not interpreted
+    return None
+
+
+def refresh_draft_state(state: DerivedState, manager: ReleaseStateManager) -> DerivedState:
+    """
+    Re-check the draft release of an active snapshot.
+
+    Args:
+        state: Reduced state (updated in place)
+        manager: ReleaseStateManager for the repository
+
+    Returns:
+        The state, DRAFT_READY or SNAPSHOT_ACTIVE as the draft release
+        exists or not
+    """
+    info = state.release_info
+    if info.release_tag and info.state in (ReleaseState.SNAPSHOT_ACTIVE, ReleaseState.DRAFT_READY):
+        if manager._draft_release_exists(info.release_tag):
+            info.state = ReleaseState.DRAFT_READY
+        else:
+            info.state = ReleaseState.SNAPSHOT_ACTIVE
+    return state
+
+
+def is_settled(event_name: str, payload: Dict[str, Any], state: DerivedState) -> bool:
+    """
+    Tell whether the run triggered by an event leaves the artifacts as derived.
+
+    Args:
+        event_name: GitHub event name of the run
+        payload: GitHub event payload
+        state: State derived for the run
+
+    Returns:
+        False if the run goes on to change the release artifacts
+    """
+    action = payload.get("action")
+    if event_name == "issue_comment":
+        command = _slash_command(event_name, payload)
+        if command in MUTATING_COMMANDS:
+            return False
+        # sync-issue creates the Release Issue if there is none
+        return command != "sync-issue" or state.release_info.release_issue_number is not None
+    if event_name == "issues":
+        return action not in ("closed", "reopened")
+    if event_name == "pull_request":
+        pr = payload.get("pull_request") or {}
+        base = (pr.get("base") or {}).get("ref", "")
+        return not (action == "closed" and pr.get("merged") and base.startswith(config.SNAPSHOT_BRANCH_PREFIX))
+    # push and workflow_dispatch run sync-issue, which may open or close issues
+    return event_name not in ("push", "workflow_dispatch")
+
+
+def compare_states(actual: DerivedState, expected: DerivedState) -> List[str]:
+    """
+    List the differences between two states, ignoring bookkeeping fields.
+
+    Args:
+        actual: State produced by the reducer
+        expected: State from a full derivation
+
+    Returns:
+        Descriptions of the differences (empty if equal)
+    """
+    differences = []
+    actual_dict = actual.to_dict()
+    expected_dict = expected.to_dict()
+    for section in ("release_info", "snapshot", "plan"):
+        a = actual_dict[section] or {}
+        e = expected_dict[section] or {}
+        for key in sorted(set(a) | set(e)):
+            if section == "snapshot" and key == "created_at":
+                continue
+            if a.get(key) != e.get(key):
+                differences.append(f"{section}.{key}: reduced {a.get(key)!r}, derived {e.get(key)!r}")
+    return differences
+
+
+@dataclass
+class StateResolution:
+    """
+    Outcome of resolve_state().
+
+    Attributes:
+        state: State to report (from the reducer, or derived in full)
+        incremental: True if the state came from the reducer
+        differences: Reducer vs. full derivation (verify mode only)
+    """
+    state: DerivedState
+    incremental: bool = False
+    differences: List[str] = field(default_factory=list)
+
+
+def resolve_state(
+    manager: ReleaseStateManager,
+    event_name: str,
+    payload: Dict[str, Any],
+    path: Optional[str] = None,
+    verify: bool = False,
+    max_age: timedelta = DEFAULT_MAX_AGE,
+) -> StateResolution:
+    """
+    Return the release state for a run, reducing the stored state if possible.
+
+    The result is stored for the next run (best-effort: a failed write
+    only costs the next run a full derivation).
+
+    Args:
+        manager: ReleaseStateManager for the repository
+        event_name: GitHub event name of the run
+        payload: GitHub event payload
+        path: Stored state file (None disables the reducer)
+        verify: Also derive in full, report differences and use the derived state
+        max_age: Oldest stored state that is reused
+
+    Returns:
+        StateResolution
+    """
+    reduced = None
+    if path:
+        reduced = reduce_event(DerivedState.load(path), event_name, payload, max_age)
+    if reduced is not None:
+        reduced = refresh_draft_state(reduced, manager)
+
+    if reduced is not None and not verify:
+        resolution = StateResolution(reduced, incremental=True)
+    else:
+        derived = DerivedState.derive(manager)
+        differences = compare_states(reduced, derived) if reduced is not None else []
+        resolution = StateResolution(derived, differences=differences)
+
+    resolution.state.settled = is_settled(event_name, payload, resolution.state)
+    if path:
+        try:
+            resolution.state.save(path)
+        except OSError:
+            pass
+    return resolution
+
+
+def read_event() -> Tuple[str, Dict[str, Any]]:
+    """
+    Read the event of the current GitHub Actions run.
+
+    Returns:
+        (event_name, payload); the payload is empty if it cannot be read
+    """
+    event_name = os.environ.get("GITHUB_EVENT_NAME", "")
+    event_path = os.environ.get("GITHUB_EVENT_PATH")
+    payload: Dict[str, Any] = {}
+    if event_path:
+        try:
+            with open(event_path, encoding="utf-8") as f:
+                payload = json.load(f) or {}
+        except (OSError, ValueError):
+            payload = {}
+    return event_name, payload
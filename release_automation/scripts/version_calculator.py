@@ -6,10 +6,12 @@ It ensures each pre-release version has a unique extension number.
 """
 
 import re
+from bisect import bisect_right, insort
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 
 from .github_client import GitHubClient
+from .version_ledger import VersionLedger
 
 
 def calculate_url_version(api_version: str) -> str:
@@ -48,29 +50,143 @@ def calculate_url_version(api_version: str) -> str:
     if api_version == "wip":
         return "vwip"
 
-    # Parse version: x.y.z or x.y.z-status.n
-    pattern = re.compile(r'^(\d+)\.(\d+)\.(\d+)(?:-([a-z]+)\.(\d+))?$')
-    match = pattern.match(api_version)
-    if not match:
+    parsed = ParsedVersion.parse(api_version)
+    if parsed is None:
         # Fallback for invalid versions
         return "vwip"
 
-    major, minor, _patch, status, extension = match.groups()
-    major = int(major)
+    return parsed.url_version
 
-    # Build URL version base
-    if major == 0:
-        # Initial version: include minor
-        base = f"v0.{minor}"
-    else:
-        # Stable version: major only
-        base = f"v{major}"
 
-    # Add pre-release suffix if present
-    if status and extension:
-        return f"{base}{status}{extension}"
+# x.y.z or x.y.z-status.n
+_VERSION_RE = re.compile(r'^(\d+)\.(\d+)\.(\d+)(?:-([a-z]+)\.(\d+))?$')
 
-    return base
+
+class ParsedVersion:
+    """
+    An API version split into its parts, with its URL namespace precomputed.
+
+    The namespace is the URL version without the pre-release extension
+    (CAMARA API Design Guide 7.2): "v{major}" for stable versions and
+    "v0.{minor}" for initial versions. Two pre-release versions with the
+    same status collide when they share a namespace, e.g. 3.1.0-rc.1 and
+    3.2.0-rc.1 both become v3rc1.
+    """
+
+    __slots__ = ("major", "minor", "patch", "status", "extension", "namespace")
+
+    def __init__(
+        self,
+        major: int,
+        minor: int,
+        patch: int,
+        status: Optional[str] = None,
+        extension: Optional[int] = None,
+    ):
+        """
+        Initialize the version.
+
+        Args:
+            major, minor, patch: Version numbers
+            status: Pre-release status ("alpha", "rc"), None for public
+            extension: Pre-release extension number, None for public
+        """
+        self.major = major
+        self.minor = minor
+        self.patch = patch
+        self.status = status
+        self.extension = extension
+        self.namespace = f"v{major}" if major else f"v0.{minor}"
+
+    @classmethod
+    def parse(cls, version: str) -> Optional["ParsedVersion"]:
+        """
+        Parse "x.y.z" or "x.y.z-status.n".
+
+        Returns:
+            ParsedVersion, or None if the string is not a valid version
+        """
+        match = _VERSION_RE.match(version) if isinstance(version, str) else None
+        if not match:
+            return None
+        major, minor, patch, status, extension = match.groups()
+        return cls(
+            int(major),
+            int(minor),
+            int(patch),
+            status,
+            int(extension) if extension is not None else None,
+        )
+
+    @property
+    def url_version(self) -> str:
+        """URL version component (e.g., "v1rc3", "v0.3")."""
+        if self.status is None:
+            return self.namespace
+        return f"{self.namespace}{self.status}{self.extension}"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ParsedVersion):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def __repr__(self) -> str:
+        version = f"{self.major}.{self.minor}.{self.patch}"
+        if self.status is not None:
+            version += f"-{self.status}.{self.extension}"
+        return f"ParsedVersion({version!r})"
+
+    def _key(self) -> Tuple[int, int, int, Optional[str], Optional[int]]:
+        return (self.major, self.minor, self.patch, self.status, self.extension)
+
+
+class ExtensionIndex:
+    """
+    Sorted index of published pre-release extensions.
+
+    Entries are (api_name, status, namespace, extension) tuples kept in
+    sorted order, so the extensions of one (api_name, status, namespace)
+    are a contiguous run and the highest one is found by bisection.
+    """
+
+    __slots__ = ("_entries",)
+
+    def __init__(self):
+        self._entries: List[Tuple[str, str, str, int]] = []
+
+    def add(self, api_name: str, version: ParsedVersion) -> None:
+        """Index a pre-release version of an API (others are ignored)."""
+        if version.status is None:
+            return
+        insort(self._entries, (api_name, version.status, version.namespace, version.extension))
+
+    def max_extension(self, api_name: str, status: str, namespace: str) -> Optional[int]:
+        """
+        Return the highest extension published in a namespace, in O(log n).
+
+        Returns:
+            Extension number, or None if there is none
+        """
+        i = bisect_right(self._entries, (api_name, status, namespace, float("inf")))
+        if i and self._entries[i - 1][:3] == (api_name, status, namespace):
+            return self._entries[i - 1][3]
+        return None
+
+    def extensions(self, api_name: str, status: str, namespace: str) -> List[int]:
+        """Return all extensions published in a namespace, ascending."""
+        prefix = (api_name, status, namespace)
+        i = bisect_right(self._entries, prefix)
+        result = []
+        while i < len(self._entries) and self._entries[i][:3] == prefix:
+            result.append(self._entries[i][3])
+            i += 1
+        return result
+
+    def __len__(self) -> int:
+        return len(self._entries)
 
 
 @dataclass
@@ -95,25 +211,28 @@ class VersionCalculator:
         - Public release: 3.2.0
     """
 
-    # Pattern to parse version with extension: 1.2.3-rc.4
-    VERSION_PATTERN = re.compile(
-        r'^(\d+\.\d+\.\d+)-([a-z]+)\.(\d+)$'
-    )
-
-    def __init__(self, github_client: GitHubClient):
+    def __init__(
+        self,
+        github_client: GitHubClient,
+        ledger: Optional[VersionLedger] = None,
+    ):
         """
         Initialize the version calculator.
 
         Args:
             github_client: GitHubClient instance for repository operations
+            ledger: Optional version ledger; when given, the release
+                history is read from it and only new releases are scanned
         """
         self.gh = github_client
+        self.ledger = ledger
 
     def calculate_version(
         self,
         api_name: str,
         target_version: str,
-        target_status: str
+        target_status: str,
+        extension_index: Optional[ExtensionIndex] = None,
     ) -> str:
         """
         Calculate the full version string with extension.
@@ -125,6 +244,8 @@ class VersionCalculator:
             api_name: Name of the API (e.g., "location-verification")
             target_version: Base version (e.g., "3.2.0")
             target_status: Release status ("alpha", "rc", or "public")
+            extension_index: Optional prebuilt index (see
+                build_extension_index); scanned from releases if not given
 
         Returns:
             Full version string (e.g., "3.2.0-rc.2")
@@ -133,18 +254,14 @@ class VersionCalculator:
         if target_status == "public":
             return target_version
 
-        # Find existing extensions for this version/status combination
-        existing = self.find_existing_extensions(
-            api_name, target_version, target_status
-        )
+        if extension_index is None:
+            extension_index = self.build_extension_index()
 
-        # Calculate next extension number
-        if existing:
-            # Get the highest existing extension
-            max_ext = max(existing)
-            next_ext = max_ext + 1
-        else:
-            next_ext = 1
+        # Highest extension already used in the target's URL namespace
+        max_ext = extension_index.max_extension(
+            api_name, target_status, self._namespace(target_version)
+        )
+        next_ext = max_ext + 1 if max_ext is not None else 1
 
         return f"{target_version}-{target_status}.{next_ext}"
 
@@ -152,23 +269,64 @@ class VersionCalculator:
         self,
         api_name: str,
         target_version: str,
-        target_status: str
+        target_status: str,
+        extension_index: Optional[ExtensionIndex] = None,
     ) -> List[int]:
         """
         Find all existing extension numbers for a version/status combination.
 
-        Scans all published releases and reads their release-metadata.yaml
-        to find matching API versions.
+        Looks the combination up in the extension index, which is built
+        from the release-metadata.yaml of all published releases.
 
         Args:
             api_name: Name of the API
             target_version: Base version (e.g., "3.2.0")
             target_status: Release status ("alpha", "rc")
+            extension_index: Optional prebuilt index (see
+                build_extension_index); scanned from releases if not given
+
+        Returns:
+            List of extension numbers found, ascending (e.g., [1, 2, 3])
+        """
+        if extension_index is None:
+            extension_index = self.build_extension_index()
+
+        return extension_index.extensions(
+            api_name, target_status, self._namespace(target_version)
+        )
+
+    def build_extension_index(self) -> ExtensionIndex:
+        """
+        Scan the release history once and index all pre-release extensions.
+
+        Reads release-metadata.yaml of every published release (or the
+        version ledger, if configured) and files each pre-release API
+        version under (api_name, status, URL version namespace).
+        Versions share a namespace when they produce the same URL
+        version (see ParsedVersion.namespace), so one index answers
+        every API and target version.
 
         Returns:
-            List of extension numbers found (e.g., [1, 2, 3])
+            ExtensionIndex of the extensions found per
+            (api_name, status, namespace)
         """
-        extensions = []
+        index = ExtensionIndex()
+
+        for api_name, api_version in self._published_versions():
+            parsed = ParsedVersion.parse(api_version)
+            if api_name and parsed is not None:
+                index.add(api_name, parsed)
+
+        return index
+
+    def _published_versions(self) -> Iterator[Tuple[str, str]]:
+        """Yield (api_name, api_version) of all published releases."""
+        if self.ledger is not None:
+            # Reads metadata only for releases the ledger has not seen
+            self.ledger.sync(self.gh)
+            for _, api_name, api_version in self.ledger.entries():
+                yield api_name, api_version
+            return
 
         # Get all published releases
         releases = self.gh.get_releases(include_drafts=False)
@@ -179,20 +337,8 @@ class VersionCalculator:
             if not metadata:
                 continue
 
-            # Check each API in the release
-            apis = metadata.get("apis", [])
-            for api in apis:
-                if api.get("api_name") != api_name:
-                    continue
-
-                api_version = api.get("api_version", "")
-                ext = self._parse_extension(
-                    api_version, target_version, target_status
-                )
-                if ext is not None:
-                    extensions.append(ext)
-
-        return extensions
+            for api in metadata.get("apis", []):
+                yield api.get("api_name"), api.get("api_version", "")
 
     def calculate_versions_for_plan(
         self,
@@ -201,6 +347,9 @@ class VersionCalculator:
         """
         Calculate versions for all APIs in a release plan.
 
+        The release history is scanned once (build_extension_index) and
+        shared by all APIs in the plan.
+
         Args:
             release_plan: Parsed release-plan.yaml content
 
@@ -208,6 +357,7 @@ class VersionCalculator:
             Dict mapping api_name to calculated version
         """
         versions = {}
+        extension_index: Optional[ExtensionIndex] = None
 
         apis = release_plan.get("apis", [])
         for api in apis:
@@ -216,12 +366,21 @@ class VersionCalculator:
             target_status = api.get("target_api_status", "public")
 
             if api_name and target_version:
+                if target_status != "public" and extension_index is None:
+                    extension_index = self.build_extension_index()
                 versions[api_name] = self.calculate_version(
-                    api_name, target_version, target_status
+                    api_name, target_version, target_status, extension_index
                 )
 
         return versions
 
+    @staticmethod
+    def _namespace(base_version: str) -> str:
+        """URL namespace shared by all pre-releases of a base version."""
+        parsed = ParsedVersion.parse(base_version)
+        # Invalid versions fall back to "vwip", like calculate_url_version
+        return parsed.namespace if parsed is not None else "vwip"
+
     def _parse_extension(
         self,
         version: str,
@@ -248,21 +407,15 @@ class VersionCalculator:
         Returns:
             Extension number or None if no match
         """
-        match = self.VERSION_PATTERN.match(version)
-        if not match:
+        parsed = ParsedVersion.parse(version)
+        if parsed is None or parsed.status is None:
             return None
 
-        base_version, status, extension = match.groups()
-
-        if status != target_status:
+        if parsed.status != target_status:
             return None
 
         # Two versions collide if they produce the same URL version prefix.
-        # Reuse calculate_url_version with dummy extension to compare.
-        existing_url = calculate_url_version(f"{base_version}-{status}.1")
-        target_url = calculate_url_version(f"{target_version}-{status}.1")
-
-        if existing_url == target_url:
-            return int(extension)
+        if parsed.namespace == self._namespace(target_version):
+            return parsed.extension
 
         return None
@@ -0,0 +1,308 @@
+"""
+Persistent ledger of the API versions published per release tag.
+
+Published release tags never change, so the API versions they carry
+only ever grow by the release that is being published. Instead of
+reading release-metadata.yaml from every historical tag on every run,
+VersionLedger keeps the published versions in one small JSON file:
+
+    {
+      "repository": "camaraproject/QualityOnDemand",
+      "tags": {
+        "r4.1": {"quality-on-demand": "1.1.0-rc.1", ...},
+        ...
+      }
+    }
+
+- ReleasePublisher appends the release it publishes;
+- sync() catches up with the release list, newest first, reading
+  metadata only for tags the ledger does not know yet and stopping at
+  the first tag it knows, so a run usually reads one page of releases;
+  sync(full=True) walks the whole history and also drops tags whose
+  release no longer exists;
+- rebuild / verify (command line) bootstrap the ledger from the full
+  release history and check an existing ledger against it.
+
+Usage:
+    python -m release_automation.scripts.version_ledger rebuild --repo owner/name --path ledger.json
+    python -m release_automation.scripts.version_ledger verify --repo owner/name --path ledger.json
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .github_client import GitHubClient
+from .github_transport import CACHE_DIR_ENV
+
+
+LEDGER_DIR = "version-ledger"
+
+
+def default_ledger_path(repo: str, cache_dir: Optional[str] = None) -> Optional[str]:
+    """
+    Return the ledger file for a repository under the API cache directory.
+
+    Args:
+        repo: Repository in format "owner/name"
+        cache_dir: Cache directory (defaults to GITHUB_CLIENT_CACHE_DIR)
+
+    Returns:
+        Path of the ledger file, or None if no cache directory is set
+    """
+    cache_dir = cache_dir or os.environ.get(CACHE_DIR_ENV)
+    if not cache_dir:
+        return None
+    return os.path.join(cache_dir, LEDGER_DIR, repo.replace("/", "__") + ".json")
+
+
+class VersionLedger:
+    """
+    API versions published per release tag, for one repository.
+
+    Tags are kept in release order (newest first, as returned by
+    GitHubClient.iter_releases) once the ledger has been synced.
+    """
+
+    def __init__(
+        self,
+        repo: str,
+        path: Optional[str] = None,
+        tags: Optional[Dict[str, Dict[str, str]]] = None,
+    ):
+        """
+        Initialize the ledger.
+
+        Args:
+            repo: Repository in format "owner/name"
+            path: Optional file the ledger is saved to
+            tags: Mapping of release tag to {api_name: api_version}
+        """
+        self.repo = repo
+        self.path = path
+        self.tags: Dict[str, Dict[str, str]] = dict(tags or {})
+
+    # -------------------------------------------------------------------------
+    # Persistence
+    # -------------------------------------------------------------------------
+
+    @classmethod
+    def load(cls, repo: str, path: Optional[str]) -> "VersionLedger":
+        """
+        Load a ledger file; a missing or unreadable file gives an empty ledger.
+
+        Args:
+            repo: Repository in format "owner/name"
+            path: Ledger file (None for an in-memory ledger)
+
+        Returns:
+            VersionLedger for the repository
+        """
+        ledger = cls(repo, path)
+        if not path:
+            return ledger
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return ledger
+        if not isinstance(data, dict) or data.get("repository") != repo:
+            return ledger
+
+        tags = data.get("tags")
+        if isinstance(tags, dict):
+            for tag, apis in tags.items():
+                if isinstance(apis, dict):
+                    ledger.tags[tag] = {
+                        str(name): str(version) for name, version in apis.items()
+                    }
+        return ledger
+
+    def save(self) -> None:
+        """Write the ledger to its file (atomically); no-op without a path."""
+        if not self.path:
+            return
+        directory = os.path.dirname(self.path) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"repository": self.repo, "tags": self.tags}, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    # -------------------------------------------------------------------------
+    # Updates
+    # -------------------------------------------------------------------------
+
+    def record(self, tag: str, metadata: dict) -> None:
+        """
+        Record the API versions of a published release.
+
+        The tag is placed first, as the newest release.
+
+        Args:
+            tag: Release tag (e.g., "r4.1")
+            metadata: Parsed release-metadata.yaml of the release
+        """
+        apis = self._apis(metadata)
+        self.tags.pop(tag, None)
+        self.tags = {tag: apis, **self.tags}
+
+    def sync(self, gh: GitHubClient, full: bool = False) -> int:
+        """
+        Bring the ledger in line with the published releases.
+
+        Releases are listed newest first and the listing stops at the
+        first tag already in the ledger (published releases only grow
+        at the front), so older pages are not read again. Reads
+        release-metadata.yaml only for tags not yet in the ledger. Tags
+        without readable metadata are left out and tried again while
+        they are newer than every known tag. Saves the ledger if it
+        changed; a failed write only costs the next run the reads saved
+        here.
+
+        Args:
+            gh: GitHubClient for the repository
+            full: List the whole history, dropping tags whose release no
+                longer exists (also done when no known tag is reached)
+
+        Returns:
+            Number of tags added
+        """
+        added = 0
+        reached_known = False
+        tags: Dict[str, Dict[str, str]] = {}
+        for release in gh.iter_releases(include_drafts=False, page_size=100):
+            tag = release.tag_name
+            if tag in self.tags:
+                if not full:
+                    reached_known = True
+                    break
+                tags[tag] = self.tags[tag]
+                continue
+            metadata = gh.get_release_metadata(tag)
+            if metadata:
+                tags[tag] = self._apis(metadata)
+                added += 1
+        if reached_known:
+            tags.update(self.tags)
+
+        changed = added > 0 or list(tags) != list(self.tags)
+        self.tags = tags
+        if changed:
+            try:
+                self.save()
+            except OSError:
+                pass
+        return added
+
+    @classmethod
+    def rebuild(cls, gh: GitHubClient, path: Optional[str] = None) -> "VersionLedger":
+        """
+        Build a ledger from the full release history.
+
+        Args:
+            gh: GitHubClient for the repository
+            path: Optional file to save the ledger to
+
+        Returns:
+            The rebuilt ledger
+        """
+        ledger = cls(gh.repo, path)
+        ledger.sync(gh, full=True)
+        return ledger
+
+    def verify(self, gh: GitHubClient) -> List[str]:
+        """
+        Compare the ledger with the release history.
+
+        Args:
+            gh: GitHubClient for the repository
+
+        Returns:
+            Descriptions of the differences (empty if consistent)
+        """
+        expected = VersionLedger.rebuild(gh).tags
+        problems = []
+        for tag in self.tags:
+            if tag not in expected:
+                problems.append(f"{tag}: in ledger but not a published release")
+        for tag, apis in expected.items():
+            if tag not in self.tags:
+                problems.append(f"{tag}: missing from ledger")
+            elif self.tags[tag] != apis:
+                problems.append(f"{tag}: ledger has {self.tags[tag]}, release has {apis}")
+        return problems
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def entries(self) -> Iterator[Tuple[str, str, str]]:
+        """Yield (tag, api_name, api_version) in release order."""
+        for tag, apis in self.tags.items():
+            for api_name, api_version in apis.items():
+                yield tag, api_name, api_version
+
+    def versions(self, api_name: str) -> List[str]:
+        """Return the published versions of an API, newest release first."""
+        return [
+            version for _, name, version in self.entries() if name == api_name
+        ]
+
+    @staticmethod
+    def _apis(metadata: dict) -> Dict[str, str]:
+        apis = {}
+        for api in metadata.get("apis", []) or []:
+            api_name = api.get("api_name")
+            api_version = api.get("api_version")
+            if api_name and api_version:
+                apis[api_name] = str(api_version)
+        return apis
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Maintain the API version ledger")
+    parser.add_argument("command", choices=["rebuild", "verify"])
+    parser.add_argument("--repo", required=True, help="Repository in format owner/name")
+    parser.add_argument(
+        "--path",
+        default=None,
+        help=f"Ledger file (defaults to one under ${CACHE_DIR_ENV})",
+    )
+    args = parser.parse_args(argv)
+
+    path = args.path or default_ledger_path(args.repo)
+    gh = GitHubClient(args.repo, os.environ.get("GITHUB_TOKEN"))
+
+    if args.command == "rebuild":
+        ledger = VersionLedger.rebuild(gh, path)
+        if path:
+            ledger.save()
+        else:
+            print(json.dumps({"repository": ledger.repo, "tags": ledger.tags}, indent=2))
+        print(f"Ledger has {len(ledger.tags)} release(s)", file=sys.stderr)
+        return 0
+
+    if not path:
+        parser.error(f"verify needs --path or ${CACHE_DIR_ENV}")
+    ledger = VersionLedger.load(args.repo, path)
+    problems = ledger.verify(gh)
+    for problem in problems:
+        print(f"::warning::{problem}", file=sys.stderr)
+    if problems:
+        print(f"Ledger has {len(problems)} difference(s)", file=sys.stderr)
+        return 1
+    print(f"Ledger is consistent ({len(ledger.tags)} release(s))", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
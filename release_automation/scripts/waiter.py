@@ -0,0 +1,149 @@
+"""
+Polling for GitHub API eventual consistency.
+
+Objects created through the API (a draft release, a new issue) may not be
+visible to the next read for a moment. Waiter polls a probe until it
+succeeds, instead of sleeping a fixed time:
+
+- the first retry comes after a short interval, and intervals grow
+  exponentially up to a cap, so the common case (consistent within a
+  second or two) is detected quickly while slow cases do not hammer the API;
+- intervals are jittered, so concurrent pollers do not align;
+- a total deadline bounds the wait, whatever the number of attempts;
+- the result reports how long consistency took.
+
+Probes should be cheap: where the client supports it, poll a GET request
+that the response cache revalidates (a 304 does not count against the
+rate limit).
+"""
+
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator, Optional
+
+
+# Defaults sized for GitHub: most reads are consistent within ~1 s
+DEFAULT_INITIAL_DELAY = 0.25
+DEFAULT_FACTOR = 2.0
+DEFAULT_MAX_DELAY = 4.0
+DEFAULT_DEADLINE = 10.0
+DEFAULT_JITTER = 0.2
+
+
+@dataclass
+class WaitResult:
+    """
+    Outcome of Waiter.until().
+
+    Attributes:
+        value: Last value returned by the probe
+        satisfied: Whether the probe succeeded before the deadline
+        attempts: Number of probe calls
+        elapsed: Seconds from the first probe to the last
+    """
+    value: Any
+    satisfied: bool
+    attempts: int
+    elapsed: float
+
+
+class Waiter:
+    """
+    Exponential backoff with jitter and a total deadline.
+
+    One Waiter can be reused for any number of waits.
+    """
+
+    def __init__(
+        self,
+        initial_delay: float = DEFAULT_INITIAL_DELAY,
+        factor: float = DEFAULT_FACTOR,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        deadline: float = DEFAULT_DEADLINE,
+        jitter: float = DEFAULT_JITTER,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        random_source: Callable[[], float] = random.random,
+    ):
+        """
+        Initialize the waiter.
+
+        Args:
+            initial_delay: Seconds before the first retry
+            factor: Growth of the interval per retry
+            max_delay: Longest interval between two probes
+            deadline: Longest total wait in seconds
+            jitter: Relative jitter (0.2 varies each interval by ±20%)
+            clock: Monotonic time source (injectable for tests)
+            sleep: Sleep function (injectable for tests)
+            random_source: Random source in [0, 1) (injectable for tests)
+        """
+        self.initial_delay = initial_delay
+        self.factor = factor
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self.jitter = jitter
+        self.clock = clock
+        self.sleep = sleep
+        self.random_source = random_source
+
+    def delays(self) -> Iterator[float]:
+        """Yield the (jittered) intervals between probes, without the deadline."""
+        delay = self.initial_delay
+        while True:
+            yield delay * (1 + self.jitter * (2 * self.random_source() - 1))
+            delay = min(delay * self.factor, self.max_delay)
+
+    def until(
+        self,
+        probe: Callable[[], Any],
+        done: Callable[[Any], bool] = bool,
+        retry_on: Optional[Callable[[Exception], bool]] = None,
+        description: str = "",
+    ) -> WaitResult:
+        """
+        Call probe until done(value) is true or the deadline passes.
+
+        Args:
+            probe: Zero-argument callable to poll
+            done: Tells whether a probe value means success
+            retry_on: Tells whether an exception raised by the probe means
+                "not yet" (retried) rather than a failure (re-raised);
+                without it every exception is re-raised
+            description: What is awaited, for the log line
+
+        Returns:
+            WaitResult (satisfied=False if the deadline passed)
+
+        Raises:
+            Exception: The probe's exception if it is not retried, or the
+                last retried one if the deadline passes
+        """
+        start = self.clock()
+        attempts = 0
+        delays = self.delays()
+        while True:
+            attempts += 1
+            error = None
+            try:
+                value = probe()
+            except Exception as e:
+                if retry_on is None or not retry_on(e):
+                    raise
+                error, value = e, None
+
+            elapsed = self.clock() - start
+            if error is None and done(value):
+                if description and attempts > 1:
+                    print(f"{description}: consistent after {elapsed:.1f}s ({attempts} attempts)")
+                return WaitResult(value, True, attempts, elapsed)
+
+            remaining = self.deadline - elapsed
+            if remaining <= 0:
+                if description:
+                    print(f"{description}: not seen after {elapsed:.1f}s ({attempts} attempts)")
+                if error is not None:
+                    raise error
+                return WaitResult(value, False, attempts, elapsed)
+            self.sleep(min(next(delays), remaining))
@@ -0,0 +1,111 @@
+"""
+Unit tests for the concurrent GitHub client helpers.
+"""
+
+import asyncio
+import threading
+import time
+from functools import partial
+from unittest.mock import MagicMock
+
+import pytest
+
+from release_automation.scripts.async_github_client import (
+    AsyncGitHubClient,
+    gather_bounded,
+    run_parallel,
+)
+from release_automation.scripts.github_client import GitHubClientError
+
+
+class ConcurrencyProbe:
+    """Callable that records how many calls overlap."""
+
+    def __init__(self, delay=0.02):
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, value):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self.lock:
+            self.active -= 1
+        return value
+
+
+class TestRunParallel:
+    def test_results_keep_call_order(self):
+        probe = ConcurrencyProbe()
+        assert run_parallel([partial(probe, i) for i in range(6)]) == list(range(6))
+
+    def test_concurrency_is_bounded(self):
+        probe = ConcurrencyProbe()
+
+        run_parallel([partial(probe, i) for i in range(8)], limit=3)
+
+        assert 1 < probe.peak <= 3
+
+    def test_first_exception_is_raised(self):
+        def fail():
+            raise GitHubClientError("boom")
+
+        with pytest.raises(GitHubClientError, match="boom"):
+            run_parallel([lambda: 1, fail])
+
+    def test_return_exceptions(self):
+        error = GitHubClientError("boom")
+
+        def fail():
+            raise error
+
+        assert run_parallel([lambda: 1, fail], return_exceptions=True) == [1, error]
+
+    def test_single_call_runs_inline(self):
+        assert run_parallel([threading.get_ident]) == [threading.get_ident()]
+        assert run_parallel([]) == []
+
+    def test_gather_bounded_in_running_loop(self):
+        probe = ConcurrencyProbe()
+
+        results = asyncio.run(gather_bounded([partial(probe, i) for i in range(4)], limit=2))
+
+        assert results == [0, 1, 2, 3]
+        assert probe.peak <= 2
+
+
+class TestAsyncGitHubClient:
+    def test_methods_become_coroutines(self):
+        client = MagicMock()
+        client.get_label.side_effect = lambda name: {"name": name}
+        agh = AsyncGitHubClient(client)
+
+        async def main():
+            return await agh.gather(agh.get_label("a"), agh.get_label("b"))
+
+        assert asyncio.run(main()) == [{"name": "a"}, {"name": "b"}]
+        assert client.get_label.call_count == 2
+
+    def test_attributes_pass_through(self):
+        client = MagicMock()
+        client.repo = "o/r"
+        assert AsyncGitHubClient(client).repo == "o/r"
+
+    def test_shared_concurrency_bound(self):
+        probe = ConcurrencyProbe()
+        client = MagicMock()
+        client.get_label.side_effect = probe
+        agh = AsyncGitHubClient(client, max_concurrency=2)
+
+        async def main():
+            return await agh.gather(*(agh.get_label(i) for i in range(6)))
+
+        assert asyncio.run(main()) == list(range(6))
+        assert probe.peak <= 2
+
+    def test_requires_client_or_repo(self):
+        with pytest.raises(ValueError):
+            AsyncGitHubClient()
@@ -0,0 +1,82 @@
+"""
+Unit tests for the immutable content cache.
+"""
+
+from release_automation.scripts.content_cache import (
+    ContentCache,
+    is_commit_sha,
+    is_release_tag,
+)
+
+
+SHA = "0123456789abcdef0123456789abcdef01234567"
+
+
+class TestRefClassification:
+    def test_commit_sha(self):
+        assert is_commit_sha(SHA)
+        assert not is_commit_sha(SHA[:7])
+        assert not is_commit_sha("main")
+
+    def test_release_tag(self):
+        assert is_release_tag("r4.1")
+        assert is_release_tag("r10.12")
+        assert not is_release_tag("release-snapshot/r4.1-abc1234")
+        assert not is_release_tag("main")
+
+
+class TestContentCache:
+    def test_miss_then_hit(self):
+        cache = ContentCache()
+
+        assert cache.get("o/r", SHA, "a.yaml") == (False, None)
+        cache.put("o/r", SHA, "a.yaml", "content")
+
+        assert cache.get("o/r", SHA, "a.yaml") == (True, "content")
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_missing_file_is_recorded(self):
+        cache = ContentCache()
+        cache.put("o/r", SHA, "a.yaml", None)
+
+        assert cache.get("o/r", SHA, "a.yaml") == (True, None)
+
+    def test_key_includes_repo(self):
+        cache = ContentCache()
+        cache.put("o/a", SHA, "VERSION.yaml", "a")
+
+        assert cache.get("o/b", SHA, "VERSION.yaml") == (False, None)
+
+    def test_persists_contents_but_not_refs(self, tmp_path):
+        cache = ContentCache(str(tmp_path))
+        cache.put("o/r", SHA, "a.yaml", "content")
+        cache.put_shas("o/r", {"r4.1": SHA})
+        assert cache.get_sha("o/r", "r4.1") == SHA
+        assert cache.get_sha("o/other", "r4.1") is None
+
+        reloaded = ContentCache(str(tmp_path))
+
+        assert reloaded.get("o/r", SHA, "a.yaml") == (True, "content")
+        # Tags may be re-created: every run resolves them again
+        assert reloaded.get_sha("o/r", "r4.1") is None
+        assert not (tmp_path / "refs.json").exists()
+
+    def test_corrupt_entries_are_ignored(self, tmp_path):
+        cache = ContentCache(str(tmp_path))
+        cache.put("o/r", SHA, "a.yaml", "content")
+        for entry in (tmp_path / "objects").iterdir():
+            entry.write_text("not json")
+
+        assert ContentCache(str(tmp_path)).get("o/r", SHA, "a.yaml") == (False, None)
+
+    def test_parsed_values_are_isolated(self):
+        cache = ContentCache()
+        value = {"apis": [{"name": "a"}]}
+        cache.put_parsed("o/r", SHA, "a.yaml", value)
+        value["apis"].clear()
+
+        found, parsed = cache.get_parsed("o/r", SHA, "a.yaml")
+        parsed["apis"].append({"name": "b"})
+
+        assert found
+        assert cache.get_parsed("o/r", SHA, "a.yaml") == (True, {"apis": [{"name": "a"}]})
@@ -0,0 +1,168 @@
+"""
+Unit tests for the clone-free Git Data API snapshot workspace.
+"""
+
+import base64
+from unittest.mock import Mock
+
+import pytest
+
+from release_automation.scripts.git_data_workspace import GitDataWorkspace, pattern_regex
+from release_automation.scripts.git_operations import CloneError, CommitError, PushError
+from release_automation.scripts.github_client import GitHubClientError
+
+
+BLOBS = {
+    "b-readme": b"# QoD\n",
+    "b-plan": b"repository:\n  target_release_tag: r4.1\n",
+    "b-api": b"info:\n  version: wip\n",
+    "b-doc": b"see blob/main/\n",
+    "b-image": b"\x89PNG",
+}
+
+TREE = [
+    {"path": "README.md", "mode": "100644", "type": "blob", "sha": "b-readme"},
+    {"path": "release-plan.yaml", "mode": "100644", "type": "blob", "sha": "b-plan"},
+    {"path": "code", "mode": "040000", "type": "tree", "sha": "t-code"},
+    {"path": "code/API_definitions/qod.yaml", "mode": "100644", "type": "blob", "sha": "b-api"},
+    {"path": "documentation/API_documentation/guide.md", "mode": "100644", "type": "blob", "sha": "b-doc"},
+    {"path": "documentation/images/flow.png", "mode": "100644", "type": "blob", "sha": "b-image"},
+    {"path": "documentation/link.md", "mode": "120000", "type": "blob", "sha": "b-link"},
+]
+
+PATTERNS = ["README.md", "release-plan.yaml", "code/API_definitions/*.yaml", "documentation/**/*.md"]
+
+
+@pytest.fixture
+def gh():
+    client = Mock()
+    client.repo = "owner/repo"
+    client.token = "token"
+    client.get_branch_sha.return_value = "c1"
+    client.get_tree.return_value = ("t1", TREE)
+    client.get_blob.side_effect = lambda sha: BLOBS[sha]
+    client.create_blob.side_effect = lambda content: "blob-" + base64.b16encode(content[:4]).decode()
+    client.create_tree.return_value = "t2"
+    client.create_commit.return_value = "c2"
+    client.create_branch_at_sha.return_value = True
+    return client
+
+
+@pytest.fixture
+def workspace(gh, tmp_path):
+    ws = GitDataWorkspace(gh, str(tmp_path), PATTERNS)
+    ws.clone(branch="main")
+    return ws
+
+
+class TestPatternRegex:
+    @pytest.mark.parametrize("pattern,path,matches", [
+        ("code/API_definitions/*.yaml", "code/API_definitions/qod.yaml", True),
+        ("code/API_definitions/*.yaml", "code/API_definitions/sub/qod.yaml", False),
+        ("documentation/**/*.md", "documentation/guide.md", True),
+        ("documentation/**/*.md", "documentation/a/b/guide.md", True),
+        ("*.md", "docs/guide.md", False),
+        ("CHANGELOG.md", "CHANGELOG.md", True),
+        ("CHANGELOG.md", "CHANGELOG.mdx", False),
+    ])
+    def test_glob_semantics(self, pattern, path, matches):
+        assert bool(pattern_regex(pattern).match(path)) is matches
+
+
+class TestClone:
+    def test_downloads_matching_regular_files(self, workspace, gh, tmp_path):
+        assert sorted(p.relative_to(tmp_path).as_posix() for p in tmp_path.rglob("*") if p.is_file()) == [
+            "README.md",
+            "code/API_definitions/qod.yaml",
+            "documentation/API_documentation/guide.md",
+            "release-plan.yaml",
+        ]
+        assert workspace.head == "c1"
+        assert workspace.tree == "t1"
+        downloaded = sorted(c.args[0] for c in gh.get_blob.call_args_list)
+        assert "b-image" not in downloaded
+        assert "b-link" not in downloaded
+
+    def test_stats(self, gh, tmp_path):
+        stats = GitDataWorkspace(gh, str(tmp_path), ["README.md"]).clone()
+
+        assert stats.strategy == "git-data"
+        assert stats.disk_bytes == len(BLOBS["b-readme"])
+
+    def test_missing_branch(self, gh, tmp_path):
+        gh.get_branch_sha.return_value = None
+
+        with pytest.raises(CloneError):
+            GitDataWorkspace(gh, str(tmp_path), PATTERNS).clone(branch="nope")
+
+    def test_unreadable_tree(self, gh, tmp_path):
+        gh.get_tree.side_effect = GitHubClientError("Tree too large")
+
+        with pytest.raises(CloneError, match="too large"):
+            GitDataWorkspace(gh, str(tmp_path), PATTERNS).clone()
+
+
+class TestCommitAll:
+    def test_changed_new_and_deleted_files(self, workspace, gh, tmp_path):
+        workspace.configure_user("bot", "bot@example.com")
+        (tmp_path / "code/API_definitions/qod.yaml").write_text("info:\n  version: 1.0.0\n")
+        (tmp_path / "release-metadata.yaml").write_text("repository: {}\n")
+        (tmp_path / "release-plan.yaml").unlink()
+
+        sha = workspace.commit_all("Create snapshot")
+
+        assert sha == "c2"
+        assert gh.create_blob.call_count == 2
+        base_tree, entries = gh.create_tree.call_args[0]
+        assert base_tree == "t1"
+        assert sorted((e["path"], e["sha"] is None) for e in entries) == [
+            ("code/API_definitions/qod.yaml", False),
+            ("release-metadata.yaml", False),
+            ("release-plan.yaml", True),
+        ]
+        gh.create_commit.assert_called_once_with(
+            "Create snapshot", "t2", ["c1"], author={"name": "bot", "email": "bot@example.com"}
+        )
+
+    def test_commits_chain(self, workspace, gh, tmp_path):
+        (tmp_path / "README.md").write_text("# QoD r4.1\n")
+        workspace.commit_all("first")
+        gh.create_tree.return_value = "t3"
+        gh.create_commit.return_value = "c3"
+        (tmp_path / "CHANGELOG").mkdir()
+        (tmp_path / "CHANGELOG/CHANGELOG-r4.md").write_text("# r4.1\n")
+
+        workspace.commit_all("second")
+
+        assert gh.create_tree.call_args[0][0] == "t2"
+        assert [e["path"] for e in gh.create_tree.call_args[0][1]] == ["CHANGELOG/CHANGELOG-r4.md"]
+        assert gh.create_commit.call_args[0][2] == ["c2"]
+        assert workspace.get_commit_sha() == "c3"
+
+    def test_no_changes(self, workspace):
+        with pytest.raises(CommitError, match="No changes"):
+            workspace.commit_all("nothing")
+
+    def test_api_error(self, workspace, gh, tmp_path):
+        (tmp_path / "README.md").write_text("changed")
+        gh.create_tree.side_effect = GitHubClientError("422")
+
+        with pytest.raises(CommitError):
+            workspace.commit_all("broken")
+
+
+class TestPush:
+    def test_creates_ref_at_head(self, workspace, gh, tmp_path):
+        workspace.create_branch("release-snapshot/r4.1-abc1234")
+        (tmp_path / "README.md").write_text("changed")
+        workspace.commit_all("snapshot")
+
+        workspace.push("release-snapshot/r4.1-abc1234")
+
+        gh.create_branch_at_sha.assert_called_once_with("release-snapshot/r4.1-abc1234", "c2")
+
+    def test_existing_branch(self, workspace, gh):
+        gh.create_branch_at_sha.return_value = False
+
+        with pytest.raises(PushError, match="already exists"):
+            workspace.push("release-snapshot/r4.1-abc1234")
@@ -5,6 +5,8 @@ These tests verify the git command wrapper functionality by mocking
 subprocess calls to avoid actual git operations.
 """
 
+import base64
+
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 import subprocess
@@ -14,6 +16,8 @@ from release_automation.scripts.git_operations import (
     PullRequestInfo,
     GitOperationsError,
     CloneError,
+    CloneStats,
+    default_mirror_path,
     BranchError,
     CommitError,
     PushError,
@@ -97,6 +101,209 @@ class TestClone:
 
         assert "Failed to clone" in str(exc_info.value)
 
+    @patch("subprocess.run")
+    def test_clone_returns_stats(self, mock_run, git_ops):
+        """Test clone reports the strategy used."""
+        mock_run.return_value = Mock(returncode=0, stdout="", stderr="")
+
+        stats = git_ops.clone()
+
+        assert isinstance(stats, CloneStats)
+        assert stats.requested == "full"
+        assert stats.strategy == "full"
+        assert stats.fallback_reason is None
+
+    @pytest.mark.parametrize("strategy,options", [
+        ("shallow", ["--depth", "1"]),
+        ("partial", ["--filter=blob:none"]),
+    ])
+    @patch("subprocess.run")
+    def test_clone_strategy_options(self, mock_run, git_ops, strategy, options):
+        """Test shallow and partial clones pass their git options."""
+        mock_run.return_value = Mock(returncode=0, stdout="", stderr="")
+
+        git_ops.clone(strategy=strategy)
+
+        cmd = mock_run.call_args[0][0]
+        assert cmd[cmd.index("main") + 1:-2] == options
+
+    @patch("subprocess.run")
+    def test_clone_sparse(self, mock_run, git_ops):
+        """Test sparse clone sets the sparse-checkout cones."""
+        mock_run.return_value = Mock(returncode=0, stdout="", stderr="")
+
+        git_ops.clone(strategy="sparse", sparse_paths=["code/API_definitions", "CHANGELOG"])
+
+        clone_cmd = mock_run.call_args_list[0][0][0]
+        assert "--filter=blob:none" in clone_cmd
+        assert "--sparse" in clone_cmd
+        sparse_cmd = mock_run.call_args_list[1][0][0]
+        assert sparse_cmd == [
+            "git", "sparse-checkout", "set", "--cone", "code/API_definitions", "CHANGELOG",
+        ]
+
+    @patch("shutil.rmtree")
+    @patch("subprocess.run")
+    def test_clone_falls_back_to_full(self, mock_run, mock_rmtree, git_ops):
+        """Test a failing sparse clone falls back to a full clone."""
+        mock_run.side_effect = [
+            Mock(returncode=0, stdout="", stderr=""),
+            subprocess.CalledProcessError(1, "git", stderr="unknown subcommand"),
+            Mock(returncode=0, stdout="", stderr=""),
+        ]
+
+        stats = git_ops.clone(strategy="sparse", sparse_paths=["docs"])
+
+        assert stats.requested == "sparse"
+        assert stats.strategy == "full"
+        assert "unknown subcommand" in stats.fallback_reason
+        mock_rmtree.assert_called_once_with("/tmp/test-repo", ignore_errors=True)
+        full_cmd = mock_run.call_args_list[2][0][0]
+        assert "--sparse" not in full_cmd
+        assert "--filter=blob:none" not in full_cmd
+
+    @patch("subprocess.run")
+    def test_full_clone_failure_is_not_retried(self, mock_run, git_ops):
+        """Test a failing full clone raises without a second attempt."""
+        mock_run.side_effect = subprocess.CalledProcessError(1, "git", stderr="denied")
+
+        with pytest.raises(CloneError):
+            git_ops.clone()
+
+        assert mock_run.call_count == 1
+
+    def test_clone_unknown_strategy(self, git_ops):
+        """Test an unknown strategy is rejected."""
+        with pytest.raises(ValueError):
+            git_ops.clone(strategy="lazy")
+
+    @patch("subprocess.run")
+    def test_clone_measures_disk_use(self, mock_run, tmp_path):
+        """Test disk use is measured below work_dir."""
+        work_dir = tmp_path / "repo"
+        work_dir.mkdir()
+        (work_dir / "README.md").write_text("x" * 100)
+        mock_run.return_value = Mock(returncode=0, stdout="", stderr="")
+
+        stats = GitOperations(repo="owner/repo", work_dir=str(work_dir)).clone()
+
+        assert stats.disk_bytes == 100
+
+
+class TestMirror:
+    """Tests for the bare-mirror reference cache."""
+
+    def test_default_mirror_path(self, tmp_path, monkeypatch):
+        """Test the mirror path is derived from the mirror directory."""
+        monkeypatch.delenv("GIT_MIRROR_DIR", raising=False)
+        assert default_mirror_path("owner/repo") is None
+        monkeypatch.setenv("GIT_MIRROR_DIR", str(tmp_path))
+        assert default_mirror_path("owner/repo") == str(tmp_path / "owner__repo.git")
+
+    def test_disabled_without_mirror_dir(self, monkeypatch):
+        """Test no mirror is used by default."""
+        monkeypatch.delenv("GIT_MIRROR_DIR", raising=False)
+        assert GitOperations("owner/repo", "/tmp/test-repo").update_mirror() is None
+
+    @patch("subprocess.run")
+    def test_update_creates_and_fetches(self, mock_run, tmp_path):
+        """Test a missing mirror is initialized, then fetched by URL."""
+        mock_run.return_value = Mock(returncode=0, stdout="", stderr="")
+        ops = GitOperations("owner/repo", "/tmp/test-repo", token="t", mirror_dir=str(tmp_path))
+
+        assert ops.update_mirror() == str(tmp_path / "owner__repo.git")
+
+        init_cmd, fetch_cmd = [c[0][0] for c in mock_run.call_args_list]
+        assert init_cmd[:3] == ["git", "init", "--bare"]
+        assert fetch_cmd[:4] == ["git", "fetch", "--prune", "--quiet"]
+        assert "https://github.com/owner/repo.git" in fetch_cmd
+        assert not any("t@" in arg for arg in fetch_cmd)
+        assert "+refs/heads/*:refs/heads/*" in fetch_cmd
+        fetch = mock_run.call_args_list[1].kwargs
+        assert fetch["cwd"] == str(tmp_path / "owner__repo.git")
+        assert fetch["env"]["GIT_CONFIG_KEY_0"] == "http.https://github.com/.extraheader"
+        assert fetch["env"]["GIT_CONFIG_VALUE_0"] == (
+            "AUTHORIZATION: basic " + base64.b64encode(b"x-access-token:t").decode()
+        )
+
+    @patch("subprocess.run")
+    def test_failed_fetch_does_not_leak_token(self, mock_run, tmp_path, capsys):
+        """Test the token appears neither in the warning nor in argv."""
+        mirror = tmp_path / "owner__repo.git"
+        mirror.mkdir()
+        (mirror / "HEAD").write_text("ref: refs/heads/main\n")
+        mock_run.side_effect = subprocess.CalledProcessError(
+            128, ["git"], stderr="fatal: could not read secret-token"
+        )
+        ops = GitOperations("owner/repo", "/tmp/test-repo", token="secret-token", mirror_dir=str(tmp_path))
+
+        assert ops.update_mirror() is None
+
+        assert "secret-token" not in capsys.readouterr().out
+        assert not any("secret-token" in arg for arg in mock_run.call_args[0][0])
+
+    @patch("subprocess.run")
+    def test_existing_mirror_is_only_fetched(self, mock_run, tmp_path):
+        """Test an existing mirror is fetched incrementally."""
+        mirror = tmp_path / "owner__repo.git"
+        mirror.mkdir()
+        (mirror / "HEAD").write_text("ref: refs/heads/main\n")
+        mock_run.return_value = Mock(returncode=0, stdout="", stderr="")
+        ops = GitOperations("owner/repo", "/tmp/test-repo", mirror_dir=str(tmp_path))
+
+        ops.update_mirror()
+
+        assert mock_run.call_count == 1
+        assert mock_run.call_args[0][0][1] == "fetch"
+
+    @patch("subprocess.run")
+    def test_clone_references_mirror(self, mock_run, tmp_path):
+        """Test clones borrow objects from the mirror without depth or filter."""
+        mock_run.return_value = Mock(returncode=0, stdout="", stderr="")
+        ops = GitOperations("owner/repo", str(tmp_path / "work"), mirror_dir=str(tmp_path))
+
+        stats = ops.clone(strategy="sparse", sparse_paths=["docs"])
+
+        clone_cmd = mock_run.call_args_list[2][0][0]
+        assert clone_cmd[clone_cmd.index("--reference") + 1] == str(tmp_path / "owner__repo.git")
+        assert "--sparse" in clone_cmd
+        assert "--filter=blob:none" not in clone_cmd
+        assert stats.mirror is True
+        assert stats.strategy == "sparse"
+
+    @patch("subprocess.run")
+    def test_failed_fetch_clones_from_network(self, mock_run, tmp_path):
+        """Test a failing mirror fetch falls back to a plain clone."""
+        mock_run.side_effect = [
+            Mock(returncode=0, stdout="", stderr=""),
+            subprocess.CalledProcessError(1, "git", stderr="network down"),
+            Mock(returncode=0, stdout="", stderr=""),
+        ]
+        ops = GitOperations("owner/repo", str(tmp_path / "work"), mirror_dir=str(tmp_path))
+
+        stats = ops.clone()
+
+        assert "--reference" not in mock_run.call_args[0][0]
+        assert stats.mirror is False
+
+    @patch("shutil.rmtree")
+    @patch("subprocess.run")
+    def test_failed_mirror_clone_falls_back(self, mock_run, mock_rmtree, tmp_path):
+        """Test a failing mirror-backed clone is retried as a plain full clone."""
+        mock_run.side_effect = [
+            Mock(returncode=0, stdout="", stderr=""),
+            Mock(returncode=0, stdout="", stderr=""),
+            subprocess.CalledProcessError(1, "git", stderr="bad alternates"),
+            Mock(returncode=0, stdout="", stderr=""),
+        ]
+        ops = GitOperations("owner/repo", str(tmp_path / "work"), mirror_dir=str(tmp_path))
+
+        stats = ops.clone()
+
+        assert "--reference" not in mock_run.call_args[0][0]
+        assert stats.mirror is False
+        assert "bad alternates" in stats.fallback_reason
+
 
 class TestGetCommitSha:
     """Tests for get_commit_sha operation."""
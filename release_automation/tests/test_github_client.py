@@ -1,10 +1,17 @@
+import base64
 import subprocess
+import tempfile
 import unittest
 from unittest.mock import MagicMock, patch, call
 import json
+from functools import partial
 
 
-from release_automation.scripts.github_client import GitHubClient, GitHubClientError, Branch, Release
+from release_automation.scripts.async_github_client import run_parallel
+from release_automation.scripts.content_cache import ContentCache
+from release_automation.scripts.github_client import GitHubClient, GitHubClientError, Branch, Release, ReleaseRecord, ReleaseView, _classify_command
+from release_automation.scripts.github_transport import GhCliTransport, TransportError
+from release_automation.scripts.waiter import Waiter
 
 class TestGitHubClient(unittest.TestCase):
     def setUp(self):
@@ -48,26 +55,52 @@ class TestGitHubClient(unittest.TestCase):
 
     @patch("release_automation.scripts.github_client.GitHubClient._run_gh")
     def test_list_branches(self, mock_run_gh):
-        # Mock first call (list names)
-        # Mock second call (get sha for branch 1)
-        # Mock third call (get sha for branch 2)
-        
-        # It's easier to mock _run_gh to return different values based on calls
-        # or just test the logic that parsing works.
-        
-        mock_run_gh.side_effect = [
-            "branch1\nbranch2\n", # list
-            "sha1\n", # sha for branch1
-            "sha2\n"  # sha for branch2
-        ]
-        
+        # One paginated listing returns names and SHAs together
+        mock_run_gh.return_value = (
+            '{"name":"branch1","sha":"sha1"}\n'
+            '{"name":"branch2","sha":"sha2"}\n'
+        )
+
         branches = self.client.list_branches()
-        
+
         self.assertEqual(len(branches), 2)
         self.assertEqual(branches[0].name, "branch1")
         self.assertEqual(branches[0].sha, "sha1")
         self.assertEqual(branches[1].name, "branch2")
         self.assertEqual(branches[1].sha, "sha2")
+        mock_run_gh.assert_called_once()
+        args = mock_run_gh.call_args[0][0]
+        self.assertIn("repos/owner/repo/branches?per_page=100", args)
+        self.assertIn("--paginate", args)
+
+    @patch("release_automation.scripts.github_client.GitHubClient._run_gh")
+    def test_list_branches_filters_prefix_server_side(self, mock_run_gh):
+        mock_run_gh.return_value = (
+            '{"name":"refs/heads/release-snapshot/r4.1-abc1234","sha":"sha1"}\n'
+            '{"name":"refs/heads/release-snapshot/r4.10-def5678","sha":"sha2"}\n'
+        )
+
+        branches = self.client.list_branches("release-snapshot/r4.1-*")
+
+        self.assertEqual(
+            branches, [Branch(name="release-snapshot/r4.1-abc1234", sha="sha1")]
+        )
+        mock_run_gh.assert_called_once()
+        self.assertIn(
+            "repos/owner/repo/git/matching-refs/heads/release-snapshot/r4.1-",
+            mock_run_gh.call_args[0][0],
+        )
+
+    @patch("release_automation.scripts.github_client.GitHubClient._run_gh")
+    def test_list_branches_exact_name(self, mock_run_gh):
+        mock_run_gh.return_value = (
+            '{"name":"refs/heads/main","sha":"mainsha"}\n'
+            '{"name":"refs/heads/main-backup","sha":"othersha"}\n'
+        )
+
+        branches = self.client.list_branches("main")
+
+        self.assertEqual(branches, [Branch(name="main", sha="mainsha")])
 
     @patch("release_automation.scripts.github_client.GitHubClient._run_gh")
     def test_get_file_content(self, mock_run_gh):
@@ -113,7 +146,7 @@ class TestGitHubClient(unittest.TestCase):
         mock_get_file_content.assert_called_once_with("release-metadata.yaml", ref="r4.1")
         mock_download_release_asset.assert_not_called()
 
-    @patch("release_automation.scripts.github_client.GitHubClient.download_release_asset")
+    @patch("release_automation.scripts.github_client.GitHubClient._fetch_release_asset")
     @patch("release_automation.scripts.github_client.GitHubClient.get_file_content")
     def test_get_release_metadata_falls_back_to_release_asset(
         self, mock_get_file_content, mock_download_release_asset
@@ -141,6 +174,17 @@ class TestGitHubClient(unittest.TestCase):
         self.assertIsNone(metadata)
         mock_download_release_asset.assert_not_called()
 
+    @patch("release_automation.scripts.github_client.GitHubClient._run_gh")
+    def test_search_issue_numbers(self, mock_run_gh):
+        mock_run_gh.return_value = "[12,7]\n"
+
+        numbers = self.client.search_issue_numbers("r4.1", labels=["release-issue"])
+
+        self.assertEqual(numbers, [12, 7])
+        args = mock_run_gh.call_args[0][0]
+        self.assertIn("search/issues", args)
+        self.assertIn('q=repo:owner/repo is:issue "r4.1" in:body label:"release-issue" state:open', args)
+
     @patch("release_automation.scripts.github_client.GitHubClient._run_gh")
     def test_create_issue(self, mock_run_gh):
         # create_issue returns a local dict from the URL output (no fetch-back)
@@ -156,40 +200,88 @@ class TestGitHubClient(unittest.TestCase):
         # Only one _run_gh call (create), no fetch-back
         self.assertEqual(mock_run_gh.call_count, 1)
 
-    @patch("release_automation.scripts.github_client.time.sleep")
-    def test_retry_on_not_found_succeeds_first_try(self, mock_sleep):
+    def _waiter(self, sleeps):
+        now = [0.0]
+
+        def sleep(seconds):
+            sleeps.append(seconds)
+            now[0] += seconds
+
+        return Waiter(
+            initial_delay=0.5, deadline=3.0,
+            clock=lambda: now[0], sleep=sleep, random_source=lambda: 0.5,
+        )
+
+    def test_retry_on_not_found_succeeds_first_try(self):
+        sleeps = []
         fn = MagicMock(return_value="result")
-        result = self.client.retry_on_not_found(fn)
+        result = self.client.retry_on_not_found(fn, waiter=self._waiter(sleeps))
         self.assertEqual(result, "result")
         fn.assert_called_once()
-        mock_sleep.assert_not_called()
+        self.assertEqual(sleeps, [])
 
-    @patch("release_automation.scripts.github_client.time.sleep")
-    def test_retry_on_not_found_retries_on_404(self, mock_sleep):
+    def test_retry_on_not_found_retries_on_404(self):
+        sleeps = []
         fn = MagicMock(side_effect=[
             GitHubClientError("gh: Not Found (HTTP 404)"),
             "success"
         ])
-        result = self.client.retry_on_not_found(fn, max_retries=3, delay=1.0)
+        result = self.client.retry_on_not_found(fn, waiter=self._waiter(sleeps))
         self.assertEqual(result, "success")
         self.assertEqual(fn.call_count, 2)
-        mock_sleep.assert_called_once_with(1.0)  # delay * (attempt+1) = 1.0 * 1
+        self.assertEqual(sleeps, [0.5])
 
-    @patch("release_automation.scripts.github_client.time.sleep")
-    def test_retry_on_not_found_gives_up_after_max_retries(self, mock_sleep):
+    def test_retry_on_not_found_gives_up_at_deadline(self):
+        sleeps = []
         fn = MagicMock(side_effect=GitHubClientError("HTTP 404"))
         with self.assertRaises(GitHubClientError):
-            self.client.retry_on_not_found(fn, max_retries=3, delay=0.5)
+            self.client.retry_on_not_found(fn, waiter=self._waiter(sleeps))
+        # 0.5 + 1.0, then clipped to the 3 s deadline
+        self.assertEqual(sleeps, [0.5, 1.0, 1.5])
+        self.assertEqual(fn.call_count, 4)
+
+    def test_retry_on_not_found_deprecated_arguments(self):
+        fn = MagicMock(side_effect=GitHubClientError("HTTP 404"))
+        with self.assertWarns(DeprecationWarning):
+            with self.assertRaises(GitHubClientError):
+                self.client.retry_on_not_found(fn, max_retries=3, delay=0.01)
+        # Waits of 0.01 s and 0.02 s, as the former linear schedule
         self.assertEqual(fn.call_count, 3)
-        self.assertEqual(mock_sleep.call_count, 2)  # retries 1 and 2, not after final
 
-    @patch("release_automation.scripts.github_client.time.sleep")
-    def test_retry_on_not_found_raises_non_404_immediately(self, mock_sleep):
+        with self.assertRaises(ValueError):
+            self.client.retry_on_not_found(fn, max_retries=3, waiter=self._waiter([]))
+
+    def test_retry_on_not_found_raises_non_404_immediately(self):
+        sleeps = []
         fn = MagicMock(side_effect=GitHubClientError("HTTP 500 Server Error"))
         with self.assertRaises(GitHubClientError):
-            self.client.retry_on_not_found(fn, max_retries=3)
+            self.client.retry_on_not_found(fn, waiter=self._waiter(sleeps))
         fn.assert_called_once()
-        mock_sleep.assert_not_called()
+        self.assertEqual(sleeps, [])
+
+    @patch("release_automation.scripts.github_client.GitHubClient.iter_releases")
+    def test_draft_release_exists_fresh_rebuilds_index(self, mock_iter):
+        # The draft sits beyond the first page of releases
+        records = [ReleaseRecord(i, f"r1.{i}", False, False, "") for i in range(150)]
+        records.append(ReleaseRecord(999, "r4.1", True, False, ""))
+        mock_iter.side_effect = lambda **kwargs: iter(records)
+        self.client._release_index = {}
+
+        self.assertTrue(self.client.draft_release_exists("r4.1", fresh=True))
+        self.assertFalse(self.client.draft_release_exists("r4.3", fresh=True))
+
+        self.assertEqual(mock_iter.call_count, 2)
+        self.assertIn("r4.1", self.client._release_index)
+
+    @patch("release_automation.scripts.github_client.GitHubClient.iter_releases")
+    def test_draft_release_exists_fresh_raises_other_errors(self, mock_iter):
+        mock_iter.side_effect = GitHubClientError("HTTP 403: rate limit exceeded")
+
+        with self.assertRaises(GitHubClientError):
+            self.client.draft_release_exists("r4.1", fresh=True)
+
+        mock_iter.side_effect = GitHubClientError("HTTP 404: Not Found")
+        self.assertFalse(self.client.draft_release_exists("r4.1", fresh=True))
 
     @patch("release_automation.scripts.github_client.GitHubClient._run_gh")
     def test_get_tag_sha_success(self, mock_run_gh):
@@ -228,5 +320,586 @@ class TestGitHubClient(unittest.TestCase):
         with self.assertRaises(GitHubClientError):
             self.client.create_branch_at_sha("release/r4.1", "abc123")
 
+    @patch("release_automation.scripts.github_client.GitHubClient._run_gh")
+    def test_get_branch_sha(self, mock_run_gh):
+        mock_run_gh.return_value = "abc123\n"
+        self.assertEqual(self.client.get_branch_sha("main"), "abc123")
+        self.assertIn("repos/owner/repo/git/ref/heads/main", mock_run_gh.call_args[0][0])
+        mock_run_gh.side_effect = GitHubClientError("404 Not Found")
+        self.assertIsNone(self.client.get_branch_sha("missing"))
+
+    @patch("release_automation.scripts.github_client.GitHubClient._run_gh")
+    def test_get_tree(self, mock_run_gh):
+        mock_run_gh.return_value = json.dumps({
+            "sha": "tree1", "truncated": False,
+            "tree": [{"path": "README.md", "mode": "100644", "type": "blob", "sha": "b1"}],
+        })
+        tree, entries = self.client.get_tree("abc123")
+        self.assertEqual(tree, "tree1")
+        self.assertEqual(entries[0]["path"], "README.md")
+
+    @patch("release_automation.scripts.github_client.GitHubClient._run_gh")
+    def test_get_tree_truncated(self, mock_run_gh):
+        mock_run_gh.return_value = json.dumps({"sha": "tree1", "truncated": True, "tree": []})
+        with self.assertRaises(GitHubClientError):
+            self.client.get_tree("abc123")
+
+    @patch("release_automation.scripts.github_client.GitHubClient._run_gh")
+    def test_blob_round_trip(self, mock_run_gh):
+        mock_run_gh.return_value = "aGVsbG8K\n"
+        self.assertEqual(self.client.get_blob("b1"), b"hello\n")
+
+        mock_run_gh.return_value = "b2\n"
+        self.assertEqual(self.client.create_blob(b"hello\n"), "b2")
+        args, kwargs = mock_run_gh.call_args
+        self.assertIn("--input", args[0])
+        self.assertEqual(json.loads(kwargs["input"]), {"content": "aGVsbG8K", "encoding": "base64"})
+
+    @patch("subprocess.run")
+    def test_large_file_body_is_sent_on_stdin(self, mock_run):
+        mock_run.return_value = MagicMock(stdout="b3\n")
+        client = GitHubClient(self.repo, self.token, transport=GhCliTransport(self.token))
+        content = b"x" * 200_000
+
+        self.assertEqual(client.create_blob(content), "b3")
+
+        cmd, kwargs = mock_run.call_args[0][0], mock_run.call_args[1]
+        self.assertLess(sum(len(a) for a in cmd), 1000)
+        self.assertEqual(json.loads(kwargs["input"])["content"], base64.b64encode(content).decode())
+
+    @patch("subprocess.run")
+    def test_run_gh_os_error(self, mock_run):
+        mock_run.side_effect = OSError(7, "Argument list too long")
+
+        with self.assertRaises(GitHubClientError):
+            self.client._run_gh(["api", "x"])
+
+    @patch("release_automation.scripts.github_client.GitHubClient._run_gh")
+    def test_create_tree_with_deletion(self, mock_run_gh):
+        mock_run_gh.return_value = "tree2\n"
+        tree = self.client.create_tree("tree1", [
+            {"path": "a.md", "mode": "100644", "sha": "b1"},
+            {"path": "release-plan.yaml", "sha": None},
+        ])
+        args = mock_run_gh.call_args[0][0]
+        self.assertEqual(tree, "tree2")
+        self.assertIn("base_tree=tree1", args)
+        self.assertIn("tree[][sha]=b1", args)
+        self.assertEqual(args[args.index("tree[][sha]=null") - 1], "-F")
+
+    @patch("release_automation.scripts.github_client.GitHubClient._run_gh")
+    def test_create_commit(self, mock_run_gh):
+        mock_run_gh.return_value = "c2\n"
+        sha = self.client.create_commit(
+            "msg", "tree2", ["c1"], author={"name": "bot", "email": "bot@example.com"}
+        )
+        args = mock_run_gh.call_args[0][0]
+        self.assertEqual(sha, "c2")
+        self.assertIn("parents[]=c1", args)
+        self.assertIn("committer[name]=bot", args)
+
+    def _release_view_response(self, **overrides):
+        repository = {
+            "tags": {"pageInfo": {"hasNextPage": False},
+                     "nodes": [{"name": "r4.1", "target": {"oid": "tagsha"}}]},
+            "branches": {"pageInfo": {"hasNextPage": False}, "nodes": [{
+                "name": "r4.2-abc1234",
+                "target": {
+                    "oid": "branchsha",
+                    "committedDate": "2026-01-29T12:00:00Z",
+                    "file": {"object": {"text": "repository:\n  release_tag: r4.2\n"}},
+                },
+            }]},
+            "releases": {"pageInfo": {"hasNextPage": False},
+                         "nodes": [{"tagName": "r4.2", "isDraft": True}]},
+            "pullRequests": {"pageInfo": {"hasNextPage": False},
+                             "nodes": [{"number": 7, "headRefName": "release-review/r4.2-abc1234"}]},
+            "plan": {"text": "repository:\n  target_release_tag: r4.2\n"},
+        }
+        repository.update(overrides)
+        return json.dumps({"data": {"repository": repository}})
+
+    @patch("release_automation.scripts.github_client.GitHubClient._run_gh")
+    def test_get_release_view_single_request(self, mock_run_gh):
+        mock_run_gh.return_value = self._release_view_response()
+
+        view = self.client.get_release_view(
+            "r4.2", "release-snapshot/", "release-plan.yaml", "release-metadata.yaml"
+        )
+
+        mock_run_gh.assert_called_once()
+        self.assertEqual(mock_run_gh.call_args[0][0][:2], ["api", "graphql"])
+        self.assertTrue(view.tag_exists("r4.1"))
+        self.assertFalse(view.tag_exists("r4.2"))
+        self.assertEqual(
+            view.list_branches("release-snapshot/r4.2-*"),
+            [Branch(name="release-snapshot/r4.2-abc1234", sha="branchsha")],
+        )
+        self.assertTrue(view.draft_release_exists("r4.2"))
+        self.assertEqual(view.find_pr_for_branch("release-review/r4.2-abc1234"), 7)
+        self.assertIsNone(view.find_pr_for_branch("release-review/other"))
+        self.assertEqual(
+            view.get_branch_creation_time("release-snapshot/r4.2-abc1234"),
+            "2026-01-29T12:00:00Z",
+        )
+        self.assertIn("r4.2", view.get_file_content("release-plan.yaml", "main"))
+        self.assertIn(
+            "release_tag: r4.2",
+            view.get_file_content("release-metadata.yaml", "release-snapshot/r4.2-abc1234"),
+        )
+        # Everything above was answered from the single GraphQL response
+        self.assertEqual(mock_run_gh.call_count, 1)
+
+    @patch("release_automation.scripts.github_client.GitHubClient._run_gh")
+    def test_get_release_view_missing_plan(self, mock_run_gh):
+        mock_run_gh.return_value = self._release_view_response(plan=None)
+
+        view = self.client.get_release_view(
+            None, "release-snapshot/", "release-plan.yaml", "release-metadata.yaml"
+        )
+
+        self.assertIsNone(view.get_file_content("release-plan.yaml", "main"))
+
+    @patch("release_automation.scripts.github_client.GitHubClient.tag_exists")
+    @patch("release_automation.scripts.github_client.GitHubClient._run_gh")
+    def test_get_release_view_falls_back_when_truncated(self, mock_run_gh, mock_tag_exists):
+        mock_run_gh.return_value = self._release_view_response(
+            tags={"pageInfo": {"hasNextPage": True}, "nodes": []}
+        )
+        mock_tag_exists.return_value = True
+
+        view = self.client.get_release_view(
+            "r3.1", "release-snapshot/", "release-plan.yaml", "release-metadata.yaml"
+        )
+
+        self.assertTrue(view.tag_exists("r3.1"))
+        mock_tag_exists.assert_called_once_with("r3.1")
+
+    @patch("release_automation.scripts.github_client.GitHubClient._run_gh")
+    def test_get_release_view_graphql_error(self, mock_run_gh):
+        mock_run_gh.side_effect = GitHubClientError("GitHub GraphQL request failed")
+
+        with self.assertRaises(GitHubClientError):
+            self.client.get_release_view(
+                "r4.2", "release-snapshot/", "release-plan.yaml", "release-metadata.yaml"
+            )
+
 if __name__ == '__main__':
     unittest.main()
+
+
+TAG_LISTING = (
+    '{"name":"refs/tags/r3.2","sha":"' + "a" * 40 + '"}\n'
+    '{"name":"refs/tags/r4.1","sha":"' + "b" * 40 + '"}\n'
+    '{"name":"refs/tags/release-test","sha":"' + "c" * 40 + '"}\n'
+)
+
+
+class TestImmutableContentCache(unittest.TestCase):
+    """File reads at release tags and SHAs are served from the content cache."""
+
+    def setUp(self):
+        self.cache = ContentCache()
+        self.client = GitHubClient("owner/repo", "fake-token", content_cache=self.cache)
+
+    @patch("release_automation.scripts.github_client.GitHubClient._run_gh")
+    def test_release_tag_reads_are_fetched_once(self, mock_run_gh):
+        mock_run_gh.side_effect = [TAG_LISTING, "a: 1\n", "b: 2\n"]
+
+        for _ in range(3):
+            self.assertEqual(self.client.get_yaml_file("release-metadata.yaml", ref="r3.2"), {"a": 1})
+            self.assertEqual(self.client.get_file_content("VERSION.yaml", ref="r4.1"), "b: 2\n")
+
+        # One tag listing resolves every release tag, then one read per file
+        self.assertEqual(mock_run_gh.call_count, 3)
+        self.assertIn("repos/owner/repo/git/matching-refs/tags/r", mock_run_gh.call_args_list[0][0][0])
+
+    @patch("release_automation.scripts.github_client.GitHubClient._run_gh")
+    def test_recreated_tag_is_resolved_again_in_next_run(self, mock_run_gh):
+        recreated = TAG_LISTING.replace("a" * 40, "e" * 40)
+        mock_run_gh.side_effect = [TAG_LISTING, "a: 1\n", recreated, "a: 2\n"]
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            first_run = GitHubClient("owner/repo", "fake-token", content_cache=ContentCache(cache_dir))
+            self.assertEqual(first_run.get_yaml_file("release-metadata.yaml", ref="r3.2"), {"a": 1})
+
+            # r3.2 was deleted and re-created at another commit
+            next_run = GitHubClient("owner/repo", "fake-token", content_cache=ContentCache(cache_dir))
+            self.assertEqual(next_run.get_yaml_file("release-metadata.yaml", ref="r3.2"), {"a": 2})
+
+        self.assertEqual(mock_run_gh.call_count, 4)
+
+    @patch("release_automation.scripts.github_client.GitHubClient._run_gh")
+    def test_parsed_yaml_is_copied(self, mock_run_gh):
+        mock_run_gh.side_effect = [TAG_LISTING, "apis:\n  - name: a\n"]
+
+        first = self.client.get_yaml_file("release-metadata.yaml", ref="r3.2")
+        first["apis"].append({"name": "b"})
+
+        self.assertEqual(
+            self.client.get_yaml_file("release-metadata.yaml", ref="r3.2"),
+            {"apis": [{"name": "a"}]},
+        )
+
+    @patch("release_automation.scripts.github_client.GitHubClient._run_gh")
+    def test_branches_are_not_cached(self, mock_run_gh):
+        mock_run_gh.return_value = "content"
+
+        self.client.get_file_content("release-plan.yaml", ref="main")
+        self.client.get_file_content("release-plan.yaml", ref="main")
+
+        self.assertEqual(mock_run_gh.call_count, 2)
+
+    @patch("release_automation.scripts.github_client.GitHubClient._run_gh")
+    def test_commit_sha_needs_no_resolution(self, mock_run_gh):
+        sha = "d" * 40
+        mock_run_gh.return_value = "content"
+
+        self.client.get_file_content("x.yaml", ref=sha)
+        self.client.get_file_content("x.yaml", ref=sha)
+
+        mock_run_gh.assert_called_once()
+
+    @patch("release_automation.scripts.github_client.GitHubClient._run_gh")
+    def test_missing_file_is_cached(self, mock_run_gh):
+        mock_run_gh.side_effect = [TAG_LISTING, GitHubClientError("HTTP 404: Not Found")]
+
+        self.assertIsNone(self.client.get_file_content("release-metadata.yaml", ref="r3.2"))
+        self.assertIsNone(self.client.get_file_content("release-metadata.yaml", ref="r3.2"))
+
+        self.assertEqual(mock_run_gh.call_count, 2)
+
+    @patch("release_automation.scripts.github_client.GitHubClient._run_gh")
+    def test_other_errors_are_not_cached(self, mock_run_gh):
+        mock_run_gh.side_effect = [
+            TAG_LISTING, GitHubClientError("HTTP 502: Bad Gateway"), "content",
+        ]
+
+        self.assertIsNone(self.client.get_file_content("x.yaml", ref="r3.2"))
+        self.assertEqual(self.client.get_file_content("x.yaml", ref="r3.2"), "content")
+
+    @patch("release_automation.scripts.github_client.GitHubClient._run_gh")
+    def test_unknown_tag_is_read_directly(self, mock_run_gh):
+        mock_run_gh.side_effect = [TAG_LISTING, "x", "x"]
+
+        self.client.get_file_content("x.yaml", ref="r9.9")
+        self.client.get_file_content("x.yaml", ref="r9.9")
+
+        self.assertEqual(mock_run_gh.call_count, 3)
+
+    @patch("release_automation.scripts.github_client.GitHubClient._fetch_release_asset")
+    @patch("release_automation.scripts.github_client.GitHubClient._run_gh")
+    def test_release_metadata_asset_fallback_is_cached(self, mock_run_gh, mock_download):
+        mock_run_gh.side_effect = [TAG_LISTING, GitHubClientError("HTTP 404: Not Found")]
+        mock_download.return_value = "repository:\n  release_tag: r3.2\n"
+
+        for _ in range(2):
+            metadata = self.client.get_release_metadata("r3.2")
+            self.assertEqual(metadata["repository"]["release_tag"], "r3.2")
+
+        mock_download.assert_called_once()
+
+    @patch("release_automation.scripts.github_client.GitHubClient._fetch_release_asset")
+    @patch("release_automation.scripts.github_client.GitHubClient._run_gh")
+    def test_missing_release_metadata_is_cached(self, mock_run_gh, mock_download):
+        mock_run_gh.side_effect = [TAG_LISTING, GitHubClientError("HTTP 404: Not Found")]
+        mock_download.side_effect = GitHubClientError("no assets match the file pattern")
+
+        self.assertIsNone(self.client.get_release_metadata("r3.2"))
+        self.assertIsNone(self.client.get_release_metadata("r3.2"))
+
+        mock_download.assert_called_once()
+
+    @patch("release_automation.scripts.github_client.GitHubClient._fetch_release_asset")
+    @patch("release_automation.scripts.github_client.GitHubClient._run_gh")
+    def test_failed_asset_download_is_not_cached(self, mock_run_gh, mock_download):
+        mock_run_gh.side_effect = [TAG_LISTING, GitHubClientError("HTTP 404: Not Found")]
+        mock_download.side_effect = [
+            GitHubClientError("HTTP 502: Bad Gateway"),
+            "repository:\n  release_tag: r3.2\n",
+        ]
+
+        self.assertIsNone(self.client.get_release_metadata("r3.2"))
+        metadata = self.client.get_release_metadata("r3.2")
+
+        self.assertEqual(metadata["repository"]["release_tag"], "r3.2")
+
+    @patch("release_automation.scripts.github_client.GitHubClient._fetch_release_asset")
+    @patch("release_automation.scripts.github_client.GitHubClient._run_gh")
+    def test_failed_file_read_is_not_cached(self, mock_run_gh, mock_download):
+        mock_run_gh.side_effect = [
+            TAG_LISTING, GitHubClientError("HTTP 502: Bad Gateway"), "repository: {}\napis: []\n",
+        ]
+
+        self.assertIsNone(self.client.get_release_metadata("r3.2"))
+        self.assertEqual(self.client.get_release_metadata("r3.2"), {"repository": {}, "apis": []})
+        mock_download.assert_not_called()
+
+    @patch("release_automation.scripts.github_client.GitHubClient._run_gh")
+    def test_cache_dir_persists_between_clients(self, mock_run_gh):
+        mock_run_gh.side_effect = [TAG_LISTING, "a: 1\n", TAG_LISTING]
+        with tempfile.TemporaryDirectory() as cache_dir:
+            for _ in range(2):
+                client = GitHubClient("owner/repo", "fake-token", cache_dir=cache_dir)
+                self.assertEqual(client.get_yaml_file("release-metadata.yaml", ref="r3.2"), {"a": 1})
+
+        # The second run lists the tags again but reads no file
+        self.assertEqual(mock_run_gh.call_count, 3)
+
+    @patch("release_automation.scripts.github_client.GitHubClient._run_gh")
+    def test_repository_yaml_file_shares_cache(self, mock_run_gh):
+        mock_run_gh.side_effect = [TAG_LISTING, "version: 0.6.0\n"]
+
+        for _ in range(2):
+            self.assertEqual(
+                self.client.get_repository_yaml_file("org/Commonalities", "VERSION.yaml", ref="r4.1"),
+                {"version": "0.6.0"},
+            )
+
+        self.assertEqual(mock_run_gh.call_count, 2)
+        self.assertIn("repos/org/Commonalities/git/matching-refs/tags/r", mock_run_gh.call_args_list[0][0][0])
+
+
+class TestMemoizedReads(unittest.TestCase):
+    """Reads are deduplicated inside GitHubClient.memoized()."""
+
+    def setUp(self):
+        self.transport = MagicMock()
+        self.transport.run.return_value = "[]"
+        self.client = GitHubClient("owner/repo", "fake-token", transport=self.transport)
+
+    def test_identical_reads_are_sent_once(self):
+        with self.client.memoized():
+            self.client.get_releases()
+            self.client.get_releases()
+            self.client.get_releases(include_drafts=True)
+
+        self.assertEqual(self.transport.run.call_count, 1)
+
+    def test_no_memoization_outside_block(self):
+        with self.client.memoized():
+            self.client.get_releases()
+        self.client.get_releases()
+        self.client.get_releases()
+
+        self.assertEqual(self.transport.run.call_count, 3)
+
+    def test_cross_repository_reads_share_the_memo(self):
+        self.transport.run.return_value = "version: 0.6.0\n"
+        with self.client.memoized():
+            for _ in range(2):
+                self.client.get_repository_yaml_file("org/Commonalities", "VERSION.yaml")
+            self.assertEqual(self.transport.run.call_count, 1)
+
+            # An invalidation of this client also drops the other repository's reads
+            self.client.invalidate()
+            self.client.get_repository_yaml_file("org/Commonalities", "VERSION.yaml")
+
+        self.assertEqual(self.transport.run.call_count, 2)
+
+    def test_write_invalidates_affected_reads(self):
+        self.transport.run.side_effect = lambda args, check=True, input=None: (
+            "refs/tags/r4.1" if "git/refs/tags/r4.1" in args[1] else "[]"
+        )
+        with self.client.memoized():
+            self.client.get_releases()
+            self.client.tag_exists("r4.1")
+            self.client.delete_branch("release-snapshot/r4.1-abc1234")
+            self.client.get_releases()
+            self.client.tag_exists("r4.1")
+
+        endpoints = [
+            next(a for a in c[0][0] if a.startswith("repos/"))
+            for c in self.transport.run.call_args_list
+        ]
+        self.assertEqual(endpoints.count("repos/owner/repo/releases"), 1)
+        self.assertEqual(endpoints.count("repos/owner/repo/git/refs/tags/r4.1"), 2)
+
+    def test_errors_are_not_memoized(self):
+        self.transport.run.side_effect = [
+            TransportError("GitHub API request failed: Not Found (HTTP 404)"),
+            "refs/tags/r4.1",
+            "unused",
+        ]
+
+        with self.client.memoized():
+            self.assertFalse(self.client.tag_exists("r4.1"))
+            self.assertTrue(self.client.tag_exists("r4.1"))
+            self.assertTrue(self.client.tag_exists("r4.1"))
+
+        self.assertEqual(self.transport.run.call_count, 2)
+
+    def test_fresh_reads_bypass_memo(self):
+        with self.client.memoized():
+            self.client.get_releases()
+            with self.client.fresh_reads():
+                self.client.get_releases()
+            self.client.get_releases()
+
+        self.assertEqual(self.transport.run.call_count, 2)
+
+    def test_read_overlapping_a_write_is_not_stored(self):
+        def run(args, check=True, input=None):
+            if "releases" in args[1] and self.transport.run.call_count == 1:
+                # A concurrent stage writes while this read is in flight
+                self.client.invalidate("releases")
+            return "[]"
+
+        self.transport.run.side_effect = run
+        with self.client.memoized():
+            self.client.get_releases()
+            self.client.get_releases()
+
+        self.assertEqual(self.transport.run.call_count, 2)
+
+    def test_concurrent_reads_and_writes(self):
+        def worker(n):
+            for i in range(50):
+                self.client._run_gh(["api", f"repos/owner/repo/releases?page={n}-{i}"])
+                self.client.invalidate("releases")
+
+        with self.client.memoized():
+            run_parallel([partial(worker, n) for n in range(4)])
+
+        self.assertEqual(self.transport.run.call_count, 200)
+
+    def test_nested_blocks_share_scope(self):
+        with self.client.memoized():
+            self.client.get_releases()
+            with self.client.memoized():
+                self.client.get_releases()
+            self.client.get_releases()
+
+        self.assertEqual(self.transport.run.call_count, 1)
+
+
+class TestClassifyCommand(unittest.TestCase):
+    def test_reads(self):
+        self.assertEqual(_classify_command(["api", "repos/o/r/releases", "--paginate"]), ("read", "releases"))
+        self.assertEqual(_classify_command(["api", "repos/o/r/git/matching-refs/heads/x"]), ("read", "refs"))
+        self.assertEqual(_classify_command(["issue", "list", "--repo", "o/r"]), ("read", "issues"))
+        self.assertEqual(_classify_command(["api", "graphql", "-f", "query=query { x }"]), ("read", "graphql"))
+
+    def test_writes(self):
+        self.assertEqual(_classify_command(["api", "-X", "PATCH", "repos/o/r/releases/1"]), ("write", "releases"))
+        self.assertEqual(_classify_command(["api", "repos/o/r/labels", "-f", "name=x"]), ("write", "labels"))
+        self.assertEqual(_classify_command(["issue", "create", "--repo", "o/r"]), ("write", "issues"))
+        self.assertEqual(_classify_command(["api", "graphql", "-f", "query=mutation { x }"]), ("write", None))
+
+    def test_git_object_creation_is_neither(self):
+        args = ["api", "repos/o/r/git/blobs", "-X", "POST", "-f", "content=x"]
+        self.assertEqual(_classify_command(args), ("other", None))
+        self.assertEqual(_classify_command(["api", "repos/o/r/git/trees/abc?recursive=1"]), ("read", "refs"))
+
+    def test_generate_notes_is_neither(self):
+        args = ["api", "repos/o/r/releases/generate-notes", "-f", "tag_name=r4.1"]
+        self.assertEqual(_classify_command(args), ("other", None))
+
+
+def _releases_page(nodes, has_next=False, cursor=None):
+    return json.dumps({
+        "pageInfo": {"hasNextPage": has_next, "endCursor": cursor},
+        "nodes": nodes,
+    })
+
+
+def _release_node(tag, draft=False, prerelease=False, db_id=1):
+    return {
+        "databaseId": db_id, "tagName": tag, "isDraft": draft,
+        "isPrerelease": prerelease, "createdAt": "2026-01-01T00:00:00Z",
+    }
+
+
+class TestIterReleases(unittest.TestCase):
+    def setUp(self):
+        self.client = GitHubClient("owner/repo", "fake-token")
+
+    @patch("release_automation.scripts.github_client.GitHubClient._run_gh")
+    def test_yields_compact_records(self, mock_run_gh):
+        mock_run_gh.return_value = _releases_page([
+            _release_node("r4.1", draft=True, db_id=3),
+            _release_node("r4.1-rc", prerelease=True, db_id=2),
+        ])
+
+        records = list(self.client.iter_releases())
+
+        self.assertEqual(records, [
+            ReleaseRecord(id=2, tag_name="r4.1-rc", draft=False, prerelease=True,
+                          created_at="2026-01-01T00:00:00Z"),
+        ])
+        self.assertEqual(len(list(self.client.iter_releases(include_drafts=True))), 2)
+        args = mock_run_gh.call_args[0][0]
+        self.assertIn("graphql", args)
+        self.assertIn("owner=owner", args)
+        self.assertIn("name=repo", args)
+
+    @patch("release_automation.scripts.github_client.GitHubClient._run_gh")
+    def test_pages_are_fetched_lazily(self, mock_run_gh):
+        mock_run_gh.side_effect = [
+            _releases_page([_release_node("r3.2")], has_next=True, cursor="c1"),
+            _releases_page([_release_node("r3.1")]),
+        ]
+
+        releases = self.client.iter_releases()
+        self.assertEqual(next(releases).tag_name, "r3.2")
+        self.assertEqual(mock_run_gh.call_count, 1)
+
+        self.assertEqual(next(releases).tag_name, "r3.1")
+        self.assertIn("after=c1", mock_run_gh.call_args[0][0])
+        self.assertEqual(list(releases), [])
+        self.assertEqual(mock_run_gh.call_count, 2)
+
+    @patch("release_automation.scripts.github_client.GitHubClient._run_gh")
+    def test_unparseable_page_raises(self, mock_run_gh):
+        mock_run_gh.return_value = "null"
+
+        with self.assertRaises(GitHubClientError):
+            list(self.client.iter_releases())
+
+
+class TestReleaseIndex(unittest.TestCase):
+    def setUp(self):
+        self.client = GitHubClient("owner/repo", "fake-token")
+
+    @patch("release_automation.scripts.github_client.GitHubClient._run_gh")
+    def test_lookups_share_one_paginated_fetch(self, mock_run_gh):
+        mock_run_gh.side_effect = [
+            _releases_page([_release_node("r4.2", prerelease=True, db_id=5)],
+                           has_next=True, cursor="c1"),
+            _releases_page([_release_node("r4.1", draft=True, db_id=4),
+                            _release_node("r3.2", db_id=3)]),
+        ]
+
+        # Draft on the second page is found
+        self.assertTrue(self.client.draft_release_exists("r4.1"))
+        self.assertFalse(self.client.draft_release_exists("r3.2"))
+        self.assertEqual(self.client.get_release_id("r4.1", draft_only=True), 4)
+        self.assertIsNone(self.client.get_release_id("r3.2", draft_only=True))
+        self.assertEqual(self.client.get_release_id("r3.2"), 3)
+        self.assertEqual(self.client.get_draft_release("r4.1").tag_name, "r4.1")
+        self.assertIsNone(self.client.get_draft_release("r9.9"))
+
+        self.assertEqual(mock_run_gh.call_count, 2)
+        self.assertIn("first=100", mock_run_gh.call_args_list[0][0][0])
+
+    def test_release_update_drops_index(self):
+        self.client.transport = MagicMock()
+        self.client.transport.run.side_effect = [
+            _releases_page([_release_node("r4.1", draft=True, db_id=4)]),
+            '{"id": 4}',
+            _releases_page([_release_node("r4.1", db_id=4)]),
+        ]
+
+        self.assertTrue(self.client.draft_release_exists("r4.1"))
+        self.client.update_release(4, draft=False)
+
+        self.assertFalse(self.client.draft_release_exists("r4.1"))
+        self.assertEqual(self.client.transport.run.call_count, 3)
+
+    @patch("release_automation.scripts.github_client.GitHubClient._run_gh")
+    def test_listing_failure(self, mock_run_gh):
+        mock_run_gh.side_effect = GitHubClientError("HTTP 500")
+
+        self.assertFalse(self.client.draft_release_exists("r4.1"))
+        self.assertIsNone(self.client.get_release_id("r4.1"))
+        self.assertIsNone(self.client.get_draft_release("r4.1"))
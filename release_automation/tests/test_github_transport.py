@@ -0,0 +1,507 @@
+"""
+Unit tests for the GitHub client transports.
+
+The HTTP transport is exercised against a local stand-in server that
+mimics the GitHub REST API, so no network access is needed.
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from release_automation.scripts.github_client import GitHubClient, GitHubClientError
+from release_automation.scripts.profiling import Profile
+from release_automation.scripts.rate_limiter import RateLimiter
+from release_automation.scripts.github_transport import (
+    GhCliTransport,
+    HttpTransport,
+    ResponseCache,
+    TransportError,
+    _compile_jq,
+    _format_jq_output,
+    _parse_api_args,
+    create_transport,
+)
+
+
+class FakeGitHub:
+    """Routes for the stand-in server: (method, path) -> (status, headers, body)."""
+
+    def __init__(self):
+        self.routes = {}
+        self.requests = []
+        self.connections = set()
+
+    def add(self, method, path, body, status=200, headers=None):
+        self.routes[(method, path)] = (status, headers or {}, body)
+
+    def add_sequence(self, method, path, responses):
+        """Answer successive requests with (status, headers, body) in turn."""
+        self.routes[(method, path)] = list(responses)
+
+
+@pytest.fixture
+def fake_github():
+    """Start a local HTTP server that answers like the GitHub API."""
+    fake = FakeGitHub()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _handle(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            body = self.rfile.read(length).decode() if length else ""
+            fake.requests.append({
+                "method": self.command,
+                "path": self.path,
+                "headers": dict(self.headers),
+                "body": body,
+            })
+            fake.connections.add(self.client_address)
+            route = fake.routes.get(
+                (self.command, self.path),
+                (404, {}, {"message": "Not Found"}),
+            )
+            if isinstance(route, list):
+                route = route.pop(0) if len(route) > 1 else route[0]
+            status, headers, payload = route
+            data = payload if isinstance(payload, str) else json.dumps(payload)
+            data = data.replace("{base}", fake.base_url).encode()
+            if "ETag" in headers and self.headers.get("If-None-Match") == headers["ETag"]:
+                status, data = 304, b""
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value.replace("{base}", fake.base_url))
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        do_GET = do_POST = do_PATCH = do_PUT = do_DELETE = _handle
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    fake.base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield fake
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def transport(fake_github):
+    fallback = MagicMock()
+    fallback.run.return_value = "from-cli"
+    t = HttpTransport("test-token", api_url=fake_github.base_url, fallback=fallback)
+    yield t
+    t.close()
+
+
+class TestJqSubset:
+    """Tests for the in-process jq evaluator."""
+
+    def _run(self, source, data):
+        return _format_jq_output(_compile_jq(source)(data))
+
+    def test_field_paths(self):
+        data = {"ref": "refs/tags/r4.1", "object": {"sha": "abc"}}
+        assert self._run(".ref", data) == "refs/tags/r4.1\n"
+        assert self._run(".object.sha", data) == "abc\n"
+
+    def test_iterate_and_index(self):
+        data = [{"name": "a", "number": 1}, {"name": "b", "number": 2}]
+        assert self._run(".[].name", data) == "a\nb\n"
+        assert self._run(".[0].number", data) == "1\n"
+        assert self._run(".[0].number", []) == "\n"
+
+    def test_select_and_length(self):
+        data = [
+            {"tag_name": "r4.1", "draft": True, "id": 7},
+            {"tag_name": "r4.1", "draft": False, "id": 8},
+        ]
+        source = '[.[] | select(.tag_name == "r4.1" and .draft == true)] | length'
+        assert self._run(source, data) == "1\n"
+        source = '.[] | select(.tag_name == "r4.1" and .draft == true) | .id'
+        assert self._run(source, data) == "7\n"
+
+    def test_object_construction(self):
+        data = {"id": 1, "login": "bot", "type": "Bot", "extra": "x"}
+        output = self._run("{id: .id, login: .login, type: .type}", data)
+        assert json.loads(output) == {"id": 1, "login": "bot", "type": "Bot"}
+
+    def test_identity_outputs_compact_json(self):
+        assert self._run(".", {"a": [1, 2]}) == '{"a":[1,2]}\n'
+
+    def test_unsupported_filter_raises(self):
+        with pytest.raises(TransportError):
+            _compile_jq('.[] | "\\(.name)"')
+
+
+class TestParseApiArgs:
+    """Tests for gh api argument parsing."""
+
+    def test_get_with_headers_and_jq(self):
+        request = _parse_api_args([
+            "repos/o/r/contents/x?ref=main", "-H", "Accept: application/vnd.github.raw",
+            "--jq", ".ref",
+        ])
+        assert request["method"] == "GET"
+        assert request["headers"] == {"Accept": "application/vnd.github.raw"}
+        assert request["jq"] == ".ref"
+
+    def test_fields_default_to_post_and_are_typed(self):
+        request = _parse_api_args([
+            "repos/o/r/releases/1", "-F", "draft=false", "-f", "name=r4.1",
+            "-f", "labels[]=a", "-f", "labels[]=b",
+        ])
+        assert request["method"] == "POST"
+        assert request["fields"] == {"draft": False, "name": "r4.1", "labels": ["a", "b"]}
+
+    def test_nested_fields(self):
+        request = _parse_api_args([
+            "repos/o/r/git/trees", "-f", "base_tree=t",
+            "-f", "tree[][path]=a.md", "-f", "tree[][sha]=1",
+            "-f", "tree[][path]=b.md", "-F", "tree[][sha]=null",
+            "-f", "author[name]=bot", "-f", "author[email]=bot@example.com",
+        ])
+        assert request["fields"] == {
+            "base_tree": "t",
+            "tree": [{"path": "a.md", "sha": "1"}, {"path": "b.md", "sha": None}],
+            "author": {"name": "bot", "email": "bot@example.com"},
+        }
+
+    def test_input_from_stdin(self):
+        request = _parse_api_args(["repos/o/r/git/blobs", "--input", "-", "--jq", ".sha"])
+        assert request["input"] is True
+        assert request["method"] == "POST"
+
+    def test_explicit_method(self):
+        request = _parse_api_args(["repos/o/r/issues/1", "-X", "PATCH", "-f", "title=t"])
+        assert request["method"] == "PATCH"
+
+
+class TestHttpTransport:
+    """Tests for the in-process HTTP transport."""
+
+    def test_get_with_jq_and_auth(self, transport, fake_github):
+        fake_github.add("GET", "/repos/o/r/git/refs/tags/r4.1", {"ref": "refs/tags/r4.1"})
+
+        output = transport.run(["api", "repos/o/r/git/refs/tags/r4.1", "--jq", ".ref"])
+
+        assert output == "refs/tags/r4.1\n"
+        headers = fake_github.requests[0]["headers"]
+        assert headers["Authorization"] == "Bearer test-token"
+
+    def test_connection_is_reused(self, transport, fake_github):
+        fake_github.add("GET", "/a", {"x": 1})
+        fake_github.add("GET", "/b", {"x": 2})
+
+        transport.run(["api", "a"])
+        transport.run(["api", "b"])
+        transport.run(["api", "a"])
+
+        assert len(fake_github.requests) == 3
+        assert len(fake_github.connections) == 1
+
+    def test_threads_use_separate_connections(self, transport, fake_github):
+        fake_github.add("GET", "/a", {"x": 1})
+        outputs = []
+
+        def worker():
+            outputs.append(transport.run(["api", "a", "--jq", ".x"]))
+            outputs.append(transport.run(["api", "a", "--jq", ".x"]))
+
+        threads = [threading.Thread(target=worker) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert outputs == ["1\n"] * 6
+        assert len(fake_github.connections) == 3
+
+    def test_requests_are_profiled(self, transport, fake_github):
+        fake_github.add("GET", "/a", {"x": 1})
+        fake_github.add(
+            "GET", "/b", [1], headers={"Link": '<{base}/b?page=2>; rel="next"'},
+        )
+        fake_github.add("GET", "/b?page=2", [2])
+        profile = Profile()
+
+        with profile.stage("reads"):
+            transport.run(["api", "a"])
+            transport.run(["api", "b", "--paginate"])
+
+        stage = profile.stages["reads"]
+        assert stage.api_calls == 3
+        assert stage.bytes_received == len('{"x": 1}') + 2 * len("[1]")
+
+    def test_paginate_follows_link_header(self, transport, fake_github):
+        fake_github.add(
+            "GET", "/repos/o/r/branches", [{"name": "main"}],
+            headers={"Link": '<{base}/repos/o/r/branches?page=2>; rel="next"'},
+        )
+        fake_github.add("GET", "/repos/o/r/branches?page=2", [{"name": "dev"}])
+
+        output = transport.run(["api", "repos/o/r/branches", "--paginate", "--jq", ".[].name"])
+
+        assert output == "main\ndev\n"
+
+    def test_patch_sends_json_body(self, transport, fake_github):
+        fake_github.add("PATCH", "/repos/o/r/releases/5", {"id": 5})
+
+        transport.run(["api", "-X", "PATCH", "repos/o/r/releases/5", "-F", "draft=false"])
+
+        assert json.loads(fake_github.requests[0]["body"]) == {"draft": False}
+
+    def test_input_body_is_sent_as_given(self, transport, fake_github):
+        fake_github.add("PUT", "/repos/o/r/contents/a.md", {"content": {"sha": "s1"}})
+        body = json.dumps({"message": "m", "content": "eA==", "branch": "main"})
+
+        transport.run(["api", "-X", "PUT", "repos/o/r/contents/a.md", "--input", "-"], input=body)
+
+        assert fake_github.requests[0]["body"] == body
+
+    def test_error_message_contains_status(self, transport, fake_github):
+        fake_github.add(
+            "POST", "/repos/o/r/git/refs", {"message": "Reference already exists"},
+            status=422,
+        )
+
+        with pytest.raises(TransportError) as exc_info:
+            transport.run(["api", "repos/o/r/git/refs", "-X", "POST", "-f", "ref=refs/heads/x"])
+
+        assert "422" in str(exc_info.value)
+        assert "Reference already exists" in str(exc_info.value)
+
+    def test_not_found(self, transport):
+        with pytest.raises(TransportError) as exc_info:
+            transport.run(["api", "repos/o/r/git/refs/tags/missing"])
+        assert "404" in str(exc_info.value)
+
+    def test_non_api_commands_use_fallback(self, transport):
+        args = ["issue", "list", "--repo", "o/r"]
+
+        assert transport.run(args) == "from-cli"
+        transport.fallback.run.assert_called_once_with(args, check=True, input=None)
+
+    def test_unsupported_jq_uses_fallback(self, transport, fake_github):
+        args = ["api", "repos/o/r", "--jq", '"\\(.name)"']
+
+        assert transport.run(args) == "from-cli"
+        assert fake_github.requests == []
+
+    def test_graphql_posts_query_and_variables(self, transport, fake_github):
+        fake_github.add("POST", "/graphql", {"data": {"repository": {"id": "R1"}}})
+
+        output = transport.run([
+            "api", "graphql", "-f", "query=query($o: String!) { x }", "-F", "o=camara",
+            "--jq", ".data.repository.id",
+        ])
+
+        assert output == "R1\n"
+        body = json.loads(fake_github.requests[0]["body"])
+        assert body == {"query": "query($o: String!) { x }", "variables": {"o": "camara"}}
+
+    def test_graphql_errors_raise(self, transport, fake_github):
+        fake_github.add("POST", "/graphql", {"errors": [{"message": "Bad query"}]})
+
+        with pytest.raises(TransportError, match="Bad query"):
+            transport.run(["api", "graphql", "-f", "query={ x }"])
+
+
+class TestResponseCache:
+    """Tests for conditional requests backed by the on-disk cache."""
+
+    @pytest.fixture
+    def cached_transport(self, fake_github, tmp_path):
+        t = HttpTransport(
+            "test-token", api_url=fake_github.base_url, fallback=MagicMock(),
+            cache=ResponseCache(str(tmp_path)),
+        )
+        yield t
+        t.close()
+
+    def test_not_modified_is_served_from_cache(self, cached_transport, fake_github):
+        fake_github.add("GET", "/repos/o/r/labels", [{"name": "release-issue"}],
+                        headers={"ETag": '"v1"'})
+
+        first = cached_transport.run(["api", "repos/o/r/labels", "--jq", ".[].name"])
+        second = cached_transport.run(["api", "repos/o/r/labels", "--jq", ".[].name"])
+
+        assert first == second == "release-issue\n"
+        assert "If-None-Match" not in fake_github.requests[0]["headers"]
+        assert fake_github.requests[1]["headers"]["If-None-Match"] == '"v1"'
+        assert (cached_transport.cache.hits, cached_transport.cache.misses) == (1, 1)
+
+    def test_cache_persists_across_transports(self, fake_github, tmp_path):
+        fake_github.add("GET", "/repos/o/r/releases", [{"tag_name": "r4.1"}],
+                        headers={"ETag": '"v1"'})
+        for _ in range(2):
+            t = HttpTransport("test-token", api_url=fake_github.base_url,
+                              fallback=MagicMock(), cache=ResponseCache(str(tmp_path)))
+            assert t.run(["api", "repos/o/r/releases", "--jq", ".[0].tag_name"]) == "r4.1\n"
+            t.close()
+
+        assert fake_github.requests[1]["headers"]["If-None-Match"] == '"v1"'
+
+    def test_changed_resource_replaces_entry(self, cached_transport, fake_github):
+        fake_github.add("GET", "/repos/o/r/branches", [{"name": "main"}],
+                        headers={"ETag": '"v1"'})
+        cached_transport.run(["api", "repos/o/r/branches"])
+        fake_github.add("GET", "/repos/o/r/branches", [{"name": "main"}, {"name": "dev"}],
+                        headers={"ETag": '"v2"'})
+
+        output = cached_transport.run(["api", "repos/o/r/branches", "--jq", ".[].name"])
+
+        assert output == "main\ndev\n"
+        assert cached_transport.cache.hits == 0
+        assert cached_transport.run(["api", "repos/o/r/branches", "--jq", "length"]) == "2\n"
+        assert cached_transport.cache.hits == 1
+
+    def test_accept_header_is_part_of_key(self, cached_transport, fake_github):
+        fake_github.add("GET", "/repos/o/r/contents/x", {"content": ""},
+                        headers={"ETag": '"v1"'})
+        cached_transport.run(["api", "repos/o/r/contents/x"])
+        cached_transport.run([
+            "api", "repos/o/r/contents/x", "-H", "Accept: application/vnd.github.raw",
+        ])
+
+        assert "If-None-Match" not in fake_github.requests[1]["headers"]
+
+    def test_writes_and_errors_are_not_cached(self, cached_transport, fake_github, tmp_path):
+        fake_github.add("POST", "/repos/o/r/labels", {"name": "x"}, headers={"ETag": '"v1"'})
+        cached_transport.run(["api", "repos/o/r/labels", "-f", "name=x"])
+        with pytest.raises(TransportError):
+            cached_transport.run(["api", "repos/o/r/missing"])
+
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestRateLimitedTransport:
+    """Tests for rate-limit handling against rate-limit headers."""
+
+    @pytest.fixture
+    def limited(self, fake_github):
+        self.sleeps = []
+        limiter = RateLimiter(sleep=self.sleeps.append, jitter=lambda: 0.0)
+        t = HttpTransport("test-token", api_url=fake_github.base_url,
+                          fallback=MagicMock(), rate_limiter=limiter)
+        yield t
+        t.close()
+
+    def test_budget_is_tracked_from_headers(self, limited, fake_github):
+        fake_github.add("GET", "/repos/o/r", {"id": 1}, headers={
+            "X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": "4321",
+            "X-RateLimit-Reset": "1900000000", "X-RateLimit-Resource": "core",
+        })
+        client = GitHubClient("o/r", "test-token", transport=limited)
+
+        assert client.rate_limit_budget() is None
+        client._run_gh(["api", "repos/o/r"])
+
+        budget = client.rate_limit_budget()
+        assert (budget.limit, budget.remaining, budget.reset) == (5000, 4321, 1900000000)
+
+    def test_retry_after_is_honored(self, limited, fake_github):
+        fake_github.add_sequence("POST", "/repos/o/r/issues/1/comments", [
+            (429, {"Retry-After": "7"}, {"message": "Too Many Requests"}),
+            (201, {}, {"id": 9}),
+        ])
+
+        output = limited.run(["api", "repos/o/r/issues/1/comments", "-f", "body=hi", "--jq", ".id"])
+
+        assert output == "9\n"
+        assert self.sleeps == [7.0]
+        assert len(fake_github.requests) == 2
+
+    def test_secondary_limit_backs_off_exponentially(self, limited, fake_github):
+        secondary = (403, {}, {"message": "You have exceeded a secondary rate limit."})
+        fake_github.add_sequence("GET", "/repos/o/r", [secondary, secondary, (200, {}, {"id": 1})])
+
+        assert limited.run(["api", "repos/o/r", "--jq", ".id"]) == "1\n"
+        assert self.sleeps == [60.0, 120.0]
+
+    def test_retries_are_bounded(self, limited, fake_github):
+        fake_github.add("GET", "/repos/o/r", {"message": "Too Many Requests"},
+                        status=429, headers={"Retry-After": "1"})
+
+        with pytest.raises(TransportError, match="429"):
+            limited.run(["api", "repos/o/r"])
+        assert len(fake_github.requests) == RateLimiter.MAX_RETRIES + 1
+
+    def test_permission_error_is_not_retried(self, limited, fake_github):
+        fake_github.add("GET", "/repos/o/r", {"message": "Resource not accessible"}, status=403)
+
+        with pytest.raises(TransportError, match="403"):
+            limited.run(["api", "repos/o/r"])
+        assert len(fake_github.requests) == 1
+        assert self.sleeps == []
+
+
+class TestTransportSelection:
+    """Tests for create_transport and GitHubClient integration."""
+
+    def test_http_transport_with_token(self, monkeypatch):
+        monkeypatch.delenv("GITHUB_CLIENT_TRANSPORT", raising=False)
+        monkeypatch.setenv("GITHUB_API_URL", "https://ghe.example.com/api/v3")
+
+        transport = create_transport("token")
+
+        assert isinstance(transport, HttpTransport)
+        assert transport.api_url == "https://ghe.example.com/api/v3"
+
+    def test_cache_enabled_by_env(self, monkeypatch, tmp_path):
+        monkeypatch.delenv("GITHUB_CLIENT_TRANSPORT", raising=False)
+        monkeypatch.setenv("GITHUB_CLIENT_CACHE_DIR", str(tmp_path))
+
+        transport = create_transport("token")
+
+        assert transport.cache.directory == str(tmp_path)
+
+    def test_rate_limiter_shared_per_token(self, monkeypatch):
+        monkeypatch.delenv("GITHUB_CLIENT_TRANSPORT", raising=False)
+
+        assert create_transport("a").rate_limiter is create_transport("a").rate_limiter
+        assert create_transport("a").rate_limiter is not create_transport("b").rate_limiter
+
+    def test_cache_disabled_by_default(self, monkeypatch):
+        monkeypatch.delenv("GITHUB_CLIENT_TRANSPORT", raising=False)
+        monkeypatch.delenv("GITHUB_CLIENT_CACHE_DIR", raising=False)
+        assert create_transport("token").cache is None
+
+    def test_cli_transport_without_token(self, monkeypatch):
+        monkeypatch.delenv("GITHUB_CLIENT_TRANSPORT", raising=False)
+        assert isinstance(create_transport(None), GhCliTransport)
+
+    def test_cli_transport_forced_by_env(self, monkeypatch):
+        monkeypatch.setenv("GITHUB_CLIENT_TRANSPORT", "gh")
+        assert isinstance(create_transport("token"), GhCliTransport)
+
+    def test_client_wraps_transport_errors(self):
+        transport = MagicMock()
+        transport.run.side_effect = TransportError("GitHub API request failed: Not Found (HTTP 404)")
+        client = GitHubClient("o/r", "token", transport=transport)
+
+        assert client.tag_exists("r4.1") is False
+        with pytest.raises(GitHubClientError):
+            client._run_gh(["api", "repos/o/r"])
+
+    def test_client_end_to_end_over_http(self, transport, fake_github):
+        fake_github.add("GET", "/repos/o/r/pulls?head=o:release-review/r4.1-abc&state=open",
+                        [{"number": 42}])
+        client = GitHubClient("o/r", "test-token", transport=transport)
+
+        assert client.find_pr_for_branch("release-review/r4.1-abc") == 42
+
+    @patch("subprocess.run")
+    def test_cli_transport_sets_token(self, mock_run):
+        mock_run.return_value = MagicMock(stdout="ok")
+
+        assert GhCliTransport("tok").run(["api", "x"]) == "ok"
+        assert mock_run.call_args.kwargs["env"]["GH_TOKEN"] == "tok"
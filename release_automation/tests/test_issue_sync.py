@@ -5,7 +5,7 @@ Tests the IssueSyncManager class which handles Release Issue synchronization.
 """
 
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import DEFAULT, MagicMock, patch
 
 from release_automation.scripts.issue_sync import (
     IssueSyncManager,
@@ -16,6 +16,18 @@ from release_automation.scripts.issue_sync import (
 from release_automation.scripts.state_manager import ReleaseState
 
 
+def _set_issues(client, issues):
+    """Serve issues through list_issue_titles (number and title) and get_issue."""
+    client.list_issue_titles.return_value = [
+        {"number": issue["number"], "title": issue.get("title")} for issue in issues
+    ]
+    by_number = {issue["number"]: issue for issue in issues}
+    client.get_issue.side_effect = lambda number: by_number.get(number, DEFAULT)
+    client.search_issue_numbers.side_effect = lambda text, labels=None, state="open": [
+        issue["number"] for issue in issues if text in (issue.get("body") or "")
+    ]
+
+
 class TestSyncResult:
     """Tests for SyncResult dataclass."""
 
@@ -61,33 +73,33 @@ class TestFindWorkflowOwnedIssue:
     def test_finds_issue_with_marker_and_tag(self):
         """Test finding an issue with workflow marker and release tag marker in body."""
         gh = MagicMock()
-        gh.search_issues.return_value = [
+        _set_issues(gh, [
             {
                 "number": 1,
                 "title": "Release r4.1 (RC) — Sync26",
                 "body": f"Some content\n{WORKFLOW_MARKER}\n<!-- release-automation:release-tag:r4.1 -->\nMore content",
                 "labels": [{"name": "release-issue"}]
             }
-        ]
+        ])
 
         manager = IssueSyncManager(gh, MagicMock(), MagicMock(), MagicMock())
         result = manager.find_workflow_owned_issue("r4.1")
 
         assert result is not None
         assert result["number"] == 1
-        gh.search_issues.assert_called_once_with(labels=["release-issue"], state="open")
+        gh.list_issue_titles.assert_called_once_with(labels=["release-issue"], state="open")
 
     def test_ignores_issue_without_marker(self):
         """Test that issues without workflow marker are ignored."""
         gh = MagicMock()
-        gh.search_issues.return_value = [
+        _set_issues(gh, [
             {
                 "number": 1,
                 "title": "Release r4.1 (RC)",
                 "body": "No marker here",
                 "labels": [{"name": "release-issue"}]
             }
-        ]
+        ])
 
         manager = IssueSyncManager(gh, MagicMock(), MagicMock(), MagicMock())
         result = manager.find_workflow_owned_issue("r4.1")
@@ -97,14 +109,14 @@ class TestFindWorkflowOwnedIssue:
     def test_ignores_issue_with_wrong_tag(self):
         """Test that issues with different release tag marker are ignored."""
         gh = MagicMock()
-        gh.search_issues.return_value = [
+        _set_issues(gh, [
             {
                 "number": 1,
                 "title": "Release r4.0 (RC)",
                 "body": f"{WORKFLOW_MARKER}\n<!-- release-automation:release-tag:r4.0 -->",
                 "labels": [{"name": "release-issue"}]
             }
-        ]
+        ])
 
         manager = IssueSyncManager(gh, MagicMock(), MagicMock(), MagicMock())
         result = manager.find_workflow_owned_issue("r4.1")
@@ -114,7 +126,7 @@ class TestFindWorkflowOwnedIssue:
     def test_returns_none_when_no_issues(self):
         """Test returns None when no issues found."""
         gh = MagicMock()
-        gh.search_issues.return_value = []
+        _set_issues(gh, [])
 
         manager = IssueSyncManager(gh, MagicMock(), MagicMock(), MagicMock())
         result = manager.find_workflow_owned_issue("r4.1")
@@ -124,7 +136,7 @@ class TestFindWorkflowOwnedIssue:
     def test_handles_multiple_issues_finds_correct_one(self):
         """Test finding correct issue among multiple."""
         gh = MagicMock()
-        gh.search_issues.return_value = [
+        _set_issues(gh, [
             {
                 "number": 1,
                 "title": "Release r4.0",
@@ -143,7 +155,7 @@ class TestFindWorkflowOwnedIssue:
                 "body": "No marker",
                 "labels": []
             }
-        ]
+        ])
 
         manager = IssueSyncManager(gh, MagicMock(), MagicMock(), MagicMock())
         result = manager.find_workflow_owned_issue("r4.1")
@@ -151,6 +163,46 @@ class TestFindWorkflowOwnedIssue:
         assert result is not None
         assert result["number"] == 2
 
+    def test_reads_only_issues_titled_with_tag(self):
+        """Bodies are read only for issues whose title carries the tag."""
+        gh = MagicMock()
+        _set_issues(gh, [
+            {"number": n, "title": f"Release r3.{n}", "body": WORKFLOW_MARKER, "labels": []}
+            for n in range(1, 20)
+        ] + [{
+            "number": 20,
+            "title": "Release r4.1 (RC)",
+            "body": f"{WORKFLOW_MARKER}\n<!-- release-automation:release-tag:r4.1 -->",
+            "labels": [],
+        }])
+
+        manager = IssueSyncManager(gh, MagicMock(), MagicMock(), MagicMock())
+        result = manager.find_workflow_owned_issue("r4.1")
+
+        assert result["number"] == 20
+        gh.get_issue.assert_called_once_with(20)
+        gh.search_issue_numbers.assert_not_called()
+
+    def test_finds_issue_with_edited_title_by_search(self):
+        """An issue whose title lost the tag is found by searching bodies."""
+        gh = MagicMock()
+        _set_issues(gh, [
+            {"number": 1, "title": "Release r4.0", "body": WORKFLOW_MARKER, "labels": []},
+            {
+                "number": 2,
+                "title": "Next release",
+                "body": f"{WORKFLOW_MARKER}\n<!-- release-automation:release-tag:r4.1 -->",
+                "labels": [],
+            },
+        ])
+
+        manager = IssueSyncManager(gh, MagicMock(), MagicMock(), MagicMock())
+        result = manager.find_workflow_owned_issue("r4.1")
+
+        assert result["number"] == 2
+        gh.search_issue_numbers.assert_called_once_with("r4.1", labels=["release-issue"], state="open")
+        gh.get_issue.assert_called_once_with(2)
+
 
 class TestSyncReleaseIssue:
     """Tests for sync_release_issue method."""
@@ -182,7 +234,7 @@ class TestSyncReleaseIssue:
         }
 
         state_manager.derive_state.return_value = ReleaseState.PLANNED
-        gh.search_issues.return_value = []
+        _set_issues(gh, [])
         gh.create_issue.return_value = {"number": 1, "title": "Release r4.1 (RC)"}
         issue_manager.generate_title.return_value = "Release r4.1 (RC) — Sync26"
         issue_manager.generate_issue_body_template.return_value = f"## Release\n{WORKFLOW_MARKER}"
@@ -205,15 +257,14 @@ class TestSyncReleaseIssue:
         }
 
         state_manager.derive_state.return_value = ReleaseState.PLANNED
-        gh.search_issues.return_value = [
+        _set_issues(gh, [
             {
                 "number": 1,
                 "title": "Release r4.1 (RC)",
                 "body": f"{WORKFLOW_MARKER}\n<!-- release-automation:release-tag:r4.1 -->",
                 "labels": [{"name": "release-state:planned"}]
             }
-        ]
-        gh.get_issue.return_value = {"number": 1, "title": "Release r4.1 (RC)"}
+        ])
         issue_manager.should_update_title.return_value = False
         issue_manager.generate_state_section.return_value = "**State**: planned"
         issue_manager.update_section.return_value = "updated body"
@@ -235,15 +286,14 @@ class TestSyncReleaseIssue:
         }
 
         state_manager.derive_state.return_value = ReleaseState.SNAPSHOT_ACTIVE
-        gh.search_issues.return_value = [
+        _set_issues(gh, [
             {
                 "number": 1,
                 "title": "Release r4.1 (RC)",
                 "body": f"{WORKFLOW_MARKER}\n<!-- release-automation:release-tag:r4.1 -->\n<!-- BEGIN:STATE -->old<!-- END:STATE -->",
                 "labels": [{"name": "release-state:planned"}]  # Old label
             }
-        ]
-        gh.get_issue.return_value = {"number": 1, "title": "Release r4.1 (RC)"}
+        ])
         issue_manager.should_update_title.return_value = False
         issue_manager.generate_state_section.return_value = "**State**: SNAPSHOT_ACTIVE"
         issue_manager.update_section.return_value = "updated body"
@@ -266,7 +316,7 @@ class TestSyncReleaseIssue:
         }
 
         state_manager.derive_state.return_value = ReleaseState.NOT_PLANNED
-        gh.search_issues.return_value = []
+        _set_issues(gh, [])
 
         result = manager.sync_release_issue(release_plan)
 
@@ -296,15 +346,14 @@ class TestSyncReleaseIssue:
             }
         }
 
-        gh.search_issues.return_value = [
+        _set_issues(gh, [
             {
                 "number": 1,
                 "title": "Release r4.1 (RC)",
                 "body": f"{WORKFLOW_MARKER}\n<!-- release-automation:release-tag:r4.1 -->",
                 "labels": [{"name": "release-state:snapshot-active"}]
             }
-        ]
-        gh.get_issue.return_value = {"number": 1, "title": "Release r4.1 (RC)"}
+        ])
         issue_manager.should_update_title.return_value = False
         issue_manager.generate_state_section.return_value = "**State**: snapshot-active"
         issue_manager.update_section.return_value = "updated body"
@@ -329,15 +378,14 @@ class TestSyncReleaseIssue:
             }
         }
 
-        gh.search_issues.return_value = [
+        _set_issues(gh, [
             {
                 "number": 1,
                 "title": "Release r4.1 (RC)",
                 "body": f"{WORKFLOW_MARKER}\n<!-- release-automation:release-tag:r4.1 -->",
                 "labels": [{"name": "release-state:snapshot-active"}]
             }
-        ]
-        gh.get_issue.return_value = {"number": 1, "title": "Release r4.1 (RC)"}
+        ])
         issue_manager.should_update_title.return_value = False
         issue_manager.generate_state_section.return_value = "**State**: draft-ready"
         issue_manager.update_section.return_value = "updated body"
@@ -709,7 +757,7 @@ class TestSyncReleaseIssueWithLabels:
         state_manager = MagicMock()
         gh.get_label.return_value = None  # All labels missing
         state_manager.derive_state.return_value = ReleaseState.NOT_PLANNED
-        gh.search_issues.return_value = []
+        _set_issues(gh, [])
 
         manager = IssueSyncManager(gh, state_manager, MagicMock(), MagicMock())
 
@@ -551,3 +551,62 @@ class TestLoadConfig:
             assert transformer.rules[0].name == "valid_rule"
         finally:
             os.unlink(config_path)
+
+
+class TestSparseDirectories:
+    """Tests for sparse-checkout directories derived from rules."""
+
+    @staticmethod
+    def _transformer(*patterns, enabled=True):
+        transformer = MechanicalTransformer()
+        transformer.rules = [
+            TransformationRule(
+                name=f"rule{i}",
+                description="",
+                type=TransformationType.REGEX,
+                file_pattern=pattern,
+                replacement="",
+                enabled=enabled,
+            )
+            for i, pattern in enumerate(patterns)
+        ]
+        return transformer
+
+    def test_leading_literal_directories(self):
+        transformer = self._transformer(
+            "code/API_definitions/*.yaml",
+            "documentation/**/*.md",
+            "docs/*/guide.md",
+            "CHANGELOG.md",
+            "*.md",
+            "",
+        )
+
+        assert transformer.sparse_directories() == [
+            "code/API_definitions",
+            "docs",
+            "documentation",
+        ]
+
+    def test_wildcard_first_directory_is_unbounded(self):
+        transformer = self._transformer("code/API_definitions/*.yaml", "**/*.md")
+
+        assert transformer.sparse_directories() is None
+
+    def test_disabled_rules_ignored(self):
+        assert self._transformer("**/*.md", enabled=False).sparse_directories() == []
+        assert self._transformer("**/*.md", enabled=False).file_patterns() == []
+
+    def test_file_patterns(self):
+        assert self._transformer("code/API_definitions/*.yaml", "").file_patterns() == [
+            "code/API_definitions/*.yaml"
+        ]
+
+    def test_shipped_config(self):
+        config_path = os.path.join(
+            os.path.dirname(__file__), "..", "config", "transformations.yaml"
+        )
+
+        directories = MechanicalTransformer(config_path).sparse_directories()
+
+        assert "code/API_definitions" in directories
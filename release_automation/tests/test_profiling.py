@@ -0,0 +1,105 @@
+"""
+Unit tests for per-stage profiling.
+"""
+
+import json
+from functools import partial
+
+from release_automation.scripts.async_github_client import run_parallel
+from release_automation.scripts.profiling import Profile, record_api_call
+
+
+class FakeClock:
+    """Clock advanced by hand."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestProfile:
+    def test_stage_records_time_and_calls(self):
+        clock = FakeClock()
+        profile = Profile(clock=clock)
+
+        with profile.stage("clone"):
+            record_api_call(10, 200)
+            record_api_call(0, 50)
+            clock.now += 1.5
+
+        stage = profile.stages["clone"]
+        assert stage.wall_time == 1.5
+        assert (stage.api_calls, stage.bytes_sent, stage.bytes_received) == (2, 10, 250)
+
+    def test_calls_outside_stages_are_ignored(self):
+        profile = Profile()
+
+        record_api_call(1, 1)
+        with profile.stage("a"):
+            pass
+        record_api_call(1, 1)
+
+        assert profile.stages["a"].api_calls == 0
+
+    def test_nested_stage_counts_innermost(self):
+        profile = Profile()
+
+        with profile.stage("outer"):
+            record_api_call()
+            with profile.stage("inner"):
+                record_api_call()
+            record_api_call()
+
+        assert profile.stages["outer"].api_calls == 2
+        assert profile.stages["inner"].api_calls == 1
+
+    def test_reentered_stage_accumulates(self):
+        clock = FakeClock()
+        profile = Profile(clock=clock)
+
+        for _ in range(2):
+            with profile.stage("commit"):
+                record_api_call()
+                clock.now += 1.0
+
+        assert profile.stages["commit"].wall_time == 2.0
+        assert profile.stages["commit"].api_calls == 2
+
+    def test_parallel_stages_keep_their_counts(self):
+        profile = Profile()
+
+        def stage(name, calls):
+            with profile.stage(name):
+                for _ in range(calls):
+                    record_api_call(1, 2)
+
+        run_parallel([partial(stage, "a", 3), partial(stage, "b", 5)])
+
+        assert profile.stages["a"].api_calls == 3
+        assert profile.stages["b"].api_calls == 5
+
+    def test_worker_threads_count_towards_calling_stage(self):
+        profile = Profile()
+
+        with profile.stage("clone"):
+            run_parallel([partial(record_api_call, 1, 1) for _ in range(4)])
+
+        assert profile.stages["clone"].api_calls == 4
+
+    def test_to_dict_and_markdown(self):
+        profile = Profile()
+        with profile.stage("versions"):
+            record_api_call(0, 100)
+        with profile.stage("clone"):
+            record_api_call(20, 300)
+
+        data = profile.to_dict()
+        markdown = profile.to_markdown("Snapshot profile")
+
+        assert [s["name"] for s in data["stages"]] == ["versions", "clone"]
+        assert data["totals"] == {"api_calls": 2, "bytes_sent": 20, "bytes_received": 400}
+        assert "| clone | 0.00 | 1 | 20 | 300 |" in markdown
+        embedded = markdown.split("```json\n")[1].split("```")[0]
+        assert json.loads(embedded) == data
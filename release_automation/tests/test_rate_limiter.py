@@ -0,0 +1,121 @@
+"""
+Unit tests for the rate-limit-aware request scheduler.
+"""
+
+import pytest
+
+from release_automation.scripts.rate_limiter import RateLimiter
+
+
+class FakeClock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def make_limiter(clock, **kwargs):
+    return RateLimiter(clock=clock, sleep=clock.sleep, jitter=lambda: 0.5, **kwargs)
+
+
+class TestTokenBucket:
+    def test_burst_is_not_delayed(self, clock):
+        limiter = make_limiter(clock, points_per_second=1.0, burst=3.0)
+
+        for _ in range(3):
+            limiter.acquire("GET")
+
+        assert clock.sleeps == []
+
+    def test_requests_beyond_burst_are_spaced(self, clock):
+        limiter = make_limiter(clock, points_per_second=2.0, burst=2.0)
+
+        for _ in range(4):
+            limiter.acquire("GET")
+
+        assert clock.sleeps == [0.5, 0.5]
+
+    def test_writes_cost_more(self, clock):
+        limiter = make_limiter(clock, points_per_second=5.0, burst=5.0)
+
+        limiter.acquire("POST")
+        limiter.acquire("POST")
+
+        assert clock.sleeps == [1.0]
+
+
+class TestPrimaryBudget:
+    def test_exhausted_budget_waits_for_reset(self, clock):
+        limiter = make_limiter(clock)
+        limiter.update({"x-ratelimit-remaining": "0", "x-ratelimit-reset": str(int(clock.now) + 30)})
+
+        limiter.acquire("GET")
+
+        assert clock.sleeps == [30.0]
+
+    def test_low_budget_is_spread_until_reset(self, clock):
+        limiter = make_limiter(clock, reserve=100)
+        limiter.update({"x-ratelimit-remaining": "10", "x-ratelimit-reset": str(int(clock.now) + 100)})
+
+        limiter.acquire("GET")
+
+        assert clock.sleeps == [10.0]
+
+    def test_budgets_are_per_resource(self, clock):
+        limiter = make_limiter(clock)
+        limiter.update({"x-ratelimit-remaining": "0", "x-ratelimit-reset": str(int(clock.now) + 30),
+                        "x-ratelimit-resource": "graphql"})
+
+        limiter.acquire("GET", "core")
+
+        assert clock.sleeps == []
+        assert limiter.budget("graphql").remaining == 0
+        assert limiter.budget("core") is None
+
+    def test_responses_without_headers_are_ignored(self, clock):
+        limiter = make_limiter(clock)
+        limiter.update({})
+        assert limiter.budget() is None
+
+
+class TestRetryDelay:
+    def test_retry_after(self, clock):
+        limiter = make_limiter(clock)
+        assert limiter.retry_delay(429, {"retry-after": "12"}, "", 0) == 12.0
+
+    def test_exhausted_primary_limit_waits_for_reset(self, clock):
+        limiter = make_limiter(clock)
+        headers = {"x-ratelimit-remaining": "0", "x-ratelimit-reset": str(int(clock.now) + 20)}
+        assert limiter.retry_delay(403, headers, "API rate limit exceeded", 0) == 21.0
+
+    def test_secondary_limit_backoff_with_jitter(self, clock):
+        limiter = make_limiter(clock)
+        body = '{"message": "You have exceeded a secondary rate limit"}'
+
+        assert limiter.retry_delay(403, {}, body, 0) == 90.0
+        assert limiter.retry_delay(403, {}, body, 1) == 180.0
+
+    def test_not_rate_limited(self, clock):
+        limiter = make_limiter(clock)
+        assert limiter.retry_delay(403, {}, '{"message": "Forbidden"}', 0) is None
+        assert limiter.retry_delay(500, {}, "", 0) is None
+
+    def test_retries_exhausted(self, clock):
+        limiter = make_limiter(clock)
+        assert limiter.retry_delay(429, {"retry-after": "1"}, "", RateLimiter.MAX_RETRIES) is None
+
+
+def test_for_token_shares_instances():
+    assert RateLimiter.for_token("x") is RateLimiter.for_token("x")
+    assert RateLimiter.for_token("x") is not RateLimiter.for_token("y")
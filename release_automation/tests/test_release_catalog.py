@@ -0,0 +1,193 @@
+"""
+Unit tests for the organisation-wide release catalog.
+"""
+
+import os
+from unittest.mock import Mock
+
+import pytest
+
+from release_automation.scripts.github_client import GitHubClientError, ReleaseRecord
+from release_automation.scripts.release_catalog import (
+    CatalogEntry,
+    ReleaseCatalog,
+    load_repositories,
+)
+
+
+def _record(tag, prerelease=False):
+    return ReleaseRecord(
+        id=1, tag_name=tag, draft=False, prerelease=prerelease, created_at=""
+    )
+
+
+def _metadata(release_type, apis, commonalities=None):
+    metadata = {
+        "repository": {"release_type": release_type, "release_date": "2026-03-01T00:00:00Z"},
+        "apis": [{"api_name": name, "api_version": version} for name, version in apis.items()],
+    }
+    if commonalities:
+        metadata["dependencies"] = {"commonalities_release": commonalities}
+    return metadata
+
+
+REPOS = {
+    "QualityOnDemand": {
+        "r4.2": (True, _metadata("pre-release-rc", {"quality-on-demand": "1.1.0-rc.1"}, "r4.1")),
+        "r3.2": (False, _metadata("public-release", {"quality-on-demand": "1.0.0"}, "r3.4")),
+        "v0.9.0": (False, None),
+    },
+    "DeviceLocation": {
+        "r3.1": (False, _metadata("public-release", {"location-verification": "2.0.0"}, "r3.4")),
+    },
+}
+
+
+@pytest.fixture
+def clients():
+    """Create one mock GitHubClient per repository in REPOS."""
+    clients = {}
+    for repo, releases in REPOS.items():
+        client = Mock()
+        client.iter_releases.side_effect = lambda page_size=30, releases=releases: iter(
+            [_record(tag, prerelease) for tag, (prerelease, _) in releases.items()]
+        )
+        client.get_release_metadata.side_effect = (
+            lambda tag, releases=releases: releases[tag][1]
+        )
+        clients[f"camaraproject/{repo}"] = client
+    return clients
+
+
+class TestLoadRepositories:
+    def test_reads_repository_keys(self, tmp_path):
+        settings = tmp_path / "validation-settings.yaml"
+        settings.write_text(
+            "version: 1\n"
+            "defaults:\n  stage: advisory\n"
+            "repositories:\n"
+            "  ClickToDial:\n    stage: enabled\n"
+            "  QualityOnDemand:\n    stage: enabled\n"
+        )
+
+        assert load_repositories(str(settings)) == ["ClickToDial", "QualityOnDemand"]
+
+    def test_repository_settings_file(self):
+        root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        repositories = load_repositories(os.path.join(root, "config", "validation-settings.yaml"))
+        assert "QualityOnDemand" in repositories
+
+
+class TestCatalogEntry:
+    def test_from_metadata(self):
+        entry = CatalogEntry.from_metadata(
+            "QualityOnDemand", "r4.2", True, REPOS["QualityOnDemand"]["r4.2"][1]
+        )
+
+        assert entry.release_type == "pre-release-rc"
+        assert entry.apis == {"quality-on-demand": "1.1.0-rc.1"}
+        assert entry.dependencies == {"commonalities_release": "r4.1"}
+        assert entry.has_metadata is True
+
+    def test_without_metadata(self):
+        entry = CatalogEntry.from_metadata("QualityOnDemand", "v0.9.0", False, None)
+
+        assert entry.has_metadata is False
+        assert entry.apis == {}
+
+
+class TestRefresh:
+    def test_crawls_all_repositories(self, clients, tmp_path):
+        path = str(tmp_path / "catalog.json")
+        catalog = ReleaseCatalog(path=path)
+
+        results = catalog.refresh(REPOS, clients.__getitem__)
+        catalog.save()
+
+        assert [(r.repository, r.added, r.error) for r in results] == [
+            ("QualityOnDemand", 3, None),
+            ("DeviceLocation", 1, None),
+        ]
+        loaded = ReleaseCatalog.load(path)
+        assert [e.tag for e in loaded.entries("QualityOnDemand")] == ["r4.2", "r3.2", "v0.9.0"]
+        assert loaded.get("DeviceLocation", "r3.1").apis == {"location-verification": "2.0.0"}
+
+    def test_second_crawl_reads_only_new_tags(self, clients):
+        catalog = ReleaseCatalog()
+        catalog.refresh(REPOS, clients.__getitem__)
+        for client in clients.values():
+            client.get_release_metadata.reset_mock()
+
+        results = catalog.refresh(REPOS, clients.__getitem__)
+
+        assert all(r.added == 0 for r in results)
+        # Only the tag recorded without metadata is read again
+        clients["camaraproject/QualityOnDemand"].get_release_metadata.assert_called_once_with("v0.9.0")
+        clients["camaraproject/DeviceLocation"].get_release_metadata.assert_not_called()
+
+    def test_entry_without_metadata_is_filled_in_later(self, clients):
+        catalog = ReleaseCatalog()
+        catalog.repositories["DeviceLocation"] = {
+            "r3.1": CatalogEntry("DeviceLocation", "r3.1", has_metadata=False),
+        }
+
+        results = catalog.refresh(["DeviceLocation"], clients.__getitem__)
+
+        assert results[0].added == 0
+        assert catalog.get("DeviceLocation", "r3.1").apis == {"location-verification": "2.0.0"}
+
+    def test_full_crawl_rereads_tags(self, clients):
+        catalog = ReleaseCatalog()
+        catalog.refresh(["DeviceLocation"], clients.__getitem__)
+
+        results = catalog.refresh(["DeviceLocation"], clients.__getitem__, full=True)
+
+        assert results[0].added == 1
+        assert clients["camaraproject/DeviceLocation"].get_release_metadata.call_count == 2
+
+    def test_deleted_releases_are_dropped(self, clients):
+        catalog = ReleaseCatalog()
+        catalog.repositories["DeviceLocation"] = {
+            "r2.1": CatalogEntry("DeviceLocation", "r2.1"),
+        }
+
+        results = catalog.refresh(["DeviceLocation"], clients.__getitem__)
+
+        assert results[0].removed == 1
+        assert catalog.get("DeviceLocation", "r2.1") is None
+
+    def test_failed_repository_keeps_entries(self, clients):
+        catalog = ReleaseCatalog()
+        catalog.refresh(["DeviceLocation"], clients.__getitem__)
+        clients["camaraproject/DeviceLocation"].iter_releases.side_effect = (
+            GitHubClientError("boom")
+        )
+
+        results = catalog.refresh(["DeviceLocation"], clients.__getitem__)
+
+        assert results[0].error == "boom"
+        assert catalog.get("DeviceLocation", "r3.1") is not None
+
+
+class TestQueries:
+    @pytest.fixture
+    def catalog(self, clients):
+        catalog = ReleaseCatalog()
+        catalog.refresh(REPOS, clients.__getitem__)
+        return catalog
+
+    def test_releases_with_api(self, catalog):
+        entries = catalog.releases_with_api("quality-on-demand")
+        assert [e.tag for e in entries] == ["r4.2", "r3.2"]
+
+    def test_releases_depending_on(self, catalog):
+        entries = catalog.releases_depending_on("r3.4")
+        assert sorted((e.repository, e.tag) for e in entries) == [
+            ("DeviceLocation", "r3.1"),
+            ("QualityOnDemand", "r3.2"),
+        ]
+
+    def test_latest(self, catalog):
+        assert catalog.latest("QualityOnDemand").tag == "r3.2"
+        assert catalog.latest("QualityOnDemand", include_prereleases=True).tag == "r4.2"
+        assert catalog.latest("Unknown") is None
@@ -0,0 +1,134 @@
+"""
+Unit tests for the organisation-wide release state dashboard.
+"""
+
+import json
+from unittest.mock import DEFAULT, Mock
+
+import pytest
+
+from release_automation.scripts.github_client import Branch, GitHubClientError
+from release_automation.scripts.release_dashboard import (
+    RepositoryStatus,
+    collect_statuses,
+    derive_repository_status,
+    render_json,
+    render_markdown,
+)
+
+
+PLAN = "repository:\n  target_release_tag: r4.1\n  target_release_type: pre-release-rc\n"
+
+
+def _set_issues(client, issues):
+    """Serve issues through list_issue_titles (number and title) and get_issue."""
+    client.list_issue_titles.return_value = [
+        {"number": issue["number"], "title": issue.get("title")} for issue in issues
+    ]
+    by_number = {issue["number"]: issue for issue in issues}
+    client.get_issue.side_effect = lambda number: by_number.get(number, DEFAULT)
+
+
+def _client(plan=PLAN, branches=(), issues=()):
+    """Create a mock GitHubClient for one repository."""
+    client = Mock()
+    client.tag_exists.return_value = False
+    client.list_branches.return_value = list(branches)
+    client.draft_release_exists.return_value = False
+    client.get_file_content.side_effect = lambda path, ref="main": (
+        plan if path == "release-plan.yaml" else None
+    )
+    client.get_branch_creation_time.return_value = "2026-01-29T12:00:00Z"
+    client.find_pr_for_branch.return_value = 17
+    _set_issues(client, list(issues))
+    return client
+
+
+@pytest.fixture
+def clients():
+    return {
+        "camaraproject/QualityOnDemand": _client(
+            branches=[Branch(name="release-snapshot/r4.1-abc1234", sha="abc1234")],
+            issues=[{
+                "number": 5,
+                "title": "Release r4.1",
+                "body": "<!-- release-automation:workflow-owned -->",
+            }],
+        ),
+        "camaraproject/DeviceLocation": _client(),
+        "camaraproject/Broken": _client(plan=None),
+    }
+
+
+class TestDeriveRepositoryStatus:
+    def test_snapshot_active(self, clients):
+        status = derive_repository_status(
+            "QualityOnDemand", clients["camaraproject/QualityOnDemand"], use_release_view=False
+        )
+
+        assert status.state == "snapshot-active"
+        assert status.release_tag == "r4.1"
+        assert status.snapshot_id == "r4.1-abc1234"
+        assert status.release_pr_number == 17
+        assert status.release_issue_number == 5
+        # One consistent view: each artifact is fetched once
+        clients["camaraproject/QualityOnDemand"].list_branches.assert_called_once()
+
+    def test_config_error(self, clients):
+        status = derive_repository_status(
+            "Broken", clients["camaraproject/Broken"], use_release_view=False
+        )
+
+        assert status.state is None
+        assert status.config_error_type == "missing_file"
+
+    def test_client_error(self):
+        client = _client()
+        client.tag_exists.side_effect = GitHubClientError("boom")
+
+        status = derive_repository_status("X", client, use_release_view=False)
+
+        assert status.error == "boom"
+
+
+class TestCollectStatuses:
+    def test_all_repositories_in_order(self, clients):
+        statuses = collect_statuses(
+            ["QualityOnDemand", "DeviceLocation", "Broken"],
+            clients.__getitem__,
+            use_release_view=False,
+        )
+
+        assert [(s.repository, s.state) for s in statuses] == [
+            ("QualityOnDemand", "snapshot-active"),
+            ("DeviceLocation", "planned"),
+            ("Broken", None),
+        ]
+
+
+class TestReports:
+    STATUSES = [
+        RepositoryStatus(
+            "QualityOnDemand", release_tag="r4.1", state="snapshot-active",
+            snapshot_id="r4.1-abc1234", release_pr_number=17, release_issue_number=5,
+            release_type="pre-release-rc",
+        ),
+        RepositoryStatus(
+            "Broken", config_error="No release-plan.yaml | found",
+            config_error_type="missing_file",
+        ),
+    ]
+
+    def test_json(self):
+        report = json.loads(render_json(self.STATUSES))
+
+        assert report["organization"] == "camaraproject"
+        assert report["repositories"][0]["state"] == "snapshot-active"
+        assert report["repositories"][1]["config_error_type"] == "missing_file"
+
+    def test_markdown(self):
+        report = render_markdown(self.STATUSES)
+
+        assert "| [QualityOnDemand](https://github.com/camaraproject/QualityOnDemand) | `r4.1` |" in report
+        assert "[#17](https://github.com/camaraproject/QualityOnDemand/pull/17)" in report
+        assert "No release-plan.yaml \\| found" in report
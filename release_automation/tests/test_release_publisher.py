@@ -13,6 +13,7 @@ from release_automation.scripts.release_publisher import (
     PublishResult,
     ReleasePublisher,
 )
+from release_automation.scripts.version_ledger import VersionLedger
 
 
 @pytest.fixture
@@ -233,6 +234,33 @@ repository:
             12345, make_latest='true'
         )
 
+    def test_publish_release_records_version_ledger(self, mock_github_client, tmp_path):
+        """Published API versions are appended to the version ledger."""
+        mock_github_client.get_draft_release.return_value = Release(
+            tag_name="r4.2",
+            name="Release r4.2",
+            draft=True,
+            prerelease=True,
+            html_url="https://github.com/test/releases/tag/r4.2"
+        )
+        mock_github_client.get_release_id.return_value = 12345
+        mock_github_client.get_file_content.return_value = "repository: {}\n"
+        mock_github_client.get_release_metadata.return_value = {
+            "apis": [{"api_name": "quality-on-demand", "api_version": "1.1.0-rc.2"}]
+        }
+        path = str(tmp_path / "ledger.json")
+        ledger = VersionLedger(
+            "test-org/test-repo", path, {"r4.1": {"quality-on-demand": "1.1.0-rc.1"}}
+        )
+        publisher = ReleasePublisher(mock_github_client, ledger=ledger)
+
+        result = publisher.publish_release("r4.2", "release-snapshot/r4.2-abc123")
+
+        assert result.success is True
+        mock_github_client.get_release_metadata.assert_called_once_with("r4.2")
+        saved = VersionLedger.load("test-org/test-repo", path)
+        assert saved.versions("quality-on-demand") == ["1.1.0-rc.2", "1.1.0-rc.1"]
+
     def test_publish_release_no_draft(self, publisher, mock_github_client):
         """Draft doesn't exist - returns error."""
         mock_github_client.get_draft_release.return_value = None
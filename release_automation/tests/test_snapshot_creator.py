@@ -10,6 +10,8 @@ These tests verify the orchestration of snapshot creation including:
 """
 
 import os
+import threading
+from contextlib import nullcontext
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from dataclasses import dataclass
@@ -22,18 +24,29 @@ from release_automation.scripts.snapshot_creator import (
     InvalidStateError,
     TransformationError,
 )
+from release_automation.scripts.profiling import record_api_call
 from release_automation.scripts.state_manager import ReleaseState
 from release_automation.scripts.mechanical_transformer import TransformationResult
-from release_automation.scripts.git_operations import PullRequestInfo, GitOperationsError
+from release_automation.scripts.git_operations import (
+    CloneStats,
+    GitOperationsError,
+    PullRequestInfo,
+)
 
 
 # --- Fixtures ---
 
+def releases_iter(releases):
+    """side_effect for iter_releases: a fresh newest-first iterator per call."""
+    return lambda include_drafts=False, **kwargs: iter(releases)
+
+
 @pytest.fixture
 def mock_github_client():
     """Create a mock GitHubClient."""
     client = Mock()
     client.repo = "hdamker/TestRepo-QoD"
+    client.memoized.side_effect = lambda: nullcontext(client)
     client.token = "test-token"
     client.list_branches.return_value = [
         Mock(name="main", sha="abc1234567890abcdef1234567890abcdef12345678")
@@ -312,6 +325,247 @@ class TestValidatePreconditions:
         assert "not planned" in errors[0]
 
 
+# --- Tests for clone strategy ---
+
+class TestClonePlan:
+    """Tests for the clone strategy of the snapshot checkout."""
+
+    def test_non_sparse_strategies_unchanged(self, snapshot_creator):
+        for strategy in ("full", "shallow", "partial"):
+            assert snapshot_creator._clone_plan(strategy) == (strategy, None)
+
+    def test_sparse_covers_rule_directories(self, snapshot_creator, mock_transformer):
+        mock_transformer.sparse_directories.return_value = ["code/API_definitions", "documentation"]
+
+        strategy, paths = snapshot_creator._clone_plan("sparse")
+
+        assert strategy == "sparse"
+        assert paths == [
+            "CHANGELOG",
+            "code/API_definitions",
+            "code/Test_definitions",
+            "documentation",
+        ]
+
+    def test_sparse_with_unbounded_rule_uses_partial(self, snapshot_creator, mock_transformer):
+        mock_transformer.sparse_directories.return_value = None
+
+        assert snapshot_creator._clone_plan("sparse") == ("partial", None)
+
+    @patch("release_automation.scripts.snapshot_creator.tempfile.mkdtemp")
+    @patch("release_automation.scripts.snapshot_creator.shutil.rmtree")
+    @patch("release_automation.scripts.snapshot_creator.GitOperations")
+    @patch("builtins.open", create=True)
+    def test_clone_stats_and_fallback_warning(
+        self,
+        mock_open,
+        mock_git_ops_class,
+        mock_rmtree,
+        mock_mkdtemp,
+        snapshot_creator,
+        mock_transformer,
+        sample_release_plan,
+    ):
+        mock_mkdtemp.return_value = "/tmp/test-snapshot"
+        mock_transformer.sparse_directories.return_value = ["documentation"]
+        mock_git_ops = MagicMock()
+        mock_git_ops_class.return_value = mock_git_ops
+        stats = CloneStats("sparse", "full", 2.0, 4096, fallback_reason="unknown option")
+        mock_git_ops.clone.return_value = stats
+        mock_git_ops.create_pr.return_value = PullRequestInfo(
+            number=42, url="https://github.com/owner/repo/pull/42"
+        )
+
+        config = SnapshotConfig(release_tag="r4.1", clone_strategy="sparse")
+        result = snapshot_creator.create_snapshot(sample_release_plan, config)
+
+        assert result.success is True
+        assert result.clone_stats is stats
+        kwargs = mock_git_ops.clone.call_args.kwargs
+        assert kwargs["strategy"] == "sparse"
+        assert "documentation" in kwargs["sparse_paths"]
+        assert "sparse clone failed, used a full clone: unknown option" in result.warnings
+
+
+class TestGitDataBackend:
+    """Tests for the clone-free Git Data API backend."""
+
+    @patch("release_automation.scripts.snapshot_creator.GitOperations")
+    @patch("release_automation.scripts.snapshot_creator.GitDataWorkspace")
+    def test_uses_workspace_with_patterns(
+        self, mock_workspace_class, mock_git_ops_class, snapshot_creator, mock_transformer
+    ):
+        mock_transformer.file_patterns.return_value = ["documentation/**/*.md"]
+        workspace = mock_workspace_class.return_value
+        result = SnapshotResult(success=False)
+
+        git_ops = snapshot_creator._open_workspace(
+            SnapshotConfig(release_tag="r4.1", backend="git-data"), "/tmp/ws", result
+        )
+
+        assert git_ops is workspace
+        patterns = mock_workspace_class.call_args[0][2]
+        assert "code/API_definitions/*.yaml" in patterns
+        assert "documentation/**/*.md" in patterns
+        assert result.clone_stats is workspace.clone.return_value
+        mock_git_ops_class.assert_not_called()
+
+    @patch("release_automation.scripts.snapshot_creator.os.makedirs")
+    @patch("release_automation.scripts.snapshot_creator.shutil.rmtree")
+    @patch("release_automation.scripts.snapshot_creator.GitOperations")
+    @patch("release_automation.scripts.snapshot_creator.GitDataWorkspace")
+    def test_falls_back_to_clone(
+        self,
+        mock_workspace_class,
+        mock_git_ops_class,
+        mock_rmtree,
+        mock_makedirs,
+        snapshot_creator,
+        mock_transformer,
+    ):
+        mock_transformer.file_patterns.return_value = []
+        mock_workspace_class.return_value.clone.side_effect = GitOperationsError("Tree too large")
+        mock_git_ops_class.return_value.clone.return_value = CloneStats("full", "full", 1.0, 1024)
+        result = SnapshotResult(success=False)
+
+        git_ops = snapshot_creator._open_workspace(
+            SnapshotConfig(release_tag="r4.1", backend="git-data"), "/tmp/ws", result
+        )
+
+        assert git_ops is mock_git_ops_class.return_value
+        assert result.warnings == ["Git Data API checkout failed, used a clone: Tree too large"]
+        mock_rmtree.assert_called_once_with("/tmp/ws", ignore_errors=True)
+
+
+class TestPreparationStages:
+    """Tests for the concurrent preparation stages of create_snapshot."""
+
+    @pytest.fixture
+    def git_ops(self):
+        with patch("release_automation.scripts.snapshot_creator.GitOperations") as cls, \
+                patch("release_automation.scripts.snapshot_creator.tempfile.mkdtemp",
+                      return_value="/tmp/test-snapshot"), \
+                patch("release_automation.scripts.snapshot_creator.shutil.rmtree"), \
+                patch("builtins.open", create=True):
+            git_ops = cls.return_value
+            git_ops.clone.return_value = CloneStats("full", "full", 1.0, 1024)
+            git_ops.create_pr.return_value = PullRequestInfo(
+                number=42, url="https://github.com/owner/repo/pull/42"
+            )
+            yield git_ops
+
+    def test_clone_overlaps_version_calculation(
+        self, git_ops, snapshot_creator, mock_version_calculator, sample_release_plan
+    ):
+        barrier = threading.Barrier(2, timeout=5)
+        versions = mock_version_calculator.calculate_versions_for_plan.return_value
+
+        def calculate(plan):
+            barrier.wait()
+            return versions
+
+        def clone(**kwargs):
+            barrier.wait()
+            return CloneStats("full", "full", 1.0, 1024)
+
+        mock_version_calculator.calculate_versions_for_plan.side_effect = calculate
+        git_ops.clone.side_effect = clone
+
+        result = snapshot_creator.create_snapshot(sample_release_plan, SnapshotConfig(release_tag="r4.1"))
+
+        assert result.success is True
+
+    def test_version_error_takes_precedence(
+        self, git_ops, snapshot_creator, mock_version_calculator, sample_release_plan
+    ):
+        mock_version_calculator.calculate_versions_for_plan.side_effect = ValueError("bad plan")
+        git_ops.clone.side_effect = GitOperationsError("Clone failed")
+
+        with patch.object(snapshot_creator, "_cleanup_branches", return_value=[]) as cleanup:
+            result = snapshot_creator.create_snapshot(
+                sample_release_plan, SnapshotConfig(release_tag="r4.1")
+            )
+
+        assert result.errors == ["Unexpected error: bad plan"]
+        # As before: the failure happened before branch names were assigned
+        cleanup.assert_called_once_with(None, None)
+        assert result.snapshot_branch is None
+
+    def test_candidate_changes_fetched_once_during_preparation(
+        self, git_ops, snapshot_creator, mock_github_client, sample_release_plan
+    ):
+        mock_github_client.generate_release_notes.return_value = "## What's Changed\n"
+
+        with patch.object(snapshot_creator, "_get_compare_base", return_value="r3.2") as base:
+            snapshot_creator.create_snapshot(sample_release_plan, SnapshotConfig(release_tag="r4.1"))
+
+        base.assert_called_once_with("pre-release-rc", "r4.1")
+        mock_github_client.generate_release_notes.assert_called_once_with("r4.1", "r3.2")
+
+    def test_profile_records_each_step(
+        self, git_ops, snapshot_creator, mock_github_client, sample_release_plan
+    ):
+        def list_branches(name):
+            record_api_call(0, 100)
+            return [Mock(sha="abc1234def")]
+
+        def clone(**kwargs):
+            record_api_call(0, 2048)
+            return CloneStats("full", "full", 1.0, 1024)
+
+        mock_github_client.list_branches.side_effect = list_branches
+        git_ops.clone.side_effect = clone
+
+        result = snapshot_creator.create_snapshot(sample_release_plan, SnapshotConfig(release_tag="r4.1"))
+
+        stages = {s["name"]: s for s in result.to_bot_context()["profile"]["stages"]}
+        assert {"preconditions", "base_sha", "versions", "clone", "transform",
+                "commit", "push_snapshot", "release_pr"} <= set(stages)
+        assert stages["base_sha"]["bytes_received"] == 100
+        assert stages["clone"]["api_calls"] == 1
+        assert stages["clone"]["bytes_received"] == 2048
+        assert stages["versions"]["api_calls"] == 0
+
+    def test_memoizes_only_preparation(
+        self, git_ops, snapshot_creator, mock_github_client, sample_release_plan
+    ):
+        events = []
+        memo = MagicMock()
+        memo.__enter__.side_effect = lambda: events.append("enter")
+        memo.__exit__.side_effect = lambda *args: events.append("exit")
+        mock_github_client.memoized.side_effect = lambda: memo
+        git_ops.push.side_effect = lambda branch: events.append("push")
+
+        result = snapshot_creator.create_snapshot(sample_release_plan, SnapshotConfig(release_tag="r4.1"))
+
+        assert result.success is True
+        assert events == ["enter", "exit", "push", "push"]
+
+    def test_dry_run_skips_clone_and_changes(
+        self, git_ops, snapshot_creator, mock_github_client, sample_release_plan
+    ):
+        result = snapshot_creator.create_snapshot(
+            sample_release_plan, SnapshotConfig(release_tag="r4.1", dry_run=True)
+        )
+
+        assert result.success is True
+        git_ops.clone.assert_not_called()
+        mock_github_client.generate_release_notes.assert_not_called()
+
+    def test_prefetch_for_other_release_type_is_ignored(self, snapshot_creator, tmp_path):
+        config = SnapshotConfig(release_tag="r4.1")
+        metadata = {"repository": {"release_type": "public-release"}}
+
+        with patch.object(snapshot_creator, "_get_compare_base", return_value="r3.2") as base, \
+                patch.object(snapshot_creator, "_get_candidate_changes", return_value=None):
+            snapshot_creator._generate_changelog(
+                str(tmp_path), config, {}, {}, metadata, "QoD",
+                prefetched_changes=("pre-release-rc", "## What's Changed\n"),
+            )
+
+        base.assert_called_once_with("public-release", "r4.1")
+
+
 # --- Tests for create_snapshot ---
 
 class TestCreateSnapshot:
@@ -846,7 +1100,10 @@ class TestTransformationIntegration:
         assert result.errors == [
             "IdentityAndConsentManagement VERSION.yaml could not be resolved for release 'r3.3'"
         ]
-        mock_git_ops_class.assert_not_called()
+        # The clone runs alongside the lookups, but nothing is committed or pushed
+        mock_git_ops = mock_git_ops_class.return_value
+        mock_git_ops.create_branch.assert_not_called()
+        mock_git_ops.push.assert_not_called()
 
     @patch("release_automation.scripts.snapshot_creator.tempfile.mkdtemp")
     @patch("release_automation.scripts.snapshot_creator.shutil.rmtree")
@@ -879,7 +1136,10 @@ class TestTransformationIntegration:
         assert result.errors == [
             "Commonalities VERSION.yaml could not be resolved for release 'r3.4'"
         ]
-        mock_git_ops_class.assert_not_called()
+        # The clone runs alongside the lookups, but nothing is committed or pushed
+        mock_git_ops = mock_git_ops_class.return_value
+        mock_git_ops.create_branch.assert_not_called()
+        mock_git_ops.push.assert_not_called()
 
     @patch("release_automation.scripts.snapshot_creator.tempfile.mkdtemp")
     @patch("release_automation.scripts.snapshot_creator.shutil.rmtree")
@@ -993,11 +1253,11 @@ class TestReleaseDocumentation:
         self, snapshot_creator, mock_github_client
     ):
         """Returns tag of first non-prerelease release."""
-        mock_github_client.get_releases.return_value = [
+        mock_github_client.iter_releases.side_effect = releases_iter([
             Mock(tag_name="r4.1-rc.1", prerelease=True),
             Mock(tag_name="r3.2", prerelease=False),
             Mock(tag_name="r2.2", prerelease=False),
-        ]
+        ])
         result = snapshot_creator._get_latest_public_release()
         assert result == "r3.2"
 
@@ -1005,9 +1265,9 @@ class TestReleaseDocumentation:
         self, snapshot_creator, mock_github_client
     ):
         """Returns None when only prereleases exist."""
-        mock_github_client.get_releases.return_value = [
+        mock_github_client.iter_releases.side_effect = releases_iter([
             Mock(tag_name="r4.1-rc.1", prerelease=True),
-        ]
+        ])
         result = snapshot_creator._get_latest_public_release()
         assert result is None
 
@@ -1015,10 +1275,10 @@ class TestReleaseDocumentation:
         self, snapshot_creator, mock_github_client
     ):
         """Returns the most recent release tag."""
-        mock_github_client.get_releases.return_value = [
+        mock_github_client.iter_releases.side_effect = releases_iter([
             Mock(tag_name="r3.2"),
             Mock(tag_name="r2.2"),
-        ]
+        ])
         result = snapshot_creator._get_previous_release()
         assert result == "r3.2"
 
@@ -1026,7 +1286,7 @@ class TestReleaseDocumentation:
         self, snapshot_creator, mock_github_client
     ):
         """Returns None when no releases exist."""
-        mock_github_client.get_releases.return_value = []
+        mock_github_client.iter_releases.side_effect = releases_iter([])
         result = snapshot_creator._get_previous_release()
         assert result is None
 
@@ -1036,10 +1296,10 @@ class TestReleaseDocumentation:
         self, snapshot_creator, mock_github_client
     ):
         """Alpha compares against previous release (any type)."""
-        mock_github_client.get_releases.return_value = [
+        mock_github_client.iter_releases.side_effect = releases_iter([
             Mock(tag_name="r4.1", prerelease=True),
             Mock(tag_name="r3.2", prerelease=False),
-        ]
+        ])
         result = snapshot_creator._get_compare_base("pre-release-alpha", "r4.2")
         assert result == "r4.1"
 
@@ -1047,11 +1307,11 @@ class TestReleaseDocumentation:
         self, snapshot_creator, mock_github_client
     ):
         """First RC (no prior RC in same cycle) compares against last public."""
-        mock_github_client.get_releases.return_value = [
+        mock_github_client.iter_releases.side_effect = releases_iter([
             Mock(tag_name="r4.1", prerelease=True),
             Mock(tag_name="r4.0", prerelease=True),
             Mock(tag_name="r3.2", prerelease=False),
-        ]
+        ])
         # Same-cycle prereleases are alphas
         mock_github_client.get_release_metadata.side_effect = [
             {"repository": {"release_type": "pre-release-alpha"}},
@@ -1064,11 +1324,11 @@ class TestReleaseDocumentation:
         self, snapshot_creator, mock_github_client
     ):
         """Subsequent RC compares against previous RC in same cycle."""
-        mock_github_client.get_releases.return_value = [
+        mock_github_client.iter_releases.side_effect = releases_iter([
             Mock(tag_name="r4.2", prerelease=True),
             Mock(tag_name="r4.1", prerelease=True),
             Mock(tag_name="r3.2", prerelease=False),
-        ]
+        ])
         # First same-cycle prerelease is an RC
         mock_github_client.get_release_metadata.return_value = {
             "repository": {"release_type": "pre-release-rc"},
@@ -1082,10 +1342,10 @@ class TestReleaseDocumentation:
         self, snapshot_creator, mock_github_client
     ):
         """Public release compares against previous public release."""
-        mock_github_client.get_releases.return_value = [
+        mock_github_client.iter_releases.side_effect = releases_iter([
             Mock(tag_name="r4.1", prerelease=True),
             Mock(tag_name="r3.2", prerelease=False),
-        ]
+        ])
         result = snapshot_creator._get_compare_base("public-release", "r4.2")
         assert result == "r3.2"
 
@@ -1093,10 +1353,10 @@ class TestReleaseDocumentation:
         self, snapshot_creator, mock_github_client
     ):
         """Maintenance release compares against last public release."""
-        mock_github_client.get_releases.return_value = [
+        mock_github_client.iter_releases.side_effect = releases_iter([
             Mock(tag_name="r3.2", prerelease=False),
             Mock(tag_name="r2.1", prerelease=False),
-        ]
+        ])
         result = snapshot_creator._get_compare_base("maintenance-release", "r3.3")
         assert result == "r3.2"
 
@@ -1104,7 +1364,7 @@ class TestReleaseDocumentation:
         self, snapshot_creator, mock_github_client
     ):
         """Alpha returns None when no releases exist."""
-        mock_github_client.get_releases.return_value = []
+        mock_github_client.iter_releases.side_effect = releases_iter([])
         result = snapshot_creator._get_compare_base("pre-release-alpha", "r4.0")
         assert result is None
 
@@ -1112,9 +1372,9 @@ class TestReleaseDocumentation:
         self, snapshot_creator, mock_github_client
     ):
         """RC returns None when no public releases exist and no prior RC."""
-        mock_github_client.get_releases.return_value = [
+        mock_github_client.iter_releases.side_effect = releases_iter([
             Mock(tag_name="r4.1", prerelease=True),
-        ]
+        ])
         mock_github_client.get_release_metadata.return_value = {
             "repository": {"release_type": "pre-release-alpha"},
         }
@@ -1125,10 +1385,10 @@ class TestReleaseDocumentation:
         self, snapshot_creator, mock_github_client
     ):
         """RC skips same-cycle prereleases with no release-metadata.yaml."""
-        mock_github_client.get_releases.return_value = [
+        mock_github_client.iter_releases.side_effect = releases_iter([
             Mock(tag_name="r4.1", prerelease=True),
             Mock(tag_name="r3.2", prerelease=False),
-        ]
+        ])
         # Legacy release — no metadata
         mock_github_client.get_release_metadata.return_value = None
         result = snapshot_creator._get_compare_base("pre-release-rc", "r4.2")
@@ -1138,10 +1398,10 @@ class TestReleaseDocumentation:
         self, snapshot_creator, mock_github_client
     ):
         """RC ignores prereleases from different cycles."""
-        mock_github_client.get_releases.return_value = [
+        mock_github_client.iter_releases.side_effect = releases_iter([
             Mock(tag_name="r3.1", prerelease=True),  # Different cycle
             Mock(tag_name="r2.0", prerelease=False),
-        ]
+        ])
         # r3.1 is different cycle — get_release_metadata should not be called
         result = snapshot_creator._get_compare_base("pre-release-rc", "r4.0")
         assert result == "r2.0"
@@ -1151,15 +1411,47 @@ class TestReleaseDocumentation:
         self, snapshot_creator, mock_github_client
     ):
         """RC stops searching same-cycle when public release found."""
-        mock_github_client.get_releases.return_value = [
+        mock_github_client.iter_releases.side_effect = releases_iter([
             Mock(tag_name="r4.0", prerelease=False),  # Public in same cycle
             Mock(tag_name="r3.2", prerelease=False),
-        ]
+        ])
         result = snapshot_creator._get_compare_base("pre-release-rc", "r4.1")
         # Should return r4.0 (last public, found after breaking from same-cycle search)
         assert result == "r4.0"
         mock_github_client.get_release_metadata.assert_not_called()
 
+    def test_release_lookups_stop_consuming_early(
+        self, snapshot_creator, mock_github_client
+    ):
+        """Lookups stop iterating (and fetching pages) once answered."""
+        consumed = []
+
+        def releases(include_drafts=False, **kwargs):
+            for r in [
+                Mock(tag_name="r4.1", prerelease=True),
+                Mock(tag_name="r3.2", prerelease=False),
+                Mock(tag_name="r3.1", prerelease=False),
+                Mock(tag_name="r2.2", prerelease=False),
+            ]:
+                consumed.append(r.tag_name)
+                yield r
+
+        mock_github_client.iter_releases.side_effect = releases
+        mock_github_client.get_release_metadata.return_value = {
+            "repository": {"release_type": "pre-release-rc"}
+        }
+
+        assert snapshot_creator._get_latest_public_release() == "r3.2"
+        assert consumed == ["r4.1", "r3.2"]
+
+        consumed.clear()
+        assert snapshot_creator._get_previous_release() == "r4.1"
+        assert consumed == ["r4.1"]
+
+        consumed.clear()
+        assert snapshot_creator._get_compare_base("pre-release-rc", "r4.2") == "r4.1"
+        assert consumed == ["r4.1"]
+
     def test_get_candidate_changes_works_without_previous(
         self, snapshot_creator, mock_github_client
     ):
@@ -1208,7 +1500,7 @@ class TestReleaseDocumentation:
         readme.write_text(
             "<!-- CAMARA:RELEASE-INFO:START -->\nold\n<!-- CAMARA:RELEASE-INFO:END -->\n"
         )
-        mock_github_client.get_releases.return_value = []
+        mock_github_client.iter_releases.side_effect = releases_iter([])
 
         mock_instance = Mock()
         mock_instance.update_release_info.return_value = True
@@ -1231,7 +1523,7 @@ class TestReleaseDocumentation:
         self, mock_gen_cls, snapshot_creator, mock_github_client, tmp_path
     ):
         """Generates CHANGELOG and writes to directory."""
-        mock_github_client.get_releases.return_value = []
+        mock_github_client.iter_releases.side_effect = releases_iter([])
         mock_github_client.generate_release_notes.return_value = None
 
         mock_instance = Mock()
@@ -1253,7 +1545,7 @@ class TestReleaseDocumentation:
         self, mock_gen_cls, snapshot_creator, mock_github_client, tmp_path
     ):
         """CHANGELOG generation uses semantic version instead of metadata display string."""
-        mock_github_client.get_releases.return_value = []
+        mock_github_client.iter_releases.side_effect = releases_iter([])
         mock_github_client.generate_release_notes.return_value = None
 
         mock_instance = Mock()
@@ -1293,10 +1585,10 @@ class TestReleaseDocumentation:
         self, mock_gen_cls, snapshot_creator, mock_github_client, tmp_path
     ):
         """RC changelog compares against last public release, not previous alpha."""
-        mock_github_client.get_releases.return_value = [
+        mock_github_client.iter_releases.side_effect = releases_iter([
             Mock(tag_name="r4.1", prerelease=True),
             Mock(tag_name="r3.2", prerelease=False),
-        ]
+        ])
         mock_github_client.get_release_metadata.return_value = {
             "repository": {"release_type": "pre-release-alpha"},
         }
@@ -1321,10 +1613,10 @@ class TestReleaseDocumentation:
         self, mock_gen_cls, snapshot_creator, mock_github_client, tmp_path
     ):
         """Alpha changelog compares against previous release (any type)."""
-        mock_github_client.get_releases.return_value = [
+        mock_github_client.iter_releases.side_effect = releases_iter([
             Mock(tag_name="r4.1", prerelease=True),
             Mock(tag_name="r3.2", prerelease=False),
-        ]
+        ])
         mock_github_client.generate_release_notes.return_value = "## What's Changed\n"
 
         mock_instance = Mock()
@@ -1345,9 +1637,9 @@ class TestReleaseDocumentation:
         self, snapshot_creator, mock_github_client
     ):
         """README update goes through GitHubClient shared metadata loading."""
-        mock_github_client.get_releases.return_value = [
+        mock_github_client.iter_releases.side_effect = releases_iter([
             Mock(tag_name="r3.2", draft=False, prerelease=False, html_url="")
-        ]
+        ])
         mock_github_client.get_release_metadata.return_value = {
             "repository": {
                 "release_type": "public-release",
@@ -1468,6 +1760,7 @@ class TestWipCheckIntegration:
         mock_mkdtemp.return_value = "/tmp/test-snapshot"
         mock_git_ops = MagicMock()
         mock_git_ops_class.return_value = mock_git_ops
+        mock_git_ops.clone.return_value = CloneStats("full", "full", 0.5, 1024)
 
         mock_check_wip.return_value = WipCheckResult(
             compliant=False,
@@ -5,18 +5,31 @@ These tests verify the state derivation logic for all 5 release states
 and edge cases.
 """
 
+import threading
+
 import pytest
 from datetime import datetime
-from unittest.mock import Mock, patch
+from unittest.mock import DEFAULT, Mock, patch
 
-from release_automation.scripts.github_client import Branch
+from release_automation.scripts.github_client import Branch, GitHubClientError, ReleaseView
 from release_automation.scripts.state_manager import (
     ConfigurationError,
     ReleaseInfoResult,
     ReleaseState,
     ReleaseStateManager,
+    RepositoryStateView,
     SnapshotInfo,
 )
+from release_automation.scripts.waiter import Waiter
+
+
+def _set_issues(client, issues):
+    """Serve issues through list_issue_titles (number and title) and get_issue."""
+    client.list_issue_titles.return_value = [
+        {"number": issue["number"], "title": issue.get("title")} for issue in issues
+    ]
+    by_number = {issue["number"]: issue for issue in issues}
+    client.get_issue.side_effect = lambda number: by_number.get(number, DEFAULT)
 
 
 @pytest.fixture
@@ -29,10 +42,21 @@ def mock_github_client():
     client.get_file_content.return_value = None
     client.get_branch_creation_time.return_value = "2026-01-29T12:00:00Z"
     client.find_pr_for_branch.return_value = None
-    client.search_issues.return_value = []  # No release issues by default
+    _set_issues(client, [])  # No release issues by default
     return client
 
 
+def _fake_waiter(sleeps):
+    """Create a Waiter without jitter whose clock advances by the sleeps."""
+    now = [0.0]
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    return Waiter(clock=lambda: now[0], sleep=sleep, random_source=lambda: 0.5)
+
+
 @pytest.fixture
 def state_manager(mock_github_client):
     """Create a ReleaseStateManager with mocked client."""
@@ -83,37 +107,41 @@ class TestDeriveState:
 
         assert state == ReleaseState.SNAPSHOT_ACTIVE
 
-    @patch("release_automation.scripts.state_manager.time.sleep")
-    def test_draft_ready_retries_when_enabled(
-        self, mock_sleep, state_manager, mock_github_client
-    ):
-        """Draft release detection retries before concluding DRAFT_READY."""
+    def test_draft_ready_retries_when_enabled(self, mock_github_client):
+        """Draft release detection polls with backoff before concluding DRAFT_READY."""
+        sleeps = []
+        manager = ReleaseStateManager(
+            mock_github_client, draft_waiter=_fake_waiter(sleeps)
+        )
         mock_github_client.list_branches.return_value = [
             Branch(name="release-snapshot/r4.1-abc1234", sha="abc1234")
         ]
         mock_github_client.draft_release_exists.side_effect = [False, False, True]
 
-        state = state_manager.derive_state("r4.1", retry_draft_release=True)
+        state = manager.derive_state("r4.1", retry_draft_release=True)
 
         assert state == ReleaseState.DRAFT_READY
         assert mock_github_client.draft_release_exists.call_count == 3
-        assert mock_sleep.call_count == 2
-
-    @patch("release_automation.scripts.state_manager.time.sleep")
-    def test_snapshot_active_when_retry_exhausted(
-        self, mock_sleep, state_manager, mock_github_client
-    ):
-        """Retry exhaustion falls back to SNAPSHOT_ACTIVE."""
+        # Polls bypass the release index
+        mock_github_client.draft_release_exists.assert_called_with("r4.1", fresh=True)
+        assert sleeps == [0.25, 0.5]
+
+    def test_snapshot_active_when_retry_exhausted(self, mock_github_client):
+        """Reaching the deadline falls back to SNAPSHOT_ACTIVE."""
+        sleeps = []
+        manager = ReleaseStateManager(
+            mock_github_client, draft_waiter=_fake_waiter(sleeps)
+        )
         mock_github_client.list_branches.return_value = [
             Branch(name="release-snapshot/r4.1-abc1234", sha="abc1234")
         ]
-        mock_github_client.draft_release_exists.side_effect = [False, False, False]
+        mock_github_client.draft_release_exists.return_value = False
 
-        state = state_manager.derive_state("r4.1", retry_draft_release=True)
+        state = manager.derive_state("r4.1", retry_draft_release=True)
 
         assert state == ReleaseState.SNAPSHOT_ACTIVE
-        assert mock_github_client.draft_release_exists.call_count == 3
-        assert mock_sleep.call_count == 2
+        assert sleeps == [0.25, 0.5, 1.0, 2.0, 4.0, 2.25]
+        assert sum(sleeps) == 10.0
 
     def test_planned_when_release_plan_defines_release(
         self, state_manager, mock_github_client
@@ -494,7 +522,7 @@ repository:
 """
         mock_github_client.list_branches.return_value = []
         mock_github_client.tag_exists.return_value = False
-        mock_github_client.search_issues.return_value = []
+        _set_issues(mock_github_client, [])
 
         result = state_manager.get_current_release_info()
         result_dict = result.to_dict()
@@ -511,24 +539,24 @@ class TestFindReleaseIssue:
 
     def test_returns_none_when_no_issues(self, state_manager, mock_github_client):
         """Returns None when no release issues exist."""
-        mock_github_client.search_issues.return_value = []
+        _set_issues(mock_github_client, [])
 
         result = state_manager.find_release_issue("r4.1")
 
         assert result is None
-        mock_github_client.search_issues.assert_called_once_with(
+        mock_github_client.list_issue_titles.assert_called_once_with(
             labels=["release-issue"], state="open"
         )
 
     def test_returns_issue_number_when_found(self, state_manager, mock_github_client):
         """Returns issue number when workflow-owned issue exists."""
-        mock_github_client.search_issues.return_value = [
+        _set_issues(mock_github_client, [
             {
                 "number": 42,
                 "title": "Release r4.1 - Tracking Issue",
                 "body": "<!-- release-automation:workflow-owned -->\nRelease content",
             }
-        ]
+        ])
 
         result = state_manager.find_release_issue("r4.1")
 
@@ -538,13 +566,13 @@ class TestFindReleaseIssue:
         self, state_manager, mock_github_client
     ):
         """Ignores issues that don't have the workflow marker."""
-        mock_github_client.search_issues.return_value = [
+        _set_issues(mock_github_client, [
             {
                 "number": 99,
                 "title": "Release r4.1 - Manual Issue",
                 "body": "This is a manually created issue without marker",
             }
-        ]
+        ])
 
         result = state_manager.find_release_issue("r4.1")
 
@@ -554,27 +582,37 @@ class TestFindReleaseIssue:
         self, state_manager, mock_github_client
     ):
         """Ignores issues for different release tags."""
-        mock_github_client.search_issues.return_value = [
+        _set_issues(mock_github_client, [
             {
                 "number": 50,
                 "title": "Release r3.0 - Tracking Issue",
                 "body": "<!-- release-automation:workflow-owned -->\nRelease content",
             }
-        ]
+        ])
 
         result = state_manager.find_release_issue("r4.1")
 
         assert result is None
+        # Bodies are read only for issues whose title matches
+        mock_github_client.get_issue.assert_not_called()
+
+    def test_listing_error_propagates(self, state_manager, mock_github_client):
+        """A failed issue listing is not reported as "no Release Issue"."""
+        mock_github_client.list_issue_titles.side_effect = GitHubClientError("HTTP 403: rate limit")
+
+        with pytest.raises(GitHubClientError):
+            state_manager.find_release_issue("r4.1")
+        mock_github_client.list_issue_titles.assert_called_once()
 
     def test_handles_none_body(self, state_manager, mock_github_client):
         """Handles issues with None body gracefully."""
-        mock_github_client.search_issues.return_value = [
+        _set_issues(mock_github_client, [
             {
                 "number": 10,
                 "title": "Release r4.1",
                 "body": None,
             }
-        ]
+        ])
 
         result = state_manager.find_release_issue("r4.1")
 
@@ -582,13 +620,13 @@ class TestFindReleaseIssue:
 
     def test_handles_none_title(self, state_manager, mock_github_client):
         """Handles issues with None title gracefully."""
-        mock_github_client.search_issues.return_value = [
+        _set_issues(mock_github_client, [
             {
                 "number": 10,
                 "title": None,
                 "body": "<!-- release-automation:workflow-owned -->\nContent",
             }
-        ]
+        ])
 
         result = state_manager.find_release_issue("r4.1")
 
@@ -607,13 +645,13 @@ repository:
 """
         mock_github_client.list_branches.return_value = []
         mock_github_client.tag_exists.return_value = False
-        mock_github_client.search_issues.return_value = [
+        _set_issues(mock_github_client, [
             {
                 "number": 123,
                 "title": "Release r4.1 - Tracking Issue",
                 "body": "<!-- release-automation:workflow-owned -->\nRelease content",
             }
-        ]
+        ])
 
         result = state_manager.get_current_release_info()
 
@@ -631,9 +669,254 @@ repository:
 """
         mock_github_client.list_branches.return_value = []
         mock_github_client.tag_exists.return_value = False
-        mock_github_client.search_issues.return_value = []
+        _set_issues(mock_github_client, [])
 
         result = state_manager.get_current_release_info()
 
         assert result.success
         assert result.release_issue_number is None
+
+
+def _release_view(client, **overrides):
+    """Build a ReleaseView backed by the given (mock) client."""
+    values = dict(
+        tags={},
+        branches=[],
+        branch_dates={},
+        branch_files={},
+        draft_tags=[],
+        open_prs={},
+        plan_ref="main",
+        plan_path="release-plan.yaml",
+        plan_content="repository:\n  target_release_tag: r4.1\n  target_release_type: initial\n",
+        client=client,
+    )
+    values.update(overrides)
+    return ReleaseView(**values)
+
+
+class TestReleaseViewDerivation:
+    """Tests for state derivation from a batched ReleaseView."""
+
+    @pytest.fixture
+    def view_manager(self, mock_github_client):
+        return ReleaseStateManager(mock_github_client, use_release_view=True)
+
+    def test_derive_state_uses_single_view(self, view_manager, mock_github_client):
+        """All lookups are answered by the view; no per-artifact REST calls."""
+        mock_github_client.get_release_view.return_value = _release_view(
+            mock_github_client,
+            branches=[Branch(name="release-snapshot/r4.1-abc1234", sha="abc1234")],
+            draft_tags=["r4.1"],
+        )
+
+        state = view_manager.derive_state("r4.1")
+
+        assert state == ReleaseState.DRAFT_READY
+        mock_github_client.get_release_view.assert_called_once()
+        assert mock_github_client.get_release_view.call_args[0][0] == "r4.1"
+        mock_github_client.tag_exists.assert_not_called()
+        mock_github_client.list_branches.assert_not_called()
+        mock_github_client.draft_release_exists.assert_not_called()
+
+    def test_derive_state_planned_from_view_plan(self, view_manager, mock_github_client):
+        mock_github_client.get_release_view.return_value = _release_view(mock_github_client)
+
+        assert view_manager.derive_state("r4.1") == ReleaseState.PLANNED
+        mock_github_client.get_file_content.assert_not_called()
+
+    def test_get_current_release_info_from_view(self, view_manager, mock_github_client):
+        mock_github_client.get_release_view.return_value = _release_view(
+            mock_github_client,
+            branches=[Branch(name="release-snapshot/r4.1-abc1234", sha="abc1234")],
+            branch_files={
+                ("release-snapshot/r4.1-abc1234", "release-metadata.yaml"):
+                    "repository:\n  release_tag: r4.1\n",
+            },
+        )
+
+        result = view_manager.get_current_release_info()
+
+        assert result.success
+        assert result.state == ReleaseState.SNAPSHOT_ACTIVE
+        assert result.snapshot_branch == "release-snapshot/r4.1-abc1234"
+        assert mock_github_client.get_release_view.call_args[0][0] is None
+        mock_github_client.get_file_content.assert_not_called()
+
+    def test_view_missing_plan_is_config_error(self, view_manager, mock_github_client):
+        mock_github_client.get_release_view.return_value = _release_view(
+            mock_github_client, plan_content=None
+        )
+
+        result = view_manager.get_current_release_info()
+
+        assert not result.success
+        assert result.config_error.error_type == "missing_file"
+
+    def test_falls_back_to_rest_when_view_fails(self, view_manager, mock_github_client):
+        mock_github_client.get_release_view.side_effect = GitHubClientError("boom")
+        mock_github_client.tag_exists.return_value = True
+
+        assert view_manager.derive_state("r4.1") == ReleaseState.PUBLISHED
+        mock_github_client.tag_exists.assert_called_once_with("r4.1")
+
+
+class TestRepositoryStateView:
+    """Tests for run-scoped artifact views."""
+
+    def test_view_memoizes_lookups(self, mock_github_client):
+        view = RepositoryStateView(mock_github_client)
+
+        assert view.tag_exists("r4.1") is False
+        assert view.tag_exists("r4.1") is False
+        view.list_issue_titles(labels=["release-issue"], state="open")
+        view.list_issue_titles(labels=["release-issue"], state="open")
+
+        mock_github_client.tag_exists.assert_called_once_with("r4.1")
+        mock_github_client.list_issue_titles.assert_called_once()
+        assert (view.lookups, view.fetches) == (4, 2)
+
+    def test_consistent_view_shares_lookups_across_methods(
+        self, state_manager, mock_github_client
+    ):
+        """One run sees the same artifacts and fetches each once."""
+        mock_github_client.get_file_content.return_value = (
+            "repository:\n  target_release_tag: r4.1\n  target_release_type: initial\n"
+        )
+        mock_github_client.list_branches.return_value = [
+            Branch(name="release-snapshot/r4.1-abc1234", sha="abc1234")
+        ]
+
+        with state_manager.consistent_view() as view:
+            info = state_manager.get_current_release_info()
+            snapshot = state_manager.get_current_snapshot("r4.1")
+            state = state_manager.derive_state("r4.1")
+            issue = state_manager.find_release_issue("r4.1")
+
+        assert info.state == ReleaseState.SNAPSHOT_ACTIVE
+        assert snapshot.snapshot_branch == "release-snapshot/r4.1-abc1234"
+        assert state == ReleaseState.SNAPSHOT_ACTIVE
+        assert issue is None
+        mock_github_client.tag_exists.assert_called_once_with("r4.1")
+        mock_github_client.list_branches.assert_called_once()
+        mock_github_client.draft_release_exists.assert_called_once()
+        mock_github_client.list_issue_titles.assert_called_once()
+        assert view.fetches < view.lookups
+
+    def test_views_are_per_call_outside_block(self, state_manager, mock_github_client):
+        state_manager.derive_state("r4.1")
+        state_manager.derive_state("r4.1")
+
+        assert mock_github_client.tag_exists.call_count == 2
+
+    def test_consistent_view_uses_one_release_view(self, mock_github_client):
+        manager = ReleaseStateManager(mock_github_client, use_release_view=True)
+        mock_github_client.get_release_view.return_value = _release_view(
+            mock_github_client,
+            branches=[Branch(name="release-snapshot/r4.1-abc1234", sha="abc1234")],
+            branch_dates={"release-snapshot/r4.1-abc1234": "2026-01-29T12:00:00Z"},
+        )
+
+        with manager.consistent_view():
+            manager.get_current_release_info()
+            manager.get_current_snapshot("r4.1")
+
+        mock_github_client.get_release_view.assert_called_once()
+        mock_github_client.list_branches.assert_not_called()
+        mock_github_client.get_branch_creation_time.assert_not_called()
+
+    def test_offline_stub_source(self, mock_github_client):
+        """Any object with the read methods can back a view."""
+        class StubArtifacts:
+            def tag_exists(self, tag):
+                return tag == "r4.1"
+
+        manager = ReleaseStateManager(mock_github_client)
+        manager.capture_view = lambda release_tag=None: RepositoryStateView(
+            StubArtifacts(), mock_github_client
+        )
+
+        assert manager.derive_state("r4.1") == ReleaseState.PUBLISHED
+        mock_github_client.tag_exists.assert_not_called()
+
+
+class TestConcurrentLookups:
+    """Independent lookups are issued concurrently."""
+
+    def test_snapshot_lookups_run_concurrently(self, state_manager, mock_github_client):
+        """Metadata, HEAD date and PR lookups overlap (each waits for the others)."""
+        barrier = threading.Barrier(3, timeout=5)
+
+        def wait_then(value):
+            def call(*args, **kwargs):
+                barrier.wait()
+                return value
+            return call
+
+        mock_github_client.list_branches.return_value = [
+            Branch(name="release-snapshot/r4.1-abc1234", sha="abc1234")
+        ]
+        mock_github_client.get_file_content.side_effect = wait_then(
+            "repository:\n  release_type: pre-release-rc\n"
+        )
+        mock_github_client.get_branch_creation_time.side_effect = wait_then(
+            "2026-01-29T12:00:00Z"
+        )
+        mock_github_client.find_pr_for_branch.side_effect = wait_then(42)
+
+        snapshot = state_manager.get_current_snapshot("r4.1")
+
+        assert snapshot.release_type == "pre-release-rc"
+        assert snapshot.release_pr_number == 42
+        assert snapshot.created_at.year == 2026
+
+    def test_sequential_when_concurrency_is_one(self, mock_github_client):
+        manager = ReleaseStateManager(mock_github_client, max_concurrency=1)
+        mock_github_client.list_branches.return_value = [
+            Branch(name="release-snapshot/r4.1-abc1234", sha="abc1234")
+        ]
+        mock_github_client.find_pr_for_branch.return_value = 7
+
+        assert manager.get_current_snapshot("r4.1").release_pr_number == 7
+
+    def test_issue_search_overlaps_release_info(self, state_manager, mock_github_client):
+        """The release issue search runs alongside the state derivation."""
+        barrier = threading.Barrier(2, timeout=5)
+        mock_github_client.get_file_content.return_value = (
+            "repository:\n  target_release_tag: r4.1\n  target_release_type: initial\n"
+        )
+
+        def tag_exists(tag):
+            barrier.wait()
+            return False
+
+        def list_issue_titles(labels=None, state="open"):
+            barrier.wait()
+            return [{"number": 9, "title": "Release r4.1"}]
+
+        mock_github_client.tag_exists.side_effect = tag_exists
+        mock_github_client.list_issue_titles.side_effect = list_issue_titles
+        mock_github_client.get_issue.side_effect = None
+        mock_github_client.get_issue.return_value = {
+            "number": 9,
+            "title": "Release r4.1",
+            "body": "<!-- release-automation:workflow-owned -->",
+        }
+
+        result = state_manager.get_current_release_info()
+
+        assert result.state == ReleaseState.PLANNED
+        assert result.release_issue_number == 9
+        mock_github_client.list_issue_titles.assert_called_once()
+
+    def test_issue_listing_error_fails_release_info(self, state_manager, mock_github_client):
+        """A failed issue listing is raised once, not retried or hidden."""
+        mock_github_client.get_file_content.return_value = (
+            "repository:\n  target_release_tag: r4.1\n  target_release_type: initial\n"
+        )
+        mock_github_client.tag_exists.return_value = False
+        mock_github_client.list_issue_titles.side_effect = GitHubClientError("HTTP 401: Bad credentials")
+
+        with pytest.raises(GitHubClientError):
+            state_manager.get_current_release_info()
+        mock_github_client.list_issue_titles.assert_called_once()
@@ -0,0 +1,281 @@
+"""
+Unit tests for incremental release state updates.
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+
+import pytest
+
+from release_automation.scripts.github_client import Branch
+from release_automation.scripts.state_manager import (
+    ConfigurationError,
+    ReleaseInfoResult,
+    ReleaseState,
+    ReleaseStateManager,
+    SnapshotInfo,
+)
+from release_automation.scripts.state_reducer import (
+    DerivedState,
+    compare_states,
+    default_state_path,
+    is_settled,
+    reduce_event,
+    resolve_state,
+)
+
+
+PLAN = "repository:\n  target_release_tag: r4.1\n  target_release_type: pre-release-rc\n"
+
+
+def _snapshot(pr_number=None):
+    return SnapshotInfo(
+        snapshot_id="r4.1-abc1234",
+        snapshot_branch="release-snapshot/r4.1-abc1234",
+        release_review_branch="release-review/r4.1-abc1234",
+        src_commit_sha="abc1234def",
+        created_at=datetime(2026, 1, 29, 12, 0, tzinfo=timezone.utc),
+        release_pr_number=pr_number,
+        release_type="pre-release-rc",
+        apis=[{"api_name": "quality-on-demand", "api_version": "1.1.0-rc.1"}],
+    )
+
+
+def _state(state=ReleaseState.SNAPSHOT_ACTIVE, snapshot=True, age=timedelta(0), settled=True):
+    return DerivedState(
+        release_info=ReleaseInfoResult(
+            success=True,
+            release_tag="r4.1",
+            state=state,
+            snapshot_branch="release-snapshot/r4.1-abc1234" if snapshot else None,
+            source="release-metadata.yaml" if snapshot else "release-plan.yaml",
+            release_issue_number=5,
+        ),
+        snapshot=_snapshot(pr_number=17) if snapshot else None,
+        plan={"repository": {"target_release_tag": "r4.1"}},
+        derived_at=(datetime.now(timezone.utc) - age).isoformat(),
+        settled=settled,
+    )
+
+
+def _comment(body):
+    return {"action": "created", "comment": {"body": body}, "issue": {"number": 5}}
+
+
+class TestDerivedState:
+    def test_round_trip(self, tmp_path):
+        path = str(tmp_path / "state" / "repo.json")
+        state = _state()
+
+        state.save(path)
+        loaded = DerivedState.load(path)
+
+        assert loaded.to_dict() == state.to_dict()
+        assert loaded.release_info.state == ReleaseState.SNAPSHOT_ACTIVE
+        assert loaded.snapshot.created_at == state.snapshot.created_at
+
+    def test_round_trip_config_error(self):
+        state = DerivedState(ReleaseInfoResult(
+            success=False,
+            config_error=ConfigurationError("missing_file", "No plan", "release-plan.yaml"),
+        ))
+
+        loaded = DerivedState.from_dict(state.to_dict())
+
+        assert loaded.release_info.config_error.error_type == "missing_file"
+
+    def test_load_missing_or_corrupt(self, tmp_path):
+        path = tmp_path / "repo.json"
+        assert DerivedState.load(str(path)) is None
+        path.write_text("{not json")
+        assert DerivedState.load(str(path)) is None
+        assert DerivedState.load(None) is None
+
+    def test_default_path(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("GITHUB_CLIENT_CACHE_DIR", raising=False)
+        assert default_state_path("owner/repo") is None
+        assert default_state_path("owner/repo", str(tmp_path)).endswith("release-state/owner__repo.json")
+
+
+class TestReduceEvent:
+    def test_no_previous_state(self):
+        assert reduce_event(None, "issue_comment", _comment("/sync-issue")) is None
+
+    def test_unsettled_or_stale_state(self):
+        assert reduce_event(_state(settled=False), "issue_comment", _comment("hi")) is None
+        assert reduce_event(_state(age=timedelta(days=2)), "issue_comment", _comment("hi")) is None
+
+    @pytest.mark.parametrize("body", ["/create-snapshot", "/sync-issue", "Looks good"])
+    def test_comment_keeps_state(self, body):
+        previous = _state()
+
+        state = reduce_event(previous, "issue_comment", _comment(body))
+
+        assert state.to_dict() == previous.to_dict()
+        assert state is not previous
+
+    def test_issue_close_is_ambiguous(self):
+        assert reduce_event(_state(), "issues", {"action": "closed"}) is None
+
+    def test_release_pr_closed(self):
+        payload = {
+            "action": "closed",
+            "pull_request": {
+                "number": 17,
+                "merged": False,
+                "head": {"ref": "release-review/r4.1-abc1234"},
+                "base": {"ref": "release-snapshot/r4.1-abc1234"},
+            },
+        }
+
+        state = reduce_event(_state(), "pull_request", payload)
+
+        assert state.snapshot.release_pr_number is None
+
+    def test_release_pr_merged_is_ambiguous(self):
+        payload = {
+            "action": "closed",
+            "pull_request": {
+                "number": 17,
+                "merged": True,
+                "head": {"ref": "release-review/r4.1-abc1234"},
+                "base": {"ref": "release-snapshot/r4.1-abc1234"},
+            },
+        }
+        assert reduce_event(_state(), "pull_request", payload) is None
+
+    def test_push_to_main(self):
+        unrelated = {"ref": "refs/heads/main", "commits": [{"modified": ["README.md"]}]}
+        plan_change = {"ref": "refs/heads/main", "commits": [{"modified": ["release-plan.yaml"]}]}
+
+        assert reduce_event(_state(), "push", unrelated) is not None
+        assert reduce_event(_state(), "push", plan_change) is None
+        assert reduce_event(_state(), "push", {"ref": "refs/heads/main"}) is None
+
+    def test_snapshot_branch_events_are_ambiguous(self):
+        payload = {"ref": "release-snapshot/r4.1-def5678", "ref_type": "branch"}
+
+        assert reduce_event(_state(ReleaseState.PLANNED, snapshot=False), "create", payload) is None
+        assert reduce_event(_state(), "create", {"ref": "feature", "ref_type": "branch"}) is not None
+
+    def test_release_event_for_tag_is_ambiguous(self):
+        draft = {"tag_name": "r4.1", "draft": True}
+        assert reduce_event(_state(), "release", {"action": "created", "release": draft}) is None
+
+    def test_release_published_is_ambiguous(self):
+        payload = {"action": "published", "release": {"tag_name": "r4.1", "draft": False}}
+        assert reduce_event(_state(ReleaseState.DRAFT_READY), "release", payload) is None
+
+    def test_other_release_keeps_state(self):
+        payload = {"action": "published", "release": {"tag_name": "r3.2", "draft": False}}
+        assert reduce_event(_state(), "release", payload) is not None
+
+    def test_workflow_dispatch_derives_in_full(self):
+        assert reduce_event(_state(), "workflow_dispatch", {}) is None
+
+
+class TestIsSettled:
+    def test_mutating_command(self):
+        assert is_settled("issue_comment", _comment("/create-snapshot"), _state()) is False
+
+    def test_sync_issue_with_issue(self):
+        state = _state()
+        assert is_settled("issue_comment", _comment("/sync-issue"), state) is True
+        state.release_info.release_issue_number = None
+        assert is_settled("issue_comment", _comment("/sync-issue"), state) is False
+
+    def test_pr_merge_and_push(self):
+        merged = {"action": "closed", "pull_request": {"merged": True, "base": {"ref": "release-snapshot/r4.1-abc"}}}
+        assert is_settled("pull_request", merged, _state()) is False
+        assert is_settled("push", {}, _state()) is False
+
+
+class TestCompareStates:
+    def test_reports_differences(self):
+        reduced = _state()
+        derived = _state(ReleaseState.DRAFT_READY)
+
+        assert compare_states(reduced, derived) == [
+            "release_info.state: reduced 'snapshot-active', derived 'draft-ready'"
+        ]
+
+    def test_ignores_bookkeeping(self):
+        assert compare_states(_state(), _state(age=timedelta(hours=1), settled=False)) == []
+
+
+class TestResolveState:
+    @pytest.fixture
+    def manager(self):
+        client = Mock()
+        client.tag_exists.return_value = False
+        client.list_branches.return_value = [
+            Branch(name="release-snapshot/r4.1-abc1234", sha="abc1234def")
+        ]
+        client.draft_release_exists.return_value = False
+        client.get_file_content.side_effect = lambda path, ref="main": (
+            PLAN if path == "release-plan.yaml" else None
+        )
+        client.get_branch_creation_time.return_value = "2026-01-29T12:00:00Z"
+        client.find_pr_for_branch.return_value = 17
+        client.list_issue_titles.return_value = []
+        return ReleaseStateManager(client, use_release_view=False)
+
+    def test_full_derivation_is_stored(self, manager, tmp_path):
+        path = str(tmp_path / "state.json")
+
+        resolution = resolve_state(manager, "issue_comment", _comment("/sync-issue"), path=path)
+
+        assert resolution.incremental is False
+        assert resolution.state.release_info.state == ReleaseState.SNAPSHOT_ACTIVE
+        assert resolution.state.snapshot.release_pr_number == 17
+        stored = DerivedState.load(path)
+        # No Release Issue yet: sync-issue will create one
+        assert stored.settled is False
+
+    def test_reduced_state_skips_api(self, manager, tmp_path):
+        path = str(tmp_path / "state.json")
+        _state().save(path)
+
+        resolution = resolve_state(manager, "issue_comment", _comment("/sync-issue"), path=path)
+
+        assert resolution.incremental is True
+        manager.gh.list_branches.assert_not_called()
+        manager.gh.list_issue_titles.assert_not_called()
+
+    @pytest.mark.parametrize("stored, draft, expected", [
+        (ReleaseState.SNAPSHOT_ACTIVE, True, ReleaseState.DRAFT_READY),
+        (ReleaseState.DRAFT_READY, False, ReleaseState.SNAPSHOT_ACTIVE),
+    ])
+    def test_draft_presence_checked_without_draft_event(self, manager, tmp_path, stored, draft, expected):
+        # Draft releases trigger no workflow: only a comment arrives
+        path = str(tmp_path / "state.json")
+        _state(stored).save(path)
+        manager.gh.draft_release_exists.return_value = draft
+
+        resolution = resolve_state(manager, "issue_comment", _comment("hello"), path=path)
+
+        assert resolution.incremental is True
+        assert resolution.state.release_info.state == expected
+        manager.gh.draft_release_exists.assert_called_once_with("r4.1")
+        manager.gh.list_branches.assert_not_called()
+
+    def test_verify_mode_uses_derivation(self, manager, tmp_path):
+        path = str(tmp_path / "state.json")
+        _state(ReleaseState.DRAFT_READY).save(path)
+
+        resolution = resolve_state(
+            manager, "issue_comment", _comment("hello"), path=path, verify=True
+        )
+
+        assert resolution.incremental is False
+        assert resolution.state.release_info.state == ReleaseState.SNAPSHOT_ACTIVE
+        # The Release Issue was closed outside the workflow
+        assert "release_info.release_issue_number: reduced 5, derived None" in resolution.differences
+        # The draft release is re-checked, so the reduced state does not drift
+        assert not any(d.startswith("release_info.state") for d in resolution.differences)
+
+    def test_without_path(self, manager):
+        resolution = resolve_state(manager, "issue_comment", _comment("hello"))
+
+        assert resolution.incremental is False
+        manager.gh.list_branches.assert_called()
@@ -13,7 +13,12 @@ import pytest
 from unittest.mock import Mock
 
 from release_automation.scripts.github_client import Release
-from release_automation.scripts.version_calculator import VersionCalculator
+from release_automation.scripts.version_calculator import (
+    ExtensionIndex,
+    ParsedVersion,
+    VersionCalculator,
+)
+from release_automation.scripts.version_ledger import VersionLedger
 
 
 @pytest.fixture
@@ -491,6 +496,72 @@ class TestCalculateVersionsForPlan:
             "location-retrieval": "1.0.0"
         }
 
+    def test_scans_release_history_once(self, calculator, mock_github_client):
+        """All APIs are answered from one pass over the release history."""
+        mock_github_client.get_releases.return_value = [
+            Mock(tag_name="r4.2"),
+            Mock(tag_name="r4.1"),
+        ]
+
+        def get_release_metadata(ref):
+            return {
+                "r4.2": {"apis": [
+                    {"api_name": "api-a", "api_version": "3.2.0-rc.2"},
+                    {"api_name": "api-b", "api_version": "0.4.0-alpha.1"},
+                ]},
+                "r4.1": {"apis": [
+                    {"api_name": "api-a", "api_version": "3.1.0-rc.1"},
+                    {"api_name": "api-c", "api_version": "1.0.0"},
+                ]},
+            }[ref]
+
+        mock_github_client.get_release_metadata.side_effect = get_release_metadata
+
+        result = calculator.calculate_versions_for_plan({"apis": [
+            {"api_name": "api-a", "target_api_version": "3.3.0", "target_api_status": "rc"},
+            {"api_name": "api-b", "target_api_version": "0.4.1", "target_api_status": "alpha"},
+            {"api_name": "api-c", "target_api_version": "1.1.0", "target_api_status": "rc"},
+            {"api_name": "api-d", "target_api_version": "1.0.0", "target_api_status": "public"},
+        ]})
+
+        assert result == {
+            "api-a": "3.3.0-rc.3",
+            "api-b": "0.4.1-alpha.2",
+            "api-c": "1.1.0-rc.1",
+            "api-d": "1.0.0",
+        }
+        mock_github_client.get_releases.assert_called_once()
+        assert mock_github_client.get_release_metadata.call_count == 2
+
+    def test_ledger_replaces_history_scan(self, mock_github_client):
+        """With a version ledger only releases it has not seen are read."""
+        mock_github_client.iter_releases.return_value = iter([
+            Mock(tag_name="r4.2"),
+            Mock(tag_name="r4.1"),
+        ])
+        mock_github_client.get_release_metadata.return_value = {"apis": [
+            {"api_name": "api-a", "api_version": "3.2.0-rc.2"},
+        ]}
+        ledger = VersionLedger("test-org/test-repo", tags={
+            "r4.1": {"api-a": "3.2.0-rc.1"},
+        })
+        calculator = VersionCalculator(mock_github_client, ledger=ledger)
+
+        result = calculator.calculate_version("api-a", "3.2.0", "rc")
+
+        assert result == "3.2.0-rc.3"
+        mock_github_client.get_release_metadata.assert_called_once_with("r4.2")
+        assert list(ledger.tags) == ["r4.2", "r4.1"]
+        mock_github_client.get_releases.assert_not_called()
+
+    def test_public_only_plan_skips_history(self, calculator, mock_github_client):
+        """Plans without pre-releases do not scan releases at all."""
+        calculator.calculate_versions_for_plan({"apis": [
+            {"api_name": "api-a", "target_api_version": "1.0.0", "target_api_status": "public"},
+        ]})
+
+        mock_github_client.get_releases.assert_not_called()
+
     def test_defaults_to_public_status(self, calculator, mock_github_client):
         """APIs without status default to public."""
         mock_github_client.get_releases.return_value = []
@@ -601,3 +672,67 @@ class TestParseExtension:
             target_status="rc"
         )
         assert result is None
+
+
+class TestParsedVersion:
+    """Tests for the parsed version record."""
+
+    def test_parses_prerelease(self):
+        version = ParsedVersion.parse("3.2.1-rc.4")
+        assert (version.major, version.minor, version.patch) == (3, 2, 1)
+        assert (version.status, version.extension) == ("rc", 4)
+        assert version.namespace == "v3"
+        assert version.url_version == "v3rc4"
+
+    def test_initial_version_namespace_includes_minor(self):
+        version = ParsedVersion.parse("0.4.0")
+        assert version.status is None
+        assert version.namespace == "v0.4"
+        assert version.url_version == "v0.4"
+
+    def test_rejects_invalid_versions(self):
+        assert ParsedVersion.parse("wip") is None
+        assert ParsedVersion.parse("3.2.0-rc") is None
+        assert ParsedVersion.parse(None) is None
+
+    def test_equality(self):
+        assert ParsedVersion.parse("1.0.0-alpha.1") == ParsedVersion(1, 0, 0, "alpha", 1)
+        assert ParsedVersion.parse("1.0.0-alpha.1") != ParsedVersion.parse("1.0.0-alpha.2")
+
+
+class TestExtensionIndex:
+    """Tests for the sorted extension index."""
+
+    def _index(self, *entries):
+        index = ExtensionIndex()
+        for api_name, version in entries:
+            index.add(api_name, ParsedVersion.parse(version))
+        return index
+
+    def test_max_extension_per_namespace(self):
+        index = self._index(
+            ("api-a", "3.1.0-rc.2"),
+            ("api-a", "3.2.0-rc.1"),
+            ("api-a", "4.0.0-rc.7"),
+            ("api-a", "3.2.0-alpha.5"),
+            ("api-b", "3.0.0-rc.9"),
+            ("api-a", "3.2.0"),
+        )
+
+        assert index.max_extension("api-a", "rc", "v3") == 2
+        assert index.max_extension("api-a", "rc", "v4") == 7
+        assert index.max_extension("api-a", "alpha", "v3") == 5
+        assert index.max_extension("api-a", "rc", "v5") is None
+        assert index.max_extension("api-c", "rc", "v3") is None
+        assert len(index) == 5
+
+    def test_extensions_ascending(self):
+        index = self._index(
+            ("api-a", "0.3.0-alpha.3"),
+            ("api-a", "0.3.1-alpha.1"),
+            ("api-a", "0.4.0-alpha.2"),
+        )
+
+        assert index.extensions("api-a", "alpha", "v0.3") == [1, 3]
+        assert index.extensions("api-a", "alpha", "v0.4") == [2]
+        assert index.extensions("api-a", "rc", "v0.3") == []
@@ -0,0 +1,176 @@
+"""
+Unit tests for the API version ledger.
+"""
+
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from release_automation.scripts.version_ledger import (
+    VersionLedger,
+    default_ledger_path,
+    main,
+)
+
+
+REPO = "test-org/test-repo"
+
+METADATA = {
+    "r4.2": {"apis": [
+        {"api_name": "api-a", "api_version": "3.2.0-rc.2"},
+        {"api_name": "api-b", "api_version": "0.4.0-alpha.1"},
+    ]},
+    "r4.1": {"apis": [
+        {"api_name": "api-a", "api_version": "3.2.0-rc.1"},
+    ]},
+}
+
+
+@pytest.fixture
+def mock_github_client():
+    """Create a mock GitHubClient with two published releases."""
+    client = Mock()
+    client.repo = REPO
+    client.releases = [Mock(tag_name="r4.2"), Mock(tag_name="r4.1")]
+    client.iter_releases.side_effect = lambda **kwargs: iter(client.releases)
+    client.get_release_metadata.side_effect = lambda tag: METADATA.get(tag)
+    return client
+
+
+class TestPersistence:
+    def test_default_path_follows_cache_dir(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("GITHUB_CLIENT_CACHE_DIR", raising=False)
+        assert default_ledger_path(REPO) is None
+
+        monkeypatch.setenv("GITHUB_CLIENT_CACHE_DIR", str(tmp_path))
+        assert default_ledger_path(REPO) == str(
+            tmp_path / "version-ledger" / "test-org__test-repo.json"
+        )
+
+    def test_save_and_load(self, tmp_path):
+        path = str(tmp_path / "ledger.json")
+        ledger = VersionLedger(REPO, path, {"r4.1": {"api-a": "3.2.0-rc.1"}})
+        ledger.save()
+
+        loaded = VersionLedger.load(REPO, path)
+
+        assert loaded.tags == {"r4.1": {"api-a": "3.2.0-rc.1"}}
+
+    def test_load_ignores_missing_corrupt_and_foreign_files(self, tmp_path):
+        assert VersionLedger.load(REPO, str(tmp_path / "missing.json")).tags == {}
+
+        corrupt = tmp_path / "corrupt.json"
+        corrupt.write_text("{not json")
+        assert VersionLedger.load(REPO, str(corrupt)).tags == {}
+
+        foreign = tmp_path / "foreign.json"
+        foreign.write_text(json.dumps({"repository": "other/repo", "tags": {"r1.1": {}}}))
+        assert VersionLedger.load(REPO, str(foreign)).tags == {}
+
+
+class TestSync:
+    def test_sync_reads_only_new_tags(self, mock_github_client, tmp_path):
+        path = str(tmp_path / "ledger.json")
+        ledger = VersionLedger(REPO, path, {"r4.1": {"api-a": "3.2.0-rc.1"}})
+
+        added = ledger.sync(mock_github_client)
+
+        assert added == 1
+        mock_github_client.get_release_metadata.assert_called_once_with("r4.2")
+        assert list(ledger.tags) == ["r4.2", "r4.1"]
+        assert VersionLedger.load(REPO, path).tags == ledger.tags
+
+    def test_sync_stops_at_first_known_tag(self, mock_github_client):
+        listed = []
+
+        def releases(**kwargs):
+            for tag in ["r4.3", "r4.2", "r4.1"]:
+                listed.append(tag)
+                yield Mock(tag_name=tag)
+            raise AssertionError("older releases must not be listed")
+
+        mock_github_client.iter_releases.side_effect = releases
+        mock_github_client.get_release_metadata.side_effect = lambda tag: METADATA["r4.1"]
+        ledger = VersionLedger(REPO, tags={
+            "r4.2": {"api-a": "3.2.0-rc.2"},
+            "r3.9": {"api-a": "3.1.0"},
+        })
+
+        assert ledger.sync(mock_github_client) == 1
+        assert listed == ["r4.3", "r4.2"]
+        assert list(ledger.tags) == ["r4.3", "r4.2", "r3.9"]
+
+    def test_full_sync_drops_deleted_releases(self, mock_github_client):
+        ledger = VersionLedger(REPO, tags={
+            "r4.2": {"api-a": "3.2.0-rc.2"},
+            "r4.1": {"api-a": "3.2.0-rc.1"},
+            "r4.0": {"api-a": "3.2.0-rc.0"},
+        })
+
+        assert ledger.sync(mock_github_client, full=True) == 0
+        assert list(ledger.tags) == ["r4.2", "r4.1"]
+        mock_github_client.get_release_metadata.assert_not_called()
+
+    def test_sync_without_known_tag_replaces_ledger(self, mock_github_client):
+        ledger = VersionLedger(REPO, tags={"r1.1": {"api-a": "0.1.0"}})
+
+        assert ledger.sync(mock_github_client) == 2
+        assert list(ledger.tags) == ["r4.2", "r4.1"]
+
+    def test_tags_without_metadata_are_retried(self, mock_github_client):
+        mock_github_client.releases = [Mock(tag_name="r1.1")]
+        ledger = VersionLedger(REPO)
+
+        ledger.sync(mock_github_client)
+        ledger.sync(mock_github_client)
+
+        assert ledger.tags == {}
+        assert mock_github_client.get_release_metadata.call_count == 2
+
+    def test_record_puts_tag_first(self):
+        ledger = VersionLedger(REPO, tags={"r4.1": {"api-a": "3.2.0-rc.1"}})
+
+        ledger.record("r4.2", METADATA["r4.2"])
+
+        assert list(ledger.tags) == ["r4.2", "r4.1"]
+        assert ledger.versions("api-a") == ["3.2.0-rc.2", "3.2.0-rc.1"]
+
+
+class TestRebuildAndVerify:
+    def test_rebuild_from_history(self, mock_github_client):
+        ledger = VersionLedger.rebuild(mock_github_client)
+
+        assert ledger.tags == {
+            "r4.2": {"api-a": "3.2.0-rc.2", "api-b": "0.4.0-alpha.1"},
+            "r4.1": {"api-a": "3.2.0-rc.1"},
+        }
+
+    def test_verify_reports_differences(self, mock_github_client):
+        ledger = VersionLedger(REPO, tags={
+            "r4.2": {"api-a": "3.2.0-rc.9"},
+            "r3.9": {"api-a": "3.1.0"},
+        })
+
+        problems = ledger.verify(mock_github_client)
+
+        assert len(problems) == 3
+        assert any(p.startswith("r3.9:") for p in problems)
+        assert any(p.startswith("r4.2:") for p in problems)
+        assert any(p == "r4.1: missing from ledger" for p in problems)
+
+    def test_cli_rebuild_then_verify(self, mock_github_client, tmp_path, monkeypatch):
+        monkeypatch.setattr(
+            "release_automation.scripts.version_ledger.GitHubClient",
+            lambda repo, token: mock_github_client,
+        )
+        path = str(tmp_path / "ledger.json")
+
+        assert main(["rebuild", "--repo", REPO, "--path", path]) == 0
+        assert main(["verify", "--repo", REPO, "--path", path]) == 0
+
+        mock_github_client.releases = [Mock(tag_name="r4.3")]
+        mock_github_client.get_release_metadata.side_effect = lambda tag: {
+            "apis": [{"api_name": "api-a", "api_version": "3.2.0"}]
+        }
+        assert main(["verify", "--repo", REPO, "--path", path]) == 1
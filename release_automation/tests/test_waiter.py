@@ -0,0 +1,109 @@
+"""
+Unit tests for the eventual-consistency waiter.
+"""
+
+import pytest
+
+from release_automation.scripts.waiter import Waiter
+
+
+class FakeClock:
+    """Clock that advances only when the waiter sleeps."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def _waiter(clock, **kwargs):
+    kwargs.setdefault("random_source", lambda: 0.5)
+    return Waiter(clock=clock, sleep=clock.sleep, **kwargs)
+
+
+class TestDelays:
+    def test_exponential_up_to_cap(self, clock):
+        delays = _waiter(clock, initial_delay=0.25, factor=2.0, max_delay=1.0).delays()
+
+        assert [next(delays) for _ in range(5)] == [0.25, 0.5, 1.0, 1.0, 1.0]
+
+    def test_jitter_bounds(self, clock):
+        low = _waiter(clock, jitter=0.2, random_source=lambda: 0.0).delays()
+        high = _waiter(clock, jitter=0.2, random_source=lambda: 0.999999).delays()
+
+        assert next(low) == pytest.approx(0.2)
+        assert next(high) == pytest.approx(0.3)
+
+
+class TestUntil:
+    def test_immediate_success_does_not_sleep(self, clock):
+        result = _waiter(clock).until(lambda: True)
+
+        assert result.satisfied is True
+        assert result.attempts == 1
+        assert clock.sleeps == []
+
+    def test_reports_time_to_consistency(self, clock, capsys):
+        values = iter([False, False, False, True])
+
+        result = _waiter(clock).until(lambda: next(values), description="Draft release r4.1")
+
+        assert result.satisfied is True
+        assert result.attempts == 4
+        assert result.elapsed == pytest.approx(1.75)
+        assert "Draft release r4.1: consistent after 1.8s (4 attempts)" in capsys.readouterr().out
+
+    def test_deadline_bounds_total_wait(self, clock):
+        result = _waiter(clock, deadline=5.0).until(lambda: None)
+
+        assert result.satisfied is False
+        assert result.value is None
+        assert sum(clock.sleeps) == pytest.approx(5.0)
+
+    def test_custom_done_predicate(self, clock):
+        values = iter([1, 2, 3])
+
+        result = _waiter(clock).until(lambda: next(values), done=lambda v: v >= 3)
+
+        assert result.value == 3
+
+    def test_retried_exception(self, clock):
+        calls = []
+
+        def probe():
+            calls.append(1)
+            if len(calls) < 3:
+                raise KeyError("not yet")
+            return "ok"
+
+        result = _waiter(clock).until(probe, retry_on=lambda e: isinstance(e, KeyError))
+
+        assert result.value == "ok"
+        assert len(clock.sleeps) == 2
+
+    def test_retried_exception_raised_at_deadline(self, clock):
+        def probe():
+            raise KeyError("never")
+
+        with pytest.raises(KeyError):
+            _waiter(clock, deadline=1.0).until(probe, retry_on=lambda e: True)
+        assert sum(clock.sleeps) == pytest.approx(1.0)
+
+    def test_other_exception_raised_immediately(self, clock):
+        def probe():
+            raise ValueError("broken")
+
+        with pytest.raises(ValueError):
+            _waiter(clock).until(probe, retry_on=lambda e: isinstance(e, KeyError))
+        assert clock.sleeps == []